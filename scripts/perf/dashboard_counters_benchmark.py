@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Benchmark dashboard metric reads as the corpus grows.
+
+Seeds scratch SQLite databases with increasing numbers of documents, notes,
+discoveries and notebooks spread over a year, then times the dashboard metric
+query twice per size: once from the per-day :class:`DashboardCounter` rollups
+and once with the legacy full-table counts. Rollup latency should stay flat
+because it depends on the number of days, not rows; the script reports the
+ratio between the largest and smallest corpus for both paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf.hot_path_benchmarks import BenchmarkResult, measure  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+DEFAULT_SIZES: tuple[int, ...] = (1_000, 10_000, 50_000)
+_SPAN_DAYS = 365
+_BATCH = 5_000
+
+
+def _seed(engine: Engine, rows: int, *, now: datetime) -> None:
+    from theo.adapters.persistence.models import (
+        Discovery,
+        Document,
+        Notebook,
+        ResearchNote,
+    )
+
+    def stamp(index: int) -> datetime:
+        return now - timedelta(days=index % _SPAN_DAYS, minutes=index % 1440)
+
+    def documents(index: int) -> dict[str, Any]:
+        moment = stamp(index)
+        return {
+            "id": f"doc-{index}",
+            "title": f"Document {index}",
+            "created_at": moment,
+            "updated_at": moment,
+        }
+
+    def notes(index: int) -> dict[str, Any]:
+        moment = stamp(index)
+        return {
+            "id": f"note-{index}",
+            "osis": "John.1.1",
+            "body": "note",
+            "created_at": moment,
+            "updated_at": moment,
+        }
+
+    def discoveries(index: int) -> dict[str, Any]:
+        return {
+            "user_id": "bench",
+            "discovery_type": "theme",
+            "title": f"Discovery {index}",
+            "confidence": 0.5,
+            "relevance_score": 0.5,
+            "created_at": stamp(index),
+        }
+
+    def notebooks(index: int) -> dict[str, Any]:
+        moment = stamp(index)
+        return {
+            "id": f"nb-{index}",
+            "title": f"Notebook {index}",
+            "created_by": "bench",
+            "created_at": moment,
+            "updated_at": moment,
+        }
+
+    with engine.begin() as connection:
+        for model, build in (
+            (Document, documents),
+            (ResearchNote, notes),
+            (Discovery, discoveries),
+            (Notebook, notebooks),
+        ):
+            for offset in range(0, rows, _BATCH):
+                batch = range(offset, min(offset + _BATCH, rows))
+                connection.execute(
+                    insert(model.__table__), [build(index) for index in batch]
+                )
+
+
+def prepare_database(path: Path, rows: int, *, now: datetime) -> Engine:
+    """Create a database at *path* with *rows* rows per metric and rollups."""
+
+    from theo.application.facades.database import Base
+    from theo.infrastructure.api.app.db.dashboard_counters import (
+        reconcile_dashboard_counters,
+    )
+
+    if path.exists():
+        path.unlink()
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    _seed(engine, rows, now=now)
+    with Session(engine) as session:
+        reconcile_dashboard_counters(session)
+    return engine
+
+
+def run_benchmark(
+    sizes: Sequence[int], *, workdir: Path, iterations: int
+) -> dict[int, dict[str, BenchmarkResult]]:
+    """Time the rollup and full-count metric reads for every corpus size."""
+
+    from theo.infrastructure.api.app.routes import dashboard
+
+    now = datetime.now(UTC)
+    results: dict[int, dict[str, BenchmarkResult]] = {}
+    for rows in sizes:
+        engine = prepare_database(workdir / f"dashboard-{rows}.db", rows, now=now)
+        try:
+            with Session(engine) as session:
+                rollups = measure(
+                    "rollups",
+                    lambda: dashboard._metric_counts(session, now),
+                    iterations=iterations,
+                )
+                ready = dashboard.dashboard_counters_ready
+                dashboard.dashboard_counters_ready = lambda _session: False
+                try:
+                    full_scan = measure(
+                        "full_scan",
+                        lambda: dashboard._metric_counts(session, now),
+                        iterations=iterations,
+                    )
+                finally:
+                    dashboard.dashboard_counters_ready = ready
+        finally:
+            engine.dispose()
+        results[rows] = {"rollups": rollups, "full_scan": full_scan}
+    return results
+
+
+def growth(results: dict[int, dict[str, BenchmarkResult]], path: str) -> float:
+    """Return p50 latency at the largest size divided by the smallest."""
+
+    sizes = sorted(results)
+    first = results[sizes[0]][path].percentile(0.5)
+    last = results[sizes[-1]][path].percentile(0.5)
+    return round(last / first, 2) if first else 0.0
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size",
+        dest="sizes",
+        type=int,
+        action="append",
+        help="Rows per metric (repeatable; defaults to 1k, 10k and 50k).",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the scratch databases (defaults to a temp dir).",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the full report as JSON."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    sizes = sorted(args.sizes or DEFAULT_SIZES)
+
+    with tempfile.TemporaryDirectory(prefix="theo-dashboard-bench-") as scratch:
+        workdir = args.workdir or Path(scratch)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmark(sizes, workdir=workdir, iterations=args.iterations)
+
+    report: dict[str, Any] = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "sizes": {
+            str(rows): {path: result.as_dict() for path, result in paths.items()}
+            for rows, paths in results.items()
+        },
+        "growth": {path: growth(results, path) for path in ("rollups", "full_scan")},
+    }
+    for rows, paths in results.items():
+        rollups, full_scan = paths["rollups"].as_dict(), paths["full_scan"].as_dict()
+        print(
+            f"{rows:>9} rows/metric  rollups p50={rollups['p50_ms']:>8.2f}ms "
+            f"p95={rollups['p95_ms']:>8.2f}ms  full scan p50="
+            f"{full_scan['p50_ms']:>8.2f}ms p95={full_scan['p95_ms']:>8.2f}ms"
+        )
+    print(
+        f"p50 growth {sizes[0]} -> {sizes[-1]} rows: "
+        f"rollups x{report['growth']['rollups']}, "
+        f"full scan x{report['growth']['full_scan']}"
+    )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
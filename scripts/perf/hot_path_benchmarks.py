@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""Benchmark Theo's core hot paths against a synthetic SQLite corpus.
+
+The suite seeds a deterministic corpus (see :mod:`synthetic_corpus`) into a
+scratch SQLite database and times hybrid search, verse mention lookups,
+chunking, reranking, document export, discovery refresh and document
+persistence. Each
+benchmark reports latency percentiles, throughput and the peak Python heap
+allocation of a single call. The p95 latencies are compared with a stored
+baseline through :func:`regression_detector.detect_performance_regressions`;
+the script exits non-zero when any hot path slowed down past its threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Query embeddings must come from the deterministic fallback embedder rather
+# than a locally installed model, otherwise timings depend on the machine.
+os.environ.setdefault("THEO_FORCE_EMBEDDING_FALLBACK", "1")
+
+from scripts.perf.regression_detector import (  # noqa: E402
+    detect_performance_regressions,
+    save_baseline,
+)
+from scripts.perf.synthetic_corpus import (  # noqa: E402
+    CorpusSpec,
+    SyntheticCorpus,
+    generate_corpus,
+    load_corpus,
+)
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+DEFAULT_BASELINE = REPO_ROOT / "perf_metrics" / "hot_path_baselines.json"
+BASELINE_METRIC = "p95_ms"
+_DEFAULT_SPEC = CorpusSpec()
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timings collected for one hot path."""
+
+    name: str
+    items_per_call: int
+    durations: list[float] = field(default_factory=list)
+    peak_memory_bytes: int = 0
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.durations)
+        if not ordered:
+            return 0.0
+        rank = fraction * (len(ordered) - 1)
+        lower = int(rank)
+        upper = min(lower + 1, len(ordered) - 1)
+        weight = rank - lower
+        return ordered[lower] * (1.0 - weight) + ordered[upper] * weight
+
+    def as_dict(self) -> dict[str, Any]:
+        total = sum(self.durations)
+        calls = len(self.durations)
+        return {
+            "iterations": calls,
+            "items_per_call": self.items_per_call,
+            "mean_ms": round(total / calls * 1000.0, 3) if calls else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000.0, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000.0, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000.0, 3),
+            "calls_per_second": round(calls / total, 2) if total else 0.0,
+            "items_per_second": (
+                round(calls * self.items_per_call / total, 2) if total else 0.0
+            ),
+            "peak_memory_kib": round(self.peak_memory_bytes / 1024.0, 1),
+        }
+
+
+@dataclass(slots=True)
+class BenchmarkContext:
+    """Shared state handed to every benchmark factory."""
+
+    engine: Engine
+    corpus: SyntheticCorpus
+    workdir: Path
+    dimension: int
+    iterations: int
+
+
+BenchmarkCall = Callable[[], Any]
+# A factory returns the callable to time and the number of items one call
+# processes (passages, documents, ...), used for throughput.
+BenchmarkFactory = Callable[[BenchmarkContext], Iterator[tuple[BenchmarkCall, int]]]
+
+
+def measure(
+    name: str,
+    call: BenchmarkCall,
+    *,
+    iterations: int,
+    items_per_call: int = 1,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Time *call* ``iterations`` times and trace the heap of one extra call.
+
+    Memory is sampled on a separate call because ``tracemalloc`` slows the
+    allocator enough to distort the latency figures.
+    """
+
+    result = BenchmarkResult(name=name, items_per_call=items_per_call)
+    for _ in range(warmup):
+        call()
+    gc.collect()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        result.durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        call()
+        _current, result.peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def _hybrid_search(context: BenchmarkContext) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.infrastructure.api.app.models.search import HybridSearchRequest
+    from theo.infrastructure.api.app.retriever.hybrid import hybrid_search
+
+    queries = context.corpus.query_terms(max(context.iterations, 8))
+    requests = [HybridSearchRequest(query=query, k=10) for query in queries]
+    cursor = iter(range(10**9))
+
+    with Session(context.engine) as session:
+
+        def call() -> Any:
+            return hybrid_search(session, requests[next(cursor) % len(requests)])
+
+        yield call, 1
+
+
+def _verse_mentions(context: BenchmarkContext) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.infrastructure.api.app.retriever.verses import get_mentions_for_osis
+
+    references = context.corpus.hot_references
+    cursor = iter(range(10**9))
+
+    with Session(context.engine) as session:
+
+        def call() -> Any:
+            osis = references[next(cursor) % len(references)]
+            return get_mentions_for_osis(session, osis)
+
+        yield call, 1
+
+
+def _chunk_text(context: BenchmarkContext) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.infrastructure.api.app.ingest.chunking import chunk_text
+
+    text = "\n\n".join(document.text for document in context.corpus.documents[:10])
+
+    def call() -> Any:
+        return chunk_text(text)
+
+    yield call, len(text)
+
+
+def _export_documents(
+    context: BenchmarkContext,
+) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.infrastructure.api.app.models.export import DocumentExportFilters
+    from theo.infrastructure.api.app.retriever.export import export_documents
+
+    filters = DocumentExportFilters(collection=context.corpus.spec.collection)
+    limit = min(100, len(context.corpus.documents))
+
+    with Session(context.engine) as session:
+
+        def call() -> Any:
+            response = export_documents(session, filters, limit=limit)
+            session.expunge_all()
+            return response
+
+        yield call, limit
+
+
+def _rerank_candidates(context: BenchmarkContext) -> list[list[Any]]:
+    """Return top-20 hybrid search results for a handful of corpus queries."""
+
+    from theo.infrastructure.api.app.models.search import HybridSearchRequest
+    from theo.infrastructure.api.app.retriever.hybrid import hybrid_search
+
+    with Session(context.engine) as session:
+        return [
+            list(hybrid_search(session, HybridSearchRequest(query=query, k=20)))
+            for query in context.corpus.query_terms(8)
+        ]
+
+
+class _LinearEstimator:
+    """Fixed-weight stand-in for a trained scikit-learn reranker."""
+
+    def __init__(self) -> None:
+        import numpy as np
+
+        self._coef = np.linspace(1.0, 0.1, 7)
+
+    def decision_function(self, features: Any) -> Any:
+        return features @ self._coef
+
+
+def _rerank_top_k(context: BenchmarkContext) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.infrastructure.api.app.ranking.re_ranker import Reranker
+
+    candidates = _rerank_candidates(context)
+    reranker = Reranker(_LinearEstimator())
+    cursor = iter(range(10**9))
+
+    def call() -> Any:
+        return reranker.rerank(candidates[next(cursor) % len(candidates)])
+
+    yield call, 20
+
+
+class _OverlapCrossEncoder:
+    """CPU stand-in scoring a pair by shared query words."""
+
+    def compute_score(
+        self, sentence_pairs: Sequence[tuple[str, str]], batch_size: int = 16
+    ) -> list[float]:
+        return [
+            float(len(set(query.split()) & set(passage.split())))
+            for query, passage in sentence_pairs
+        ]
+
+
+def _cross_encoder_top_n(
+    context: BenchmarkContext,
+) -> Iterator[tuple[BenchmarkCall, int]]:
+    """Time the cross-encoder stage on a cold score cache.
+
+    Set ``THEO_BENCH_CROSS_ENCODER_MODEL`` (with the ``ml`` extra installed) to
+    time a real checkpoint; otherwise a lexical stand-in measures the stage's
+    own batching, caching and reordering overhead.
+    """
+
+    from theo.infrastructure.api.app.ranking.cross_encoder import (
+        CrossEncoderReranker,
+    )
+
+    model_name = os.environ.get("THEO_BENCH_CROSS_ENCODER_MODEL")
+    if model_name:
+        from FlagEmbedding import FlagReranker
+
+        backend: Any = FlagReranker(model_name, use_fp16=False)
+    else:
+        model_name, backend = "overlap-stand-in", _OverlapCrossEncoder()
+    candidates = _rerank_candidates(context)
+    queries = context.corpus.query_terms(len(candidates))
+    reranker = CrossEncoderReranker(backend, model_name=model_name, top_n=20)
+    cursor = iter(range(10**9))
+
+    def call() -> Any:
+        index = next(cursor) % len(candidates)
+        reranker.cache.clear()
+        return reranker.rerank(candidates[index], query=queries[index])
+
+    yield call, 20
+
+
+class _KeywordTopicModel:
+    """BERTopic stand-in that clusters documents by their most frequent word.
+
+    Fitting BERTopic dominates the gap engine and depends on an optional model
+    download, so the benchmark times the refresh orchestration around it.
+    """
+
+    def __init__(self) -> None:
+        self._topics: dict[int, list[tuple[str, float]]] = {}
+
+    def fit_transform(self, texts: Sequence[str]) -> tuple[list[int], None]:
+        assignments: list[int] = []
+        labels: dict[str, int] = {}
+        for text in texts:
+            counts: dict[str, int] = {}
+            for word in text.lower().split():
+                counts[word] = counts.get(word, 0) + 1
+            ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            label = ranked[0][0] if ranked else ""
+            topic_id = labels.setdefault(label, len(labels))
+            self._topics.setdefault(
+                topic_id, [(word, float(count)) for word, count in ranked[:10]]
+            )
+            assignments.append(topic_id)
+        return assignments, None
+
+    def get_topic(self, topic_id: int) -> list[tuple[str, float]]:
+        return self._topics.get(topic_id, [])
+
+
+def _refresh_discoveries(
+    context: BenchmarkContext,
+) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.adapters.persistence.discovery_repository import (
+        SQLAlchemyDiscoveryRepository,
+    )
+    from theo.adapters.persistence.document_repository import (
+        SQLAlchemyDocumentRepository,
+    )
+    from theo.domain.discoveries import (
+        ContradictionDiscoveryEngine,
+        GapDiscoveryEngine,
+    )
+    from theo.infrastructure.api.app.use_cases.refresh_discoveries import (
+        RefreshDiscoveriesUseCase,
+    )
+
+    user_id = context.corpus.spec.collection
+    # Pin the rule-based NLI model and a keyword topic model so the benchmark
+    # neither downloads nor times transformer checkpoints.
+    contradiction_engine = ContradictionDiscoveryEngine()
+    contradiction_engine._model = contradiction_engine._RuleBasedNLIModel()
+    gap_engine = GapDiscoveryEngine(topic_model=_KeywordTopicModel())
+
+    def call() -> Any:
+        # Roll back so every iteration starts from the same discovery state.
+        with Session(context.engine) as session:
+            use_case = RefreshDiscoveriesUseCase(
+                SQLAlchemyDiscoveryRepository(session),
+                contradiction_engine=contradiction_engine,
+                gap_engine=gap_engine,
+            )
+            discoveries = use_case.execute(
+                user_id, SQLAlchemyDocumentRepository(session)
+            )
+            session.rollback()
+            return discoveries
+
+    yield call, len(context.corpus.documents)
+
+
+class _FallbackEmbeddingService:
+    def __init__(self, dimension: int) -> None:
+        from theo.infrastructure.api.app.ingest.embeddings import _FallbackEmbedder
+
+        self._embedder = _FallbackEmbedder(dimension)
+
+    def embed(self, texts: Sequence[str], *, batch_size: int = 32):
+        return self._embedder.encode(list(texts))
+
+
+def _persist_text_document(
+    context: BenchmarkContext,
+) -> Iterator[tuple[BenchmarkCall, int]]:
+    from theo.application.facades.settings import get_settings
+    from theo.infrastructure.api.app.ingest.chunking import chunk_text
+    from theo.infrastructure.api.app.ingest.persistence import persist_text_document
+    from theo.infrastructure.api.app.ingest.stages import (
+        IngestContext,
+        Instrumentation,
+    )
+
+    settings = get_settings().model_copy(
+        update={"storage_root": context.workdir / "storage"}
+    )
+    ingest_context = IngestContext(
+        settings=settings,
+        embedding_service=_FallbackEmbeddingService(context.dimension),
+        instrumentation=Instrumentation(span=None),
+    )
+    source = context.corpus.documents[0]
+    text = source.text
+    chunks = chunk_text(text, max_tokens=200, min_tokens=100, hard_cap=300)
+    cursor = iter(range(10**9))
+
+    def call() -> Any:
+        index = next(cursor)
+        with Session(context.engine) as session:
+            return persist_text_document(
+                session,
+                context=ingest_context,
+                chunks=chunks,
+                parser="plain_text",
+                parser_version="bench",
+                frontmatter={"title": source.title, "collection": "bench-ingest"},
+                sha256=f"{source.sha256}-{index}",
+                source_type="txt",
+                title=source.title,
+                source_url=None,
+                text_content=text,
+            ).id
+
+    yield call, len(chunks)
+
+
+# Ordered so that benchmarks which write to the corpus run last.
+BENCHMARKS: dict[str, BenchmarkFactory] = {
+    "chunk_text": _chunk_text,
+    "hybrid_search": _hybrid_search,
+    "get_mentions_for_osis": _verse_mentions,
+    "rerank_top_k": _rerank_top_k,
+    "cross_encoder_top_n": _cross_encoder_top_n,
+    "export_documents": _export_documents,
+    "refresh_discoveries": _refresh_discoveries,
+    "persist_text_document": _persist_text_document,
+}
+
+
+def prepare_database(
+    path: Path, corpus: SyntheticCorpus, *, dimension: int
+) -> Engine:
+    """Create a fresh SQLite database at *path* seeded with *corpus*."""
+
+    from theo.application.facades.database import Base
+
+    if path.exists():
+        path.unlink()
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        load_corpus(session, corpus, dimension=dimension)
+    return engine
+
+
+def run_benchmarks(
+    spec: CorpusSpec,
+    *,
+    workdir: Path,
+    iterations: int,
+    only: Sequence[str] | None = None,
+    dimension: int | None = None,
+) -> dict[str, BenchmarkResult]:
+    """Seed a corpus for *spec* under *workdir* and run the selected benchmarks."""
+
+    if dimension is None:
+        from theo.application.facades.settings import get_settings
+
+        dimension = get_settings().embedding_dim
+    corpus = generate_corpus(spec)
+    engine = prepare_database(workdir / "bench.db", corpus, dimension=dimension)
+    context = BenchmarkContext(
+        engine=engine,
+        corpus=corpus,
+        workdir=workdir,
+        dimension=dimension,
+        iterations=iterations,
+    )
+    selected = [name for name in BENCHMARKS if not only or name in only]
+    results: dict[str, BenchmarkResult] = {}
+    try:
+        for name in selected:
+            factory = BENCHMARKS[name]
+            for call, items in factory(context):
+                results[name] = measure(
+                    name, call, iterations=iterations, items_per_call=items
+                )
+    finally:
+        engine.dispose()
+    return results
+
+
+def baseline_metrics(results: dict[str, BenchmarkResult]) -> dict[str, float]:
+    """Flatten *results* into the ``{name: value}`` shape the detector expects."""
+
+    return {
+        f"{name}.{BASELINE_METRIC}": result.as_dict()[BASELINE_METRIC]
+        for name, result in results.items()
+    }
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=_DEFAULT_SPEC.documents)
+    parser.add_argument(
+        "--passages-per-document",
+        type=int,
+        default=_DEFAULT_SPEC.passages_per_document,
+    )
+    parser.add_argument("--seed", type=int, default=_DEFAULT_SPEC.seed)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only the named benchmark (repeatable).",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the scratch database (defaults to a temp dir).",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the full report as JSON."
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run instead of comparing.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    spec = CorpusSpec(
+        documents=args.documents,
+        passages_per_document=args.passages_per_document,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="theo-bench-") as scratch:
+        workdir = args.workdir or Path(scratch)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(
+            spec, workdir=workdir, iterations=args.iterations, only=args.only
+        )
+
+    report: dict[str, Any] = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "corpus": {
+            "documents": spec.documents,
+            "passages": spec.documents * spec.passages_per_document,
+            "seed": spec.seed,
+        },
+        "benchmarks": {name: result.as_dict() for name, result in results.items()},
+    }
+    for name, summary in report["benchmarks"].items():
+        print(
+            f"{name:24} p50={summary['p50_ms']:>9.2f}ms "
+            f"p95={summary['p95_ms']:>9.2f}ms "
+            f"{summary['items_per_second']:>11.1f} items/s "
+            f"peak={summary['peak_memory_kib']:>9.1f}KiB"
+        )
+
+    metrics = baseline_metrics(results)
+    args.baseline.parent.mkdir(parents=True, exist_ok=True)
+    if args.update_baseline:
+        save_baseline(args.baseline, metrics)
+        report["regressions"] = {"status": "baseline_updated", "regressions": []}
+    else:
+        report["regressions"] = detect_performance_regressions(args.baseline, metrics)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    regressions = report["regressions"].get("regressions", [])
+    for entry in regressions:
+        print(
+            f"REGRESSION {entry['test']}: {entry['baseline']:.2f}ms -> "
+            f"{entry['current']:.2f}ms (+{entry['regression_percent']:.0f}%)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
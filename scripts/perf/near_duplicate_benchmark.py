@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Benchmark MinHash/LSH near-duplicate detection throughput.
+
+Generates a deterministic corpus of passages in which a fraction are lightly
+edited copies of earlier ones (a word swapped and a closing word appended, the
+way reposted sermons and re-issued commentaries differ). The corpus is seeded
+into a scratch SQLite database and indexed in ingest-sized batches. The report
+gives throughput in passages per second for signature computation alone and
+for full indexing (signatures, band lookups and inserts). It also checks the
+detected duplicates against the generated ground truth and reports precision
+and recall.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf.hot_path_benchmarks import BenchmarkResult  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+_VOCABULARY = (
+    "grace faith works law spirit flesh covenant promise righteousness sin"
+    " death life kingdom heaven earth prophet apostle church gospel word truth"
+    " light darkness mercy judgment glory father son holy love hope peace"
+    " temple priest sacrifice blood cross resurrection servant shepherd"
+).split()
+
+
+def generate_passages(
+    count: int, *, duplicate_ratio: float, words: int, seed: int
+) -> tuple[list[tuple[str, str]], dict[str, str]]:
+    """Return ``(passage_id, text)`` pairs and a copy-to-original map."""
+
+    rng = random.Random(seed)
+    passages: list[tuple[str, str]] = []
+    sources: list[tuple[str, str]] = []
+    originals: dict[str, str] = {}
+    for index in range(count):
+        passage_id = f"p{index:06d}"
+        if sources and rng.random() < duplicate_ratio:
+            source_id, source_text = rng.choice(sources)
+            tokens = source_text.split()
+            for _ in range(max(1, len(tokens) // 150)):
+                tokens[rng.randrange(len(tokens))] = rng.choice(_VOCABULARY)
+            passages.append((passage_id, " ".join(tokens) + " Amen."))
+            originals[passage_id] = source_id
+        else:
+            text = " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+            passages.append((passage_id, text))
+            sources.append((passage_id, text))
+    return passages, originals
+
+
+def _seed_database(path: Path, passages: Sequence[tuple[str, str]]):
+    from theo.adapters.persistence.models import Document, Passage
+    from theo.application.facades.database import Base
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Document.__table__), [{"id": "bench", "title": "Benchmark"}]
+        )
+        connection.execute(
+            insert(Passage.__table__),
+            [
+                {"id": passage_id, "document_id": "bench", "text": text}
+                for passage_id, text in passages
+            ],
+        )
+    return engine
+
+
+def run_benchmark(
+    *,
+    workdir: Path,
+    passages: int,
+    batch_size: int,
+    duplicate_ratio: float = 0.2,
+    words: int = 180,
+    threshold: float = 0.85,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """Time signature computation and indexing over a generated corpus."""
+
+    from theo.infrastructure.api.app.db.near_duplicates import (
+        MinHasher,
+        index_passage_texts,
+        load_cluster_ids,
+    )
+
+    corpus, originals = generate_passages(
+        passages, duplicate_ratio=duplicate_ratio, words=words, seed=seed
+    )
+    hasher = MinHasher.from_settings()
+    batches = [
+        corpus[start : start + batch_size]
+        for start in range(0, len(corpus), batch_size)
+    ]
+
+    signatures = BenchmarkResult(name="signature", items_per_call=batch_size)
+    for batch in batches:
+        started = time.perf_counter()
+        for _passage_id, text in batch:
+            hasher.band_keys(hasher.signature(text))
+        signatures.durations.append(time.perf_counter() - started)
+
+    db_path = workdir / "near-duplicates.db"
+    if db_path.exists():
+        db_path.unlink()
+    engine = _seed_database(db_path, corpus)
+    indexing = BenchmarkResult(name="index", items_per_call=batch_size)
+    flagged = 0
+    try:
+        with Session(engine) as session:
+            for batch in batches:
+                started = time.perf_counter()
+                flagged += index_passage_texts(
+                    session, batch, hasher=hasher, threshold=threshold
+                )
+                session.commit()
+                indexing.durations.append(time.perf_counter() - started)
+            clusters = load_cluster_ids(session, [pid for pid, _ in corpus])
+    finally:
+        engine.dispose()
+
+    detected = {pid for pid, cluster in clusters.items() if cluster != pid}
+    correct = sum(
+        1 for pid in detected if clusters[pid] == originals.get(pid, clusters[pid])
+    )
+    true_positives = len(detected & set(originals))
+    return {
+        "signature": signatures,
+        "index": indexing,
+        "passages": len(corpus),
+        "generated_duplicates": len(originals),
+        "flagged_duplicates": flagged,
+        "precision": round(true_positives / len(detected), 4) if detected else 1.0,
+        "recall": (
+            round(true_positives / len(originals), 4) if originals else 1.0
+        ),
+        "cluster_accuracy": round(correct / len(detected), 4) if detected else 1.0,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passages", type=int, default=20_000)
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="Passages per indexing batch."
+    )
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument(
+        "--words", type=int, default=180, help="Words per generated passage."
+    )
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the scratch database (defaults to a temp dir).",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the full report as JSON."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    with tempfile.TemporaryDirectory(prefix="theo-near-dup-bench-") as scratch:
+        workdir = args.workdir or Path(scratch)
+        workdir.mkdir(parents=True, exist_ok=True)
+        outcome = run_benchmark(
+            workdir=workdir,
+            passages=args.passages,
+            batch_size=args.batch_size,
+            duplicate_ratio=args.duplicate_ratio,
+            words=args.words,
+            threshold=args.threshold,
+            seed=args.seed,
+        )
+
+    timings = {name: outcome.pop(name) for name in ("signature", "index")}
+    report: dict[str, Any] = {"generated_at": datetime.now(UTC).isoformat(), **outcome}
+    for name, result in timings.items():
+        # The last batch can be short, so throughput comes from the corpus size.
+        total = sum(result.durations)
+        report[name] = {
+            **result.as_dict(),
+            "passages_per_second": (
+                round(outcome["passages"] / total, 1) if total else 0.0
+            ),
+        }
+    print(
+        f"signatures {report['signature']['passages_per_second']:>10.1f} passages/s  "
+        f"index {report['index']['passages_per_second']:>10.1f} passages/s  "
+        f"flagged={outcome['flagged_duplicates']}/{outcome['generated_duplicates']}  "
+        f"precision={outcome['precision']:.3f} recall={outcome['recall']:.3f}"
+    )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent SQLite reads and writes under both engine profiles.
+
+Seeds a scratch database for each ``sqlite_profile`` (``compat``: ``NullPool``
+with default pragmas, ``performance``: pooled WAL connections with tuned
+pragmas and a serialised writer), then runs reader and writer threads against
+it. Every read opens a session, loads a document by id and lists a page of
+titles; every write opens a session, inserts a document and commits. The
+report gives per-operation latency percentiles, wall-clock throughput and the
+number of failed operations (for example ``database is locked``) per profile.
+
+Both profiles use plain SQLAlchemy sessions. The application's compat session
+also sweeps every open ``sqlite3`` connection in the process when it closes.
+That sweep closes connections other threads are still using, so it cannot run
+under this workload at all. The compat numbers are therefore a best case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf.hot_path_benchmarks import BenchmarkResult  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+PROFILES: tuple[str, ...] = ("compat", "performance")
+_SEED_ROWS = 2_000
+
+
+def prepare_engine(path: Path, profile: str, *, seed_rows: int) -> Engine:
+    """Create a seeded database at *path* opened with *profile*."""
+
+    from theo.adapters.persistence.models import Document
+    from theo.application.facades.database import Base, _create_engine
+
+    if path.exists():
+        path.unlink()
+    engine = _create_engine(f"sqlite:///{path}", sqlite_profile=profile)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Document.__table__),
+            [
+                {"id": f"seed-{index}", "title": f"Seed {index}", "collection": "bench"}
+                for index in range(seed_rows)
+            ],
+        )
+    return engine
+
+
+def run_profile(
+    engine: Engine,
+    *,
+    readers: int,
+    writers: int,
+    operations: int,
+    seed_rows: int,
+) -> dict[str, Any]:
+    """Run the concurrent workload against *engine* and collect timings."""
+
+    from theo.adapters.persistence.models import Document
+
+    factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+    reads = BenchmarkResult(name="read", items_per_call=1)
+    writes = BenchmarkResult(name="write", items_per_call=1)
+    errors: list[str] = []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(readers + writers)
+
+    def _read(worker: int) -> None:
+        rng = random.Random(worker)
+        start_barrier.wait()
+        for _ in range(operations):
+            started = time.perf_counter()
+            try:
+                with factory() as session:
+                    session.get(Document, f"seed-{rng.randrange(seed_rows)}")
+                    session.scalars(
+                        select(Document.title)
+                        .where(Document.collection == "bench")
+                        .limit(20)
+                    ).all()
+            except Exception as exc:  # noqa: BLE001 - failures are reported
+                with lock:
+                    errors.append(f"read: {exc.__class__.__name__}: {exc}")
+                continue
+            with lock:
+                reads.durations.append(time.perf_counter() - started)
+
+    def _write(worker: int) -> None:
+        start_barrier.wait()
+        for index in range(operations):
+            started = time.perf_counter()
+            try:
+                with factory() as session:
+                    session.add(
+                        Document(
+                            id=f"w{worker}-{index}",
+                            title=f"Write {worker}/{index}",
+                            collection="bench-writes",
+                        )
+                    )
+                    session.commit()
+            except Exception as exc:  # noqa: BLE001 - failures are reported
+                with lock:
+                    errors.append(f"write: {exc.__class__.__name__}: {exc}")
+                continue
+            with lock:
+                writes.durations.append(time.perf_counter() - started)
+
+    threads = [
+        threading.Thread(target=_read, args=(worker,)) for worker in range(readers)
+    ] + [
+        threading.Thread(target=_write, args=(worker,)) for worker in range(writers)
+    ]
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+
+    completed = len(reads.durations) + len(writes.durations)
+    return {
+        "read": reads,
+        "write": writes,
+        "errors": errors,
+        "wall_seconds": wall,
+        "ops_per_second": round(completed / wall, 2) if wall else 0.0,
+    }
+
+
+def run_benchmark(
+    profiles: Sequence[str],
+    *,
+    workdir: Path,
+    readers: int,
+    writers: int,
+    operations: int,
+    seed_rows: int = _SEED_ROWS,
+) -> dict[str, dict[str, Any]]:
+    """Benchmark every profile in *profiles* on its own scratch database."""
+
+    results: dict[str, dict[str, Any]] = {}
+    for profile in profiles:
+        engine = prepare_engine(
+            workdir / f"sqlite-{profile}.db", profile, seed_rows=seed_rows
+        )
+        try:
+            results[profile] = run_profile(
+                engine,
+                readers=readers,
+                writers=writers,
+                operations=operations,
+                seed_rows=seed_rows,
+            )
+        finally:
+            engine.dispose()
+    return results
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--profile",
+        dest="profiles",
+        choices=PROFILES,
+        action="append",
+        help="Profile to benchmark (repeatable; defaults to both).",
+    )
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument(
+        "--operations", type=int, default=200, help="Operations per thread."
+    )
+    parser.add_argument("--seed-rows", type=int, default=_SEED_ROWS)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help="Directory for the scratch databases (defaults to a temp dir).",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the full report as JSON."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    profiles = args.profiles or list(PROFILES)
+
+    with tempfile.TemporaryDirectory(prefix="theo-sqlite-bench-") as scratch:
+        workdir = args.workdir or Path(scratch)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmark(
+            profiles,
+            workdir=workdir,
+            readers=args.readers,
+            writers=args.writers,
+            operations=args.operations,
+            seed_rows=args.seed_rows,
+        )
+
+    report: dict[str, Any] = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "readers": args.readers,
+        "writers": args.writers,
+        "operations_per_thread": args.operations,
+        "profiles": {},
+    }
+    for profile, outcome in results.items():
+        read, write = outcome["read"].as_dict(), outcome["write"].as_dict()
+        report["profiles"][profile] = {
+            "read": read,
+            "write": write,
+            "errors": len(outcome["errors"]),
+            "error_samples": outcome["errors"][:5],
+            "wall_seconds": round(outcome["wall_seconds"], 3),
+            "ops_per_second": outcome["ops_per_second"],
+        }
+        print(
+            f"{profile:>12}  {outcome['ops_per_second']:>9.1f} ops/s  "
+            f"read p50={read['p50_ms']:>7.2f}ms p95={read['p95_ms']:>7.2f}ms  "
+            f"write p50={write['p50_ms']:>7.2f}ms p95={write['p95_ms']:>7.2f}ms  "
+            f"errors={len(outcome['errors'])}"
+        )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
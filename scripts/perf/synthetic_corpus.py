@@ -0,0 +1,244 @@
+"""Deterministic synthetic corpus used by the hot-path benchmarks.
+
+The generator produces documents whose passages cite OSIS references with a
+skewed distribution (a handful of "hot" verses are cited far more often than
+the rest), mirroring how sermons and commentaries cluster around popular
+texts. Every value derives from a seeded :class:`random.Random`, so two runs
+with the same :class:`CorpusSpec` load byte-identical corpora and benchmark
+numbers stay comparable across machines and commits.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from hashlib import sha256
+
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, Passage, PassageVerse
+from theo.infrastructure.api.app.ingest.embeddings import _FallbackEmbedder
+from theo.infrastructure.api.app.ingest.osis import canonical_verse_range
+
+__all__ = [
+    "BOOKS",
+    "CorpusSpec",
+    "SyntheticCorpus",
+    "SyntheticDocument",
+    "SyntheticPassage",
+    "generate_corpus",
+    "load_corpus",
+]
+
+# (OSIS abbreviation, display name, chapter count). Verses are drawn from 1-6,
+# which every chapter of these books contains.
+BOOKS: tuple[tuple[str, str, int], ...] = (
+    ("Gen", "Genesis", 50),
+    ("Exod", "Exodus", 40),
+    ("Isa", "Isaiah", 66),
+    ("Matt", "Matthew", 28),
+    ("John", "John", 21),
+    ("Rom", "Romans", 16),
+    ("Heb", "Hebrews", 13),
+)
+_MAX_VERSE = 6
+
+_VOCABULARY: tuple[str, ...] = (
+    "grace", "covenant", "faith", "law", "spirit", "kingdom", "mercy",
+    "righteousness", "atonement", "resurrection", "prophet", "temple",
+    "sacrifice", "wisdom", "creation", "exile", "promise", "glory", "word",
+    "shepherd", "light", "truth", "judgment", "redemption", "blessing",
+    "sabbath", "priest", "gospel", "church", "baptism", "prayer", "hope",
+    "love", "sin", "forgiveness", "israel", "nations", "servant", "king",
+    "messiah", "discipleship", "witness", "apostle", "epistle", "parable",
+)
+_AUTHORS: tuple[str, ...] = (
+    "Augustine", "Calvin", "Luther", "Wesley", "Barth", "Wright", "Stott",
+    "Bruce", "Carson", "Keener",
+)
+_SOURCE_TYPES: tuple[str, ...] = ("txt", "markdown", "pdf", "youtube")
+
+
+@dataclass(slots=True, frozen=True)
+class CorpusSpec:
+    """Size and shape of the generated corpus."""
+
+    documents: int = 200
+    passages_per_document: int = 20
+    words_per_passage: int = 120
+    hot_references: int = 12
+    hot_reference_share: float = 0.35
+    collection: str = "bench-user"
+    seed: int = 1729
+
+
+@dataclass(slots=True)
+class SyntheticPassage:
+    id: str
+    text: str
+    osis_ref: str
+    page_no: int
+    start_char: int
+    end_char: int
+
+
+@dataclass(slots=True)
+class SyntheticDocument:
+    id: str
+    title: str
+    collection: str
+    authors: list[str]
+    source_type: str
+    topics: list[str]
+    sha256: str
+    passages: list[SyntheticPassage] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(passage.text for passage in self.passages)
+
+
+@dataclass(slots=True)
+class SyntheticCorpus:
+    spec: CorpusSpec
+    documents: list[SyntheticDocument]
+    hot_references: list[str]
+
+    @property
+    def passage_count(self) -> int:
+        return sum(len(document.passages) for document in self.documents)
+
+    def query_terms(self, count: int, *, seed: int | None = None) -> list[str]:
+        """Return *count* two-word queries drawn from the corpus vocabulary."""
+
+        rng = random.Random(self.spec.seed if seed is None else seed)
+        return [" ".join(rng.sample(_VOCABULARY, 2)) for _ in range(count)]
+
+
+def _random_reference(rng: random.Random) -> str:
+    book, _name, chapters = rng.choice(BOOKS)
+    chapter = rng.randint(1, chapters)
+    verse = rng.randint(1, _MAX_VERSE - 2)
+    if rng.random() < 0.25:
+        end = verse + rng.randint(1, 2)
+        return f"{book}.{chapter}.{verse}-{book}.{chapter}.{end}"
+    return f"{book}.{chapter}.{verse}"
+
+
+def _human_reference(osis: str) -> str:
+    """Render ``John.3.16`` (or a range) as ``John 3:16`` for passage text."""
+
+    names = {book: name for book, name, _chapters in BOOKS}
+    start, _, end = osis.partition("-")
+    book, chapter, verse = start.split(".")
+    rendered = f"{names[book]} {chapter}:{verse}"
+    if end:
+        rendered += f"-{end.split('.')[-1]}"
+    return rendered
+
+
+def _passage_text(rng: random.Random, words: int, osis: str) -> str:
+    body = rng.choices(_VOCABULARY, k=words)
+    body[0] = body[0].capitalize()
+    anchor = rng.randint(0, words - 1)
+    body.insert(anchor, f"({_human_reference(osis)})")
+    return " ".join(body) + "."
+
+
+def generate_corpus(spec: CorpusSpec | None = None) -> SyntheticCorpus:
+    """Generate the corpus described by *spec* without touching a database."""
+
+    spec = spec or CorpusSpec()
+    rng = random.Random(spec.seed)
+    hot = [_random_reference(rng) for _ in range(spec.hot_references)]
+
+    documents: list[SyntheticDocument] = []
+    for doc_index in range(spec.documents):
+        document_id = f"bench-doc-{doc_index:05d}"
+        document = SyntheticDocument(
+            id=document_id,
+            title=f"{rng.choice(_VOCABULARY).title()} study {doc_index}",
+            collection=spec.collection,
+            authors=rng.sample(_AUTHORS, rng.randint(1, 2)),
+            source_type=rng.choice(_SOURCE_TYPES),
+            topics=rng.sample(_VOCABULARY, 3),
+            sha256=sha256(f"{spec.seed}:{document_id}".encode()).hexdigest(),
+        )
+        offset = 0
+        for passage_index in range(spec.passages_per_document):
+            if hot and rng.random() < spec.hot_reference_share:
+                osis = rng.choice(hot)
+            else:
+                osis = _random_reference(rng)
+            text = _passage_text(rng, spec.words_per_passage, osis)
+            document.passages.append(
+                SyntheticPassage(
+                    id=f"{document_id}-p{passage_index:04d}",
+                    text=text,
+                    osis_ref=osis,
+                    page_no=passage_index // 4 + 1,
+                    start_char=offset,
+                    end_char=offset + len(text),
+                )
+            )
+            offset += len(text) + 2
+        documents.append(document)
+
+    return SyntheticCorpus(spec=spec, documents=documents, hot_references=hot)
+
+
+def load_corpus(
+    session: Session,
+    corpus: SyntheticCorpus,
+    *,
+    dimension: int,
+    batch_size: int = 500,
+) -> None:
+    """Insert *corpus* into *session* with fallback-embedder vectors.
+
+    Rows are written directly rather than through the ingest pipeline so that
+    seeding a large corpus stays cheap; ``persist_text_document`` is measured
+    separately by the benchmarks.
+    """
+
+    embedder = _FallbackEmbedder(dimension)
+    pending = 0
+    for synthetic in corpus.documents:
+        session.add(
+            Document(
+                id=synthetic.id,
+                title=synthetic.title,
+                collection=synthetic.collection,
+                authors=synthetic.authors,
+                source_type=synthetic.source_type,
+                topics=synthetic.topics,
+                sha256=synthetic.sha256,
+            )
+        )
+        vectors = embedder.encode([passage.text for passage in synthetic.passages])
+        for passage, vector in zip(synthetic.passages, vectors):
+            verse_ids, start_id, end_id = canonical_verse_range([passage.osis_ref])
+            row = Passage(
+                id=passage.id,
+                document_id=synthetic.id,
+                text=passage.text,
+                raw_text=passage.text,
+                tokens=len(passage.text.split()),
+                page_no=passage.page_no,
+                start_char=passage.start_char,
+                end_char=passage.end_char,
+                osis_ref=passage.osis_ref,
+                osis_verse_ids=verse_ids,
+                osis_start_verse_id=start_id,
+                osis_end_verse_id=end_id,
+                meta={"osis_refs_all": [passage.osis_ref]},
+            )
+            row.embedding = vector
+            session.add(row)
+            for verse_id in verse_ids or ():
+                session.add(PassageVerse(passage_id=passage.id, verse_id=verse_id))
+            pending += 1
+        if pending >= batch_size:
+            session.flush()
+            pending = 0
+    session.commit()
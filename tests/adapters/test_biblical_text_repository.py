@@ -0,0 +1,141 @@
+"""Tests for the columnar JSONL biblical text repository."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from theo.adapters.biblical_text_repository import ColumnarBiblicalTextRepository
+from theo.domain.biblical_texts import Reference, TheologicalTermTracker
+
+
+def _verse(book_id: str, chapter: int, verse: int, morphology: list[dict]) -> dict:
+    osis = f"{book_id.title()}.{chapter}.{verse}"
+    return {
+        "reference": {
+            "book": book_id.title(),
+            "chapter": chapter,
+            "verse": verse,
+            "book_id": book_id,
+            "osis_id": osis,
+        },
+        "language": "hebrew",
+        "text": {"raw": " ".join(tag["word"] for tag in morphology)},
+        "morphology": morphology,
+    }
+
+
+def _write_version(root: Path, abbreviation: str, verses: list[dict]) -> None:
+    directory = root / abbreviation.lower()
+    directory.mkdir(parents=True)
+    (directory / "manifest.yaml").write_text(
+        f'name: "{abbreviation} test"\nabbreviation: "{abbreviation}"\n'
+        'language: "hebrew"\nbooks:\n  - id: "gen"\n    name: "Genesis"\n'
+        "    chapters: 50\n",
+        encoding="utf-8",
+    )
+    with (directory / "part.jsonl").open("w", encoding="utf-8") as handle:
+        for verse in verses:
+            handle.write(json.dumps(verse, ensure_ascii=False) + "\n")
+        handle.write("{not json}\n")
+
+
+ELOHIM = {
+    "word": "אֱלֹהִים",
+    "lemma": "אלהים",
+    "root": "אלה",
+    "pos": "noun",
+    "number": "plural",
+}
+BARA = {
+    "word": "בָּרָא",
+    "lemma": "ברא",
+    "root": "ברא",
+    "pos": "verb",
+    "stem": "qal",
+    "number": "singular",
+    "person": 3,
+}
+WAYYOMER = {
+    "word": "וַיֹּאמֶר",
+    "lemma": "אמר",
+    "root": "אמר",
+    "pos": "verb",
+    "number": "singular",
+    "person": 3,
+}
+OR = {"word": "אוֹר", "lemma": "אור", "root": "אור", "pos": "noun"}
+
+
+@pytest.fixture()
+def repository(tmp_path: Path) -> ColumnarBiblicalTextRepository:
+    _write_version(
+        tmp_path,
+        "WLC",
+        [
+            _verse("gen", 1, 1, [BARA, ELOHIM]),
+            _verse("gen", 1, 3, [WAYYOMER, ELOHIM, OR]),
+            _verse("exo", 1, 1, [OR]),
+        ],
+    )
+    _write_version(tmp_path, "ALT", [_verse("gen", 1, 1, [ELOHIM])])
+    return ColumnarBiblicalTextRepository(tmp_path)
+
+
+def _osis(verses) -> list[str]:
+    return [verse.reference.osis_id for verse in verses]
+
+
+def test_word_lemma_and_root_lookups_ignore_vowel_points(repository) -> None:
+    assert repository.abbreviations == ["ALT", "WLC"]
+    assert _osis(repository.search_by_word("אלהים")) == ["Gen.1.1", "Gen.1.3"]
+    assert _osis(repository.search_by_word("אֱלֹהִים", lemma=True)) == [
+        "Gen.1.1",
+        "Gen.1.3",
+    ]
+    assert _osis(repository.search_by_word("אור", books=["EXO"])) == ["Exo.1.1"]
+    assert _osis(repository.search_by_root("ברא")) == ["Gen.1.1"]
+    assert repository.search_by_word("unknown") == []
+    assert repository.search_by_word("אלהים", version="LXX") == []
+
+
+def test_terms_require_every_word_and_parallel_verses_span_versions(
+    repository,
+) -> None:
+    terms = repository.search_theological_terms(["אמר אלהים", "אור", "ברא אור"])
+    assert {term: _osis(verses) for term, verses in terms.items()} == {
+        "אמר אלהים": ["Gen.1.3"],
+        "אור": ["Gen.1.3", "Exo.1.1"],
+        "ברא אור": [],
+    }
+
+    reference = Reference("Genesis", 1, 1, "gen", "Gen.1.1")
+    parallel = repository.get_parallel_verses(reference, ["WLC", "ALT", "LXX"])
+    assert sorted(parallel) == ["ALT", "WLC"]
+    assert repository.get_verse(reference).morphology[0].lemma == "ברא"
+
+
+def test_version_and_elohim_query_match_domain_tracker(repository) -> None:
+    version = repository.get_version("wlc")
+    assert version is not None
+    assert version.name == "WLC test"
+    assert version.books["gen"].chapter_count == 50
+    assert version.books["gen"].get_verse(1, 3) is not None
+
+    expected = _osis(TheologicalTermTracker.find_elohim_singular_verbs(version))
+    assert _osis(repository.find_elohim_singular_verbs()) == expected
+    assert expected == ["Gen.1.1", "Gen.1.3"]
+
+    corpus = repository.corpus("WLC")
+    assert corpus.token_verses(stem="qal", person=3).tolist() == [0]
+
+
+def test_bundled_hebrew_sample_loads() -> None:
+    repository = ColumnarBiblicalTextRepository()
+
+    verses = repository.search_by_root("ארץ")
+
+    assert "Gen.1.1" in _osis(verses)
+    assert verses[0].semantic_analysis is not None
@@ -0,0 +1,80 @@
+"""Unit tests for the shared single-pass reasoning text analysis."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from theo.infrastructure.api.app.ai.reasoning import fallacies, metacognition
+from theo.infrastructure.api.app.ai.reasoning.text_analysis import (
+    KeywordTable,
+    analyse_text,
+)
+
+TABLE = KeywordTable.build(
+    {"negation": {"not", "no"}, "marker": {"harmony", "harmonious"}}
+)
+
+
+class TestAnalyseText:
+    def test_collects_vocabulary_sentences_and_keyword_hits(self):
+        analysis = analyse_text("Harmony abounds. It is not harmonious!  ", TABLE)
+
+        assert analysis.sentence_starts == [0, 16]
+        assert [word for _pos, word in analysis.positions("marker")] == [
+            "harmony",
+            "harmonious",
+        ]
+        assert analysis.has_any({"abounds"})
+        assert not analysis.has_digits
+
+    def test_negation_window_respects_sentence_boundaries(self):
+        analysis = analyse_text("There is no doubt. Harmony follows; not harmony.", TABLE)
+        first, second = (pos for pos, _word in analysis.positions("marker"))
+
+        assert analysis.is_negated(first)
+        assert not analysis.is_negated(first, within_sentence=True)
+        assert analysis.is_negated(second, within_sentence=True)
+
+
+class TestSharedAnalysis:
+    def test_critique_tokenises_combined_text_once(self):
+        calls: list[str] = []
+        original = metacognition.analyse_text
+
+        def _counting(text, table):
+            calls.append(text)
+            return original(text, table)
+
+        with patch.object(metacognition, "analyse_text", _counting), patch.object(
+            fallacies, "analyse_text", _counting
+        ):
+            metacognition.critique_reasoning(
+                "Either grace or works, there is no other way.",
+                "It is clearly harmonious and consistent.",
+                [],
+            )
+
+        assert len(calls) == 1
+
+    def test_fallacy_rules_without_anchor_words_are_skipped(self):
+        detector = fallacies.FallacyDetector()
+        invoked: list[str] = []
+        for index, rule in enumerate(detector.rules):
+            original = rule.detector
+
+            def _tracking(text, *, _name=rule.fallacy_type, _fn=original):
+                invoked.append(_name)
+                return _fn(text)
+
+            detector.rules[index] = fallacies.FallacyRule(
+                rule.fallacy_type,
+                rule.severity,
+                rule.description,
+                detector=_tracking,
+                requires=rule.requires,
+            )
+
+        warnings = detector.detect("Either grace or works; there is no other option.")
+
+        assert invoked == ["false_dichotomy"]
+        assert [warning.fallacy_type for warning in warnings] == ["false_dichotomy"]
@@ -0,0 +1,205 @@
+"""Tests for the two-tier guardrailed answer cache."""
+
+from __future__ import annotations
+
+import zlib
+
+import pytest
+
+from theo.infrastructure.api.app.ai.rag import cache as rag_cache
+from theo.infrastructure.api.app.ai.rag.cache import RAGCache
+from theo.infrastructure.api.app.ai.rag.models import RAGAnswer
+
+
+class _FakeRedisClient:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.available = True
+
+    def _check(self) -> None:
+        if not self.available:
+            raise ConnectionError("redis is down")
+
+    def get(self, key: str) -> bytes | None:
+        self._check()
+        return self.data.get(key)
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self._check()
+        self.data[key] = value
+        return True
+
+    def delete(self, key: str) -> int:
+        self._check()
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class _FakeRedisModule:
+    def __init__(self, client: _FakeRedisClient) -> None:
+        self.Redis = self
+        self._client = client
+
+    def from_url(self, url: str, **_: object) -> _FakeRedisClient:
+        return self._client
+
+
+class _KeywordEmbedder:
+    """Embeds questions as bag-of-words vectors over a tiny vocabulary."""
+
+    _VOCAB = ("grace", "faith", "works", "law", "romans", "explain", "what")
+
+    def embed_query(self, prompt: str) -> list[float]:
+        words = prompt.split()
+        return [float(words.count(term)) for term in self._VOCAB]
+
+
+@pytest.fixture()
+def redis_client() -> _FakeRedisClient:
+    return _FakeRedisClient()
+
+
+def _cache(redis_client: _FakeRedisClient, **kwargs) -> RAGCache:
+    kwargs.setdefault("ttl_seconds", 60)
+    kwargs.setdefault("local_max_entries", 8)
+    kwargs.setdefault("local_max_bytes", 1_000_000)
+    return RAGCache(redis_module=_FakeRedisModule(redis_client), **kwargs)
+
+
+def _answer(text: str = "Grace abounds [1].") -> RAGAnswer:
+    return RAGAnswer(summary=text, citations=[], model_name="m", model_output=text)
+
+
+def test_shared_tier_is_compressed_and_promoted_to_local(redis_client) -> None:
+    cache = _cache(redis_client)
+    cache.store("rag:v:u:m:d:p1", answer=_answer(), validation={"status": "passed"})
+
+    stored = redis_client.data["rag:v:u:m:d:p1"]
+    assert stored.startswith((b"zs:", b"zl:"))
+
+    # A second worker only has the shared tier to go on.
+    other = _cache(redis_client)
+    payload = other.load("rag:v:u:m:d:p1")
+    assert payload is not None and payload["validation"] == {"status": "passed"}
+    assert other.load("rag:v:u:m:d:p1") is not None
+
+    stats = other.stats()
+    assert (stats["shared"].hits, stats["local"].hits) == (1, 1)
+    assert stats["local"].misses == 1
+
+
+def test_local_tier_serves_while_redis_is_down(redis_client) -> None:
+    cache = _cache(redis_client)
+    cache.store("rag:v:u:m:d:p1", answer=_answer(), validation=None)
+    redis_client.available = False
+
+    assert cache.load("rag:v:u:m:d:p1") is not None
+    assert cache.load("rag:v:u:m:d:other") is None
+    assert cache.stats()["shared"].misses == 1
+
+
+def test_plain_json_entries_are_still_readable(redis_client) -> None:
+    redis_client.data["legacy"] = b'{"answer": {"summary": "old"}}'
+    redis_client.data["broken"] = b"zl:" + zlib.compress(b"[1, 2]")
+
+    cache = _cache(redis_client)
+    assert cache.load("legacy") == {"answer": {"summary": "old"}}
+    assert cache.load("broken") is None
+
+
+def test_local_tier_evicts_least_recently_used_and_expires(redis_client) -> None:
+    now = [0.0]
+    cache = _cache(redis_client, local_max_entries=2, clock=lambda: now[0])
+    for key in ("a", "b", "c"):
+        cache.store(key, answer=_answer(), validation=None)
+    redis_client.available = False
+
+    assert cache.load("a") is None
+    assert cache.load("c") is not None
+    assert cache.stats()["local"].evictions == 1
+
+    now[0] = 61.0
+    assert cache.load("c") is None
+
+
+def test_changed_document_version_marks_entry_stale(redis_client) -> None:
+    cache = _cache(redis_client)
+    cache.store(
+        "rag:v:u:m:d:p1",
+        answer=_answer(),
+        validation=None,
+        doc_versions={"doc-1": "2024-01-01T00:00:00"},
+    )
+
+    assert cache.load(
+        "rag:v:u:m:d:p1", doc_versions={"doc-1": "2024-01-01T00:00:00"}
+    )
+    assert (
+        cache.load("rag:v:u:m:d:p1", doc_versions={"doc-1": "2024-02-01T00:00:00"})
+        is None
+    )
+    assert "rag:v:u:m:d:p1" not in redis_client.data
+    assert cache.stats()["local"].stale == 1
+
+
+def test_semantic_lookup_requires_similar_question_and_same_passages(
+    redis_client,
+) -> None:
+    cache = _cache(
+        redis_client, semantic_threshold=0.9, embedder=_KeywordEmbedder()
+    )
+    cache.store(
+        "rag:v:u:m:digest:prompt-a",
+        answer=_answer(),
+        validation=None,
+        question="Explain grace and faith in Romans",
+        passage_ids=["p1", "p2"],
+    )
+
+    reused = cache.load(
+        "rag:v:u:m:digest:prompt-b",
+        question="explain GRACE and faith, in Romans?",
+        passage_ids=["p2", "p1"],
+    )
+    assert reused is not None and reused["answer"]["summary"] == "Grace abounds [1]."
+
+    assert (
+        cache.load(
+            "rag:v:u:m:digest:prompt-c",
+            question="What about works of the law?",
+            passage_ids=["p1", "p2"],
+        )
+        is None
+    )
+    assert (
+        cache.load(
+            "rag:v:u:m:digest:prompt-d",
+            question="Explain grace and faith in Romans",
+            passage_ids=["p1", "p3"],
+        )
+        is None
+    )
+    assert (
+        cache.load(
+            "rag:v:other-user:m:digest:prompt-e",
+            question="Explain grace and faith in Romans",
+            passage_ids=["p1", "p2"],
+        )
+        is None
+    )
+    stats = cache.stats()["semantic"]
+    assert (stats.hits, stats.misses) == (1, 3)
+
+
+def test_document_version_stamps_reads_updated_at() -> None:
+    class _Result:
+        def all(self):
+            return [("doc-1", None)]
+
+    class _Session:
+        def execute(self, statement):
+            return _Result()
+
+    assert rag_cache.document_version_stamps(_Session(), [None, "doc-1"]) == {
+        "doc-1": ""
+    }
+    assert rag_cache.document_version_stamps(_Session(), []) == {}
@@ -117,7 +117,7 @@ def test_guarded_pipeline_compose_builds_prompt_and_records_metrics(
     monkeypatch.setattr(rag_chat, "build_retrieval_digest", lambda ordered: "digest-hash")
     monkeypatch.setattr(rag_chat, "build_cache_key", lambda **_: "cache-key")
     monkeypatch.setattr(rag_chat, "extract_cache_key_suffix", lambda key: "key-suffix")
-    monkeypatch.setattr(rag_chat, "load_cached_answer", lambda cache_key, cache=None: None)
+    monkeypatch.setattr(rag_chat, "load_cached_answer", lambda cache_key, cache=None, **_: None)
 
     validation_events: list[tuple[str, dict[str, Any]]] = []
     monkeypatch.setattr(
@@ -140,7 +140,7 @@ def test_guarded_pipeline_compose_builds_prompt_and_records_metrics(
     monkeypatch.setattr(
         rag_chat,
         "store_cached_answer",
-        lambda cache_key, *, answer, validation, cache=None: stored_payloads.append(
+        lambda cache_key, *, answer, validation, cache=None, **_: stored_payloads.append(
             {"key": cache_key, "answer": answer, "validation": validation}
         ),
     )
@@ -249,7 +249,7 @@ def test_guarded_pipeline_uses_cached_answer_for_performance(
     monkeypatch.setattr(
         rag_chat,
         "load_cached_answer",
-        lambda cache_key, cache=None: {
+        lambda cache_key, cache=None, **_: {
             "answer": cached_answer.model_dump(mode="json"),
             "model_name": cached_answer.model_name,
         },
@@ -320,7 +320,7 @@ def test_guarded_pipeline_raises_generation_error_when_all_models_fail(
     monkeypatch.setattr(rag_chat, "build_retrieval_digest", lambda ordered: "digest-hash")
     monkeypatch.setattr(rag_chat, "build_cache_key", lambda **_: "cache-key")
     monkeypatch.setattr(rag_chat, "extract_cache_key_suffix", lambda key: "suffix")
-    monkeypatch.setattr(rag_chat, "load_cached_answer", lambda cache_key, cache=None: None)
+    monkeypatch.setattr(rag_chat, "load_cached_answer", lambda cache_key, cache=None, **_: None)
     monkeypatch.setattr(rag_chat, "validate_model_completion", lambda completion, citations: {"status": "passed"})
     monkeypatch.setattr(rag_chat, "ensure_completion_safe", lambda completion: None)
     monkeypatch.setattr(rag_chat, "record_generation_result", lambda *args, **kwargs: None)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import contextlib
+import importlib.util
 import os
 import shutil
 import sys
@@ -41,7 +42,9 @@ sys.modules.setdefault("FlagEmbedding", flag_module)
 def _register_pypdf_stub() -> None:
     """Provide a lightweight :mod:`pypdf` substitute for test environments."""
 
-    if "pypdf" in sys.modules:
+    # The PDF ingest tests exercise the real parser whenever it is installed;
+    # it is no longer guaranteed to be imported before this conftest runs.
+    if "pypdf" in sys.modules or importlib.util.find_spec("pypdf") is not None:
         return
 
     pypdf_module = types.ModuleType("pypdf")
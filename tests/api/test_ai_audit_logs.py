@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import sqlite3
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import delete, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, delete, event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from theo.adapters.persistence.models import AuditLog
 from theo.application.facades.database import get_session
+from theo.infrastructure.api.app.ai import audit_logging
 from theo.infrastructure.api.app.ai.audit_logging import (
+    AuditLogBatcher,
+    AuditLogSpool,
     AuditLogWriter,
     fetch_recent_audit_logs,
+    flush_audit_logs,
     purge_audit_logs,
+    replay_audit_spool,
 )
 from theo.infrastructure.api.app.ai.rag import GuardrailError, RAGAnswer, RAGCitation
 from theo.infrastructure.api.app.main import app
@@ -147,6 +156,7 @@ def test_chat_audit_log_persists_when_persistence_fails(
 
     response = client.post("/ai/chat", json=_chat_payload("Tell me about hope"))
     assert response.status_code == 500
+    assert flush_audit_logs()
 
     with SessionLocal() as session:
         records = list(session.execute(select(AuditLog)).scalars())
@@ -208,6 +218,7 @@ def test_audit_log_reporting_and_cleanup(audit_sessionmaker: sessionmaker) -> No
             model_preset="gamma",
             inputs={"topic": "three"},
         )
+    assert flush_audit_logs()
 
     with SessionLocal() as session:
         recent = fetch_recent_audit_logs(session, limit=5)
@@ -248,6 +259,7 @@ def test_audit_log_claim_cards_and_metadata(audit_sessionmaker: sessionmaker) ->
             claim_cards=[claim_card],
             audit_metadata=metadata.model_dump(exclude_none=True),
         )
+    assert flush_audit_logs()
 
     with SessionLocal() as session:
         record = session.execute(select(AuditLog)).scalar_one()
@@ -255,3 +267,139 @@ def test_audit_log_claim_cards_and_metadata(audit_sessionmaker: sessionmaker) ->
         assert record.claim_cards[0]["claim_id"] == "c1"
         assert record.audit_metadata is not None
         assert record.audit_metadata["mode"] == "Audit-Local"
+
+
+def _audit_engine(path) -> Engine:
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"timeout": 0.05}, poolclass=NullPool
+    )
+    AuditLog.__table__.create(engine)
+    return engine
+
+
+def _row(index: int) -> dict[str, object]:
+    return {
+        "workflow": "chat",
+        "status": "generated",
+        "prompt_hash": f"hash-{index}",
+        "model_preset": None,
+        "inputs": {"question": index},
+        "created_at": datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=index),
+    }
+
+
+def test_batcher_writes_multi_row_inserts(tmp_path) -> None:
+    engine = _audit_engine(tmp_path / "audit.db")
+    statements: list[tuple[str, bool]] = []
+
+    def _record(_conn, _cursor, statement, _params, _context, executemany) -> None:
+        if statement.startswith("INSERT INTO audit_logs"):
+            statements.append((statement, executemany))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    batcher = AuditLogBatcher(batch_size=3, flush_interval=30.0)
+    try:
+        for index in range(3):
+            batcher.submit(engine, _row(index))
+        assert batcher.flush()
+    finally:
+        batcher.close()
+
+    assert len(statements) == 1 and statements[0][1] is True
+    stats = batcher.stats()
+    assert (stats.enqueued, stats.written, stats.flushes) == (3, 3, 1)
+    assert stats.last_flush_seconds is not None
+    with engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(AuditLog)).scalar() == 3
+
+
+def test_locked_database_spills_to_spool_and_replays(tmp_path) -> None:
+    engine = _audit_engine(tmp_path / "audit.db")
+    spool = AuditLogSpool(tmp_path / "spool.jsonl")
+    batcher = AuditLogBatcher(flush_interval=0.01, spool=spool)
+    blocker = sqlite3.connect(tmp_path / "audit.db")
+    try:
+        blocker.execute("BEGIN EXCLUSIVE")
+        batcher.submit(engine, _row(1))
+        batcher.submit(engine, _row(2))
+        assert batcher.flush()
+    finally:
+        blocker.rollback()
+        blocker.close()
+        batcher.close()
+
+    assert batcher.stats().spooled == 2
+    assert batcher.stats().written == 0
+    # A torn line left by a crash mid-append is skipped on replay.
+    with spool.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"workflow": "chat", "prompt')
+
+    settings = SimpleNamespace(audit_log_spool_path=spool.path, storage_root=tmp_path)
+    assert replay_audit_spool(engine, settings=settings) == 2
+    assert not spool.path.exists()
+    with Session(engine) as session:
+        rows = session.scalars(select(AuditLog).order_by(AuditLog.prompt_hash)).all()
+    assert [row.prompt_hash for row in rows] == ["hash-1", "hash-2"]
+    assert rows[0].created_at.replace(tzinfo=UTC) == _row(1)["created_at"]
+
+
+def test_full_queue_spills_or_drops(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = _audit_engine(tmp_path / "audit.db")
+    spool = AuditLogSpool(tmp_path / "spool.jsonl")
+    spooling = AuditLogBatcher(max_queue=1, spool=spool)
+    dropping = AuditLogBatcher(max_queue=1)
+    for batcher in (spooling, dropping):
+        # Keep the writer idle so the queue stays full.
+        monkeypatch.setattr(batcher, "_ensure_thread", lambda: None)
+        batcher.submit(engine, _row(1))
+        batcher.submit(engine, _row(2))
+
+    assert spooling.stats().queue_depth == 1
+    assert (spooling.stats().spooled, spooling.stats().dropped) == (1, 0)
+    assert (dropping.stats().spooled, dropping.stats().dropped) == (0, 1)
+    assert len(spool.take()) == 1
+
+
+def test_spool_claims_are_per_process_and_adopt_dead_owners(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(audit_logging, "_process_alive", lambda pid: pid == 4242)
+    spool = AuditLogSpool(tmp_path / "spool.jsonl")
+    assert spool.append([_row(1)])
+    orphan = tmp_path / "spool.jsonl.4343-deadbeef.replaying"
+    orphan.write_text(audit_logging._spool_line(_row(2)) + "\n", encoding="utf-8")
+    # A claim still held by a live process is left for that process to finish.
+    busy = tmp_path / "spool.jsonl.4242-cafebabe.replaying"
+    busy.write_text(audit_logging._spool_line(_row(3)) + "\n", encoding="utf-8")
+
+    rows = spool.take()
+
+    assert sorted(row["prompt_hash"] for row in rows) == ["hash-1", "hash-2"]
+    assert not spool.path.exists() and not orphan.exists()
+    assert busy.exists()
+    assert spool.take() == []
+
+
+def test_synchronous_mode_commits_before_returning(
+    audit_sessionmaker: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("synchronous entries must not be queued")
+
+    monkeypatch.setattr(audit_logging, "get_audit_log_batcher", _unexpected)
+
+    with audit_sessionmaker() as session:
+        AuditLogWriter.from_session(session).log(
+            workflow="chat",
+            prompt_hash="per-call",
+            model_preset=None,
+            inputs={},
+            synchronous=True,
+        )
+        AuditLogWriter.from_session(session, synchronous=True).log(
+            workflow="export", prompt_hash="per-writer", model_preset=None, inputs={}
+        )
+
+    with audit_sessionmaker() as session:
+        hashes = set(session.scalars(select(AuditLog.prompt_hash)))
+    assert hashes == {"per-call", "per-writer"}
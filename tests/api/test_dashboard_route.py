@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from theo.adapters.persistence import models
 from theo.application.facades.database import get_session
 from theo.infrastructure.api.app.main import app
+from theo.infrastructure.api.app.routes import dashboard as dashboard_module
 
 
 def _override_session_factory(engine):
@@ -80,6 +81,26 @@ def test_dashboard_handles_empty_dataset(api_engine) -> None:
         app.dependency_overrides.pop(get_session, None)
 
 
+def test_dashboard_rollups_match_live_counts(api_engine, monkeypatch) -> None:
+    session_factory, override = _override_session_factory(api_engine)
+    app.dependency_overrides[get_session] = override
+
+    try:
+        with session_factory() as session:
+            _seed_dashboard_records(session, datetime.now(UTC))
+
+        with TestClient(app) as client:
+            from_rollups = client.get("/dashboard").json()["metrics"]
+            monkeypatch.setattr(
+                dashboard_module, "dashboard_counters_ready", lambda _session: False
+            )
+            from_tables = client.get("/dashboard").json()["metrics"]
+
+        assert from_rollups == from_tables
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+
 def _seed_dashboard_records(session: Session, now: datetime) -> None:
     one_day_ago = now - timedelta(days=1)
     two_days_ago = now - timedelta(days=2)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, DocumentAnnotation, Passage
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.graphql.loaders import GraphQLLoaders
+from theo.infrastructure.api.app.graphql.schema import schema
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'graphql.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for doc_index in range(3):
+            document_id = f"doc-{doc_index}"
+            session.add(Document(id=document_id, title=f"Document {doc_index}"))
+            for passage_index in range(4):
+                session.add(
+                    Passage(
+                        id=f"{document_id}-p{passage_index}",
+                        document_id=document_id,
+                        text=f"passage {passage_index}",
+                        osis_ref="John.3.16",
+                        start_char=passage_index * 10,
+                    )
+                )
+            session.add(
+                DocumentAnnotation(
+                    id=f"note-{doc_index}",
+                    document_id=document_id,
+                    body=f'{{"text": "note", "passage_ids": ["{document_id}-p0"]}}',
+                )
+            )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _execute(session: Session, query: str, variables: dict | None = None):
+    context = SimpleNamespace(session=session, loaders=GraphQLLoaders(session))
+    return asyncio.run(
+        schema.execute(query, variable_values=variables, context_value=context)
+    )
+
+
+def test_nested_fields_batch_into_single_queries(session: Session) -> None:
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    query = """
+    query Nested($id: ID!) {
+      passagesByDocument(documentId: $id, limit: 4) {
+        id
+        annotations { id passageIds }
+        document {
+          title
+          passages(limit: 4) { id document { id } }
+        }
+      }
+    }
+    """
+    event.listen(session.get_bind(), "before_cursor_execute", _record)
+    try:
+        result = _execute(session, query, {"id": "doc-1"})
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", _record)
+
+    assert result.errors is None, result.errors
+    passages = result.data["passagesByDocument"]
+    assert [item["id"] for item in passages] == [f"doc-1-p{i}" for i in range(4)]
+    assert passages[0]["annotations"] == [
+        {"id": "note-1", "passageIds": ["doc-1-p0"]}
+    ]
+    assert passages[1]["annotations"] == []
+    assert passages[0]["document"]["title"] == "Document 1"
+    # One statement each for passages, annotations and documents no matter how
+    # many nested objects resolve.
+    assert len(statements) == 3
+
+
+def test_query_cost_limit_rejects_fan_out(session: Session) -> None:
+    query = """
+    {
+      search(query: "passage", k: 100) {
+        passage {
+          document {
+            passages(limit: 100) { document { passages(limit: 100) { id } } }
+          }
+        }
+      }
+    }
+    """
+
+    result = _execute(session, query)
+
+    assert result.errors
+    assert "Query cost" in result.errors[0].message
+    assert result.data is None
@@ -10,6 +10,7 @@ from urllib.request import Request
 
 import pytest
 from fastapi import status
+from sqlalchemy.orm import Session
 import json
 
 from fastapi.testclient import TestClient
@@ -19,7 +20,11 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from theo.application.facades import database as database_module  # noqa: E402
-from theo.application.facades.database import configure_engine, get_session  # noqa: E402
+from theo.application.facades.database import (  # noqa: E402
+    Base,
+    configure_engine,
+    get_session,
+)
 from theo.application.facades.settings import Settings  # noqa: E402
 from theo.infrastructure.api.app.main import app  # noqa: E402
 from theo.infrastructure.api.app.routes import ingest as ingest_module  # noqa: E402
@@ -35,6 +40,7 @@ if PAYLOAD_TOO_LARGE is None:  # pragma: no cover - compatibility path
 def api_engine(tmp_path_factory: pytest.TempPathFactory):
     db_path = tmp_path_factory.mktemp("api-ingest") / "ingest.db"
     engine = configure_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
     try:
         yield engine
     finally:
@@ -46,8 +52,11 @@ def api_engine(tmp_path_factory: pytest.TempPathFactory):
 
 @pytest.fixture()
 def api_client(api_engine):
+    # File ingests look up the payload hash before parsing, so the pipeline
+    # needs a real (empty) database even when later stages are stubbed.
     def _override_session():
-        yield object()
+        with Session(api_engine) as session:
+            yield session
 
     app.dependency_overrides[get_session] = _override_session
     try:
@@ -0,0 +1,218 @@
+"""Tests for pooled and asynchronous ingest jobs."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.infra import ingest_jobs
+from theo.infrastructure.api.app.infra.ingest_jobs import (
+    IngestJobPool,
+    IngestQueueFull,
+    create_ingest_job,
+    finish_ingest_job,
+    run_ingest_job,
+)
+from theo.infrastructure.api.app.ingest.progress import report_progress
+from theo.infrastructure.api.app.persistence_models import IngestionJob
+from theo.infrastructure.api.app.routes import (
+    ingest as ingest_module,
+    jobs as jobs_module,
+)
+
+
+class _Doc:
+    id = "doc-1"
+
+
+def _staged_pipeline(_session, _path, _frontmatter=None, *, dependencies=None):
+    for stage in ("fetch", "parse"):
+        report_progress(stage, "running")
+        report_progress(stage, "completed")
+    report_progress("chunk", "completed", chunks=3)
+    report_progress("embed", "running", completed=2, total=3)
+    report_progress("embed", "completed", completed=3, total=3)
+    report_progress("persist", "completed")
+    return _Doc()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    ingest_jobs.reset_ingest_job_pool()
+    yield
+    ingest_jobs.reset_ingest_job_pool()
+
+
+def test_pool_rejects_work_beyond_workers_plus_queue() -> None:
+    pool = IngestJobPool(max_workers=1, queue_depth=1, retry_after=7)
+    release = threading.Event()
+    try:
+        running = pool.submit(release.wait)
+        queued = pool.submit(lambda: "queued")
+        with pytest.raises(IngestQueueFull) as excinfo:
+            pool.submit(lambda: "rejected")
+        assert excinfo.value.retry_after == 7
+        assert pool.in_flight == 2
+
+        release.set()
+        assert running.result(timeout=5) is True
+        assert queued.result(timeout=5) == "queued"
+        assert pool.submit(lambda: "admitted").result(timeout=5) == "admitted"
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_run_ingest_job_records_stage_progress_and_outcome(api_engine) -> None:
+    job_id = create_ingest_job(api_engine, job_type="ingest_file")
+    cleaned: list[bool] = []
+
+    document = run_ingest_job(
+        api_engine,
+        job_id,
+        lambda session: _staged_pipeline(session, None),
+        cleanup=lambda: cleaned.append(True),
+    )
+
+    assert document is not None and cleaned == [True]
+    with Session(api_engine) as session:
+        job = session.get(IngestionJob, job_id)
+        assert job.status == "completed"
+        assert job.document_id == "doc-1"
+        stages = job.payload["stages"]
+        assert list(stages) == ["fetch", "parse", "chunk", "embed", "persist"]
+        assert all(entry["status"] == "completed" for entry in stages.values())
+        assert stages["embed"]["completed"] == 3
+        assert job.payload["stage"] == "persist"
+
+    failed_id = create_ingest_job(api_engine, job_type="ingest_file")
+
+    def _explode(_session):
+        report_progress("fetch", "running")
+        raise ValueError("unreadable upload")
+
+    assert run_ingest_job(api_engine, failed_id, _explode) is None
+    with Session(api_engine) as session:
+        job = session.get(IngestionJob, failed_id)
+        assert (job.status, job.error) == ("failed", "unreadable upload")
+        assert job.payload["stages"]["fetch"]["status"] == "running"
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_prefer_respond_async_returns_job_and_streams_progress(
+    monkeypatch: pytest.MonkeyPatch, api_test_client: TestClient
+) -> None:
+    monkeypatch.setattr(ingest_module, "run_pipeline_for_file", _staged_pipeline)
+    monkeypatch.setattr(jobs_module, "_JOB_EVENT_POLL_SECONDS", 0.01)
+
+    response = api_test_client.post(
+        "/ingest/file",
+        files={"file": ("notes.md", b"# Notes", "text/markdown")},
+        headers={"Prefer": "respond-async"},
+    )
+
+    assert response.status_code == 202, response.text
+    body = response.json()
+    assert body["status"] == "queued"
+    assert response.headers["location"].endswith(f"/jobs/{body['job_id']}")
+
+    with api_test_client.stream(
+        "GET", f"/jobs/{body['job_id']}/events"
+    ) as stream:
+        assert stream.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(stream.read().decode("utf-8"))
+
+    name, final = events[-1]
+    assert name == "done"
+    assert final["status"] == "completed"
+    assert final["document_id"] == "doc-1"
+    assert final["job_type"] == "ingest_file"
+    assert final["payload"]["source"]["filename"] == "notes.md"
+    assert final["payload"]["stages"]["chunk"]["chunks"] == 3
+
+
+def test_finish_ingest_job_retries_and_never_downgrades_success(
+    monkeypatch: pytest.MonkeyPatch, api_engine
+) -> None:
+    job_id = create_ingest_job(api_engine, job_type="ingest_file")
+    original = ingest_jobs.SQLAlchemyIngestionJobRepository.update_status
+    calls: list[str] = []
+
+    def _flaky(self, job_id, **kwargs):
+        calls.append(kwargs["status"])
+        if len(calls) == 1:
+            raise OperationalError("UPDATE", {}, Exception("database is locked"))
+        return original(self, job_id, **kwargs)
+
+    monkeypatch.setattr(
+        ingest_jobs.SQLAlchemyIngestionJobRepository, "update_status", _flaky
+    )
+    monkeypatch.setattr(ingest_jobs, "_STATUS_UPDATE_BACKOFF_SECONDS", 0.0)
+
+    assert finish_ingest_job(
+        api_engine, job_id, status="completed", document_id="doc-1"
+    )
+    assert not finish_ingest_job(api_engine, job_id, status="failed", error="late")
+
+    assert calls == ["completed", "completed"]
+    with Session(api_engine) as session:
+        job = session.get(IngestionJob, job_id)
+        assert (job.status, job.document_id, job.error) == ("completed", "doc-1", None)
+
+
+def test_synchronous_ingest_runs_on_pool_and_returns_document(
+    monkeypatch: pytest.MonkeyPatch, api_test_client: TestClient
+) -> None:
+    threads: list[str] = []
+    sessions: list[Session] = []
+
+    def _pipeline(session, path, frontmatter=None, *, dependencies=None):
+        threads.append(threading.current_thread().name)
+        sessions.append(session)
+        return _Doc()
+
+    monkeypatch.setattr(ingest_module, "run_pipeline_for_file", _pipeline)
+
+    response = api_test_client.post(
+        "/ingest/file", files={"file": ("notes.md", b"# Notes", "text/markdown")}
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"document_id": "doc-1", "status": "processed"}
+    assert threads and threads[0].startswith("theo-ingest")
+    # The pipeline gets a session opened on the pool thread, not the
+    # request-scoped one from ``get_session``.
+    assert type(sessions[0]).__name__ == "Session"
+
+
+def test_saturated_queue_returns_429_with_retry_after(
+    monkeypatch: pytest.MonkeyPatch, api_test_client: TestClient
+) -> None:
+    pool = IngestJobPool(max_workers=1, queue_depth=0, retry_after=11)
+    release = threading.Event()
+    pool.submit(release.wait)
+    monkeypatch.setattr(ingest_module, "get_ingest_job_pool", lambda _settings: pool)
+    try:
+        for headers in ({}, {"Prefer": "respond-async"}):
+            response = api_test_client.post(
+                "/ingest/url",
+                json={"url": "https://example.com/sermon"},
+                headers=headers,
+            )
+            assert response.status_code == 429
+            assert response.headers["retry-after"] == "11"
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,95 @@
+"""Per-route query budgets enforced through the query instrumentation."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from theo.adapters.persistence import models
+from theo.application.facades.database import get_session
+from theo.application.facades.settings import get_settings
+from theo.infrastructure.api.app.bootstrap.middleware import (
+    QUERY_COUNT_HEADER_NAME,
+    QUERY_TIME_HEADER_NAME,
+)
+from theo.infrastructure.api.app.db.query_instrumentation import (
+    InstrumentationConfig,
+    get_instrumentation_config,
+    get_slow_query_log,
+    install_query_instrumentation,
+    query_budget,
+)
+from theo.infrastructure.api.app.main import app
+
+# Statements each route may issue against a small seeded corpus. Raise a
+# budget only together with the change that needs it.
+ROUTE_BUDGETS = {
+    "/dashboard": 8,
+    "/search?q=grace": 7,
+    "/documents/doc-1/passages": 4,
+}
+
+
+@pytest.fixture()
+def client(api_engine):
+    factory = sessionmaker(bind=api_engine)
+
+    def _override():
+        with factory() as session:
+            yield session
+
+    with factory() as session:
+        session.add(models.Document(id="doc-1", title="Ephesians"))
+        session.add_all(
+            models.Passage(
+                id=f"passage-{index}",
+                document_id="doc-1",
+                text=f"By grace are ye saved through faith {index}",
+                osis_ref=f"Eph.2.{index + 1}",
+            )
+            for index in range(8)
+        )
+        session.commit()
+
+    app.dependency_overrides[get_session] = _override
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.mark.parametrize("path", sorted(ROUTE_BUDGETS))
+def test_route_stays_within_query_budget(client, path) -> None:
+    with query_budget(ROUTE_BUDGETS[path], max_repeats=3, label=path) as stats:
+        response = client.get(path)
+
+    assert response.status_code == 200
+    assert 0 < stats.count == int(response.headers[QUERY_COUNT_HEADER_NAME])
+    assert float(response.headers[QUERY_TIME_HEADER_NAME]) >= 0.0
+
+
+def test_admin_endpoint_lists_slow_queries_with_plans(client) -> None:
+    previous = get_instrumentation_config()
+    install_query_instrumentation(
+        config=InstrumentationConfig(slow_query_ms=1e-6, explain_interval_seconds=0)
+    )
+    try:
+        client.get("/documents/doc-1/passages")
+        response = client.get("/admin/db/slow-queries", params={"limit": 5})
+    finally:
+        install_query_instrumentation(config=previous)
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["slow_query_ms"] == pytest.approx(1e-6)
+    assert payload["request_query_budget"] == get_settings().db_request_query_budget
+    assert 0 < len(payload["entries"]) <= 5
+    explained = [entry for entry in payload["entries"] if entry["plan"]]
+    assert explained
+    assert explained[0]["dialect"] == "sqlite"
+    assert explained[0]["label"] == "GET /documents/doc-1/passages"
+
+    assert client.delete("/admin/db/slow-queries").status_code == 204
+    assert get_slow_query_log().snapshot() == []
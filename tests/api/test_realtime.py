@@ -253,3 +253,156 @@ def test_realtime_poll_denies_forbidden_access(
     )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.allow_sleep
+async def test_sqlite_backend_fans_out_and_shares_versions_across_brokers(
+    tmp_path,
+) -> None:
+    from theo.infrastructure.api.app.infra.notebook_events import (
+        SQLiteNotebookEventBackend,
+    )
+
+    path = tmp_path / "events.sqlite"
+    # Two brokers with their own backend connections stand in for two workers.
+    first = NotebookEventBroker(
+        SQLiteNotebookEventBackend(path, poll_interval=0.01), coalesce_seconds=0
+    )
+    second = NotebookEventBroker(
+        SQLiteNotebookEventBackend(path, poll_interval=0.01), coalesce_seconds=0
+    )
+    local = DummyWebSocket("local")
+    remote = DummyWebSocket("remote")
+    try:
+        await first.connect("nb", local)
+        await second.connect("nb", remote)
+        await _wait_for(lambda: second._listener is not None)
+        await first.broadcast("nb", {"action": "updated"})
+        # Versions only move forward, so let the fan-out land before the
+        # remote worker publishes version 2 itself.
+        await _wait_for(lambda: len(remote.sent_messages) == 1)
+        await second.broadcast("nb", {"action": "entry.created"})
+
+        await _wait_for(lambda: len(remote.sent_messages) == 2)
+        await _wait_for(lambda: len(local.sent_messages) == 2)
+        assert [m["version"] for m in local.sent_messages] == [1, 2]
+        assert [m["version"] for m in remote.sent_messages] == [1, 2]
+        assert remote.sent_messages[0]["action"] == "updated"
+        assert await first.fetch_version("nb") == 2
+        assert second.snapshot("nb").version == 2
+    finally:
+        await first.close()
+        await second.close()
+
+
+@pytest.mark.allow_sleep
+async def test_bursts_are_coalesced_into_one_monotonic_event() -> None:
+    import asyncio
+    from datetime import UTC, datetime
+
+    broker = NotebookEventBroker(coalesce_seconds=0.02)
+    websocket = DummyWebSocket("ws")
+    await broker.connect("nb", websocket)
+
+    broker.publish("nb", {"action": "entry.created", "entry_id": "a"})
+    await asyncio.to_thread(
+        broker.publish, "nb", {"action": "entry.created", "entry_id": "b"}
+    )
+    broker.publish(
+        "nb", {"action": "entry.updated", "updated_at": datetime(2024, 1, 1, tzinfo=UTC)}
+    )
+    await _wait_for(lambda: websocket.sent_messages)
+    await asyncio.sleep(0.05)
+
+    assert len(websocket.sent_messages) == 1
+    message = websocket.sent_messages[0]
+    assert message["version"] == 1
+    assert message["coalesced"] == 3
+    assert message["action"] == "entry.updated"
+    assert message["updated_at"].startswith("2024-01-01")
+
+    # A late event older than what was delivered is dropped.
+    await broker._deliver("nb", 1, {"action": "stale"})
+    assert len(websocket.sent_messages) == 1
+
+
+async def test_started_broker_takes_thread_publishes_on_the_server_loop() -> None:
+    import asyncio
+
+    broker = NotebookEventBroker(coalesce_seconds=0)
+    await broker.start()
+    try:
+        await asyncio.to_thread(broker.publish, "nb", {"action": "entry.created"})
+        await _wait_for(lambda: broker.current_version("nb") == 1)
+        assert broker._fallback is None
+    finally:
+        await broker.close()
+
+
+@pytest.mark.allow_sleep
+def test_publish_without_server_loop_uses_a_fallback_loop() -> None:
+    import asyncio
+    import threading
+    import time
+
+    broker = NotebookEventBroker(coalesce_seconds=0)
+    broker.publish("nb", {"action": "entry.created"})
+    deadline = time.monotonic() + 2.0
+    while broker.current_version("nb") != 1:
+        assert time.monotonic() < deadline, "fallback loop never broadcast"
+        time.sleep(0.01)
+
+    assert broker._fallback is not None
+    _loop, thread = broker._fallback
+    assert thread is not threading.current_thread() and thread.is_alive()
+    asyncio.run(broker.close())
+    assert broker._fallback is None and not thread.is_alive()
+
+
+async def test_redis_backend_publishes_version_and_event_atomically() -> None:
+    from theo.infrastructure.api.app.infra.notebook_events import (
+        RedisNotebookEventBackend,
+        decode_redis_message,
+    )
+
+    class _FakeRedis:
+        def __init__(self) -> None:
+            self.values: dict[str, int] = {}
+            self.published: list[tuple[str, str]] = []
+
+        async def eval(self, _script, numkeys, *keys_and_args):
+            version_key, channel = keys_and_args[:numkeys]
+            self.values[version_key] = self.values.get(version_key, 0) + 1
+            version = self.values[version_key]
+            self.published.append((channel, f"{version}:{keys_and_args[numkeys]}"))
+            return version
+
+        async def get(self, key):
+            value = self.values.get(key)
+            return None if value is None else str(value).encode()
+
+    client = _FakeRedis()
+    backend = RedisNotebookEventBackend(client=client)
+
+    assert await backend.publish("nb", {"action": "updated"}, origin="w1") == 1
+    assert await backend.publish("nb", {"action": "deleted"}, origin="w1") == 2
+    assert await backend.current_version("nb") == 2
+    assert await backend.current_version("other") == 0
+
+    channel, message = client.published[-1]
+    assert channel == backend.channel
+    event = decode_redis_message(message.encode())
+    assert (event.notebook_id, event.version, event.origin) == ("nb", 2, "w1")
+    assert event.payload == {"action": "deleted"}
+    assert decode_redis_message(b"garbage") is None
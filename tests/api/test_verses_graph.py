@@ -15,9 +15,18 @@ from theo.adapters.persistence.models import (
     Passage,
     PassageVerse,
 )
+from theo.infrastructure.api.app.db import verse_adjacency
+from theo.infrastructure.api.app.db.verse_adjacency import rebuild_verse_adjacency
 from theo.infrastructure.api.app.ingest.osis import expand_osis_reference
 
 
+@pytest.fixture(autouse=True)
+def _adjacency_dir(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        verse_adjacency, "default_adjacency_dir", lambda: tmp_path / "adjacency"
+    )
+
+
 @pytest.fixture()
 def api_client(api_engine) -> TestClient:
     with TestClient(app) as client:
@@ -50,6 +59,8 @@ def _seed_graph_data(engine) -> None:
             text="For God so loved the world",
             osis_ref="John.3.16",
             osis_verse_ids=john_ids,
+            osis_start_verse_id=john_ids[0],
+            osis_end_verse_id=john_ids[-1],
             page_no=3,
             t_start=12.5,
             t_end=18.0,
@@ -60,6 +71,8 @@ def _seed_graph_data(engine) -> None:
             text="Study notes on John 3:16",
             osis_ref="John.3.16",
             osis_verse_ids=john_ids,
+            osis_start_verse_id=john_ids[0],
+            osis_end_verse_id=john_ids[-1],
         )
         session.add_all([passage_pdf, passage_markdown])
         session.add_all(
@@ -125,6 +138,7 @@ def _seed_graph_data(engine) -> None:
         )
         session.add_all([contradiction, harmony, commentary])
         session.commit()
+        rebuild_verse_adjacency(session)
 
 
 def test_verse_graph_endpoint_combines_mentions_and_seeds(api_client: TestClient, api_engine) -> None:
@@ -326,3 +326,55 @@ def test_service_retries_commits(passages: list[FakePassage]) -> None:
     assert session.commits == 2
     assert session.rollbacks >= 1
     assert session.closed
+
+
+def test_service_skips_unchanged_text_and_resumes_by_keyset(tmp_path) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from theo.adapters.persistence.embedding_repository import (
+        SQLAlchemyPassageEmbeddingRepository,
+    )
+    from theo.adapters.persistence.models import Document, Passage
+    from theo.application.facades.database import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'rebuild.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as setup:
+        setup.add(Document(id="doc", title="Doc"))
+        setup.add_all(
+            Passage(id=f"p{index}", document_id="doc", text=f"text {index}")
+            for index in range(1, 6)
+        )
+        setup.commit()
+
+    backend = FakeEmbeddingBackend()
+    backend.model_name = "model-a"  # type: ignore[attr-defined]
+    service = EmbeddingRebuildService(
+        session_factory=lambda: Session(engine),
+        repository_factory=SQLAlchemyPassageEmbeddingRepository,
+        embedding_service=backend,
+        sanitize_text=sanitize,
+    )
+    checkpoints: list[EmbeddingRebuildState] = []
+
+    first = service.rebuild_embeddings(
+        EmbeddingRebuildOptions(fast=False, batch_size=2, prefetch_batches=1),
+        checkpoint=checkpoints.append,
+    )
+    assert (first.processed, first.skipped) == (5, 0)
+    assert [state.last_id for state in checkpoints] == ["p2", "p4", "p5"]
+
+    with Session(engine) as edit:
+        edit.get(Passage, "p4").text = "changed"
+        edit.commit()
+
+    backend.calls.clear()
+    resumed = service.rebuild_embeddings(
+        EmbeddingRebuildOptions(
+            fast=False, batch_size=2, skip_count=2, resume_after="p2"
+        )
+    )
+    assert (resumed.processed, resumed.skipped) == (5, 2)
+    assert [call[0] for call in backend.calls] == [("changed",)]
+    engine.dispose()
@@ -0,0 +1,119 @@
+"""Tests for the SQLite engine profiles built by the database facade."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from theo.application.facades import database as database_facade
+
+
+@pytest.fixture()
+def performance_engine(tmp_path: Path):
+    engine = database_facade._create_engine(
+        f"sqlite:///{tmp_path / 'perf.db'}", sqlite_profile="performance"
+    )
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_compat_profile_keeps_null_pool(tmp_path: Path) -> None:
+    engine = database_facade._create_engine(
+        f"sqlite:///{tmp_path / 'compat.db'}", sqlite_profile="compat"
+    )
+    try:
+        assert isinstance(engine.pool, NullPool)
+        assert not hasattr(engine, "sqlite_write_gate")
+    finally:
+        engine.dispose()
+
+
+def test_compat_session_close_spares_connections_checked_out_elsewhere(
+    tmp_path: Path,
+) -> None:
+    engine = database_facade._create_engine(
+        f"sqlite:///{tmp_path / 'compat.db'}", sqlite_profile="compat"
+    )
+    try:
+        with engine.connect() as busy:
+            busy.execute(text("CREATE TABLE jobs (id INTEGER)"))
+            closing = database_facade._TheoSession(bind=engine)
+            closing.execute(text("SELECT 1"))
+            closing.close()
+
+            # The sweep after ``closing`` must not close ``busy``'s connection.
+            busy.execute(text("INSERT INTO jobs VALUES (1)"))
+            assert busy.execute(text("SELECT count(*) FROM jobs")).scalar() == 1
+    finally:
+        engine.dispose()
+
+
+def test_performance_profile_pools_connections_with_tuned_pragmas(
+    performance_engine,
+) -> None:
+    assert isinstance(performance_engine.pool, QueuePool)
+    with performance_engine.connect() as connection:
+        pragmas = {
+            name: connection.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "temp_store", "cache_size")
+        }
+        first = connection.connection.dbapi_connection
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "temp_store": 2,  # MEMORY
+        "cache_size": -64 * 1024,
+    }
+    with performance_engine.connect() as connection:
+        assert connection.connection.dbapi_connection is first
+
+
+def test_write_gate_serialises_writers_and_releases_on_commit(
+    performance_engine,
+) -> None:
+    gate = performance_engine.sqlite_write_gate
+    with performance_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+    def _write(count: int) -> None:
+        for _ in range(count):
+            with performance_engine.begin() as connection:
+                connection.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+    threads = [threading.Thread(target=_write, args=(25,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with performance_engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM items")).scalar() == 100
+    assert gate.acquisitions == 101
+    assert gate.acquire(object())  # nothing is left holding the gate
+    gate.release(object())
+
+
+def test_write_gate_times_out_instead_of_deadlocking(performance_engine) -> None:
+    gate = performance_engine.sqlite_write_gate
+    gate.timeout = 0.05
+    with performance_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+    with performance_engine.connect() as holder:
+        holder.execute(text("INSERT INTO items DEFAULT VALUES"))
+        # Reads on another connection proceed while the write is open.
+        with performance_engine.connect() as reader:
+            assert reader.execute(text("SELECT count(*) FROM items")).scalar() == 0
+            with pytest.raises(OperationalError, match="database is locked"):
+                reader.execute(text("INSERT INTO items DEFAULT VALUES"))
+        holder.rollback()
+
+    with performance_engine.begin() as connection:
+        connection.execute(text("INSERT INTO items DEFAULT VALUES"))
@@ -27,10 +27,18 @@ def test_register_commands_adds_embedding_command(
     assert group.commands["rebuild_embeddings"] is embedding_rebuild.rebuild_embeddings_cmd
 
 
-def test_database_ops_register_commands_noop() -> None:
+def test_database_ops_register_commands_adds_maintenance_commands() -> None:
     group = click.Group()
     database_ops.register_commands(group)
-    assert group.commands == {}
+    assert group.commands == {
+        "backfill_near_duplicates": database_ops.backfill_near_duplicates_cmd,
+        "backfill_verse_ranges": database_ops.backfill_verse_ranges_cmd,
+        "reconcile_dashboard_counters": (
+            database_ops.reconcile_dashboard_counters_cmd
+        ),
+        "rebuild_verse_adjacency": database_ops.rebuild_verse_adjacency_cmd,
+        "rebuild_verse_timeline": database_ops.rebuild_verse_timeline_cmd,
+    }
 
 
 def test_import_export_register_commands_noop() -> None:
@@ -0,0 +1,156 @@
+"""Tests for the per-day dashboard counter rollups."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import (
+    DashboardCounter,
+    Document,
+    Notebook,
+    ResearchNote,
+)
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db.dashboard_counters import (
+    dashboard_counters_ready,
+    load_dashboard_counters,
+    reconcile_dashboard_counters,
+)
+
+_NOW = datetime(2025, 3, 14, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'counters.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _rows(session: Session) -> dict[tuple[str, date], int]:
+    return {
+        (row.metric, row.day): row.row_count
+        for row in session.scalars(select(DashboardCounter))
+        if row.row_count
+    }
+
+
+def _document(document_id: str, created_at: datetime) -> Document:
+    return Document(
+        id=document_id, title=document_id, created_at=created_at, updated_at=created_at
+    )
+
+
+def test_mapper_events_track_inserts_deletes_and_moves(session: Session) -> None:
+    yesterday = _NOW - timedelta(days=1)
+    session.add_all(
+        [
+            _document("doc-1", _NOW),
+            _document("doc-2", _NOW),
+            _document("doc-3", yesterday),
+            ResearchNote(id="note-1", osis="John.1.1", body="...", created_at=_NOW),
+            Notebook(id="nb-1", title="Study", created_by="u", updated_at=yesterday),
+        ]
+    )
+    session.commit()
+
+    assert _rows(session) == {
+        ("documents", _NOW.date()): 2,
+        ("documents", yesterday.date()): 1,
+        ("notes", _NOW.date()): 1,
+        ("notebooks", yesterday.date()): 1,
+    }
+
+    session.delete(session.get(Document, "doc-1"))
+    notebook = session.get(Notebook, "nb-1")
+    notebook.title = "Renamed"  # ``onupdate`` moves it to today
+    session.commit()
+
+    rows = _rows(session)
+    assert rows[("documents", _NOW.date())] == 1
+    today = datetime.now(UTC).date()
+    assert rows[("notebooks", today)] == 1
+    assert ("notebooks", yesterday.date()) not in rows
+
+
+def test_deltas_apply_after_commit_and_are_dropped_on_rollback(
+    session: Session,
+) -> None:
+    session.add(_document("doc-1", _NOW))
+    session.flush()
+    # The shared rows are not touched inside the writer's transaction.
+    assert _rows(session) == {}
+    session.rollback()
+    assert _rows(session) == {}
+
+    session.add(_document("doc-2", _NOW))
+    session.commit()
+    assert _rows(session) == {("documents", _NOW.date()): 1}
+
+
+def test_reconcile_repairs_drift_from_bulk_writes(session: Session) -> None:
+    session.add_all(
+        [_document(f"doc-{i}", _NOW - timedelta(days=i)) for i in range(4)]
+    )
+    session.commit()
+    assert not dashboard_counters_ready(session)
+
+    # Bulk statements bypass the mapper events.
+    session.execute(delete(Document).where(Document.id.in_(["doc-0", "doc-1"])))
+    session.add(DashboardCounter(metric="notes", day=_NOW.date(), row_count=5))
+    session.commit()
+
+    stats = reconcile_dashboard_counters(session)
+
+    assert stats.rows == 2
+    assert stats.corrected == {"documents": 2, "notes": 1}
+    assert _rows(session) == {
+        ("documents", (_NOW - timedelta(days=2)).date()): 1,
+        ("documents", (_NOW - timedelta(days=3)).date()): 1,
+    }
+    assert dashboard_counters_ready(session)
+    assert reconcile_dashboard_counters(session).corrected == {}
+
+
+def test_load_counters_sums_totals_and_periods_in_one_query(session: Session) -> None:
+    today = _NOW.date()
+    session.add_all(
+        DashboardCounter(metric=metric, day=today - timedelta(days=age), row_count=n)
+        for metric, age, n in [
+            ("documents", 0, 3),
+            ("documents", 6, 1),
+            ("documents", 7, 2),
+            ("documents", 30, 4),
+            ("notes", 10, 1),
+        ]
+    )
+    session.commit()
+
+    statements: list[str] = []
+    bind = session.get_bind()
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        summaries = load_dashboard_counters(
+            session,
+            current_start=today - timedelta(days=6),
+            previous_start=today - timedelta(days=13),
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    documents = summaries["documents"]
+    assert (documents.total, documents.current, documents.previous) == (10, 4, 2)
+    notes = summaries["notes"]
+    assert (notes.total, notes.current, notes.previous) == (1, 0, 1)
+    assert summaries["discoveries"].total == 0
@@ -0,0 +1,179 @@
+"""Tests for blue/green embedding version rollouts."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, Passage, PassageEmbeddingVersion
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db import embedding_versions
+from theo.infrastructure.api.app.db.embedding_versions import (
+    EmbeddingVersion,
+    active_embedding_version,
+    backfill_shadow_embeddings,
+    compare_embedding_versions,
+    cutover_embedding_version,
+    ensure_version_index,
+    nearest_passage_ids,
+    record_version_embeddings,
+    register_shadow_version,
+    rollback_embedding_version,
+    version_index_name,
+)
+
+
+def _vector(text: str) -> list[float]:
+    seed = sum(ord(char) for char in text)
+    return [float(seed % 7 + 1), float(seed % 5 + 1), float(seed % 3 + 1)]
+
+
+class _StubEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts, *, batch_size: int = 32):
+        self.calls.append(list(texts))
+        return [_vector(text) for text in texts]
+
+
+@pytest.fixture()
+def embedder(monkeypatch: pytest.MonkeyPatch) -> _StubEmbedder:
+    stub = _StubEmbedder()
+    monkeypatch.setattr(
+        embedding_versions, "get_embedding_service", lambda *_args: stub
+    )
+    embedding_versions.clear_embedding_version_cache()
+    yield stub
+    embedding_versions.clear_embedding_version_cache()
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'versions.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Document(id="doc", title="Doc"))
+        for index in range(5):
+            text = f"passage text {index}"
+            passage = Passage(id=f"p{index}", document_id="doc", text=text)
+            passage.embedding = _vector(text)
+            session.add(passage)
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _shadow_rows(session: Session, key: str) -> int:
+    return session.scalar(
+        select(func.count())
+        .select_from(PassageEmbeddingVersion)
+        .where(PassageEmbeddingVersion.model_version == key)
+    )
+
+
+def test_shadow_backfill_cutover_and_rollback(session, embedder) -> None:
+    live = active_embedding_version(session)
+    assert live.legacy
+
+    version = register_shadow_version(session, "new-model", 3)
+    with pytest.raises(ValueError, match="5 passage"):
+        cutover_embedding_version(session, version.key)
+
+    partial = backfill_shadow_embeddings(
+        session, version.key, batch_size=2, max_batches=1
+    )
+    assert (partial.embedded, partial.remaining) == (2, 3)
+    finished = backfill_shadow_embeddings(session, version.key, batch_size=2)
+    assert (finished.embedded, finished.remaining) == (3, 0)
+    assert active_embedding_version(session).legacy
+
+    cutover_embedding_version(session, version.key)
+    assert active_embedding_version(session).key == version.key
+
+    session.add(Passage(id="p9", document_id="doc", text="late arrival"))
+    session.flush()
+    record_version_embeddings(session, [session.get(Passage, "p9")])
+    session.commit()
+    assert _shadow_rows(session, version.key) == 6
+
+    restored = rollback_embedding_version(session)
+    assert restored.key == live.key
+    assert active_embedding_version(session).legacy
+
+
+def test_comparison_report_measures_neighbour_overlap(session, embedder) -> None:
+    version = register_shadow_version(session, "new-model", 3)
+    backfill_shadow_embeddings(session, version.key)
+
+    report = compare_embedding_versions(
+        session, None, version.key, sample_queries=3, top_k=2, seed=1
+    )
+
+    assert report["sample_size"] == 3
+    assert report["avg_overlap"] == pytest.approx(1.0)
+    assert report["candidate_coverage"] == pytest.approx(1.0)
+    assert report["baseline"] == active_embedding_version(session).key
+
+
+class _RecordingSession:
+    def __init__(self, dialect: str) -> None:
+        self.bind = SimpleNamespace(dialect=SimpleNamespace(name=dialect))
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def get_bind(self):
+        return self.bind
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def test_versions_get_a_partial_hnsw_index_on_postgres() -> None:
+    version = EmbeddingVersion(key="o'model@768", model="o'model", dimension=768)
+    session = _RecordingSession("postgresql")
+
+    assert ensure_version_index(session, version)
+    (ddl,) = session.statements
+    assert ddl == (
+        f"CREATE INDEX IF NOT EXISTS {version_index_name(version)} "
+        "ON passage_embedding_versions USING hnsw "
+        "((embedding::vector(768)) vector_cosine_ops) "
+        "WHERE model_version = 'o''model@768'"
+    )
+    assert session.commits == 1
+    assert version_index_name(version) != version_index_name(
+        EmbeddingVersion(key="o'model@1024", model="o'model", dimension=1024)
+    )
+
+    wide = EmbeddingVersion(key="wide@3072", model="wide", dimension=3072)
+    assert not ensure_version_index(session, wide)
+    assert not ensure_version_index(_RecordingSession("sqlite"), version)
+    assert len(session.statements) == 1
+
+
+def test_version_queries_inline_the_key_for_the_partial_index(
+    session, embedder
+) -> None:
+    version = register_shadow_version(session, "new-model", 3)
+    backfill_shadow_embeddings(session, version.key)
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        nearest = nearest_passage_ids(session, version, _vector("passage text 0"), 2)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert nearest[0] == "p0"
+    assert any("model_version = 'new-model@3'" in sql for sql in statements)
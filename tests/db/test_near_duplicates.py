@@ -0,0 +1,176 @@
+"""Tests for MinHash/LSH near-duplicate passage detection."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import (
+    Document,
+    Passage,
+    PassageSignature,
+    PassageSignatureBand,
+)
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db.near_duplicates import (
+    MinHasher,
+    backfill_passage_signatures,
+    collapse_near_duplicates,
+    estimate_jaccard,
+    index_passage_texts,
+    load_cluster_ids,
+)
+from theo.infrastructure.api.app.models.search import HybridSearchRequest
+from theo.infrastructure.api.app.retriever.hybrid import hybrid_search
+
+SERMON = (
+    "For by grace are ye saved through faith and that not of yourselves it is"
+    " the gift of God not of works lest any man should boast for we are his"
+    " workmanship created in Christ Jesus unto good works which God hath before"
+    " ordained that we should walk in them wherefore remember that ye being in"
+    " time past Gentiles in the flesh were without Christ"
+)
+REPOST = SERMON.replace("wherefore remember", "therefore remember") + " Amen."
+UNRELATED = (
+    "In the beginning was the Word and the Word was with God and the Word was"
+    " God the same was in the beginning with God all things were made by him"
+)
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'near-duplicates.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_document(
+    session: Session, doc_id: str, texts: dict[str, str], *, age_days: int = 0
+) -> None:
+    session.add(
+        Document(
+            id=doc_id,
+            title=doc_id,
+            created_at=datetime.now(UTC) - timedelta(days=age_days),
+        )
+    )
+    for passage_id, text in texts.items():
+        session.add(Passage(id=passage_id, document_id=doc_id, text=text))
+    session.flush()
+
+
+def test_signatures_estimate_shingle_similarity() -> None:
+    hasher = MinHasher(num_perm=128, bands=16, shingle_size=3)
+    original = hasher.signature(SERMON)
+    assert original is not None and original.dtype.name == "uint32"
+
+    assert estimate_jaccard(original, hasher.signature(SERMON.upper())) == 1.0
+    assert estimate_jaccard(original, hasher.signature(REPOST)) > 0.7
+    assert estimate_jaccard(original, hasher.signature(UNRELATED)) < 0.2
+    assert hasher.signature("  ... ") is None
+    assert len(set(hasher.band_keys(original))) == 16
+
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=100, bands=16)
+
+
+def test_index_links_near_duplicates_across_and_within_batches(session) -> None:
+    _add_document(session, "doc-a", {"a1": SERMON, "a2": UNRELATED})
+    _add_document(session, "doc-b", {"b1": REPOST, "b2": REPOST, "b3": " "})
+    hasher = MinHasher(shingle_size=3)
+
+    assert index_passage_texts(
+        session, [("a1", SERMON), ("a2", UNRELATED)], hasher=hasher, threshold=0.7
+    ) == 0
+    duplicates = index_passage_texts(
+        session,
+        [("b1", REPOST), ("b2", REPOST), ("b3", " ")],
+        hasher=hasher,
+        threshold=0.7,
+    )
+
+    assert duplicates == 2
+    clusters = load_cluster_ids(session, ["a1", "a2", "b1", "b2", "b3"])
+    assert clusters == {"a1": "a1", "a2": "a2", "b1": "a1", "b2": "a1", "b3": "b3"}
+    similarity = session.scalar(
+        select(PassageSignature.similarity).where(PassageSignature.passage_id == "b1")
+    )
+    assert 0.7 <= similarity < 1.0
+    band_count = session.scalar(
+        select(PassageSignatureBand.passage_id)
+        .where(PassageSignatureBand.passage_id == "b3")
+        .limit(1)
+    )
+    assert band_count is None
+
+
+def test_backfill_keeps_oldest_copy_as_cluster_key(session) -> None:
+    _add_document(session, "newer", {"n1": SERMON}, age_days=1)
+    _add_document(session, "older", {"o1": REPOST, "o2": UNRELATED}, age_days=30)
+    session.commit()
+    hasher = MinHasher(shingle_size=3)
+
+    result = backfill_passage_signatures(session, batch_size=1, hasher=hasher)
+
+    assert (result.indexed, result.duplicates) == (3, 1)
+    assert load_cluster_ids(session, ["n1", "o1"]) == {"n1": "o1", "o1": "o1"}
+    assert backfill_passage_signatures(session, hasher=hasher).indexed == 0
+    rebuilt = backfill_passage_signatures(session, rebuild=True, hasher=hasher)
+    assert (rebuilt.indexed, rebuilt.duplicates) == (3, 1)
+
+
+@dataclass
+class _Result:
+    id: str
+    meta: dict | None = field(default=None)
+
+
+def test_collapse_keeps_best_ranked_member_of_each_cluster(session) -> None:
+    _add_document(session, "doc-a", {"a1": SERMON, "a2": UNRELATED})
+    _add_document(session, "doc-b", {"b1": REPOST})
+    index_passage_texts(
+        session,
+        [("a1", SERMON), ("a2", UNRELATED), ("b1", REPOST)],
+        hasher=MinHasher(shingle_size=3),
+        threshold=0.7,
+    )
+
+    results = [_Result("b1"), _Result("a2"), _Result("a1"), _Result("unindexed")]
+    collapsed = collapse_near_duplicates(session, results, limit=2)
+
+    assert [result.id for result in collapsed] == ["b1", "a2"]
+    assert collapsed[0].meta == {"near_duplicates": ["a1"]}
+    assert collapsed[1].meta is None
+
+
+def test_hybrid_search_collapses_duplicates_on_request(session) -> None:
+    _add_document(session, "doc-a", {"a1": SERMON})
+    _add_document(session, "doc-b", {"b1": REPOST})
+    _add_document(session, "doc-c", {"c1": "Grace and faith are gifts of God."})
+    index_passage_texts(
+        session,
+        [("a1", SERMON), ("b1", REPOST)],
+        hasher=MinHasher(shingle_size=3),
+        threshold=0.7,
+    )
+    session.commit()
+
+    plain = hybrid_search(session, HybridSearchRequest(query="grace faith", k=3))
+    assert {result.id for result in plain} == {"a1", "b1", "c1"}
+
+    collapsed = hybrid_search(
+        session,
+        HybridSearchRequest(query="grace faith", k=3, collapse_duplicates=True),
+    )
+    assert len(collapsed) == 2
+    assert [result.rank for result in collapsed] == [1, 2]
+    representative = next(result for result in collapsed if result.id in {"a1", "b1"})
+    assert representative.meta["near_duplicates"] == [
+        ({"a1", "b1"} - {representative.id}).pop()
+    ]
@@ -0,0 +1,123 @@
+"""Tests for per-request query accounting and slow-query plan capture."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, Passage
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db.query_instrumentation import (
+    InstrumentationConfig,
+    QueryBudgetExceeded,
+    fingerprint_statement,
+    get_slow_query_log,
+    install_query_instrumentation,
+    normalize_statement,
+    query_budget,
+    track_queries,
+    uninstall_query_instrumentation,
+)
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'instrumented.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Document(id="doc", title="Romans"))
+        session.add_all(
+            Passage(id=f"p{index}", document_id="doc", text=f"verse {index}")
+            for index in range(5)
+        )
+        session.commit()
+    yield engine
+    uninstall_query_instrumentation(engine)
+    get_slow_query_log().clear()
+    engine.dispose()
+
+
+def _instrument(engine, **overrides) -> None:
+    options = {"slow_query_ms": None, "n_plus_one_threshold": 3, **overrides}
+    install_query_instrumentation(engine, config=InstrumentationConfig(**options))
+
+
+def test_fingerprint_ignores_literals_and_in_list_length() -> None:
+    one = "SELECT * FROM passages WHERE id IN (?, ?) AND page = 3 AND text = 'a'"
+    other = "SELECT *   FROM passages WHERE id IN (?, ?, ?, ?) AND page = 12 AND text = 'b'"
+
+    assert normalize_statement(one) == (
+        "SELECT * FROM passages WHERE id IN (...) AND page = ? AND text = ?"
+    )
+    assert fingerprint_statement(one) == fingerprint_statement(other)
+    assert fingerprint_statement(one) != fingerprint_statement(
+        "SELECT * FROM documents WHERE id IN (?)"
+    )
+    assert normalize_statement("SELECT x::text FROM t1 WHERE y = %(y_1)s") == (
+        "SELECT x::text FROM t1 WHERE y = ?"
+    )
+
+
+def test_track_queries_counts_statements_and_flags_n_plus_one(engine, caplog) -> None:
+    _instrument(engine)
+    caplog.set_level(logging.WARNING)
+
+    with Session(engine) as session, track_queries("passages") as stats:
+        ids = session.scalars(select(Passage.id).order_by(Passage.id)).all()
+        for passage_id in ids:
+            session.get(Passage, passage_id)
+
+    assert stats.count == 6
+    assert stats.total_ms > 0
+    assert stats.n_plus_one == [max(stats.fingerprints, key=stats.fingerprints.get)]
+    assert stats.repeated()[0][1] == 5
+    assert any(
+        getattr(record, "event", None) == "db.n_plus_one" for record in caplog.records
+    )
+
+    with Session(engine) as session:
+        session.execute(select(Passage.id)).all()
+    assert stats.count == 6
+
+
+def test_query_budget_reports_repeated_statements(engine) -> None:
+    _instrument(engine)
+
+    with Session(engine) as session, query_budget(2) as stats:
+        session.execute(select(Document.id)).all()
+    assert stats.count == 1
+
+    with pytest.raises(QueryBudgetExceeded) as excinfo:
+        with Session(engine) as session, query_budget(10, max_repeats=2):
+            for index in range(3):
+                session.get(Passage, f"p{index}")
+    message = str(excinfo.value)
+    assert "a statement ran 3 times, limit is 2" in message
+    assert "3x SELECT" in message
+
+
+def test_slow_queries_capture_sqlite_plan_once_per_interval(engine) -> None:
+    _instrument(engine, slow_query_ms=1e-6, explain_interval_seconds=3600)
+    log = get_slow_query_log()
+    log.clear()
+
+    with Session(engine) as session, track_queries("GET /passages"):
+        for _ in range(2):
+            session.execute(
+                select(Passage.id).where(Passage.document_id == "doc")
+            ).all()
+        session.execute(text("UPDATE passages SET page_no = 1 WHERE id = 'p0'"))
+        session.commit()
+
+    records = [record for record in log.snapshot() if "passages" in record.statement]
+    update, repeat, first = records[:3]
+    assert first.label == "GET /passages"
+    assert first.dialect == "sqlite"
+    assert first.plan and "passages" in " ".join(first.plan)
+    assert repeat.plan is None
+    assert update.plan is None
+    assert update.statement.startswith("UPDATE")
+    assert first.to_dict()["plan"] == list(first.plan)
@@ -650,3 +650,102 @@ def test_contradiction_seeds_repair_range_columns_and_merge_payloads(
     finally:
         engine.dispose()
 
+
+
+def test_seed_reference_data_skips_unchanged_datasets(tmp_path, monkeypatch) -> None:
+    """Datasets whose content hash is unchanged are not reloaded on restart."""
+
+    seed_dir = tmp_path / "seeds"
+    seed_dir.mkdir()
+    contradiction = {
+        "osis_a": "Gen.1.1",
+        "osis_b": "Gen.1.2",
+        "source": "test",
+        "summary": "first",
+    }
+    _write_seed(seed_dir / "contradictions.json", [contradiction])
+    _write_seed(
+        seed_dir / "harmonies.json",
+        [{"osis_a": "Gen.1.1", "osis_b": "Gen.1.2", "summary": "aligned"}],
+    )
+
+    monkeypatch.setattr(seeds, "SEED_ROOT", seed_dir)
+    monkeypatch.setattr(seeds, "seed_openbible_geo", lambda session: None)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'manifest.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        seeds.seed_reference_data(session)
+
+    calls: list[str] = []
+
+    def _tracking(label):
+        def _seed(_session):
+            calls.append(label)
+            return True
+
+        return _seed
+
+    monkeypatch.setattr(seeds, "seed_contradiction_claims", _tracking("contradiction"))
+    monkeypatch.setattr(seeds, "seed_harmony_claims", _tracking("harmony"))
+
+    with Session(engine) as session:
+        seeds.seed_reference_data(session)
+    assert calls == []
+
+    _write_seed(
+        seed_dir / "contradictions.json",
+        [contradiction, {**contradiction, "osis_b": "Gen.1.3"}],
+    )
+    with Session(engine) as session:
+        seeds.seed_reference_data(session)
+    assert calls == ["contradiction"]
+
+
+def test_seed_reference_data_reseeds_truncated_tables(tmp_path, monkeypatch) -> None:
+    seed_dir = tmp_path / "seeds"
+    seed_dir.mkdir()
+    _write_seed(
+        seed_dir / "contradictions.json",
+        [{"osis_a": "Gen.1.1", "osis_b": "Gen.1.2", "source": "test"}],
+    )
+    monkeypatch.setattr(seeds, "SEED_ROOT", seed_dir)
+    monkeypatch.setattr(seeds, "seed_openbible_geo", lambda session: None)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'truncated.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        seeds.seed_reference_data(session)
+        session.execute(text("DELETE FROM contradiction_seeds"))
+        session.commit()
+
+    with Session(engine) as session:
+        seeds.seed_reference_data(session)
+        assert len(session.scalars(select(ContradictionSeed)).all()) == 1
+
+
+def test_apply_seed_rows_applies_bulk_diff() -> None:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        rows = [
+            {"slug": "jerusalem", "name": "Jerusalem", "lat": 31.778},
+            {"slug": "bethlehem", "name": "Bethlehem", "lat": None},
+        ]
+        assert seeds._apply_seed_rows(session, GeoPlace, rows, key="slug") == (2, 0, 0)
+        session.commit()
+
+        rows = [
+            {"slug": "jerusalem", "name": "Jerusalem", "lat": 31.778},
+            {"slug": "nazareth", "name": "Nazareth", "lat": 32.7},
+        ]
+        assert seeds._apply_seed_rows(session, GeoPlace, rows, key="slug") == (1, 0, 1)
+        rows[0] = {"slug": "jerusalem", "name": "Yerushalayim", "lat": 31.778}
+        assert seeds._apply_seed_rows(session, GeoPlace, rows, key="slug") == (0, 1, 0)
+        session.commit()
+
+        names = session.scalars(select(GeoPlace.name).order_by(GeoPlace.slug)).all()
+        assert names == ["Yerushalayim", "Nazareth"]
@@ -0,0 +1,161 @@
+"""Tests for the precomputed CSR verse adjacency graph."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import (
+    CommentaryExcerptSeed,
+    ContradictionSeed,
+    CrossReference,
+    Document,
+    HarmonySeed,
+    Passage,
+)
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db import verse_adjacency
+from theo.infrastructure.api.app.db.verse_adjacency import (
+    VerseAdjacency,
+    get_verse_adjacency,
+    rebuild_verse_adjacency,
+)
+from theo.infrastructure.api.app.retriever.graph import get_verse_graph
+
+
+@pytest.fixture()
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        verse_adjacency, "default_adjacency_dir", lambda: tmp_path / "adjacency"
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'adjacency.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _seed(session: Session) -> None:
+    session.add(Document(id="doc", title="Sermon"))
+    session.add(
+        Passage(
+            id="p1",
+            document_id="doc",
+            text="love",
+            osis_ref="John.3.16",
+            osis_start_verse_id=43003016,
+            osis_end_verse_id=43003016,
+            meta={"osis_refs_all": ["John.3.16", "Rom.5.8"]},
+        )
+    )
+    session.add_all(
+        [
+            HarmonySeed(id="h1", osis_a="Rom.5.8", osis_b="1John.4.10"),
+            ContradictionSeed(id="c1", osis_a="1John.4.10", osis_b="Gen.1.1"),
+            CommentaryExcerptSeed(id="m1", osis="Rom.5.8", excerpt="Grace first."),
+            CrossReference(id="x1", source_osis="John.3.16", target_osis="John.1.14"),
+        ]
+    )
+    session.commit()
+
+
+def _edge_ids(response) -> set[str]:
+    return {edge.id for edge in response.edges}
+
+
+def test_multi_hop_traversal_and_edge_filters(session: Session) -> None:
+    _seed(session)
+    rebuild_verse_adjacency(session)
+
+    one_hop = get_verse_graph(session, "John.3.16", depth=1, edge_kinds=[])
+    assert one_hop.edges == []
+
+    two_hops = get_verse_graph(session, "John.3", depth=2, edge_kinds=None)
+    assert {edge.kind for edge in two_hops.edges} == {
+        "mention",
+        "co_mention",
+        "crossref",
+        "harmony",
+        "commentary",
+    }
+    assert "harmony:h1:1John.4.10" in _edge_ids(two_hops)
+    depths = {node.id: (node.data or {}).get("depth") for node in two_hops.nodes}
+    assert depths["verse:Rom.5.8"] == 1
+    assert depths["verse:1John.4.10"] == 2
+
+    three_hops = get_verse_graph(
+        session,
+        "John.3.16",
+        depth=3,
+        edge_kinds=["co_mention", "harmony", "contradiction"],
+    )
+    assert _edge_ids(three_hops) == {
+        "co_mention:verse:John.3.16:verse:Rom.5.8",
+        "harmony:h1:1John.4.10",
+        "contradiction:c1:Gen.1.1",
+    }
+
+    with pytest.raises(ValueError):
+        get_verse_graph(session, "John.3.16", depth=2, edge_kinds=["bogus"])
+
+
+def test_first_request_serves_empty_graph_while_building(
+    session: Session, tmp_path
+) -> None:
+    _seed(session)
+    directory = tmp_path / "graph"
+
+    pending = get_verse_adjacency(session, directory)
+    assert pending.node_count == 0
+    for thread in threading.enumerate():
+        if thread.name == "verse-adjacency-build":
+            thread.join(timeout=30)
+
+    published = get_verse_adjacency(session, directory)
+    assert published.node_id("John.3.16") is not None
+    assert get_verse_adjacency(session, directory) is published
+
+
+def test_memory_mapped_graph_matches_built_graph(session: Session, tmp_path) -> None:
+    _seed(session)
+    built, stats = rebuild_verse_adjacency(session, tmp_path / "graph")
+    loaded = VerseAdjacency.open(tmp_path / "graph" / stats.version)
+
+    assert loaded.labels == built.labels
+    assert loaded.edge_count == built.edge_count
+    start = built.node_id("John.3.16")
+    seeds = loaded.nodes_for_range(43003016, 43003016)
+    assert seeds == [start]
+    assert (
+        loaded.neighbourhood(seeds, depth=3).edges
+        == built.neighbourhood(seeds, depth=3).edges
+    )
+
+
+def test_rebuild_reuses_unchanged_segments(session: Session, tmp_path) -> None:
+    _seed(session)
+    directory = tmp_path / "graph"
+    _graph, first = rebuild_verse_adjacency(session, directory)
+    assert first.reused == 0
+
+    session.add(Document(id="doc2", title="Notes"))
+    session.add(
+        Passage(
+            id="p2",
+            document_id="doc2",
+            text="mercy",
+            osis_ref="Eph.2.4",
+            meta={"osis_refs_all": ["Eph.2.4", "Rom.5.8"]},
+        )
+    )
+    session.commit()
+    graph, second = rebuild_verse_adjacency(session, directory)
+
+    assert (second.rebuilt, second.reused) == (1, first.rebuilt)
+    assert graph.node_id("Eph.2.4") is not None
+    assert sorted(path.name for path in directory.iterdir() if path.is_dir()) == [
+        second.version
+    ]
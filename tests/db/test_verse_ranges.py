@@ -0,0 +1,120 @@
+"""Tests for the resumable passage verse range backfill."""
+
+from __future__ import annotations
+
+import runpy
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, Passage, PassageVerse
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db.verse_ranges import (
+    backfill_verse_ranges,
+    load_backfill_state,
+    verse_ranges_backfilled,
+)
+from theo.infrastructure.api.app.ingest.osis import expand_osis_reference
+from theo.infrastructure.api.app.retriever import verses
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'verse_ranges.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_legacy_passages(session: Session) -> None:
+    session.add(Document(id="doc", title="Legacy", collection="legacy"))
+    session.add_all(
+        [
+            Passage(id="p1", document_id="doc", text="ref", osis_ref="John.3.16"),
+            Passage(
+                id="p2",
+                document_id="doc",
+                text="meta",
+                meta={"osis_refs_all": ["John.3.17"]},
+            ),
+            Passage(
+                id="p3",
+                document_id="doc",
+                text="ids",
+                osis_verse_ids=sorted(expand_osis_reference("John.3.18")),
+            ),
+            Passage(id="p4", document_id="doc", text="none"),
+        ]
+    )
+    session.commit()
+
+
+def test_backfill_populates_ranges_and_resumes(session: Session) -> None:
+    _add_legacy_passages(session)
+
+    state = backfill_verse_ranges(session, batch_size=2, max_batches=1)
+    assert (state.processed, state.last_id, state.completed) == (2, "p2", False)
+    assert not verse_ranges_backfilled(session)
+
+    state = backfill_verse_ranges(session, batch_size=2)
+    assert state.completed
+    assert (state.processed, state.updated) == (4, 3)
+    assert load_backfill_state(session).completed
+
+    john_316 = sorted(expand_osis_reference("John.3.16"))
+    p1 = session.get(Passage, "p1")
+    assert p1.osis_verse_ids == john_316
+    assert (p1.osis_start_verse_id, p1.osis_end_verse_id) == (john_316[0], john_316[-1])
+    assert session.get(Passage, "p4").osis_start_verse_id is None
+    linked = set(session.scalars(select(PassageVerse.passage_id)))
+    assert linked == {"p1", "p2", "p3"}
+
+
+def test_retriever_skips_legacy_scans_after_backfill(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _add_legacy_passages(session)
+    backfill_verse_ranges(session)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("legacy overlap scan should be skipped")
+
+    monkeypatch.setattr(verses, "_passage_overlaps_range", _fail)
+    monkeypatch.setattr(verses, "_legacy_overlap_clause", _fail)
+    after = verses.get_mentions_for_osis(session, "John.3.16-John.3.18")
+
+    assert {m.passage.id for m in after} == {"p1", "p2", "p3"}
+
+
+def test_mentions_keyset_pagination(session: Session) -> None:
+    _add_legacy_passages(session)
+    backfill_verse_ranges(session)
+
+    first = verses.get_mentions_for_osis(session, "John.3", limit=2)
+    second = verses.get_mentions_for_osis(
+        session, "John.3", limit=2, after=first[-1].passage.id
+    )
+
+    assert [m.passage.id for m in first] == ["p1", "p2"]
+    assert [m.passage.id for m in second] == ["p3"]
+
+
+def test_migration_runs_the_shared_backfill(session: Session) -> None:
+    from theo.infrastructure.api.app.db.run_sql_migrations import MIGRATIONS_PATH
+
+    _add_legacy_passages(session)
+    migration = runpy.run_path(
+        str(MIGRATIONS_PATH / "20250328_backfill_passage_verse_ranges.py")
+    )
+
+    migration["apply"](session)
+
+    assert verse_ranges_backfilled(session)
+    passage = session.get(Passage, "p2")
+    assert passage.osis_start_verse_id == min(expand_osis_reference("John.3.17"))
+    linked = session.scalars(
+        select(PassageVerse.verse_id).where(PassageVerse.passage_id == "p2")
+    ).all()
+    assert linked == sorted(expand_osis_reference("John.3.17"))
@@ -0,0 +1,136 @@
+"""Tests for the materialised verse timeline rollups."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import Document, Passage, VerseTimelineRollup
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.db.verse_timeline import (
+    SAMPLE_LIMIT,
+    add_document_to_timeline,
+    rebuild_verse_timeline,
+    timeline_rollups_ready,
+)
+from theo.infrastructure.api.app.ingest.osis import expand_osis_reference
+from theo.infrastructure.api.app.retriever import verses
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'timeline.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_document(
+    session: Session, document_id: str, pub_date: date, refs: list[str]
+) -> None:
+    session.add(Document(id=document_id, title=document_id, pub_date=pub_date))
+    for index, ref in enumerate(refs):
+        ids = sorted(expand_osis_reference(ref))
+        session.add(
+            Passage(
+                id=f"{document_id}-{index}",
+                document_id=document_id,
+                text=ref,
+                osis_ref=ref,
+                osis_start_verse_id=ids[0],
+                osis_end_verse_id=ids[-1],
+            )
+        )
+    session.flush()
+
+
+def _timelines(session: Session, monkeypatch: pytest.MonkeyPatch, osis: str, window):
+    rollup = verses.get_verse_timeline(session, osis, window=window)
+    with monkeypatch.context() as patch:
+        patch.setattr(verses, "timeline_rollups_ready", lambda _session: False)
+        raw = verses.get_verse_timeline(session, osis, window=window)
+    return rollup, raw
+
+
+def _counts(response) -> list[tuple[str, int]]:
+    return [(bucket.label, bucket.count) for bucket in response.buckets]
+
+
+@pytest.mark.parametrize("window", ["week", "month", "quarter", "year"])
+def test_rollups_match_raw_bucketing(session, monkeypatch, window) -> None:
+    _add_document(session, "a", date(2023, 1, 3), ["Rom.8.1-Rom.8.4", "Rom.8.28"])
+    _add_document(session, "b", date(2023, 2, 14), ["Rom.7.25-Rom.8.2"])
+    _add_document(session, "c", date(2024, 6, 1), ["Rom.8", "John.3.16"])
+    session.commit()
+    assert rebuild_verse_timeline(session) == 3
+    assert timeline_rollups_ready(session)
+
+    for osis in ("Rom.8", "Rom.8.2", "Rom.8.3-Rom.8.30", "Rom.7.25", "John.3"):
+        rollup, raw = _timelines(session, monkeypatch, osis, window)
+        assert _counts(rollup) == _counts(raw), osis
+        assert rollup.total_mentions == raw.total_mentions
+
+
+def test_rollups_follow_ingest_and_delete(session, monkeypatch) -> None:
+    _add_document(session, "a", date(2023, 1, 3), ["Rom.8.1-Rom.8.4"])
+    session.commit()
+    rebuild_verse_timeline(session)
+
+    _add_document(session, "b", date(2023, 1, 20), ["Rom.8.3", "Rom.8.39"])
+    add_document_to_timeline(session.connection(), "b")
+    session.commit()
+    rollup, raw = _timelines(session, monkeypatch, "Rom.8", "month")
+    assert _counts(rollup) == _counts(raw) == [("2023-01", 3)]
+    assert rollup.buckets[0].document_ids == ["a", "b"]
+
+    session.delete(session.get(Document, "a"))
+    session.commit()
+    rollup, raw = _timelines(session, monkeypatch, "Rom.8", "month")
+    assert _counts(rollup) == _counts(raw) == [("2023-01", 2)]
+    assert rollup.buckets[0].document_ids == ["b"]
+
+    session.delete(session.get(Document, "b"))
+    session.commit()
+    remaining = session.scalar(select(func.count()).select_from(VerseTimelineRollup))
+    assert remaining == 0
+
+
+def test_batched_rebuild_matches_single_pass_with_capped_samples(session) -> None:
+    _add_document(session, "a", date(2023, 1, 3), ["Rom.8.1"] * (SAMPLE_LIMIT + 5))
+    _add_document(session, "b", date(2023, 1, 9), ["Rom.8.1-Rom.8.2"])
+    _add_document(session, "c", date(2023, 1, 20), ["Rom.8.2"])
+    session.commit()
+
+    def _rows():
+        return session.execute(
+            select(
+                VerseTimelineRollup.granularity,
+                VerseTimelineRollup.bucket_start,
+                VerseTimelineRollup.kind,
+                VerseTimelineRollup.verse_id,
+                VerseTimelineRollup.mention_count,
+                VerseTimelineRollup.document_ids,
+                VerseTimelineRollup.passage_ids,
+            ).order_by(*VerseTimelineRollup.__table__.primary_key.columns)
+        ).all()
+
+    assert rebuild_verse_timeline(session) == 3
+    single = _rows()
+    assert rebuild_verse_timeline(session, batch_size=1) == 3
+    assert _rows() == single
+    assert all(len(row.passage_ids) <= SAMPLE_LIMIT for row in single)
+
+    session.delete(session.get(Document, "a"))
+    session.commit()
+    remaining = [row for row in _rows() if row.verse_id == 45008001]
+    assert {row.mention_count for row in remaining} == {1}
+    assert all(row.document_ids == ["b"] for row in remaining)
+    assert not any(
+        passage_id.startswith("a-")
+        for row in remaining
+        for passage_id in row.passage_ids
+    )
@@ -0,0 +1,203 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from theo.adapters.persistence.models import (
+    Document,
+    GeoAncientPlace,
+    GeoModernLocation,
+    GeoPlaceVerse,
+    Passage,
+    PassageVerse,
+)
+from theo.application.facades.database import Base
+from theo.domain.research.osis import expand_osis_reference
+from theo.infrastructure.api.app.research.geo_spatial import (
+    BoundingBox,
+    GeoSpatialIndex,
+    IndexedLocation,
+    get_geo_spatial_index,
+    haversine_km,
+    invalidate_geo_spatial_index,
+    places_for_osis_in_region,
+    places_near,
+    resolve_origin,
+)
+
+JERUSALEM = (31.778, 35.235)
+
+
+@pytest.fixture()
+def sqlite_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'geo.db'}")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, future=True)
+    session = SessionLocal()
+    invalidate_geo_spatial_index()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        invalidate_geo_spatial_index()
+
+
+def _location(modern_id: str, name: str, lat: float, lng: float) -> GeoModernLocation:
+    return GeoModernLocation(
+        modern_id=modern_id,
+        friendly_id=name,
+        confidence=0.9,
+        latitude=lat,
+        longitude=lng,
+        names=[{"name": name}],
+        raw={},
+    )
+
+
+def _place(ancient_id: str, name: str, modern_id: str) -> GeoAncientPlace:
+    return GeoAncientPlace(
+        ancient_id=ancient_id,
+        friendly_id=name,
+        classification="settlement",
+        raw={"modern_associations": {modern_id: {"confidence": 0.9}}},
+    )
+
+
+def _passage(passage_id: str, osis: str) -> Passage:
+    return Passage(
+        id=passage_id,
+        document_id="doc-1",
+        text=osis,
+        osis_ref=osis,
+        verses=[
+            PassageVerse(verse_id=verse_id)
+            for verse_id in sorted(expand_osis_reference(osis))
+        ],
+    )
+
+
+@pytest.fixture()
+def seeded_session(sqlite_session: Session) -> Session:
+    sqlite_session.add_all(
+        [
+            _location("jerusalem", "Jerusalem", *JERUSALEM),
+            _location("bethlehem", "Bethlehem", 31.7054, 35.2003),
+            _location("capernaum", "Capernaum", 32.8803, 35.5733),
+            _place("a-jerusalem", "Jerusalem", "jerusalem"),
+            _place("a-bethlehem", "Bethlehem", "bethlehem"),
+            _place("a-capernaum", "Capernaum", "capernaum"),
+            GeoPlaceVerse(ancient_id="a-bethlehem", osis_ref="Matt.2.1"),
+            GeoPlaceVerse(ancient_id="a-bethlehem", osis_ref="Mic.5.2"),
+            GeoPlaceVerse(ancient_id="a-jerusalem", osis_ref="Matt.2.3"),
+            GeoPlaceVerse(ancient_id="a-capernaum", osis_ref="Matt.4.13"),
+            Document(id="doc-1", title="Sermons"),
+            _passage("sermon-magi", "Matt.2.1-Matt.2.2"),
+            _passage("sermon-micah", "Mic.5.2"),
+        ]
+    )
+    sqlite_session.commit()
+    return sqlite_session
+
+
+def test_haversine_matches_known_distance():
+    distance = haversine_km(*JERUSALEM, 31.7054, 35.2003)
+
+    assert distance == pytest.approx(8.7, abs=0.3)
+
+
+def test_grid_index_radius_and_bbox_queries():
+    index = GeoSpatialIndex(cell_degrees=0.1)
+    index.add(IndexedLocation("jerusalem", "Jerusalem", *JERUSALEM))
+    index.add(IndexedLocation("bethlehem", "Bethlehem", 31.7054, 35.2003))
+    index.add(IndexedLocation("capernaum", "Capernaum", 32.8803, 35.5733))
+
+    nearby = index.within_radius(*JERUSALEM, 20.0)
+    assert [match.location.modern_id for match in nearby] == ["jerusalem", "bethlehem"]
+    assert nearby[0].distance_km == pytest.approx(0.0)
+
+    box = BoundingBox(min_lat=32.5, min_lng=35.0, max_lat=33.5, max_lng=36.0)
+    assert [match.location.modern_id for match in index.within_bbox(box)] == [
+        "capernaum"
+    ]
+
+
+def test_grid_index_re_adding_moves_location():
+    index = GeoSpatialIndex(cell_degrees=0.1)
+    index.add(IndexedLocation("site", "Site", *JERUSALEM))
+    index.add(IndexedLocation("site", "Site", 32.8803, 35.5733))
+
+    assert len(index) == 1
+    assert index.within_radius(*JERUSALEM, 5.0) == []
+
+
+def test_bounding_box_rejects_inverted_bounds():
+    with pytest.raises(ValueError):
+        BoundingBox(min_lat=33.0, min_lng=35.0, max_lat=32.0, max_lng=36.0)
+
+
+def test_places_near_uses_cached_index_until_reseed(seeded_session: Session):
+    items = places_near(seeded_session, lat=JERUSALEM[0], lng=JERUSALEM[1], radius_km=20)
+
+    assert [item.modern_id for item in items] == ["jerusalem", "bethlehem"]
+    first_index = get_geo_spatial_index(seeded_session)
+    assert get_geo_spatial_index(seeded_session) is first_index
+
+    seeded_session.add(_location("bethany", "Bethany", 31.7714, 35.2437))
+    seeded_session.commit()
+
+    refreshed = places_near(
+        seeded_session, lat=JERUSALEM[0], lng=JERUSALEM[1], radius_km=20
+    )
+    assert get_geo_spatial_index(seeded_session) is not first_index
+    assert "bethany" in {item.modern_id for item in refreshed}
+
+
+def test_index_rebuilds_when_coordinates_move_in_place(seeded_session: Session):
+    first_index = get_geo_spatial_index(seeded_session)
+
+    capernaum = seeded_session.get(GeoModernLocation, "capernaum")
+    capernaum.latitude, capernaum.longitude = 31.7714, 35.2437
+    seeded_session.commit()
+
+    items = places_near(seeded_session, lat=JERUSALEM[0], lng=JERUSALEM[1], radius_km=20)
+    assert get_geo_spatial_index(seeded_session) is not first_index
+    assert "capernaum" in {item.modern_id for item in items}
+
+
+def test_resolve_origin_by_place_name(seeded_session: Session):
+    assert resolve_origin(seeded_session, place="jerusalem") == JERUSALEM
+    assert resolve_origin(seeded_session, place="Atlantis") is None
+
+
+def test_places_for_osis_in_region_joins_verse_range(seeded_session: Session):
+    response = places_for_osis_in_region(
+        seeded_session,
+        "Matt.2",
+        lat=JERUSALEM[0],
+        lng=JERUSALEM[1],
+        radius_km=20,
+    )
+
+    assert [place.ancient_id for place in response.places] == [
+        "a-jerusalem",
+        "a-bethlehem",
+    ]
+    bethlehem = response.places[1]
+    assert bethlehem.osis_refs == ["Matt.2.1"]
+    assert bethlehem.modern_locations[0].distance_km == pytest.approx(8.7, abs=0.3)
+    assert [item.passage_id for item in bethlehem.passages] == ["sermon-magi"]
+    assert response.places[0].passages == []
+
+
+def test_places_for_osis_in_region_with_bbox(seeded_session: Session):
+    box = BoundingBox(min_lat=32.5, min_lng=35.0, max_lat=33.5, max_lng=36.0)
+
+    response = places_for_osis_in_region(seeded_session, "Matt.1-Matt.5", bbox=box)
+
+    assert [place.ancient_id for place in response.places] == ["a-capernaum"]
+    assert response.places[0].osis_refs == ["Matt.4.13"]
+
+
+def test_places_for_osis_in_region_requires_region(seeded_session: Session):
+    with pytest.raises(ValueError):
+        places_for_osis_in_region(seeded_session, "Matt.2")
@@ -0,0 +1,18 @@
+"""Smoke test for the dashboard counter benchmark."""
+from __future__ import annotations
+
+import pytest
+from scripts.perf import dashboard_counters_benchmark
+
+
+@pytest.mark.performance
+def test_benchmark_times_rollups_and_full_scans(tmp_path) -> None:
+    results = dashboard_counters_benchmark.run_benchmark(
+        [20, 200], workdir=tmp_path, iterations=2
+    )
+
+    assert sorted(results) == [20, 200]
+    for paths in results.values():
+        assert set(paths) == {"rollups", "full_scan"}
+        assert paths["rollups"].as_dict()["iterations"] == 2
+    assert dashboard_counters_benchmark.growth(results, "rollups") > 0
@@ -0,0 +1,57 @@
+"""Smoke tests for the synthetic-corpus hot path benchmarks."""
+from __future__ import annotations
+
+import json
+
+import pytest
+from scripts.perf import hot_path_benchmarks
+from scripts.perf.synthetic_corpus import CorpusSpec, generate_corpus
+
+_SPEC = CorpusSpec(documents=6, passages_per_document=4, words_per_passage=30)
+
+
+def test_synthetic_corpus_is_deterministic() -> None:
+    first = generate_corpus(_SPEC)
+    second = generate_corpus(_SPEC)
+
+    assert [doc.text for doc in first.documents] == [
+        doc.text for doc in second.documents
+    ]
+    assert first.hot_references == second.hot_references
+    assert first.passage_count == 24
+    assert all(
+        passage.osis_ref for doc in first.documents for passage in doc.passages
+    )
+
+
+@pytest.mark.performance
+def test_benchmarks_report_percentiles_and_flag_regressions(tmp_path) -> None:
+    results = hot_path_benchmarks.run_benchmarks(
+        _SPEC,
+        workdir=tmp_path,
+        iterations=3,
+        only=["chunk_text", "get_mentions_for_osis", "hybrid_search"],
+        dimension=8,
+    )
+
+    assert set(results) == {"chunk_text", "get_mentions_for_osis", "hybrid_search"}
+    summary = results["get_mentions_for_osis"].as_dict()
+    assert summary["iterations"] == 3
+    assert 0 < summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
+    assert summary["peak_memory_kib"] > 0
+
+    baseline = tmp_path / "baseline.json"
+    current = hot_path_benchmarks.baseline_metrics(results)
+    # A baseline ten times faster than this run must be flagged as a regression.
+    baseline.write_text(json.dumps({key: value / 10 for key, value in current.items()}))
+    exit_code = hot_path_benchmarks.main(
+        [
+            "--documents", "6",
+            "--passages-per-document", "4",
+            "--iterations", "2",
+            "--only", "chunk_text",
+            "--workdir", str(tmp_path / "run"),
+            "--baseline", str(baseline),
+        ]
+    )
+    assert exit_code == 1
@@ -0,0 +1,123 @@
+"""Startup import budgets for the API, worker and CLI entry points.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime`` so
+the measurement is not polluted by modules this test session already loaded.
+The budgets are deliberately loose (roughly 1.3x the module counts measured
+when they were set); they exist to catch a heavy optional dependency creeping
+back onto the startup path, not to police small regressions.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+# Optional dependencies that must only be imported when a feature needs them.
+_HEAVY_MODULES: frozenset[str] = frozenset(
+    {
+        "FlagEmbedding",
+        "networkx",
+        "scipy",
+        "sklearn",
+        "tiktoken",
+        "torch",
+        "transformers",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _EntryPoint:
+    module: str
+    max_modules: int
+    max_seconds: float
+    forbidden: frozenset[str] = _HEAVY_MODULES
+
+
+_ENTRY_POINTS: tuple[_EntryPoint, ...] = (
+    _EntryPoint("theo.infrastructure.api.app.main", 2300, 6.0),
+    _EntryPoint(
+        "theo.infrastructure.api.app.workers.tasks",
+        1750,
+        4.0,
+        _HEAVY_MODULES | {"strawberry"},
+    ),
+    _EntryPoint(
+        "theo.services.cli.export_data", 1100, 3.0, _HEAVY_MODULES | {"strawberry"}
+    ),
+    _EntryPoint(
+        "theo.services.cli.ingest_folder",
+        1300,
+        3.0,
+        _HEAVY_MODULES | {"strawberry"},
+    ),
+)
+
+
+@dataclass(frozen=True)
+class _ImportProfile:
+    modules: frozenset[str]
+    total_seconds: float
+
+
+def _profile_import(module: str, cwd: Path) -> _ImportProfile:
+    env = {
+        key: value for key, value in os.environ.items() if key != "PYTHONPATH"
+    }
+    env.update(
+        {
+            "THEO_ALLOW_INSECURE_STARTUP": "1",
+            "THEORIA_ENVIRONMENT": "development",
+            "THEO_API_KEYS": '["import-time-test"]',
+        }
+    )
+    # Run outside the repository so the root ``sitecustomize`` is not loaded.
+    completed = subprocess.run(  # noqa: S603 - command built from trusted constants
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    modules: set[str] = set()
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        modules.add(name.strip())
+        # Top-level imports are indented by exactly one space.
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return _ImportProfile(frozenset(modules), total_us / 1_000_000)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "entry_point", _ENTRY_POINTS, ids=[entry.module for entry in _ENTRY_POINTS]
+)
+def test_entry_point_import_budget(entry_point: _EntryPoint, tmp_path: Path) -> None:
+    profile = _profile_import(entry_point.module, tmp_path)
+
+    loaded_roots = {name.split(".", 1)[0] for name in profile.modules}
+    assert not loaded_roots & entry_point.forbidden, (
+        f"{entry_point.module} imports heavy optional dependencies at startup: "
+        f"{sorted(loaded_roots & entry_point.forbidden)}"
+    )
+    assert len(profile.modules) <= entry_point.max_modules, (
+        f"{entry_point.module} imported {len(profile.modules)} modules "
+        f"(budget {entry_point.max_modules})"
+    )
+    assert profile.total_seconds <= entry_point.max_seconds, (
+        f"{entry_point.module} took {profile.total_seconds:.2f}s to import "
+        f"(budget {entry_point.max_seconds:.1f}s)"
+    )
@@ -0,0 +1,19 @@
+"""Smoke test for the near-duplicate detection benchmark."""
+from __future__ import annotations
+
+import pytest
+from scripts.perf import near_duplicate_benchmark
+
+
+@pytest.mark.performance
+def test_benchmark_indexes_corpus_and_finds_generated_copies(tmp_path) -> None:
+    outcome = near_duplicate_benchmark.run_benchmark(
+        workdir=tmp_path, passages=200, batch_size=50
+    )
+
+    assert outcome["passages"] == 200
+    assert outcome["generated_duplicates"] > 0
+    assert outcome["precision"] == 1.0
+    assert outcome["recall"] >= 0.9
+    assert outcome["index"].as_dict()["iterations"] == 4
+    assert outcome["signature"].as_dict()["items_per_second"] > 0
@@ -0,0 +1,35 @@
+"""Latency budget for the post-generation reasoning critique."""
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+
+from theo.infrastructure.api.app.ai.reasoning.metacognition import critique_reasoning
+
+_PARAGRAPH = (
+    "The passage is harmonious and consistent with the wider canon [1]. "
+    "Some scholars interpret the covenant as corporate, while others see it as personal. "
+    "It is not obviously a contradiction, though critics argue it is problematic. "
+    "If the law is good then obedience is good, therefore the law is obeyed. "
+)
+
+# Answer generation takes seconds; the critique over a ~60k character answer
+# must stay an order of magnitude below that.
+_BUDGET_SECONDS = 0.5
+
+
+@pytest.mark.performance
+def test_critique_of_long_answer_stays_within_budget() -> None:
+    answer = _PARAGRAPH * 200
+    citations = [{"index": 1, "passage_id": "p1", "snippet": "wider canon"}]
+    critique_reasoning(answer, answer, citations)  # warm regex caches
+
+    timings = []
+    for _ in range(3):
+        start = perf_counter()
+        critique = critique_reasoning(answer, answer, citations)
+        timings.append(perf_counter() - start)
+
+    assert critique.alternative_interpretations
+    assert min(timings) < _BUDGET_SECONDS
@@ -0,0 +1,24 @@
+"""Smoke test for the SQLite profile concurrency benchmark."""
+from __future__ import annotations
+
+import pytest
+from scripts.perf import sqlite_profile_benchmark
+
+
+@pytest.mark.performance
+def test_benchmark_runs_readers_and_writers_for_each_profile(tmp_path) -> None:
+    results = sqlite_profile_benchmark.run_benchmark(
+        sqlite_profile_benchmark.PROFILES,
+        workdir=tmp_path,
+        readers=2,
+        writers=2,
+        operations=10,
+        seed_rows=50,
+    )
+
+    assert sorted(results) == ["compat", "performance"]
+    performance = results["performance"]
+    assert performance["errors"] == []
+    assert performance["read"].as_dict()["iterations"] == 20
+    assert performance["write"].as_dict()["iterations"] == 20
+    assert performance["ops_per_second"] > 0
@@ -0,0 +1,132 @@
+"""Tests for the cross-encoder reranking stage."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from theo.infrastructure.api.app.infra.retrieval_service import RetrievalService
+from theo.infrastructure.api.app.models.search import (
+    HybridSearchRequest,
+    HybridSearchResult,
+)
+from theo.infrastructure.api.app.ranking import cross_encoder
+from theo.infrastructure.api.app.ranking.cross_encoder import (
+    CrossEncoderReranker,
+    CrossEncoderScoreCache,
+    query_fingerprint,
+)
+
+
+class _OverlapBackend:
+    """Scores a pair by the number of query words found in the passage."""
+
+    def __init__(self, clock: list[float] | None = None) -> None:
+        self.clock = clock
+        self.batches: list[int] = []
+
+    def compute_score(self, sentence_pairs, batch_size=16):  # type: ignore[no-untyped-def]
+        self.batches.append(len(sentence_pairs))
+        if self.clock is not None:
+            self.clock[0] += 0.02
+        return [
+            float(len(set(query.split()) & set(passage.split())))
+            for query, passage in sentence_pairs
+        ]
+
+
+def _result(identifier: str, text: str, rank: int) -> HybridSearchResult:
+    return HybridSearchResult(
+        id=identifier,
+        document_id="doc",
+        text=text,
+        snippet=text,
+        rank=rank,
+        score=1.0 / rank,
+        meta={"source": identifier},
+    )
+
+
+def _results() -> list[HybridSearchResult]:
+    return [
+        _result("a", "in the beginning", 1),
+        _result("b", "god so loved the world", 2),
+        _result("c", "the world was without form", 3),
+    ]
+
+
+def test_rerank_orders_by_pair_score_without_mutating_inputs() -> None:
+    backend = _OverlapBackend()
+    reranker = CrossEncoderReranker(backend, model_name="stub", batch_size=2)
+    results = _results()
+
+    reranked = reranker.rerank(results, query="god loved the world")
+
+    assert [item.id for item in reranked] == ["b", "c", "a"]
+    assert [item.rank for item in reranked] == [1, 2, 3]
+    assert reranked[0].score == 4.0
+    assert [item.rank for item in results] == [1, 2, 3]
+    assert backend.batches == [2, 1]
+
+
+def test_scores_are_cached_per_query_passage_and_model() -> None:
+    backend = _OverlapBackend()
+    cache = CrossEncoderScoreCache(max_entries=10)
+    reranker = CrossEncoderReranker(backend, model_name="stub", cache=cache)
+
+    reranker.score("The  World", _results())
+    reranker.score("the world", _results())
+    assert backend.batches == [3]
+    assert cache.hits == 3
+
+    other_model = CrossEncoderReranker(backend, model_name="other", cache=cache)
+    other_model.score("the world", _results())
+    assert backend.batches == [3, 3]
+    assert (query_fingerprint("the world"), "a", "other") in cache.get_many(
+        [(query_fingerprint("the world"), "a", "other")]
+    )
+
+
+def test_latency_budget_leaves_tail_in_retrieval_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(cross_encoder.time, "perf_counter", lambda: clock[0])
+    backend = _OverlapBackend(clock)
+    reranker = CrossEncoderReranker(
+        backend, model_name="stub", batch_size=1, latency_budget_ms=1.0
+    )
+
+    scores = reranker.score("world", _results())
+    reranked = reranker.rerank(_results(), query="world")
+
+    assert backend.batches == [1, 1]
+    assert scores[0] == 0.0 and all(value != value for value in scores[1:])
+    # Only "a" (cached) and one fresh pair were scored; the rest keep order.
+    assert [item.id for item in reranked] == ["b", "a", "c"]
+
+
+def test_retrieval_service_applies_cross_encoder_stage() -> None:
+    results = _results()
+    service = RetrievalService(
+        settings=SimpleNamespace(reranker_enabled=False),
+        search_fn=lambda _session, _request: [item.model_copy() for item in results],
+        experiment_analytics=SimpleNamespace(record_reranker_outcome=lambda _o: None),
+        cross_encoder=CrossEncoderReranker(
+            _OverlapBackend(), model_name="bge-reranker", top_n=2
+        ),
+    )
+
+    reranked, header = service.search(
+        None, HybridSearchRequest(query="god so loved the world", k=3)
+    )
+
+    assert [item.id for item in reranked] == ["b", "a", "c"]
+    assert [item.rank for item in reranked] == [1, 2, 3]
+    assert header == "bge-reranker"
+
+
+def test_invalid_batch_size_rejected() -> None:
+    with pytest.raises(ValueError):
+        CrossEncoderReranker(_OverlapBackend(), model_name="stub", batch_size=0)
@@ -0,0 +1,146 @@
+"""Tests for the precomputed passage feature store."""
+
+from __future__ import annotations
+
+import math
+import threading
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.models import (
+    Document,
+    FeedbackEvent,
+    FeedbackEventAction,
+    Passage,
+)
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.models.search import HybridSearchResult
+from theo.infrastructure.api.app.ranking import feature_store
+from theo.infrastructure.api.app.ranking.feature_store import (
+    STORE_FEATURE_NAMES,
+    PassageFeatureStore,
+    get_passage_feature_store,
+    rebuild_passage_features,
+    refresh_passage_feature_store,
+)
+from theo.infrastructure.api.app.ranking.features import FEATURE_NAMES
+from theo.infrastructure.api.app.ranking.re_ranker import Reranker
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'features.db'}")
+    Base.metadata.create_all(engine)
+    feature_store.invalidate_passage_feature_store()
+    with Session(engine) as session:
+        session.add(Document(id="doc", title="Doc", provenance_score=80))
+        session.add(
+            Passage(
+                id="cited",
+                document_id="doc",
+                text="For God so loved the world",
+                tokens=20,
+                osis_ref="John.3.16-John.3.17",
+                osis_verse_ids=[43003016, 43003017],
+            )
+        )
+        session.add(Passage(id="plain", document_id="doc", text="word " * 50))
+        for action in (
+            FeedbackEventAction.USED_IN_ANSWER,
+            FeedbackEventAction.USED_IN_ANSWER,
+            FeedbackEventAction.LIKE,
+            FeedbackEventAction.DISLIKE,
+        ):
+            session.add(FeedbackEvent(passage_id="cited", action=action))
+        session.commit()
+        yield session
+    engine.dispose()
+    feature_store.invalidate_passage_feature_store()
+
+
+def _column(name: str) -> int:
+    return STORE_FEATURE_NAMES.index(name)
+
+
+def _wait_for_refresh() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "passage-feature-store-refresh":
+            thread.join(timeout=30)
+
+
+def test_rebuild_aggregates_feedback_and_passage_signals(session: Session) -> None:
+    stats = rebuild_passage_features(session)
+    assert (stats.passages, stats.with_feedback) == (2, 1)
+
+    store = refresh_passage_feature_store(session)
+    assert store is not None and len(store) == 2
+
+    rows = store.gather(["cited", "unknown", "plain"])
+    assert rows.shape == (3, len(STORE_FEATURE_NAMES))
+    cited, unknown, plain = rows
+    assert cited[_column("citation_count")] == pytest.approx(math.log1p(2))
+    assert cited[_column("feedback_positive")] == pytest.approx(math.log1p(1))
+    assert cited[_column("feedback_negative")] == pytest.approx(math.log1p(1))
+    assert cited[_column("provenance_score")] == pytest.approx(0.8)
+    assert cited[_column("osis_density")] == pytest.approx(10.0)
+    assert plain[_column("osis_density")] == 0.0
+    assert plain[_column("passage_length")] > 0.0
+    assert not unknown.any()
+
+
+def test_lookups_serve_current_store_while_refreshing(session: Session) -> None:
+    assert get_passage_feature_store(session) is None
+    _wait_for_refresh()
+    empty = get_passage_feature_store(session)
+    assert empty is not None and len(empty) == 0
+
+    rebuild_passage_features(session)
+    assert get_passage_feature_store(session) is empty
+    _wait_for_refresh()
+    refreshed = get_passage_feature_store(session)
+    assert refreshed is not empty and len(refreshed) == 2
+
+
+class _RecordingEstimator:
+    n_features_in_ = len(FEATURE_NAMES) + len(STORE_FEATURE_NAMES)
+
+    def __init__(self) -> None:
+        self.seen: list[list[float]] = []
+
+    def predict(self, features):
+        self.seen = features
+        return [row[len(FEATURE_NAMES) + _column("citation_count")] for row in features]
+
+
+def _result(identifier: str, rank: int) -> HybridSearchResult:
+    return HybridSearchResult(
+        id=identifier,
+        document_id="doc",
+        text=identifier,
+        snippet=identifier,
+        rank=rank,
+        score=1.0 / rank,
+    )
+
+
+def test_reranker_appends_store_features_when_trained_with_them() -> None:
+    store = PassageFeatureStore(
+        ["a", "b"],
+        np.array(
+            [
+                [0, 0, 0, 0.1, 0, 0, 0],
+                [0, 0, 0, 2.0, 0, 0, 0],
+            ]
+        ),
+    )
+    estimator = _RecordingEstimator()
+    reranker = Reranker(estimator)
+
+    reranked = reranker.rerank([_result("a", 1), _result("b", 2)], feature_store=store)
+
+    assert reranker.uses_feature_store
+    assert [item.id for item in reranked] == ["b", "a"]
+    assert len(estimator.seen[0]) == len(FEATURE_NAMES) + len(STORE_FEATURE_NAMES)
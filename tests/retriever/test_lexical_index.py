@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, delete, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from theo.adapters.persistence.models import Document, Passage
+from theo.application.facades.database import Base
+from theo.infrastructure.api.app.models.search import HybridSearchRequest
+from theo.infrastructure.api.app.retriever import hybrid
+from theo.infrastructure.api.app.retriever.lexical_index import (
+    LexicalQuery,
+    get_lexical_index,
+    parse_lexical_query,
+    rebuild_lexical_index,
+)
+
+
+@pytest.fixture()
+def sqlite_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'lexical.db'}")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, future=True)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _add_passages(session: Session, texts: dict[str, str]) -> None:
+    session.add(Document(id="doc-1", title="Sermons", collection="sermons"))
+    for passage_id, body in texts.items():
+        session.add(Passage(id=passage_id, document_id="doc-1", text=body))
+    session.commit()
+
+
+def _search(session: Session, query: str) -> list[str]:
+    results = hybrid.hybrid_search(session, HybridSearchRequest(query=query, k=10))
+    return [result.id for result in results]
+
+
+def test_parse_lexical_query_handles_phrases_prefixes_and_punctuation():
+    parsed = parse_lexical_query('Grace "born again" justif* John\'s grace')
+
+    assert parsed == LexicalQuery(
+        terms=("grace",),
+        prefixes=("justif",),
+        phrases=(("born", "again"), ("john", "s")),
+    )
+    assert parsed.to_fts5() == '"grace" "justif"* "born again" "john s"'
+    assert parsed.tokens == ["grace", "justif", "born", "again", "john", "s"]
+    assert parse_lexical_query('  "" * ').is_empty()
+
+
+def test_bm25_ranks_rare_terms_and_rejects_substring_matches(sqlite_session):
+    _add_passages(
+        sqlite_session,
+        {
+            "common": "Grace grace grace and faith in every line.",
+            "rare": "Propitiation through faith in his blood.",
+            "substring": "The disgraceful episode is recounted.",
+        },
+    )
+
+    assert _search(sqlite_session, "grace") == ["common"]
+    assert _search(sqlite_session, "faith propitiation") == ["rare"]
+
+
+def test_phrase_and_prefix_queries(sqlite_session):
+    _add_passages(
+        sqlite_session,
+        {
+            "phrase": "Except a man be born again he cannot see the kingdom.",
+            "split": "He was born in Bethlehem and came again later.",
+            "prefix": "Being justified by faith we have peace.",
+        },
+    )
+
+    assert _search(sqlite_session, '"born again"') == ["phrase"]
+    assert set(_search(sqlite_session, "born again")) == {"phrase", "split"}
+    assert _search(sqlite_session, "justif*") == ["prefix"]
+
+
+def test_index_tracks_inserts_updates_and_deletes(sqlite_session):
+    _add_passages(sqlite_session, {"p1": "Mercy endures forever."})
+    assert _search(sqlite_session, "mercy") == ["p1"]
+
+    passage = sqlite_session.get(Passage, "p1")
+    passage.text = "Lovingkindness endures forever."
+    sqlite_session.add(Passage(id="p2", document_id="doc-1", text="Mercy triumphs."))
+    sqlite_session.commit()
+    assert _search(sqlite_session, "mercy") == ["p2"]
+
+    sqlite_session.execute(delete(Passage).where(Passage.id == "p2"))
+    sqlite_session.commit()
+    assert _search(sqlite_session, "mercy") == []
+    count = sqlite_session.execute(text("SELECT count(*) FROM passage_fts")).scalar()
+    assert count == 1
+
+
+def test_index_is_backfilled_for_existing_passages(sqlite_session):
+    _add_passages(sqlite_session, {"p1": "Hope does not disappoint."})
+    bind = sqlite_session.get_bind()
+
+    assert rebuild_lexical_index(bind) is True
+    sqlite_session.execute(text("DROP TABLE passage_fts"))
+    sqlite_session.commit()
+
+    assert get_lexical_index(sqlite_session) is not None
+    assert _search(sqlite_session, "hope") == ["p1"]
+
+
+def test_backfill_survives_rolled_back_read_session(sqlite_session):
+    _add_passages(sqlite_session, {"p1": "Hope does not disappoint."})
+    engine = sqlite_session.get_bind()
+
+    with Session(engine) as reader:
+        assert _search(reader, "hope") == ["p1"]
+        reader.rollback()
+
+    with Session(engine) as reader:
+        assert _search(reader, "hope") == ["p1"]
+
+
+def test_in_memory_backfill_survives_rolled_back_read_session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as writer:
+            _add_passages(writer, {"p1": "Hope does not disappoint."})
+
+        with Session(engine) as reader:
+            assert _search(reader, "hope") == ["p1"]
+            reader.rollback()
+
+        with Session(engine) as reader:
+            assert _search(reader, "hope") == ["p1"]
+    finally:
+        engine.dispose()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from theo.infrastructure.api.app.ingest.chunking import chunk_text, chunk_transcript
+from theo.infrastructure.api.app.ingest.chunking import (
+    TextBlock,
+    chunk_text,
+    chunk_transcript,
+    iter_chunks,
+)
 from theo.infrastructure.api.app.ingest.parsers import TranscriptSegment
 
 
@@ -44,6 +49,47 @@ def test_chunk_text_splits_overlong_paragraphs_on_sentence_boundaries() -> None:
     assert chunks[2].text.endswith("paragraph.")
 
 
+def test_chunk_text_offsets_slice_the_source_text() -> None:
+    text = "Alpha beta.\n\n  Alpha beta.  \n\n\n\nGamma. Delta epsilon! Zeta"
+
+    chunks = chunk_text(text, max_tokens=2, min_tokens=1, hard_cap=2)
+
+    assert [chunk.text for chunk in chunks] == [
+        "Alpha beta.",
+        "Alpha beta.",
+        "Gamma.",
+        "Delta epsilon!",
+        "Zeta",
+    ]
+    for chunk in chunks:
+        assert text[chunk.start_char : chunk.end_char] == chunk.text
+
+
+def test_iter_chunks_streams_pages_without_crossing_page_boundaries() -> None:
+    pages = [
+        TextBlock("Page one opens.\n\nStill page one.", page_no=1),
+        TextBlock("", page_no=2),
+        TextBlock("Page three text.", page_no=3),
+    ]
+    consumed: list[int | None] = []
+
+    def stream():
+        for page in pages:
+            consumed.append(page.page_no)
+            yield page
+
+    chunks = iter_chunks(stream(), max_tokens=50, min_tokens=10)
+    first = next(chunks)
+
+    assert consumed == [1, 2]
+    assert first.page_no == 1
+    assert first.text == "Page one opens.\n\nStill page one."
+    rest = list(chunks)
+    assert [(chunk.page_no, chunk.index) for chunk in rest] == [(3, 1)]
+    joined = "\n".join(page.text for page in pages)
+    assert joined[rest[0].start_char : rest[0].end_char] == "Page three text."
+
+
 def test_chunk_transcript_flushes_on_time_window_and_preserves_metadata() -> None:
     segments = [
         TranscriptSegment(text="alpha beta", start=0.0, end=5.0, speaker="Alice"),
@@ -0,0 +1,172 @@
+"""Tests for the parse cache and the duplicate filter in file ingestion."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("THEO_FORCE_EMBEDDING_FALLBACK", "1")
+
+from theo.adapters.persistence.models import Document  # noqa: E402
+from theo.application.facades.database import Base  # noqa: E402
+from theo.application.facades.settings import Settings  # noqa: E402
+from theo.infrastructure.api.app.ingest import pipeline  # noqa: E402
+from theo.infrastructure.api.app.ingest.chunking import Chunk  # noqa: E402
+from theo.infrastructure.api.app.ingest.exceptions import (  # noqa: E402
+    UnsupportedSourceError,
+)
+from theo.infrastructure.api.app.ingest.parse_cache import (  # noqa: E402
+    CachedParse,
+    ParseCache,
+    parse_cache_key,
+)
+from theo.infrastructure.api.app.ingest.parsers import ParserResult  # noqa: E402
+from theo.infrastructure.api.app.ingest.stages import (  # noqa: E402
+    parsers as parser_stages,
+)
+
+
+def _entry(text: str) -> CachedParse:
+    chunk = Chunk(text=text, start_char=0, end_char=len(text), page_no=2, index=0)
+    result = ParserResult(
+        text=text, chunks=[chunk], parser="pypdf", parser_version="5.0"
+    )
+    return CachedParse(result, text, {"title": "Cached"})
+
+
+def test_parse_cache_round_trips_and_evicts_least_recently_used(
+    tmp_path: Path,
+) -> None:
+    cache = ParseCache(tmp_path / "cache", max_bytes=10_000)
+    keys = [
+        parse_cache_key(f"sha-{i}", parser="file_parser:pdf", parser_version="5.0")
+        for i in range(3)
+    ]
+    cache.put(keys[0], _entry("alpha " * 50))
+    stored = cache.get(keys[0])
+    assert stored is not None
+    assert stored.parser_result.chunks[0].page_no == 2
+    assert stored.frontmatter == {"title": "Cached"}
+
+    entry_size = cache.stats().bytes
+    cache.max_bytes = entry_size * 2
+    cache.put(keys[1], _entry("alpha " * 50))
+    assert cache.get(keys[0]) is not None  # keys[1] is now the oldest
+    cache.put(keys[2], _entry("alpha " * 50))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
+
+    # A fresh instance rebuilds its index from the directory.
+    reopened = ParseCache(tmp_path / "cache", max_bytes=10_000)
+    assert reopened.stats().entries == 2
+
+
+def test_parse_cache_key_covers_parser_and_options() -> None:
+    base = parse_cache_key(
+        "sha", parser="p", parser_version="1", options={"max_chunk_tokens": 900}
+    )
+    assert base == parse_cache_key(
+        "sha", parser="p", parser_version="1", options={"max_chunk_tokens": 900}
+    )
+    assert base != parse_cache_key(
+        "sha", parser="p", parser_version="2", options={"max_chunk_tokens": 900}
+    )
+    assert base != parse_cache_key(
+        "sha", parser="p", parser_version="1", options={"max_chunk_tokens": 400}
+    )
+
+
+@pytest.fixture()
+def ingest_setup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(engine)
+    settings = Settings(
+        storage_root=tmp_path / "storage",
+        ingest_parse_cache_dir=tmp_path / "parse-cache",
+    )
+    parse_calls: list[str] = []
+    original = parser_stages._parse_file
+
+    def _counting_parse(source_type, path, **kwargs):
+        parse_calls.append(path.name)
+        return original(source_type, path, **kwargs)
+
+    monkeypatch.setattr(parser_stages, "_parse_file", _counting_parse)
+    try:
+        yield engine, settings, parse_calls
+    finally:
+        engine.dispose()
+
+
+def test_reingesting_unchanged_file_reuses_document_without_parsing(
+    tmp_path: Path, ingest_setup
+) -> None:
+    engine, settings, parse_calls = ingest_setup
+    source = tmp_path / "sermon.md"
+    source.write_text("---\ntitle: Sermon\n---\n\nIn the beginning was the Word.")
+    dependencies = pipeline.PipelineDependencies(
+        settings=settings, reuse_duplicates=True
+    )
+
+    with Session(engine) as session:
+        first = pipeline.run_pipeline_for_file(
+            session, source, {"collection": "a"}, dependencies=dependencies
+        )
+        session.commit()
+        first_id = first.id
+
+    with Session(engine) as session:
+        again = pipeline.run_pipeline_for_file(
+            session, source, {"collection": "a"}, dependencies=dependencies
+        )
+        assert again.id == first_id
+        assert parse_calls == ["sermon.md"]
+
+        # Changed frontmatter is not a silent no-op.
+        with pytest.raises(UnsupportedSourceError, match="already ingested"):
+            pipeline.run_pipeline_for_file(
+                session, source, {"collection": "b"}, dependencies=dependencies
+            )
+        # Without opting in, duplicates fail before the payload is parsed.
+        with pytest.raises(UnsupportedSourceError, match="already ingested"):
+            pipeline.run_pipeline_for_file(
+                session,
+                source,
+                {"collection": "a"},
+                dependencies=pipeline.PipelineDependencies(settings=settings),
+            )
+        assert parse_calls == ["sermon.md"]
+        assert session.scalar(select(func.count()).select_from(Document)) == 1
+
+
+def test_parse_cache_serves_reingest_after_document_removal(
+    tmp_path: Path, ingest_setup
+) -> None:
+    engine, settings, parse_calls = ingest_setup
+    source = tmp_path / "notes.txt"
+    source.write_text("Grace and peace to you.")
+    dependencies = pipeline.PipelineDependencies(settings=settings)
+
+    with Session(engine) as session:
+        first = pipeline.run_pipeline_for_file(
+            session, source, dependencies=dependencies
+        )
+        session.delete(first)
+        session.commit()
+
+    with Session(engine) as session:
+        second = pipeline.run_pipeline_for_file(
+            session, source, dependencies=dependencies
+        )
+        session.commit()
+        assert [passage.text for passage in second.passages] == [
+            "Grace and peace to you."
+        ]
+    assert parse_calls == ["notes.txt"]
@@ -382,10 +382,13 @@ def test_run_pipeline_for_file_wires_expected_stages(monkeypatch: pytest.MonkeyP
     stages = captured["stages"]
     assert isinstance(stages[0], pipeline.FileSourceFetcher)
     assert stages[0].frontmatter == {"merged": True}
-    assert isinstance(stages[1], pipeline.FileParser)
-    assert isinstance(stages[2], pipeline.DocumentEnricher)
-    assert isinstance(stages[3], pipeline.TextDocumentPersister)
-    assert stages[3].session is session
+    assert isinstance(stages[1], pipeline.DuplicateDocumentFilter)
+    assert stages[1].session is session
+    assert stages[1].reuse_existing is False
+    assert isinstance(stages[2], pipeline.FileParser)
+    assert isinstance(stages[3], pipeline.DocumentEnricher)
+    assert isinstance(stages[4], pipeline.TextDocumentPersister)
+    assert stages[4].session is session
     assert fake_dependencies.captured_span is captured["span"]
     assert captured["workflow"] == "ingest.file"
     assert captured["attrs"] == {"source_path": str(path), "source_name": path.name}
@@ -158,9 +158,10 @@ class WorkerStubContext:
     def __init__(self, monkeypatch: pytest.MonkeyPatch, worker_engine) -> None:
         self._monkeypatch = monkeypatch
         self._engine = worker_engine
+        database = worker_engine.url.database
         self._db_path = (
-            Path(worker_engine.url.database).resolve()
-            if worker_engine.url.database
+            Path(database).resolve()
+            if database and database != ":memory:"
             else None
         )
         self._original_deps = tasks.get_worker_dependencies()
@@ -415,6 +416,7 @@ class WorkerStubContext:
                 error=error,
                 document_id=document_id,
             )
+            session.commit()
 
     def _record_notification(self, *args: Any, **kwargs: Any) -> None:
         self.notification_calls.append({"args": args, "kwargs": kwargs})
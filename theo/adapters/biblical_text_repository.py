@@ -0,0 +1,610 @@
+"""Columnar, index-backed :class:`BiblicalTextRepository` over JSONL corpora.
+
+Each version lives in a directory such as ``data/bibles/hebrew-wlc`` holding a
+``manifest.yaml`` and one or more ``*.jsonl`` files of serialised
+:class:`~theo.domain.biblical_texts.BiblicalVerse` records. On first use a
+version is loaded into a :class:`ColumnarCorpus`: every morphological token
+becomes one row of parallel integer arrays (word, lemma, root, part of speech,
+stem, number, person and owning verse), and inverted indexes map normalised
+word forms, lemmas and roots to the sorted verse ids that contain them.
+Concordance and root lookups are therefore dictionary hits returning
+precomputed arrays, and morphological queries are vectorised masks over the
+token columns rather than walks over every ``MorphologicalTag``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import yaml
+
+from theo.domain.biblical_texts import (
+    POS,
+    AIAnalysis,
+    BibleVersion,
+    BiblicalBook,
+    BiblicalVerse,
+    HebrewStem,
+    Language,
+    ManuscriptData,
+    MorphologicalTag,
+    Reference,
+    SemanticAnalysis,
+    TextContent,
+    normalize_hebrew_text,
+)
+from theo.domain.repositories.biblical_texts import BiblicalTextRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BIBLES_ROOT = Path(__file__).resolve().parents[2] / "data" / "bibles"
+MANIFEST_FILENAME = "manifest.yaml"
+
+_EMPTY = np.empty(0, dtype=np.int32)
+_ELOHIM = normalize_hebrew_text("אלהים")
+
+
+def normalize_form(value: str | None) -> str:
+    """Return the index key for a word, lemma or root."""
+
+    return normalize_hebrew_text(value).strip().casefold()
+
+
+class Vocabulary:
+    """Bidirectional mapping between strings and dense integer codes.
+
+    Code ``0`` is reserved for "absent" so optional columns need no mask.
+    """
+
+    __slots__ = ("_codes", "values")
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {"": 0}
+        self.values: list[str] = [""]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: str | None) -> int:
+        if not value:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str | None) -> int | None:
+        """Return the code for *value*, or ``None`` when it never occurs."""
+
+        if not value:
+            return None
+        return self._codes.get(value)
+
+
+def _text(value: object) -> str | None:
+    if value is None:
+        return None
+    text = getattr(value, "value", value)
+    return str(text).strip().lower() or None
+
+
+def _person(value: object) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _inverted_index(codes: np.ndarray, verses: np.ndarray) -> dict[int, np.ndarray]:
+    """Map each non-zero code to the sorted, unique verse ids containing it."""
+
+    order = np.lexsort((verses, codes))
+    sorted_codes = codes[order]
+    sorted_verses = verses[order]
+    boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(sorted_codes)]))
+    index: dict[int, np.ndarray] = {}
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        code = int(sorted_codes[start])
+        if code == 0:
+            continue
+        block = sorted_verses[start:end]
+        keep = np.ones(len(block), dtype=bool)
+        keep[1:] = block[1:] != block[:-1]
+        index[code] = block[keep]
+    return index
+
+
+@dataclass(slots=True, frozen=True)
+class TokenColumns:
+    """Parallel per-token arrays; row ``i`` describes the ``i``-th token."""
+
+    verse: np.ndarray
+    word: np.ndarray
+    lemma: np.ndarray
+    root: np.ndarray
+    pos: np.ndarray
+    stem: np.ndarray
+    number: np.ndarray
+    person: np.ndarray
+    divine_name: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.verse)
+
+
+class ColumnarCorpus:
+    """Verses of one version with columnar morphology and inverted indexes."""
+
+    def __init__(self, verses: Sequence[BiblicalVerse]) -> None:
+        self.verses: list[BiblicalVerse] = list(verses)
+        self.words = Vocabulary()
+        self.lemmas = Vocabulary()
+        self.roots = Vocabulary()
+        self.tags = Vocabulary()
+        self.books = Vocabulary()
+
+        self._by_reference: dict[tuple[str, int, int], int] = {}
+        self._by_osis: dict[str, int] = {}
+        verse_books: list[int] = []
+        columns: dict[str, list[int]] = {
+            name: []
+            for name in (
+                "verse", "word", "lemma", "root", "pos", "stem", "number", "person"
+            )
+        }
+        divine: list[bool] = []
+        for verse_id, verse in enumerate(self.verses):
+            reference = verse.reference
+            book = reference.book_id.lower()
+            verse_books.append(self.books.add(book))
+            self._by_reference[(book, reference.chapter, reference.verse)] = verse_id
+            self._by_osis[reference.osis_id] = verse_id
+            for tag in verse.morphology:
+                columns["verse"].append(verse_id)
+                columns["word"].append(self.words.add(normalize_form(tag.word)))
+                columns["lemma"].append(self.lemmas.add(normalize_form(tag.lemma)))
+                columns["root"].append(self.roots.add(normalize_form(tag.root)))
+                columns["pos"].append(self.tags.add(_text(tag.pos)))
+                columns["stem"].append(self.tags.add(_text(tag.stem)))
+                columns["number"].append(self.tags.add(_text(tag.number)))
+                columns["person"].append(_person(tag.person))
+                divine.append("divine_name" in (tag.theological_notes or ()))
+
+        self.verse_books = np.asarray(verse_books, dtype=np.int32)
+        self.tokens = TokenColumns(
+            **{
+                name: np.asarray(values, dtype=np.int32)
+                for name, values in columns.items()
+            },
+            divine_name=np.asarray(divine, dtype=bool),
+        )
+        self._word_index = _inverted_index(self.tokens.word, self.tokens.verse)
+        self._lemma_index = _inverted_index(self.tokens.lemma, self.tokens.verse)
+        self._root_index = _inverted_index(self.tokens.root, self.tokens.verse)
+        self._elohim_singular: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.verses)
+
+    # ------------------------------------------------------------------
+    # Point lookups
+    # ------------------------------------------------------------------
+    def verse_id(self, reference: Reference) -> int | None:
+        verse_id = self._by_reference.get(
+            (reference.book_id.lower(), reference.chapter, reference.verse)
+        )
+        if verse_id is None:
+            verse_id = self._by_osis.get(reference.osis_id)
+        return verse_id
+
+    def get(self, reference: Reference) -> BiblicalVerse | None:
+        verse_id = self.verse_id(reference)
+        return None if verse_id is None else self.verses[verse_id]
+
+    # ------------------------------------------------------------------
+    # Index queries returning sorted verse id arrays
+    # ------------------------------------------------------------------
+    def word_verses(self, word: str) -> np.ndarray:
+        code = self.words.lookup(normalize_form(word))
+        return _EMPTY if code is None else self._word_index[code]
+
+    def lemma_verses(self, lemma: str) -> np.ndarray:
+        code = self.lemmas.lookup(normalize_form(lemma))
+        return _EMPTY if code is None else self._lemma_index[code]
+
+    def root_verses(self, root: str) -> np.ndarray:
+        code = self.roots.lookup(normalize_form(root))
+        return _EMPTY if code is None else self._root_index[code]
+
+    def term_verses(self, term: str) -> np.ndarray:
+        """Return verses where every word of *term* occurs as a form or lemma."""
+
+        matched: np.ndarray | None = None
+        for part in term.split():
+            hits = np.union1d(self.word_verses(part), self.lemma_verses(part))
+            matched = hits if matched is None else np.intersect1d(
+                matched, hits, assume_unique=True
+            )
+            if not len(matched):
+                break
+        return _EMPTY if matched is None else matched
+
+    def token_verses(
+        self,
+        *,
+        lemma: str | None = None,
+        root: str | None = None,
+        pos: POS | str | None = None,
+        stem: HebrewStem | str | None = None,
+        number: str | None = None,
+        person: int | None = None,
+        divine_name: bool | None = None,
+    ) -> np.ndarray:
+        """Return verses containing a single token matching every criterion."""
+
+        tokens = self.tokens
+        mask = np.ones(len(tokens), dtype=bool)
+        for column, vocabulary, value in (
+            (tokens.lemma, self.lemmas, normalize_form(lemma) if lemma else None),
+            (tokens.root, self.roots, normalize_form(root) if root else None),
+            (tokens.pos, self.tags, _text(pos)),
+            (tokens.stem, self.tags, _text(stem)),
+            (tokens.number, self.tags, _text(number)),
+        ):
+            if value is None:
+                continue
+            code = vocabulary.lookup(value)
+            if code is None:
+                return _EMPTY
+            mask &= column == code
+        if person is not None:
+            mask &= tokens.person == person
+        if divine_name is not None:
+            mask &= tokens.divine_name == divine_name
+        return np.unique(tokens.verse[mask])
+
+    def restrict_to_books(
+        self, verse_ids: np.ndarray, books: Iterable[str] | None
+    ) -> np.ndarray:
+        if books is None:
+            return verse_ids
+        codes = [
+            code
+            for code in (self.books.lookup(book.lower()) for book in books)
+            if code is not None
+        ]
+        if not codes:
+            return _EMPTY
+        return verse_ids[np.isin(self.verse_books[verse_ids], codes)]
+
+    def elohim_singular_verb_verses(self) -> np.ndarray:
+        """Verses pairing plural אלהים with a third-person singular verb.
+
+        Mirrors :meth:`TheologicalTermTracker.find_elohim_singular_verbs` with
+        two token masks and one sorted intersection, computed once per corpus.
+        """
+
+        if self._elohim_singular is None:
+            self._elohim_singular = self._elohim_singular_verb_verses()
+        return self._elohim_singular
+
+    def _elohim_singular_verb_verses(self) -> np.ndarray:
+        tokens = self.tokens
+        plural = self.tags.lookup("plural")
+        singular = self.tags.lookup("singular")
+        verb = self.tags.lookup(POS.VERB.value)
+        if plural is None or singular is None or verb is None:
+            return _EMPTY
+        elohim_code = self.lemmas.lookup(_ELOHIM)
+        is_elohim = tokens.divine_name.copy()
+        if elohim_code is not None:
+            is_elohim |= tokens.lemma == elohim_code
+        elohim = np.unique(tokens.verse[is_elohim & (tokens.number == plural)])
+        verbs = np.unique(
+            tokens.verse[
+                (tokens.pos == verb)
+                & (tokens.number == singular)
+                & (tokens.person == 3)
+            ]
+        )
+        return np.intersect1d(elohim, verbs, assume_unique=True)
+
+    def materialise(self, verse_ids: np.ndarray) -> list[BiblicalVerse]:
+        verses = self.verses
+        return [verses[index] for index in verse_ids.tolist()]
+
+
+# ----------------------------------------------------------------------
+# JSONL decoding
+# ----------------------------------------------------------------------
+def _pos(value: object) -> POS:
+    try:
+        return POS(str(value).strip().lower())
+    except ValueError:
+        return POS.NOUN
+
+
+def _stem(value: object) -> HebrewStem | str | None:
+    if not value:
+        return None
+    try:
+        return HebrewStem(str(value).strip().lower())
+    except ValueError:
+        return str(value)
+
+
+def _tag_from_record(data: Mapping[str, Any]) -> MorphologicalTag:
+    return MorphologicalTag(
+        word=str(data.get("word") or ""),
+        lemma=str(data.get("lemma") or ""),
+        root=data.get("root"),
+        pos=_pos(data.get("pos", "noun")),
+        gender=data.get("gender"),
+        number=data.get("number"),
+        state=data.get("state"),
+        stem=_stem(data.get("stem")),
+        tense=data.get("tense"),
+        person=data.get("person"),
+        prefix=data.get("prefix"),
+        suffix=data.get("suffix"),
+        gloss=data.get("gloss") or "",
+        theological_notes=list(data.get("theological_notes") or []),
+    )
+
+
+def verse_from_record(record: Mapping[str, Any]) -> BiblicalVerse:
+    """Build a :class:`BiblicalVerse` from one decoded JSONL record."""
+
+    reference = Reference(**record["reference"])
+    text = record.get("text") or {}
+    raw = text.get("raw") or ""
+    semantic = record.get("semantic_analysis")
+    manuscript = record.get("manuscript_data")
+    ai = record.get("ai_analysis")
+    return BiblicalVerse(
+        reference=reference,
+        language=Language(record.get("language", "hebrew")),
+        text=TextContent(
+            raw=raw,
+            normalized=text.get("normalized") or normalize_hebrew_text(raw),
+            transliteration=text.get("transliteration"),
+        ),
+        morphology=[_tag_from_record(tag) for tag in record.get("morphology") or []],
+        semantic_analysis=SemanticAnalysis(
+            themes=list(semantic.get("themes") or []),
+            theological_keywords=list(semantic.get("theological_keywords") or []),
+            cross_references=list(semantic.get("cross_references") or []),
+            textual_variants=list(semantic.get("textual_variants") or []),
+            translation_notes=dict(semantic.get("translation_notes") or {}),
+        )
+        if semantic
+        else None,
+        manuscript_data=ManuscriptData(
+            source=manuscript.get("source", ""),
+            variants=list(manuscript.get("variants") or []),
+            masoretic_notes=list(manuscript.get("masoretic_notes") or []),
+            critical_apparatus=list(manuscript.get("critical_apparatus") or []),
+        )
+        if manuscript
+        else None,
+        ai_analysis=AIAnalysis(
+            generated_at=datetime.fromisoformat(ai["generated_at"]),
+            model_version=ai.get("model_version", ""),
+            confidence_scores=dict(ai.get("confidence_scores") or {}),
+        )
+        if ai and ai.get("generated_at")
+        else None,
+    )
+
+
+def load_verses(paths: Iterable[Path]) -> list[BiblicalVerse]:
+    verses: list[BiblicalVerse] = []
+    for path in paths:
+        with path.open(encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    verses.append(verse_from_record(json.loads(line)))
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("Skipping malformed verse %s:%d", path, line_no)
+    return verses
+
+
+# ----------------------------------------------------------------------
+# Repository
+# ----------------------------------------------------------------------
+@dataclass(slots=True)
+class _LoadedVersion:
+    manifest: dict[str, Any]
+    corpus: ColumnarCorpus
+    version: BibleVersion
+
+
+class ColumnarBiblicalTextRepository(BiblicalTextRepository):
+    """Serve Bible versions stored as ``manifest.yaml`` + ``*.jsonl`` folders.
+
+    Versions are discovered by abbreviation when the repository is created and
+    loaded, indexed and cached on first access.
+    """
+
+    def __init__(self, root: Path | str = DEFAULT_BIBLES_ROOT) -> None:
+        self.root = Path(root)
+        self._directories: dict[str, Path] = {}
+        self._loaded: dict[str, _LoadedVersion] = {}
+        self._lock = threading.Lock()
+        if self.root.is_dir():
+            for manifest_path in sorted(self.root.glob(f"*/{MANIFEST_FILENAME}")):
+                manifest = self._read_manifest(manifest_path)
+                abbreviation = str(
+                    manifest.get("abbreviation") or manifest_path.parent.name
+                )
+                self._directories[abbreviation.upper()] = manifest_path.parent
+
+    @property
+    def abbreviations(self) -> list[str]:
+        return sorted(self._directories)
+
+    @staticmethod
+    def _read_manifest(path: Path) -> dict[str, Any]:
+        with path.open(encoding="utf-8") as handle:
+            return yaml.safe_load(handle) or {}
+
+    def corpus(self, abbreviation: str) -> ColumnarCorpus | None:
+        loaded = self._load(abbreviation)
+        return None if loaded is None else loaded.corpus
+
+    def _load(self, abbreviation: str) -> _LoadedVersion | None:
+        key = abbreviation.upper()
+        loaded = self._loaded.get(key)
+        if loaded is not None:
+            return loaded
+        directory = self._directories.get(key)
+        if directory is None:
+            return None
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is None:
+                loaded = self._build(directory)
+                self._loaded[key] = loaded
+        return loaded
+
+    def _build(self, directory: Path) -> _LoadedVersion:
+        manifest = self._read_manifest(directory / MANIFEST_FILENAME)
+        corpus = ColumnarCorpus(load_verses(sorted(directory.glob("*.jsonl"))))
+        language = Language(str(manifest.get("language", "hebrew")).lower())
+
+        book_meta = {
+            str(entry.get("id", "")).lower(): entry
+            for entry in manifest.get("books") or []
+            if isinstance(entry, Mapping)
+        }
+        grouped: dict[str, dict[str, BiblicalVerse]] = {}
+        names: dict[str, str] = {}
+        for verse in corpus.verses:
+            reference = verse.reference
+            book_id = reference.book_id.lower()
+            names.setdefault(book_id, reference.book)
+            grouped.setdefault(book_id, {})[
+                f"{reference.chapter}:{reference.verse}"
+            ] = verse
+        books = {
+            book_id: BiblicalBook(
+                id=book_id,
+                name=str(book_meta.get(book_id, {}).get("name") or names[book_id]),
+                native_name=book_meta.get(book_id, {}).get("hebrew_name"),
+                language=language,
+                chapter_count=int(
+                    book_meta.get(book_id, {}).get("chapters")
+                    or max(verse.reference.chapter for verse in verses.values())
+                ),
+                verses=verses,
+            )
+            for book_id, verses in grouped.items()
+        }
+        version = BibleVersion(
+            name=str(manifest.get("name", directory.name)),
+            abbreviation=str(manifest.get("abbreviation", directory.name)),
+            language=language,
+            license=str(manifest.get("license", "")),
+            source_url=manifest.get("source_url"),
+            version=str(manifest.get("version", "")),
+            description=str(manifest.get("description", "")),
+            features=list(manifest.get("features") or []),
+            books=books,
+        )
+        logger.info(
+            "Indexed %s: %d verses, %d tokens",
+            version.abbreviation,
+            len(corpus),
+            len(corpus.tokens),
+        )
+        return _LoadedVersion(manifest=manifest, corpus=corpus, version=version)
+
+    # ------------------------------------------------------------------
+    # BiblicalTextRepository
+    # ------------------------------------------------------------------
+    def get_version(self, abbreviation: str) -> BibleVersion | None:
+        loaded = self._load(abbreviation)
+        return None if loaded is None else loaded.version
+
+    def get_verse(
+        self, reference: Reference, version: str = "WLC"
+    ) -> BiblicalVerse | None:
+        corpus = self.corpus(version)
+        return None if corpus is None else corpus.get(reference)
+
+    def get_parallel_verses(
+        self, reference: Reference, versions: list[str]
+    ) -> dict[str, BiblicalVerse]:
+        parallel: dict[str, BiblicalVerse] = {}
+        for abbreviation in versions:
+            verse = self.get_verse(reference, abbreviation)
+            if verse is not None:
+                parallel[abbreviation] = verse
+        return parallel
+
+    def search_by_word(
+        self,
+        word: str,
+        version: str = "WLC",
+        lemma: bool = False,
+        books: list[str] | None = None,
+    ) -> list[BiblicalVerse]:
+        """Return verses containing *word*, ignoring vowel points and accents.
+
+        Unlike :meth:`BiblicalBook.search_word` this matches whole normalised
+        forms (or lemmas when ``lemma`` is true) rather than substrings.
+        """
+
+        corpus = self.corpus(version)
+        if corpus is None:
+            return []
+        verse_ids = corpus.lemma_verses(word) if lemma else corpus.word_verses(word)
+        return corpus.materialise(corpus.restrict_to_books(verse_ids, books))
+
+    def search_by_root(self, root: str, version: str = "WLC") -> list[BiblicalVerse]:
+        corpus = self.corpus(version)
+        if corpus is None:
+            return []
+        return corpus.materialise(corpus.root_verses(root))
+
+    def search_theological_terms(
+        self, terms: list[str], version: str = "WLC"
+    ) -> dict[str, list[BiblicalVerse]]:
+        """Return, per term, the verses where each of its words occurs."""
+
+        corpus = self.corpus(version)
+        if corpus is None:
+            return {term: [] for term in terms}
+        return {term: corpus.materialise(corpus.term_verses(term)) for term in terms}
+
+    def find_elohim_singular_verbs(self, version: str = "WLC") -> list[BiblicalVerse]:
+        corpus = self.corpus(version)
+        if corpus is None:
+            return []
+        return corpus.materialise(corpus.elohim_singular_verb_verses())
+
+
+__all__ = [
+    "ColumnarBiblicalTextRepository",
+    "ColumnarCorpus",
+    "DEFAULT_BIBLES_ROOT",
+    "TokenColumns",
+    "Vocabulary",
+    "load_verses",
+    "normalize_form",
+    "verse_from_record",
+]
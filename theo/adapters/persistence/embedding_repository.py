@@ -87,6 +87,50 @@ class SQLAlchemyPassageEmbeddingRepository(
                 document_updated_at=document_updated_at,
             )
 
+    def fetch_candidates(
+        self,
+        *,
+        fast: bool,
+        changed_since: datetime | None,
+        ids: Sequence[str] | None,
+        after_id: str | None,
+        limit: int,
+    ) -> list[PassageForEmbedding]:
+        stmt = (
+            select(
+                Passage.id,
+                Passage.text,
+                PassageEmbedding.embedding,
+                PassageEmbedding.embedding_model,
+                PassageEmbedding.text_hash,
+            )
+            .outerjoin(PassageEmbedding)
+            .order_by(Passage.id)
+            .limit(max(1, limit))
+        )
+        filters, join_document = self._build_filters(
+            fast=fast, changed_since=changed_since, ids=ids
+        )
+        if join_document:
+            stmt = stmt.join(Document)
+            stmt = stmt.add_columns(Document.updated_at)
+        if after_id is not None:
+            filters.append(Passage.id > after_id)
+        for criterion in filters:
+            stmt = stmt.where(criterion)
+
+        return [
+            PassageForEmbedding(
+                id=row[0],
+                text=row[1],
+                embedding=row[2],
+                embedding_model=row[3],
+                text_hash=row[4],
+                document_updated_at=row[5] if join_document else None,
+            )
+            for row in self._session.execute(stmt)
+        ]
+
     def update_embeddings(self, updates: Sequence[EmbeddingUpdate]) -> None:
         if not updates:
             return
@@ -100,6 +144,8 @@ class SQLAlchemyPassageEmbeddingRepository(
             {
                 "passage_id": update.id,
                 "embedding": list(update.embedding),
+                "embedding_model": update.embedding_model,
+                "text_hash": update.text_hash,
                 "created_at": now,
                 "updated_at": now,
             }
@@ -18,6 +18,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -80,6 +81,9 @@ class Document(Base):
     theological_tradition: Mapped[str | None] = mapped_column(String, nullable=True)
     topic_domains: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     sha256: Mapped[str | None] = mapped_column(String, unique=True)
+    # Fingerprint of the caller-supplied frontmatter; together with ``sha256``
+    # it lets re-ingestion of unchanged files reuse the existing document.
+    frontmatter_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     storage_path: Mapped[str | None] = mapped_column(String, nullable=True)
     enrichment_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
     provenance_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -141,6 +145,7 @@ class Notebook(Base):
         default=lambda: datetime.now(UTC),
         onupdate=lambda: datetime.now(UTC),
         nullable=False,
+        index=True,
     )
 
     entries: Mapped[list["NotebookEntry"]] = relationship(
@@ -377,6 +382,8 @@ class PassageEmbedding(Base):
     embedding: Mapped[list[float]] = mapped_column(
         VectorType(get_settings().embedding_dim), nullable=False
     )
+    embedding_model: Mapped[str | None] = mapped_column(String, nullable=True)
+    text_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -392,6 +399,110 @@ class PassageEmbedding(Base):
     passage: Mapped[Passage] = relationship("Passage", back_populates="embedding_record")
 
 
+class PassageEmbeddingVersion(Base):
+    """Passage vector produced by a specific embedding model version.
+
+    Holds shadow vectors for a model that is being rolled out alongside the
+    live ``passage_embeddings`` rows, and the serving vectors once that model
+    has been cut over.
+    """
+
+    __tablename__ = "passage_embedding_versions"
+
+    passage_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("passages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    model_version: Mapped[str] = mapped_column(String, primary_key=True)
+    embedding: Mapped[list[float]] = mapped_column(VectorType(None), nullable=False)
+    text_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_passage_embedding_versions_version",
+            "model_version",
+            "passage_id",
+        ),
+    )
+
+
+class PassageFeature(Base):
+    """Offline-computed ranking signals for a passage.
+
+    Rows are rebuilt wholesale by the ``tasks.refresh_passage_features`` job
+    and loaded into memory by the reranker; see
+    ``theo.infrastructure.api.app.ranking.feature_store``.
+    """
+
+    __tablename__ = "passage_features"
+
+    passage_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("passages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    feedback_positive: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    feedback_negative: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    feedback_views: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    citation_count: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    provenance_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    passage_length: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    osis_density: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
+class PassageSignature(Base):
+    """MinHash signature and near-duplicate cluster of a passage.
+
+    Written at ingest and by the ``backfill_near_duplicates`` command; passages
+    whose signatures match an earlier passage closely enough share its
+    ``cluster_id``. See ``theo.infrastructure.api.app.db.near_duplicates``.
+    """
+
+    __tablename__ = "passage_signatures"
+
+    passage_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("passages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    cluster_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    similarity: Mapped[float | None] = mapped_column(Float, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+
+class PassageSignatureBand(Base):
+    """LSH bucket membership used to find near-duplicate candidates."""
+
+    __tablename__ = "passage_signature_bands"
+
+    band_key: Mapped[str] = mapped_column(String(40), primary_key=True)
+    passage_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("passages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    __table_args__ = (
+        Index("ix_passage_signature_bands_passage", "passage_id"),
+    )
+
+
 class AppSetting(Base):
     """Simple key/value store for application-level configuration."""
 
@@ -556,7 +667,10 @@ class ResearchNote(Base):
     created_by: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     tenant_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -956,6 +1070,60 @@ class CreatorVerseRollup(Base):
     creator: Mapped[Creator] = relationship("Creator")
 
 
+class VerseTimelineRollup(Base):
+    """Mention counts per verse and timeline bucket for constant-time timelines.
+
+    ``kind`` is ``"start"`` for rows keyed by a passage's first verse and
+    ``"cover"`` for rows keyed by every later verse the passage spans. The
+    number of passages overlapping ``[a, b]`` in a bucket is the sum of the
+    ``start`` counts for verses in ``[a, b]`` plus the ``cover`` count at ``a``.
+    """
+
+    __tablename__ = "verse_timeline_rollups"
+    __table_args__ = (
+        Index(
+            "ix_verse_timeline_rollups_lookup",
+            "granularity",
+            "kind",
+            "verse_id",
+        ),
+    )
+
+    granularity: Mapped[str] = mapped_column(String(16), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(8), primary_key=True)
+    verse_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket_start: Mapped[Date] = mapped_column(Date, primary_key=True)
+    mention_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    document_ids: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    passage_ids: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+
+
+class DashboardCounter(Base):
+    """Per-day row counts backing the dashboard metrics.
+
+    One row per ``metric`` and UTC ``day``; ``row_count`` is how many rows of
+    the metric's model carry a timestamp on that day. Totals and period deltas are
+    sums over these rows, so their cost follows the number of days rather than
+    the size of the corpus.
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    metric: Mapped[str] = mapped_column(String(32), primary_key=True)
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class VerseTimelineDocument(Base):
+    """Record of the passages and date a document contributed to rollups."""
+
+    __tablename__ = "verse_timeline_documents"
+
+    document_id: Mapped[str] = mapped_column(String, primary_key=True)
+    reference_date: Mapped[Date] = mapped_column(Date, nullable=False)
+    passages: Mapped[list | None] = mapped_column(JSON, nullable=True)
+
+
 class CrossReference(Base):
     """Graph edge linking two OSIS references together."""
 
@@ -10,7 +10,10 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from sqlalchemy import event
 from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import Pool
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers
     from typing import Protocol
@@ -44,13 +47,42 @@ def _collect_open_files(process, target_paths: set[str], timeout: float = 1.0):
     return [entry for entry in entries[0] if getattr(entry, "path", None) in target_paths]
 
 
+# ids of DB-API connections currently checked out of any pool. The handle
+# sweep run when a session closes must leave these alone: they belong to
+# sessions still working on other threads (e.g. ingest pool workers).
+_checked_out: set[int] = set()
+_checked_out_lock = threading.Lock()
+
+
+@event.listens_for(Pool, "checkout")
+def _track_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    with _checked_out_lock:
+        _checked_out.add(id(dbapi_connection))
+
+
+@event.listens_for(Pool, "checkin")
+def _track_checkin(dbapi_connection, connection_record) -> None:
+    with _checked_out_lock:
+        _checked_out.discard(id(dbapi_connection))
+
+
+def _is_checked_out(obj: object) -> bool:
+    connection = getattr(obj, "connection", obj)
+    with _checked_out_lock:
+        return id(connection) in _checked_out
+
+
 def dispose_sqlite_engine(
     bind: Connection | Engine | None,
     *,
     dispose_engine: bool = True,
     dispose_callable: Callable[[], None] | None = None,
 ) -> None:
-    """Dispose SQLite engines to release file handles promptly."""
+    """Dispose SQLite engines to release file handles promptly.
+
+    Without *dispose_engine* (a session closing) connections that are still
+    checked out elsewhere are spared by the sweep.
+    """
 
     engine: Engine | None = None
     if isinstance(bind, Connection):
@@ -88,6 +120,10 @@ def dispose_sqlite_engine(
             warnings.simplefilter("ignore", FutureWarning)
             for obj in gc.get_objects():
                 try:
+                    if not dispose_engine and isinstance(
+                        obj, (sqlite3.Connection, cursor_type or ())
+                    ) and _is_checked_out(obj):
+                        continue
                     if isinstance(obj, sqlite3.Connection):
                         obj.close()
                     elif cursor_type is not None and isinstance(obj, cursor_type):
@@ -102,6 +138,10 @@ def dispose_sqlite_engine(
                 for frame_info in inspect.stack():
                     for value in list(frame_info.frame.f_locals.values()):
                         try:
+                            if not dispose_engine and isinstance(
+                                value, (sqlite3.Connection, cursor_type or ())
+                            ) and _is_checked_out(value):
+                                continue
                             if isinstance(value, sqlite3.Connection):
                                 value.close()
                             elif cursor_type is not None and isinstance(value, cursor_type):
@@ -163,3 +203,129 @@ def dispose_sqlite_engine(
                         except Exception:
                             continue
                     time.sleep(0.05)
+
+
+# Statements that take SQLite's database-wide write lock.
+_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+
+
+def _connection_key(connection: object) -> int:
+    # Commits receive the pool's proxy, cursors the raw DB-API connection.
+    return id(getattr(connection, "dbapi_connection", None) or connection)
+
+
+class SQLiteWriteGate:
+    """Serialise writers on one SQLite engine inside this process.
+
+    SQLite admits a single writer. Without coordination, concurrent writers
+    spin in SQLite's busy handler and may still fail with ``database is
+    locked``. The gate hands the write lock to one pooled connection at a
+    time, from its first write statement until its transaction commits or
+    rolls back, while readers carry on concurrently under WAL. Writers in
+    other processes are still covered by ``busy_timeout``.
+    """
+
+    def __init__(self, *, timeout: float) -> None:
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._holder: int | None = None
+        self.acquisitions = 0
+        self.wait_seconds = 0.0
+
+    def acquire(self, dbapi_connection: object) -> bool:
+        """Give *dbapi_connection* the write lock; ``False`` on timeout."""
+
+        key = _connection_key(dbapi_connection)
+        if self._holder == key:
+            return True
+        started = time.perf_counter()
+        if not self._lock.acquire(timeout=self.timeout):
+            return False
+        self._holder = key
+        self.acquisitions += 1
+        self.wait_seconds += time.perf_counter() - started
+        return True
+
+    def release(self, dbapi_connection: object) -> None:
+        """Release the write lock if *dbapi_connection* holds it."""
+
+        if self._holder != _connection_key(dbapi_connection):
+            return
+        self._holder = None
+        self._lock.release()
+
+
+def configure_sqlite_performance(
+    engine: Engine,
+    *,
+    busy_timeout_ms: int,
+    mmap_size: int,
+    cache_size_kib: int,
+) -> SQLiteWriteGate:
+    """Apply the performance pragmas and writer serialisation to *engine*.
+
+    Every new connection switches to WAL with ``synchronous=NORMAL`` (durable
+    across application crashes; the last transactions may be lost on power
+    failure) and gets the mmap, page cache, in-memory temp store and busy
+    timeout settings. The returned gate is also stored on the engine as
+    ``sqlite_write_gate``.
+    """
+
+    pragmas = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+        f"PRAGMA mmap_size={int(mmap_size)}",
+        f"PRAGMA cache_size=-{int(cache_size_kib)}",
+        "PRAGMA temp_store=MEMORY",
+    )
+    gate = SQLiteWriteGate(timeout=busy_timeout_ms / 1000.0)
+
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    def _gate_writes(conn, cursor, statement, parameters, _context, _many) -> None:
+        if not statement.lstrip()[:7].upper().startswith(_WRITE_PREFIXES):
+            return
+        if not gate.acquire(cursor.connection):
+            raise OperationalError(
+                statement,
+                parameters,
+                Exception("database is locked (write gate timeout)"),
+            )
+
+    def _release_on_checkin(dbapi_connection, _connection_record) -> None:
+        gate.release(dbapi_connection)
+
+    event.listen(engine, "connect", _apply_pragmas)
+    event.listen(engine, "before_cursor_execute", _gate_writes)
+    event.listen(engine.pool, "checkin", _release_on_checkin)
+
+    # Release after the COMMIT/ROLLBACK has completed (the engine-level
+    # ``commit`` event fires before it), so the next writer never waits in
+    # SQLite's busy handler for the previous one.
+    dialect = engine.dialect
+    original_commit = dialect.do_commit
+    original_rollback = dialect.do_rollback
+
+    def _do_commit(dbapi_connection) -> None:
+        try:
+            original_commit(dbapi_connection)
+        finally:
+            gate.release(dbapi_connection)
+
+    def _do_rollback(dbapi_connection) -> None:
+        try:
+            original_rollback(dbapi_connection)
+        finally:
+            gate.release(dbapi_connection)
+
+    dialect.do_commit = _do_commit  # type: ignore[method-assign]
+    dialect.do_rollback = _do_rollback  # type: ignore[method-assign]
+    engine.sqlite_write_gate = gate  # type: ignore[attr-defined]
+    return gate
@@ -39,7 +39,9 @@ class VectorType(_TypeDecorator[list[float] | None]):
 
     cache_ok = True
 
-    def __init__(self, dimension: int) -> None:
+    def __init__(self, dimension: int | None) -> None:
+        # ``None`` maps to an unconstrained pgvector column, used where rows
+        # from models with different dimensions share one table.
         super().__init__()
         self.dimension = dimension
 
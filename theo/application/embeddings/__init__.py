@@ -8,6 +8,7 @@ from .rebuild_service import (
     EmbeddingRebuildService,
     EmbeddingRebuildStart,
     EmbeddingRebuildState,
+    text_hash,
 )
 from .store import PassageEmbeddingService, PassageEmbeddingStore
 
@@ -21,4 +22,5 @@ __all__ = [
     "EmbeddingRebuildState",
     "PassageEmbeddingService",
     "PassageEmbeddingStore",
+    "text_hash",
 ]
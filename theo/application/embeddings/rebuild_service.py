@@ -1,11 +1,20 @@
-"""Application service orchestrating embedding rebuild workflows."""
+"""Application service orchestrating embedding rebuild workflows.
+
+Rebuilds run as a three stage pipeline so a large corpus is bounded by model
+throughput rather than database latency: a reader thread prefetches keyset
+pages of candidates, the calling thread sanitises and embeds them, and a
+writer thread persists each batch and reports progress. Bounded queues
+between the stages provide back-pressure.
+"""
 
 from __future__ import annotations
 
-import itertools
+import hashlib
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Mapping, Protocol
@@ -38,6 +47,7 @@ class EmbeddingRebuildState:
     total: int
     last_id: str | None
     metadata: Mapping[str, object]
+    skipped: int = 0
 
 
 @dataclass(frozen=True)
@@ -69,11 +79,18 @@ class EmbeddingRebuildResult:
     duration: float
     missing_ids: list[str]
     metadata: Mapping[str, object]
+    skipped: int = 0
 
 
 @dataclass(slots=True)
 class EmbeddingRebuildOptions:
-    """Inputs configuring an embedding rebuild run."""
+    """Inputs configuring an embedding rebuild run.
+
+    ``resume_after`` is the last passage id recorded by a checkpoint; the run
+    continues with the next id instead of re-reading ``skip_count`` rows.
+    ``skip_unchanged`` avoids re-embedding passages whose stored embedding was
+    produced by the same model from identical sanitised text.
+    """
 
     fast: bool
     batch_size: int
@@ -82,12 +99,67 @@ class EmbeddingRebuildOptions:
     skip_count: int = 0
     metadata: Mapping[str, object] = field(default_factory=dict)
     clear_cache: bool = False
+    resume_after: str | None = None
+    skip_unchanged: bool = True
+    prefetch_batches: int = 2
+    write_queue_size: int = 2
 
 
 class EmbeddingRebuildError(RuntimeError):
     """Raised when embedding rebuild operations fail."""
 
 
+def text_hash(text: str) -> str:
+    """Return the digest used to detect unchanged passage text."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+_DONE = object()
+_QUEUE_POLL_SECONDS = 0.1
+
+
+@dataclass(slots=True)
+class _ReadFailure:
+    error: BaseException
+
+
+@dataclass(slots=True)
+class _WriteBatch:
+    size: int
+    skipped: int
+    last_id: str
+    updates: list[EmbeddingUpdate]
+    started: float
+
+
+@dataclass(slots=True)
+class _WriterState:
+    processed: int
+    skipped: int = 0
+    batch_index: int = 0
+    error: BaseException | None = None
+
+
+def _put(target: "queue.Queue[object]", item: object, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_QUEUE_POLL_SECONDS)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _get(source: "queue.Queue[object]", stop: threading.Event) -> object | None:
+    while True:
+        try:
+            return source.get(timeout=_QUEUE_POLL_SECONDS)
+        except queue.Empty:
+            if stop.is_set():
+                return None
+
+
 class EmbeddingRebuildService:
     """Coordinates persistence and embedding adapters for rebuild workflows."""
 
@@ -101,6 +173,7 @@ class EmbeddingRebuildService:
         cache_clearer: Callable[[], None] | None = None,
         commit_attempts: int = 3,
         commit_backoff: float = 0.5,
+        model_name: str | None = None,
     ) -> None:
         if commit_attempts <= 0:
             raise ValueError("commit_attempts must be positive")
@@ -113,6 +186,7 @@ class EmbeddingRebuildService:
         self._cache_clearer = cache_clearer
         self._commit_attempts = commit_attempts
         self._commit_backoff = commit_backoff
+        self._model_name = model_name or getattr(embedding_service, "model_name", None)
 
     def rebuild_embeddings(
         self,
@@ -169,71 +243,32 @@ class EmbeddingRebuildService:
                     metadata=metadata,
                 )
 
-            candidates = repository.iter_candidates(
-                fast=options.fast,
-                changed_since=options.changed_since,
-                ids=ids or None,
-                batch_size=options.batch_size,
-            )
-            stream = iter(candidates)
-            if skip_count:
-                stream = itertools.islice(stream, skip_count, None)
-
-            processed = skip_count
-            batch_index = 0
-
-            for batch in _batched(stream, options.batch_size):
-                if not batch:
-                    continue
-                batch_index += 1
-                sanitized = [
-                    self._sanitize_text((passage.text or "").strip()) for passage in batch
-                ]
-                batch_start = time.perf_counter()
-                try:
-                    vectors = self._embedding_service.embed(
-                        sanitized, batch_size=options.batch_size
-                    )
-                except Exception as exc:  # pragma: no cover - defensive
-                    raise EmbeddingRebuildError(
-                        f"Embedding generation failed: {exc}"
-                    ) from exc
-
-                if len(vectors) != len(batch):
-                    raise EmbeddingRebuildError(
-                        "Embedding backend returned mismatched batch size"
-                    )
-
-                updates: list[EmbeddingUpdate] = [
-                    EmbeddingUpdate(id=passage.id, embedding=list(vector))
-                    for passage, vector in zip(batch, vectors)
-                ]
-                repository.update_embeddings(updates)
-                self._commit_with_retry(session)
-
-                processed += len(batch)
-                batch_duration = time.perf_counter() - batch_start
-                rate = batch_duration / len(batch)
-                state = EmbeddingRebuildState(
-                    processed=processed,
-                    total=total,
-                    last_id=batch[-1].id,
-                    metadata=metadata,
+            after_id = options.resume_after
+            if after_id is None and skip_count:
+                # Legacy checkpoints only recorded a count; translate it into
+                # a keyset position once instead of discarding rows per page.
+                skipped_rows = repository.fetch_candidates(
+                    fast=options.fast,
+                    changed_since=options.changed_since,
+                    ids=ids or None,
+                    after_id=None,
+                    limit=skip_count,
                 )
+                after_id = skipped_rows[-1].id if skipped_rows else None
 
-                if checkpoint is not None:
-                    checkpoint(state)
-
-                if on_progress is not None:
-                    on_progress(
-                        EmbeddingRebuildProgress(
-                            batch_index=batch_index,
-                            batch_size=len(batch),
-                            batch_duration=batch_duration,
-                            rate_per_passage=rate,
-                            state=state,
-                        )
-                    )
+            writer_state = self._run_pipeline(
+                session,
+                repository,
+                options,
+                ids=ids or None,
+                after_id=after_id,
+                processed=skip_count,
+                total=total,
+                metadata=metadata,
+                checkpoint=checkpoint,
+                on_progress=on_progress,
+            )
+            processed = writer_state.processed
 
             duration = time.perf_counter() - start_time
             return EmbeddingRebuildResult(
@@ -242,6 +277,7 @@ class EmbeddingRebuildService:
                 duration=duration,
                 missing_ids=missing_ids,
                 metadata=metadata,
+                skipped=writer_state.skipped,
             )
         except Exception:
             # Ensure any uncommitted transactions are rolled back before re-raising
@@ -251,6 +287,203 @@ class EmbeddingRebuildService:
             # Always ensure clean session closure with transaction cleanup
             self._safe_session_close(session)
 
+    def _run_pipeline(
+        self,
+        session: SessionProtocol,
+        repository: PassageEmbeddingRepository,
+        options: EmbeddingRebuildOptions,
+        *,
+        ids: Sequence[str] | None,
+        after_id: str | None,
+        processed: int,
+        total: int,
+        metadata: Mapping[str, object],
+        checkpoint: Callable[[EmbeddingRebuildState], None] | None,
+        on_progress: Callable[[EmbeddingRebuildProgress], None] | None,
+    ) -> _WriterState:
+        read_queue: queue.Queue[object] = queue.Queue(
+            maxsize=max(1, options.prefetch_batches)
+        )
+        write_queue: queue.Queue[object] = queue.Queue(
+            maxsize=max(1, options.write_queue_size)
+        )
+        stop = threading.Event()
+        state = _WriterState(processed=processed)
+
+        reader = threading.Thread(
+            target=self._read_batches,
+            args=(session, repository, options, ids, after_id, read_queue, stop),
+            name="embedding-rebuild-reader",
+            daemon=True,
+        )
+        writer = threading.Thread(
+            target=self._write_batches,
+            args=(write_queue, stop, state, total, metadata, checkpoint, on_progress),
+            name="embedding-rebuild-writer",
+            daemon=True,
+        )
+        reader.start()
+        writer.start()
+        try:
+            while not stop.is_set():
+                item = _get(read_queue, stop)
+                if item is None or item is _DONE:
+                    break
+                if isinstance(item, _ReadFailure):
+                    raise item.error
+                work = self._embed_batch(item, options)  # type: ignore[arg-type]
+                if not _put(write_queue, work, stop):
+                    break
+            _put(write_queue, _DONE, stop)
+            writer.join()
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            stop.set()
+            reader.join()
+            writer.join()
+
+        if state.error is not None:
+            raise state.error
+        return state
+
+    def _read_batches(
+        self,
+        session: SessionProtocol,
+        repository: PassageEmbeddingRepository,
+        options: EmbeddingRebuildOptions,
+        ids: Sequence[str] | None,
+        after_id: str | None,
+        out: "queue.Queue[object]",
+        stop: threading.Event,
+    ) -> None:
+        try:
+            while not stop.is_set():
+                batch = repository.fetch_candidates(
+                    fast=options.fast,
+                    changed_since=options.changed_since,
+                    ids=ids,
+                    after_id=after_id,
+                    limit=options.batch_size,
+                )
+                # End the read transaction between pages so the writer's
+                # commits are never blocked by a long-lived cursor.
+                self._safe_rollback(session)
+                if not batch:
+                    break
+                if not _put(out, batch, stop):
+                    return
+                after_id = batch[-1].id
+                if len(batch) < options.batch_size:
+                    break
+        except BaseException as exc:
+            _put(out, _ReadFailure(exc), stop)
+            return
+        _put(out, _DONE, stop)
+
+    def _embed_batch(
+        self, batch: list[PassageForEmbedding], options: EmbeddingRebuildOptions
+    ) -> _WriteBatch:
+        started = time.perf_counter()
+        pending: list[tuple[PassageForEmbedding, str, str]] = []
+        for passage in batch:
+            sanitized = self._sanitize_text((passage.text or "").strip())
+            digest = text_hash(sanitized)
+            if (
+                options.skip_unchanged
+                and passage.embedding is not None
+                and passage.text_hash == digest
+                and passage.embedding_model == self._model_name
+            ):
+                continue
+            pending.append((passage, sanitized, digest))
+
+        updates: list[EmbeddingUpdate] = []
+        if pending:
+            try:
+                vectors = self._embedding_service.embed(
+                    [sanitized for _, sanitized, _ in pending],
+                    batch_size=options.batch_size,
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                raise EmbeddingRebuildError(
+                    f"Embedding generation failed: {exc}"
+                ) from exc
+
+            if len(vectors) != len(pending):
+                raise EmbeddingRebuildError(
+                    "Embedding backend returned mismatched batch size"
+                )
+            updates = [
+                EmbeddingUpdate(
+                    id=passage.id,
+                    embedding=list(vector),
+                    embedding_model=self._model_name,
+                    text_hash=digest,
+                )
+                for (passage, _, digest), vector in zip(pending, vectors)
+            ]
+
+        return _WriteBatch(
+            size=len(batch),
+            skipped=len(batch) - len(pending),
+            last_id=batch[-1].id,
+            updates=updates,
+            started=started,
+        )
+
+    def _write_batches(
+        self,
+        source: "queue.Queue[object]",
+        stop: threading.Event,
+        state: _WriterState,
+        total: int,
+        metadata: Mapping[str, object],
+        checkpoint: Callable[[EmbeddingRebuildState], None] | None,
+        on_progress: Callable[[EmbeddingRebuildProgress], None] | None,
+    ) -> None:
+        session = self._session_factory()
+        try:
+            repository = self._repository_factory(session)
+            while True:
+                item = _get(source, stop)
+                if item is None or item is _DONE:
+                    return
+                assert isinstance(item, _WriteBatch)
+                if item.updates:
+                    repository.update_embeddings(item.updates)
+                    self._commit_with_retry(session)
+
+                state.batch_index += 1
+                state.processed += item.size
+                state.skipped += item.skipped
+                batch_duration = time.perf_counter() - item.started
+                progress_state = EmbeddingRebuildState(
+                    processed=min(state.processed, total),
+                    total=total,
+                    last_id=item.last_id,
+                    metadata=metadata,
+                    skipped=state.skipped,
+                )
+                if checkpoint is not None:
+                    checkpoint(progress_state)
+                if on_progress is not None:
+                    on_progress(
+                        EmbeddingRebuildProgress(
+                            batch_index=state.batch_index,
+                            batch_size=item.size,
+                            batch_duration=batch_duration,
+                            rate_per_passage=batch_duration / item.size,
+                            state=progress_state,
+                        )
+                    )
+        except BaseException as exc:
+            state.error = exc
+            stop.set()
+        finally:
+            self._safe_session_close(session)
+
     def _commit_with_retry(self, session: SessionProtocol) -> None:
         for attempt in range(1, self._commit_attempts + 1):
             try:
@@ -300,14 +533,6 @@ class EmbeddingRebuildService:
                 _LOGGER.warning("Failed to close session cleanly: %s", exc)
 
 
-def _batched(iterator: Iterable[PassageForEmbedding], size: int) -> Iterable[list[PassageForEmbedding]]:
-    while True:
-        batch = list(itertools.islice(iterator, size))
-        if not batch:
-            break
-        yield batch
-
-
 __all__ = [
     "EmbeddingRebuildError",
     "EmbeddingRebuildOptions",
@@ -316,4 +541,5 @@ __all__ = [
     "EmbeddingRebuildService",
     "EmbeddingRebuildStart",
     "EmbeddingRebuildState",
+    "text_hash",
 ]
@@ -12,7 +12,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool
 
 try:  # pragma: no cover - optional sqlite context cleanup shim
     import sqlite3
@@ -60,6 +60,7 @@ if os.name == "nt" and not getattr(Path, "__theo_unlink_retry__", False):
     Path.__theo_unlink_retry__ = True  # type: ignore[attr-defined]
 
 from theo.adapters.persistence import Base, dispose_sqlite_engine
+from theo.adapters.persistence.sqlite import configure_sqlite_performance
 from theo.application.facades.settings import get_settings
 
 __all__ = ["Base", "configure_engine", "get_engine", "get_session"]
@@ -156,22 +157,63 @@ class _TheoSession(Session):
             # before SQLAlchemy attempts its implicit rollback. Suppress the
             # resulting noise so session cleanup remains idempotent.
             
-        if bind is not None:
+        # Pooled engines keep their connections; sweeping them on every close
+        # would throw away the page cache the performance profile is for.
+        if bind is not None and not hasattr(bind, "sqlite_write_gate"):
             dispose_sqlite_engine(bind, dispose_engine=False)
 
 
-def _create_engine(database_url: str) -> Engine:
+def _is_memory_database(database_url: str) -> bool:
+    return ":memory:" in database_url or "mode=memory" in database_url or (
+        database_url.rstrip("/") in {"sqlite:", "sqlite+pysqlite:"}
+    )
+
+
+def _create_engine(database_url: str, *, sqlite_profile: str | None = None) -> Engine:
+    """Build an engine for *database_url*.
+
+    SQLite defaults to the ``compat`` profile: ``NullPool`` so every session
+    opens (and fully releases) its own connection. The opt-in ``performance``
+    profile (``settings.sqlite_profile``) keeps a connection pool instead and
+    configures WAL, tuned pragmas and a serialised writer on each connection;
+    see :func:`configure_sqlite_performance`.
+    """
+
+    is_sqlite = database_url.startswith("sqlite")
+    settings = get_settings() if is_sqlite else None
+    if is_sqlite and sqlite_profile is None:
+        sqlite_profile = settings.sqlite_profile
+    performance = is_sqlite and sqlite_profile == "performance"
+
     connect_args = {}
-    if database_url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False, "timeout": 30}
+    if is_sqlite:
+        timeout = settings.sqlite_busy_timeout_ms / 1000.0 if performance else 30
+        connect_args = {"check_same_thread": False, "timeout": timeout}
     engine_kwargs: dict[str, object] = {
         "future": True,
         "echo": False,
         "connect_args": connect_args,
     }
-    if database_url.startswith("sqlite"):
+    if performance:
+        if _is_memory_database(database_url):
+            engine_kwargs["poolclass"] = SingletonThreadPool
+        else:
+            engine_kwargs["poolclass"] = QueuePool
+            engine_kwargs["pool_size"] = settings.sqlite_pool_size
+            engine_kwargs["max_overflow"] = settings.sqlite_pool_size
+            # Other engines' disposal sweeps close stray sqlite3 connections
+            # process-wide; pre-ping replaces any pooled one that was closed.
+            engine_kwargs["pool_pre_ping"] = True
+    elif is_sqlite:
         engine_kwargs["poolclass"] = NullPool
     engine = create_engine(database_url, **engine_kwargs)
+    if performance:
+        configure_sqlite_performance(
+            engine,
+            busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            mmap_size=settings.sqlite_mmap_size_bytes,
+            cache_size_kib=settings.sqlite_cache_size_kib,
+        )
     if database_url.startswith("sqlite") and not getattr(
         engine, "__theo_dispose_wrapped__", False
     ):
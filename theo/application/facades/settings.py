@@ -149,6 +149,69 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite:///./theo.db", description="SQLAlchemy database URL"
     )
+    sqlite_profile: Literal["compat", "performance"] = Field(
+        default="compat",
+        description=(
+            "SQLite engine profile: 'compat' opens a fresh connection per session; "
+            "'performance' pools connections with WAL and tuned pragmas and "
+            "serialises writers"
+        ),
+    )
+    sqlite_pool_size: int = Field(
+        default=8,
+        ge=1,
+        description="Pooled SQLite connections kept open by the performance profile",
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="How long a SQLite writer waits for the write lock before failing",
+    )
+    sqlite_mmap_size_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="PRAGMA mmap_size applied by the SQLite performance profile",
+    )
+    sqlite_cache_size_kib: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Per-connection SQLite page cache (PRAGMA cache_size) in KiB",
+    )
+    db_query_instrumentation_enabled: bool = Field(
+        default=True,
+        description=(
+            "Count statements per API request and capture plans for slow queries"
+        ),
+    )
+    db_slow_query_ms: float | None = Field(
+        default=500.0,
+        gt=0.0,
+        description=(
+            "Statement duration above which its query plan is captured into the"
+            " slow-query buffer (None disables capture)"
+        ),
+    )
+    db_slow_query_buffer_size: int = Field(
+        default=50, ge=1, description="Slow queries retained for /admin/db/slow-queries"
+    )
+    db_slow_query_explain_interval_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Minimum time between EXPLAIN captures of the same statement shape",
+    )
+    db_n_plus_one_threshold: int = Field(
+        default=10,
+        ge=2,
+        description=(
+            "Repeats of one statement shape within a request that are reported"
+            " as an N+1 pattern"
+        ),
+    )
+    db_request_query_budget: int | None = Field(
+        default=None,
+        ge=1,
+        description="Statements per request above which a warning is logged",
+    )
     redis_url: str = Field(
         default="redis://redis:6379/0", description="Celery broker URL"
     )
@@ -177,6 +240,45 @@ class Settings(BaseSettings):
         default=None,
         description="MLflow registry URI for the reranker checkpoint (e.g. models:/theoria/Production)",
     )
+    reranker_cross_encoder_model: str | None = Field(
+        default=None,
+        description="Cross-encoder (e.g. BAAI/bge-reranker-base) rescoring the top results",
+    )
+    reranker_cross_encoder_top_n: int = Field(default=20, ge=1)
+    reranker_cross_encoder_batch_size: int = Field(default=16, ge=1)
+    reranker_cross_encoder_budget_ms: float | None = Field(
+        default=150.0,
+        description="Per-request time after which remaining cross-encoder batches are skipped",
+    )
+    reranker_cross_encoder_cache_size: int = Field(
+        default=20000,
+        ge=0,
+        description="Maximum cached (query, passage, model) cross-encoder scores",
+    )
+    rag_cache_ttl_seconds: int = Field(
+        default=30 * 60,
+        ge=1,
+        description="Lifetime of cached guardrailed answers in both cache tiers",
+    )
+    rag_cache_local_max_entries: int = Field(
+        default=512,
+        ge=0,
+        description="Answers kept in the in-process RAG cache tier (0 disables it)",
+    )
+    rag_cache_local_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Serialised size budget of the in-process RAG cache tier",
+    )
+    rag_cache_semantic_threshold: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Cosine similarity above which a cached answer for a differently"
+            " worded question over the same passages is reused (None disables)"
+        ),
+    )
     mlflow_tracking_uri: str | None = Field(
         default=None,
         description="Optional MLflow tracking server URI (defaults to MLflow's built-in client)",
@@ -195,6 +297,46 @@ class Settings(BaseSettings):
             " switching to an external manifest"
         ),
     )
+    ingest_parse_cache_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directory for the content-addressed parse cache used by file "
+            "ingestion; the cache is disabled when unset"
+        ),
+    )
+    ingest_parse_cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        ge=0,
+        description="Size limit of the parse cache before LRU eviction (0 disables it)",
+    )
+    near_duplicate_threshold: float | None = Field(
+        default=0.85,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Estimated Jaccard similarity of shingled text above which an"
+            " ingested passage joins an existing near-duplicate cluster"
+            " (None disables signature indexing)"
+        ),
+    )
+    near_duplicate_num_perm: int = Field(
+        default=128, ge=8, description="MinHash permutations per passage signature"
+    )
+    near_duplicate_bands: int = Field(
+        default=16,
+        ge=1,
+        description="LSH bands the signature is split into; must divide num_perm",
+    )
+    near_duplicate_shingle_size: int = Field(
+        default=5, ge=1, description="Words per shingle when hashing passage text"
+    )
+    search_collapse_near_duplicates: bool = Field(
+        default=False,
+        description=(
+            "Collapse near-duplicate clusters in hybrid search results unless the"
+            " request says otherwise"
+        ),
+    )
     fixtures_root: Path | None = Field(
         default=None, description="Optional fixtures path for offline resources"
     )
@@ -615,6 +757,84 @@ class Settings(BaseSettings):
         default=16 * 1024 * 1024,
         description="Maximum allowed size for synchronous ingest uploads in bytes",
     )
+    ingest_worker_threads: int = Field(
+        default=2,
+        ge=1,
+        description="Worker threads running ingest pipelines off the event loop",
+    )
+    ingest_queue_depth: int = Field(
+        default=8,
+        ge=0,
+        description="Ingest jobs allowed to wait for a worker before returning 429",
+    )
+    ingest_retry_after_seconds: int = Field(
+        default=5,
+        ge=1,
+        description="Retry-After hint sent when the ingest queue is saturated",
+    )
+    ingest_respond_async: bool = Field(
+        default=False,
+        description=(
+            "Return 202 with a job id from ingest endpoints by default instead of "
+            "waiting for the pipeline; clients may opt in per request with "
+            "'Prefer: respond-async'"
+        ),
+    )
+    notebook_events_backend: Literal["memory", "sqlite", "redis"] = Field(
+        default="memory",
+        description=(
+            "Notebook realtime fan-out: process-local memory, a shared SQLite WAL "
+            "table (single host, several workers) or Redis pub/sub"
+        ),
+    )
+    notebook_events_sqlite_path: Path | None = Field(
+        default=None,
+        description=(
+            "SQLite file for the 'sqlite' notebook event backend; defaults to "
+            "storage_root/notebook-events.sqlite"
+        ),
+    )
+    notebook_events_coalesce_ms: float = Field(
+        default=50.0,
+        ge=0.0,
+        description="Window in which bursts of notebook updates become one event",
+    )
+    audit_log_mode: Literal["async", "sync"] = Field(
+        default="async",
+        description=(
+            "Write AI audit log entries through the batched background writer or "
+            "commit each one before the request returns"
+        ),
+    )
+    audit_log_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Audit entries held in memory before new ones spill to the spool",
+    )
+    audit_log_batch_size: int = Field(
+        default=50,
+        ge=1,
+        description="Audit entries written per multi-row insert",
+    )
+    audit_log_flush_interval_ms: float = Field(
+        default=250.0,
+        gt=0.0,
+        description="Longest an audit entry waits in memory before being flushed",
+    )
+    audit_log_spool_path: Path | None = Field(
+        default=None,
+        description=(
+            "Append-only JSONL spool for audit entries the database could not "
+            "accept; replayed on startup. Defaults to storage_root/audit-spool.jsonl"
+        ),
+    )
+    ingest_job_backend: Literal["local", "celery"] = Field(
+        default="local",
+        description=(
+            "Where asynchronous file and URL ingest jobs run: the API process pool "
+            "or the Celery workers (requires storage shared with the workers)"
+        ),
+    )
     simple_ingest_allowed_roots: list[Path] = Field(
         default_factory=list,
         description=(
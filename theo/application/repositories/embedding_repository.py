@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +17,8 @@ class PassageForEmbedding:
     text: str | None
     embedding: Sequence[float] | None
     document_updated_at: datetime | None = None
+    embedding_model: str | None = None
+    text_hash: str | None = None
 
 
 @dataclass(slots=True)
@@ -24,6 +27,8 @@ class EmbeddingUpdate:
 
     id: str
     embedding: Sequence[float]
+    embedding_model: str | None = None
+    text_hash: str | None = None
 
 
 class PassageEmbeddingRepository(ABC):
@@ -54,6 +59,31 @@ class PassageEmbeddingRepository(ABC):
     ) -> Iterable[PassageForEmbedding]:
         """Yield passages requiring embedding updates in deterministic order."""
 
+    def fetch_candidates(
+        self,
+        *,
+        fast: bool,
+        changed_since: datetime | None,
+        ids: Sequence[str] | None,
+        after_id: str | None,
+        limit: int,
+    ) -> list[PassageForEmbedding]:
+        """Return up to *limit* candidates whose id sorts after *after_id*.
+
+        The default implementation filters :meth:`iter_candidates`; persistence
+        backends should override it with a keyset query so resuming a rebuild
+        does not re-read rows that were already processed.
+        """
+
+        stream = iter(
+            self.iter_candidates(
+                fast=fast, changed_since=changed_since, ids=ids, batch_size=limit
+            )
+        )
+        if after_id is not None:
+            stream = itertools.dropwhile(lambda item: item.id <= after_id, stream)
+        return list(itertools.islice(stream, limit))
+
     @abstractmethod
     def update_embeddings(self, updates: Sequence[EmbeddingUpdate]) -> None:
         """Persist the provided embedding vectors for each passage."""
@@ -39,6 +39,7 @@ class TelemetryProvider(Protocol):
 
 
 RAG_CACHE_EVENTS_METRIC = "theo_rag_cache_events_total"
+RAG_CACHE_TIER_EVENTS_METRIC = "theo_rag_cache_tier_events_total"
 CITATION_DRIFT_EVENTS_METRIC = "theo_citation_drift_events_total"
 SEARCH_RERANKER_EVENTS_METRIC = "theo_search_reranker_events_total"
 
@@ -55,6 +56,17 @@ EMBEDDING_REBUILD_PROGRESS_METRIC = "theo_embedding_rebuild_processed_total"
 DB_QUERY_LATENCY_METRIC = "theo_db_query_latency_seconds"
 DB_QUERY_REQUESTS_METRIC = "theo_db_query_requests_total"
 DB_QUERY_ERROR_METRIC = "theo_db_query_errors_total"
+DB_REQUEST_QUERY_COUNT_METRIC = "theo_db_request_query_count"
+DB_SLOW_QUERY_EVENTS_METRIC = "theo_db_slow_query_events_total"
+DB_N_PLUS_ONE_EVENTS_METRIC = "theo_db_n_plus_one_events_total"
+
+# AI audit log writer ------------------------------------------------------------
+AUDIT_LOG_EVENTS_METRIC = "theo_audit_log_events_total"
+AUDIT_LOG_QUEUE_DEPTH_METRIC = "theo_audit_log_queue_depth"
+AUDIT_LOG_FLUSH_LATENCY_METRIC = "theo_audit_log_flush_latency_seconds"
+
+# Ingestion ----------------------------------------------------------------------
+INGEST_PARSE_CACHE_EVENTS_METRIC = "theo_ingest_parse_cache_events_total"
 
 # ML inference telemetry --------------------------------------------------------
 LLM_INFERENCE_LATENCY_METRIC = "theo_llm_inference_latency_seconds"
@@ -63,17 +75,25 @@ LLM_INFERENCE_ERROR_METRIC = "theo_llm_inference_errors_total"
 
 
 __all__ = [
+    "AUDIT_LOG_EVENTS_METRIC",
+    "AUDIT_LOG_FLUSH_LATENCY_METRIC",
+    "AUDIT_LOG_QUEUE_DEPTH_METRIC",
     "CITATION_DRIFT_EVENTS_METRIC",
+    "DB_N_PLUS_ONE_EVENTS_METRIC",
     "DB_QUERY_ERROR_METRIC",
     "DB_QUERY_LATENCY_METRIC",
     "DB_QUERY_REQUESTS_METRIC",
+    "DB_REQUEST_QUERY_COUNT_METRIC",
+    "DB_SLOW_QUERY_EVENTS_METRIC",
     "EMBEDDING_REBUILD_BATCH_LATENCY_METRIC",
     "EMBEDDING_REBUILD_COMMIT_LATENCY_METRIC",
     "EMBEDDING_REBUILD_PROGRESS_METRIC",
+    "INGEST_PARSE_CACHE_EVENTS_METRIC",
     "LLM_INFERENCE_ERROR_METRIC",
     "LLM_INFERENCE_LATENCY_METRIC",
     "LLM_INFERENCE_REQUESTS_METRIC",
     "RAG_CACHE_EVENTS_METRIC",
+    "RAG_CACHE_TIER_EVENTS_METRIC",
     "SEARCH_RERANKER_EVENTS_METRIC",
     "TelemetryProvider",
     "WorkflowSpan",
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import click
 
-from . import database_ops, embedding_rebuild, import_export
+from . import database_ops, embedding_rebuild, embedding_versions, import_export
 
-__all__ = ["register_commands", "embedding_rebuild", "database_ops", "import_export"]
+__all__ = [
+    "register_commands",
+    "embedding_rebuild",
+    "embedding_versions",
+    "database_ops",
+    "import_export",
+]
 
 
 def register_commands(cli: click.Group) -> None:
@@ -14,4 +20,5 @@ def register_commands(cli: click.Group) -> None:
 
     embedding_rebuild.register_commands(cli)
     database_ops.register_commands(cli)
+    embedding_versions.register_commands(cli)
     import_export.register_commands(cli)
@@ -4,10 +4,162 @@ from __future__ import annotations
 
 import click
 
-__all__ = ["register_commands"]
+__all__ = [
+    "backfill_near_duplicates_cmd",
+    "backfill_verse_ranges_cmd",
+    "reconcile_dashboard_counters_cmd",
+    "rebuild_verse_adjacency_cmd",
+    "rebuild_verse_timeline_cmd",
+    "register_commands",
+]
 
 
-def register_commands(_cli: click.Group) -> None:
+def _resolve_engine():
+    from theo.application.services.bootstrap import resolve_application
+
+    try:
+        _container, registry = resolve_application()
+    except Exception as exc:  # pragma: no cover - defensive
+        raise click.ClickException(f"Failed to resolve application: {exc}") from exc
+    return registry.resolve("engine")
+
+
+@click.command("backfill_verse_ranges")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Number of passages updated per committed batch.",
+)
+@click.option(
+    "--max-batches",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop after this many batches; rerun the command to resume.",
+)
+@click.option(
+    "--restart",
+    is_flag=True,
+    help="Ignore the stored checkpoint and rescan every passage.",
+)
+def backfill_verse_ranges_cmd(
+    batch_size: int, max_batches: int | None, restart: bool
+) -> None:
+    """Populate verse range columns for passages ingested before they existed."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.verse_ranges import backfill_verse_ranges
+
+    with Session(_resolve_engine()) as session:
+        state = backfill_verse_ranges(
+            session,
+            batch_size=batch_size,
+            max_batches=max_batches,
+            restart=restart,
+        )
+
+    click.echo(
+        f"Scanned {state.processed} passage(s); updated {state.updated} verse range(s)."
+    )
+    if state.completed:
+        click.echo("Verse range backfill complete.")
+    else:
+        click.echo(f"Paused after passage {state.last_id}; rerun to resume.")
+
+
+@click.command("backfill_near_duplicates")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Number of passages indexed per committed batch.",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Drop existing signatures first (needed after changing MinHash settings).",
+)
+def backfill_near_duplicates_cmd(batch_size: int, rebuild: bool) -> None:
+    """Index MinHash signatures for passages ingested before they existed."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.near_duplicates import (
+        backfill_passage_signatures,
+    )
+
+    with Session(_resolve_engine()) as session:
+        result = backfill_passage_signatures(
+            session, batch_size=batch_size, rebuild=rebuild
+        )
+
+    click.echo(
+        f"Indexed {result.indexed} passage(s); "
+        f"linked {result.duplicates} near duplicate(s)."
+    )
+
+
+@click.command("rebuild_verse_timeline")
+def rebuild_verse_timeline_cmd() -> None:
+    """Recompute the materialised verse timeline rollups from passages."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.verse_timeline import rebuild_verse_timeline
+
+    with Session(_resolve_engine()) as session:
+        documents = rebuild_verse_timeline(session)
+
+    click.echo(f"Rebuilt verse timeline rollups for {documents} document(s).")
+
+
+@click.command("reconcile_dashboard_counters")
+def reconcile_dashboard_counters_cmd() -> None:
+    """Recount the per-day dashboard rollups from their source tables."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.dashboard_counters import (
+        reconcile_dashboard_counters,
+    )
+
+    with Session(_resolve_engine()) as session:
+        stats = reconcile_dashboard_counters(session)
+
+    corrected = sum(stats.corrected.values())
+    click.echo(
+        f"Reconciled {stats.rows} dashboard counter row(s); corrected {corrected}."
+    )
+
+
+@click.command("rebuild_verse_adjacency")
+def rebuild_verse_adjacency_cmd() -> None:
+    """Refresh the precomputed verse adjacency graph used for multi-hop queries."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.verse_adjacency import (
+        rebuild_verse_adjacency,
+    )
+
+    with Session(_resolve_engine()) as session:
+        _adjacency, stats = rebuild_verse_adjacency(session)
+
+    click.echo(
+        f"Published verse adjacency {stats.version}: {stats.nodes} node(s), "
+        f"{stats.edges} edge(s); rebuilt {stats.rebuilt} segment(s), "
+        f"reused {stats.reused}."
+    )
+
+
+def register_commands(cli: click.Group) -> None:
     """Register database operation commands."""
-    # Database commands will be added in future iterations.
-    return None
+
+    cli.add_command(backfill_near_duplicates_cmd)
+    cli.add_command(backfill_verse_ranges_cmd)
+    cli.add_command(reconcile_dashboard_counters_cmd)
+    cli.add_command(rebuild_verse_adjacency_cmd)
+    cli.add_command(rebuild_verse_timeline_cmd)
@@ -368,6 +368,7 @@ def rebuild_embeddings_cmd(
         skip_count=skip_count,
         metadata=metadata,
         clear_cache=no_cache,
+        resume_after=checkpoint_state.last_id if checkpoint_state else None,
     )
 
     try:
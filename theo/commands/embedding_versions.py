@@ -0,0 +1,147 @@
+"""CLI commands driving blue/green embedding model rollouts."""
+
+from __future__ import annotations
+
+import json
+
+import click
+
+from .database_ops import _resolve_engine
+
+__all__ = ["embedding_versions_group", "register_commands"]
+
+
+@click.group("embedding_versions")
+def embedding_versions_group() -> None:
+    """Roll out a new embedding model behind the live vectors."""
+
+
+@embedding_versions_group.command("register")
+@click.argument("model")
+@click.option("--dimension", type=click.IntRange(min=1), required=True)
+def register_cmd(model: str, dimension: int) -> None:
+    """Register MODEL as a shadow version to backfill."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.embedding_versions import (
+        register_shadow_version,
+    )
+
+    with Session(_resolve_engine()) as session:
+        try:
+            version = register_shadow_version(session, model, dimension)
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+    click.echo(f"Registered shadow embedding version {version.key}.")
+
+
+@embedding_versions_group.command("backfill")
+@click.argument("version")
+@click.option("--batch-size", type=click.IntRange(min=1), default=64, show_default=True)
+@click.option(
+    "--max-batches",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop after this many batches; rerun the command to continue.",
+)
+def backfill_cmd(version: str, batch_size: int, max_batches: int | None) -> None:
+    """Embed passages that lack VERSION shadow vectors."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.embedding_versions import (
+        backfill_shadow_embeddings,
+    )
+
+    with Session(_resolve_engine()) as session:
+        try:
+            result = backfill_shadow_embeddings(
+                session, version, batch_size=batch_size, max_batches=max_batches
+            )
+        except (KeyError, ValueError) as exc:
+            raise click.ClickException(f"Cannot backfill {version}: {exc}") from exc
+    click.echo(
+        f"Embedded {result.embedded} passage(s) for {result.version}; "
+        f"{result.remaining} remaining."
+    )
+
+
+@embedding_versions_group.command("compare")
+@click.argument("candidate")
+@click.option("--baseline", default=None, help="Defaults to the active version.")
+@click.option("--sample-queries", type=click.IntRange(min=1), default=20)
+@click.option("--top-k", type=click.IntRange(min=1), default=10)
+def compare_cmd(
+    candidate: str, baseline: str | None, sample_queries: int, top_k: int
+) -> None:
+    """Report neighbour overlap between the baseline and CANDIDATE versions."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.embedding_versions import (
+        compare_embedding_versions,
+    )
+
+    with Session(_resolve_engine()) as session:
+        try:
+            report = compare_embedding_versions(
+                session,
+                baseline,
+                candidate,
+                sample_queries=sample_queries,
+                top_k=top_k,
+            )
+        except KeyError as exc:
+            raise click.ClickException(f"Unknown embedding version: {exc}") from exc
+    click.echo(json.dumps(report, indent=2))
+
+
+@embedding_versions_group.command("cutover")
+@click.argument("version")
+@click.option(
+    "--allow-incomplete",
+    is_flag=True,
+    help="Cut over even if some passages lack vectors for VERSION.",
+)
+def cutover_cmd(version: str, allow_incomplete: bool) -> None:
+    """Make VERSION the embedding version used by search and ingest."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.embedding_versions import (
+        cutover_embedding_version,
+    )
+
+    with Session(_resolve_engine()) as session:
+        try:
+            active = cutover_embedding_version(
+                session, version, require_complete=not allow_incomplete
+            )
+        except (KeyError, ValueError) as exc:
+            raise click.ClickException(f"Cutover refused: {exc}") from exc
+    click.echo(f"Active embedding version is now {active.key}.")
+
+
+@embedding_versions_group.command("rollback")
+def rollback_cmd() -> None:
+    """Restore the embedding version active before the last cutover."""
+
+    from sqlalchemy.orm import Session
+
+    from theo.infrastructure.api.app.db.embedding_versions import (
+        rollback_embedding_version,
+    )
+
+    with Session(_resolve_engine()) as session:
+        try:
+            active = rollback_embedding_version(session)
+        except (KeyError, ValueError) as exc:
+            raise click.ClickException(str(exc)) from exc
+    click.echo(f"Rolled back; active embedding version is {active.key}.")
+
+
+def register_commands(cli: click.Group) -> None:
+    """Register embedding version rollout commands."""
+
+    cli.add_command(embedding_versions_group)
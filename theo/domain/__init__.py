@@ -4,35 +4,74 @@ This package is intentionally framework-agnostic. Only standard library,
 `dataclasses`, and `pydantic` types are permitted.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .documents import Document, DocumentId, DocumentMetadata
 from .mappers import PassageMapper
 from .references import ScriptureReference
-from .research import (
-    CrossReferenceEntry,
-    DssLinkEntry,
-    FallacyHit,
-    HistoricityEntry,
-    Hypothesis,
-    HypothesisDraft,
-    HypothesisNotFoundError,
-    MorphToken,
-    OverviewBullet,
-    ReliabilityOverview,
-    ResearchNote,
-    ResearchNoteDraft,
-    ResearchNoteEvidence,
-    ResearchNoteEvidenceDraft,
-    ResearchNoteNotFoundError,
-    VariantEntry,
-    Verse,
-    build_reliability_overview,
-    fallacy_detect,
-    fetch_cross_references,
-    fetch_dss_links,
-    fetch_morphology,
-    fetch_passage,
-    historicity_search,
-    variants_apparatus,
+
+if TYPE_CHECKING:  # pragma: no cover - re-exported lazily via ``__getattr__``
+    from .research import (
+        CrossReferenceEntry,
+        DssLinkEntry,
+        FallacyHit,
+        HistoricityEntry,
+        Hypothesis,
+        HypothesisDraft,
+        HypothesisNotFoundError,
+        MorphToken,
+        OverviewBullet,
+        ReliabilityOverview,
+        ResearchNote,
+        ResearchNoteDraft,
+        ResearchNoteEvidence,
+        ResearchNoteEvidenceDraft,
+        ResearchNoteNotFoundError,
+        VariantEntry,
+        Verse,
+        build_reliability_overview,
+        fallacy_detect,
+        fetch_cross_references,
+        fetch_dss_links,
+        fetch_morphology,
+        fetch_passage,
+        historicity_search,
+        variants_apparatus,
+    )
+
+# The research helpers import ``pythonbible``, which dominates the cost of
+# importing this package, so they are loaded on first access.
+_RESEARCH_EXPORTS = frozenset(
+    {
+        "CrossReferenceEntry",
+        "DssLinkEntry",
+        "FallacyHit",
+        "HistoricityEntry",
+        "Hypothesis",
+        "HypothesisDraft",
+        "HypothesisNotFoundError",
+        "MorphToken",
+        "OverviewBullet",
+        "ReliabilityOverview",
+        "ResearchNote",
+        "ResearchNoteDraft",
+        "ResearchNoteEvidence",
+        "ResearchNoteEvidenceDraft",
+        "ResearchNoteNotFoundError",
+        "VariantEntry",
+        "Verse",
+        "build_reliability_overview",
+        "fallacy_detect",
+        "fetch_cross_references",
+        "fetch_dss_links",
+        "fetch_morphology",
+        "fetch_passage",
+        "historicity_search",
+        "variants_apparatus",
+    }
 )
 
 __all__ = [
@@ -67,3 +106,11 @@ __all__ = [
     "historicity_search",
     "variants_apparatus",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RESEARCH_EXPORTS:
+        value = getattr(import_module(".research", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -218,7 +218,7 @@ class BibleVersion:
 _HEBREW_DIACRITICS_RE = re.compile(r"[\u0591-\u05C7]")
 
 
-def _normalize_hebrew_text(value: Optional[str]) -> str:
+def normalize_hebrew_text(value: Optional[str]) -> str:
     """Return ``value`` without cantillation or vowel marks for comparisons."""
 
     if not value:
@@ -226,6 +226,7 @@ def _normalize_hebrew_text(value: Optional[str]) -> str:
     return _HEBREW_DIACRITICS_RE.sub("", value)
 
 
+
 class TheologicalTermTracker:
     """Utility class for tracking theological terms across versions."""
 
@@ -239,7 +240,7 @@ class TheologicalTermTracker:
                 has_singular_verb = False
 
                 for tag in verse.morphology:
-                    lemma = _normalize_hebrew_text(getattr(tag, "lemma", None))
+                    lemma = normalize_hebrew_text(getattr(tag, "lemma", None))
                     raw_number = getattr(tag, "number", None)
                     number = str(raw_number).strip().lower() if raw_number else None
                     person = getattr(tag, "person", None)
@@ -250,7 +251,7 @@ class TheologicalTermTracker:
                     normalised_notes = {str(note).strip().lower() for note in notes}
 
                     # Check for אלהים (plural form)
-                    if (lemma == _normalize_hebrew_text("אלהים") or "divine_name" in normalised_notes) and number == "plural":
+                    if (lemma == normalize_hebrew_text("אלהים") or "divine_name" in normalised_notes) and number == "plural":
                         has_elohim = True
 
                     # Check for singular verb with null-safety
@@ -6,7 +6,6 @@ from dataclasses import dataclass, field
 from typing import Sequence
 
 import numpy as np
-from sklearn.ensemble import IsolationForest
 
 from .models import DocumentEmbedding
 
@@ -60,6 +59,8 @@ class AnomalyDiscoveryEngine:
             return []
 
         contamination = self._effective_contamination(len(filtered))
+        from sklearn.ensemble import IsolationForest
+
         forest = IsolationForest(
             n_estimators=self.n_estimators,
             contamination=contamination,
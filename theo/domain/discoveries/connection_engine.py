@@ -6,8 +6,6 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Mapping, Sequence
 
-import networkx as nx
-
 from .models import DocumentEmbedding
 
 
@@ -59,6 +57,8 @@ class ConnectionDiscoveryEngine:
         if len(filtered) < self.min_documents:
             return []
 
+        import networkx as nx
+
         bipartite_graph = nx.Graph()
         document_nodes: list[tuple[str, str]] = []
         for doc in filtered:
@@ -4,7 +4,6 @@ from collections import Counter
 from typing import Iterable, Mapping, Sequence
 
 import numpy as np
-from sklearn.cluster import DBSCAN
 
 from .models import (
     CorpusSnapshotSummary,
@@ -75,6 +74,9 @@ class PatternDiscoveryEngine:
             snapshot = self._build_snapshot(filtered, [])
             return [], snapshot
 
+        # Imported here: scikit-learn costs hundreds of milliseconds at startup.
+        from sklearn.cluster import DBSCAN
+
         clusterer = DBSCAN(eps=self.eps, min_samples=self.min_cluster_size, metric="cosine")
         labels = clusterer.fit_predict(embeddings)
         core_indices = set(getattr(clusterer, "core_sample_indices_", []))
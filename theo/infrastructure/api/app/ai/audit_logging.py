@@ -1,22 +1,62 @@
-"""Helpers for persisting and managing AI workflow audit logs."""
+"""Helpers for persisting and managing AI workflow audit logs.
+
+Guarded RAG calls record an :class:`AuditLog` row each. Committing that row
+inline costs every answer a transaction of its own and, under SQLite, contends
+with the request's write lock, so :class:`AuditLogWriter` hands entries to a
+process-wide :class:`AuditLogBatcher` by default. The batcher holds a bounded
+queue and a single background thread that writes multi-row inserts whenever
+``audit_log_batch_size`` entries are waiting or ``audit_log_flush_interval_ms``
+has elapsed.
+
+Entries the database cannot take (it is locked or unreachable) and entries
+arriving while the queue is full are appended to a JSONL spool instead, which
+:func:`replay_audit_spool` loads back on startup. Only entries that can be
+neither written nor spooled are dropped. Workflows that must not return before
+their audit row is durable pass ``synchronous=True`` (or the deployment sets
+``audit_log_mode="sync"``) to commit inline as before.
+"""
 
 from __future__ import annotations
 
+import atexit
 import dataclasses
 import hashlib
 import json
 import logging
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any, Mapping, Sequence
+from uuid import uuid4
 
-from sqlalchemy import delete, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import (
+    OperationalError,
+    SQLAlchemyError,
+    TimeoutError as PoolTimeoutError,
+)
 from sqlalchemy.orm import Session as SASession, sessionmaker
 
+from theo.application.facades.settings import Settings, get_settings
+from theo.application.facades.telemetry import record_counter, record_histogram
+from theo.application.telemetry import (
+    AUDIT_LOG_EVENTS_METRIC,
+    AUDIT_LOG_FLUSH_LATENCY_METRIC,
+    AUDIT_LOG_QUEUE_DEPTH_METRIC,
+)
 from theo.infrastructure.api.app.persistence_models import AuditLog
 
 LOGGER = logging.getLogger(__name__)
 
+# Failures that mean "the database is busy or away" rather than "this row is
+# bad"; only these are worth spooling for a later replay.
+_SPOOLABLE_ERRORS = (OperationalError, PoolTimeoutError)
+
 
 def _default_json_encoder(value: Any) -> Any:
     if isinstance(value, datetime):
@@ -88,14 +128,401 @@ def serialise_claim_cards(claim_cards: Sequence[Any] | None) -> list[Any]:
     return payload if isinstance(payload, list) else []
 
 
+def _spool_line(row: Mapping[str, Any]) -> str:
+    return json.dumps(row, ensure_ascii=False, default=_default_json_encoder)
+
+
+def _row_from_spool(line: str) -> dict[str, Any]:
+    row = json.loads(line)
+    if not isinstance(row, dict) or not row.get("workflow"):
+        raise ValueError("spooled audit entry is missing its workflow")
+    created_at = row.get("created_at")
+    if isinstance(created_at, str):
+        row["created_at"] = datetime.fromisoformat(created_at)
+    return row
+
+
+class AuditLogSpool:
+    """Append-only JSONL file holding audit rows awaiting a database write."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, rows: Sequence[Mapping[str, Any]]) -> bool:
+        """Durably append *rows*; return ``False`` when the spool is unwritable."""
+
+        if not rows:
+            return True
+        payload = "".join(_spool_line(row) + "\n" for row in rows)
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.write(payload)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        except OSError:
+            LOGGER.error("Unable to spool audit log entries", exc_info=True)
+            return False
+        return True
+
+    def take(self) -> list[dict[str, Any]]:
+        """Remove and return every spooled row, skipping corrupt lines.
+
+        The file is moved to a claim name unique to this process before reading,
+        so entries spooled concurrently go to a fresh file and two processes
+        replaying at once never read the same rows. Claims left behind by a
+        process that exited mid-replay are adopted the same way.
+        """
+
+        rows: list[dict[str, Any]] = []
+        with self._lock:
+            for claimed in self._claim():
+                rows.extend(self._read(claimed))
+                claimed.unlink(missing_ok=True)
+        return rows
+
+    def _claim(self) -> list[Path]:
+        claimed: list[Path] = []
+        for source in (*self._orphaned_claims(), self.path):
+            target = self.path.with_name(
+                f"{self.path.name}.{os.getpid()}-{uuid4().hex[:8]}.replaying"
+            )
+            try:
+                # Atomic on every platform; the loser of a race gets ENOENT.
+                os.replace(source, target)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                LOGGER.warning("Unable to claim audit spool %s", source, exc_info=True)
+                continue
+            claimed.append(target)
+        return claimed
+
+    def _orphaned_claims(self) -> list[Path]:
+        orphans: list[Path] = []
+        for candidate in self.path.parent.glob(f"{self.path.name}.*.replaying"):
+            owner = candidate.name[len(self.path.name) + 1 :].split("-", 1)[0]
+            # Our own leftovers come from a take() that raised; others are
+            # only safe to adopt once their process is gone.
+            if owner.isdigit() and (
+                int(owner) == os.getpid() or not _process_alive(int(owner))
+            ):
+                orphans.append(candidate)
+        return sorted(orphans)
+
+    @staticmethod
+    def _read(claimed: Path) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        try:
+            handle = claimed.open(encoding="utf-8")
+        except FileNotFoundError:
+            return rows
+        with handle:
+            for number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(_row_from_spool(line))
+                except ValueError:
+                    # A torn final line from a crash mid-append.
+                    LOGGER.warning(
+                        "Skipping corrupt audit spool line %d in %s", number, claimed
+                    )
+        return rows
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":  # pragma: no cover - os.kill(pid, 0) terminates on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # EPERM: the process exists but belongs to another user.
+        return True
+    return True
+
+
+@dataclasses.dataclass(slots=True)
+class AuditLogStats:
+    """Counters describing the background audit writer."""
+
+    queue_depth: int = 0
+    queue_capacity: int = 0
+    enqueued: int = 0
+    written: int = 0
+    spooled: int = 0
+    dropped: int = 0
+    flushes: int = 0
+    last_flush_seconds: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class _FlushMarker:
+    done: threading.Event = dataclasses.field(default_factory=threading.Event)
+
+
+class AuditLogBatcher:
+    """Bounded queue plus background thread writing audit rows in batches.
+
+    Rows are grouped by the engine they were logged against, so one batcher
+    serves every database the process talks to.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.25,
+        spool: AuditLogSpool | None = None,
+    ) -> None:
+        if max_queue < 1 or batch_size < 1 or flush_interval <= 0:
+            raise ValueError("audit batcher limits must be positive")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool = spool
+        self._queue: queue.Queue[tuple[Engine, dict[str, Any]] | _FlushMarker] = (
+            queue.Queue(maxsize=max_queue)
+        )
+        self._capacity = max_queue
+        self._lock = threading.Lock()
+        self._stats = AuditLogStats(queue_capacity=max_queue)
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def stats(self) -> AuditLogStats:
+        with self._lock:
+            return dataclasses.replace(self._stats, queue_depth=self._queue.qsize())
+
+    def submit(self, bind: Engine, row: dict[str, Any]) -> None:
+        """Queue *row* for *bind*, spilling to the spool when the queue is full."""
+
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((bind, row))
+        except queue.Full:
+            self._spill([row], reason="queue_full")
+            return
+        self._count("enqueued", 1)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until everything queued before the call has been handled."""
+
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        marker = _FlushMarker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush outstanding rows and stop the background thread."""
+
+        self._closed = True
+        self.flush(timeout)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)  # type: ignore[arg-type]
+            except queue.Full:  # pragma: no cover - flush just drained it
+                pass
+            thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("audit log batcher is closed")
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="theo-audit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            pending: list[tuple[Engine, dict[str, Any]]] = []
+            markers: list[_FlushMarker] = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                if isinstance(item, _FlushMarker):
+                    # Everything queued before the marker is already pending.
+                    markers.append(item)
+                    break
+                pending.append(item)
+                if len(pending) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if pending:
+                try:
+                    self._write(pending)
+                except Exception:  # pragma: no cover - keep the writer alive
+                    LOGGER.exception("Audit log writer failed to flush a batch")
+            for marker in markers:
+                marker.done.set()
+
+    def _write(self, pending: Sequence[tuple[Engine, dict[str, Any]]]) -> None:
+        record_histogram(AUDIT_LOG_QUEUE_DEPTH_METRIC, value=self._queue.qsize())
+        by_bind: dict[Engine, list[dict[str, Any]]] = defaultdict(list)
+        for bind, row in pending:
+            by_bind[bind].append(row)
+        started = time.perf_counter()
+        for bind, rows in by_bind.items():
+            try:
+                with bind.begin() as connection:
+                    connection.execute(insert(AuditLog.__table__), rows)
+            except _SPOOLABLE_ERRORS:
+                LOGGER.warning(
+                    "Database unavailable for %d audit log entries; spooling",
+                    len(rows),
+                    exc_info=True,
+                )
+                self._spill(rows, reason="database_busy")
+            except Exception:
+                LOGGER.error(
+                    "Dropping %d audit log entries the database rejected",
+                    len(rows),
+                    exc_info=True,
+                )
+                self._count("dropped", len(rows), event="dropped")
+            else:
+                self._count("written", len(rows), event="written")
+        elapsed = time.perf_counter() - started
+        record_histogram(AUDIT_LOG_FLUSH_LATENCY_METRIC, value=elapsed)
+        with self._lock:
+            self._stats.flushes += 1
+            self._stats.last_flush_seconds = elapsed
+
+    def _spill(self, rows: Sequence[dict[str, Any]], *, reason: str) -> None:
+        if self.spool is not None and self.spool.append(rows):
+            self._count("spooled", len(rows), event="spooled")
+            return
+        LOGGER.error("Dropped %d audit log entries (%s)", len(rows), reason)
+        self._count("dropped", len(rows), event="dropped")
+
+    def _count(self, field: str, amount: int, *, event: str | None = None) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + amount)
+        if event is not None:
+            record_counter(
+                AUDIT_LOG_EVENTS_METRIC, amount=amount, labels={"event": event}
+            )
+
+
+def _spool_path(settings: Settings) -> Path:
+    return settings.audit_log_spool_path or (
+        Path(settings.storage_root) / "audit-spool.jsonl"
+    )
+
+
+_batcher_lock = threading.Lock()
+_batcher: AuditLogBatcher | None = None
+
+
+def get_audit_log_batcher(settings: Settings | None = None) -> AuditLogBatcher:
+    """Return the process-wide batcher, creating it from *settings* on first use."""
+
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            resolved = settings or get_settings()
+            _batcher = AuditLogBatcher(
+                max_queue=resolved.audit_log_queue_size,
+                batch_size=resolved.audit_log_batch_size,
+                flush_interval=resolved.audit_log_flush_interval_ms / 1000.0,
+                spool=AuditLogSpool(_spool_path(resolved)),
+            )
+        return _batcher
+
+
+def flush_audit_logs(timeout: float | None = 5.0) -> bool:
+    """Wait until queued audit entries have been written or spooled."""
+
+    batcher = _batcher
+    return batcher.flush(timeout) if batcher is not None else True
+
+
+def audit_log_stats() -> AuditLogStats:
+    """Return a snapshot of the background writer's counters."""
+
+    batcher = _batcher
+    return batcher.stats() if batcher is not None else AuditLogStats()
+
+
+@atexit.register
+def shutdown_audit_log_writer() -> None:
+    """Flush and stop the background writer; the next entry starts a new one."""
+
+    global _batcher
+    with _batcher_lock:
+        batcher, _batcher = _batcher, None
+    if batcher is not None:
+        batcher.close()
+
+
+def replay_audit_spool(
+    bind: Engine, *, settings: Settings | None = None, batch_size: int = 500
+) -> int:
+    """Insert spooled audit entries into *bind* and return how many were written.
+
+    Rows that still cannot be written are appended back to the spool.
+    """
+
+    spool = AuditLogSpool(_spool_path(settings or get_settings()))
+    rows = spool.take()
+    written = 0
+    for offset in range(0, len(rows), batch_size):
+        batch = rows[offset : offset + batch_size]
+        try:
+            with bind.begin() as connection:
+                connection.execute(insert(AuditLog.__table__), batch)
+        except SQLAlchemyError:
+            LOGGER.warning("Audit spool replay interrupted", exc_info=True)
+            spool.append(rows[offset:])
+            break
+        written += len(batch)
+    if written:
+        LOGGER.info("Replayed %d spooled audit log entries", written)
+        record_counter(
+            AUDIT_LOG_EVENTS_METRIC, amount=written, labels={"event": "replayed"}
+        )
+    return written
+
+
 class AuditLogWriter:
     """Persist audit log entries without impacting the caller transaction."""
 
-    def __init__(self, session_factory: sessionmaker[SASession] | None) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[SASession] | None,
+        *,
+        synchronous: bool | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._synchronous = synchronous
 
     @classmethod
-    def from_session(cls, session: SASession | object) -> "AuditLogWriter":
+    def from_session(
+        cls, session: SASession | object, *, synchronous: bool | None = None
+    ) -> "AuditLogWriter":
         try:
             bind = session.get_bind()  # type: ignore[attr-defined]
         except Exception:  # noqa: BLE001 - defensive fallback for stub sessions
@@ -121,7 +548,14 @@ class AuditLogWriter:
             future=True,
             class_=SASession,
         )
-        return cls(factory)
+        return cls(factory, synchronous=synchronous)
+
+    def _use_synchronous(self, requested: bool | None) -> bool:
+        if requested is not None:
+            return requested
+        if self._synchronous is not None:
+            return self._synchronous
+        return get_settings().audit_log_mode == "sync"
 
     def log(
         self,
@@ -135,25 +569,46 @@ class AuditLogWriter:
         claim_cards: Sequence[Any] | None = None,
         audit_metadata: Mapping[str, Any] | Sequence[Any] | None = None,
         status: str = "generated",
+        synchronous: bool | None = None,
     ) -> None:
+        """Record an audit entry.
+
+        Entries are queued for the background writer unless *synchronous* (or
+        the writer's default, or ``audit_log_mode``) asks for an inline commit.
+        """
+
         if self._session_factory is None:
             return None
-        record = AuditLog(
-            workflow=workflow,
-            status=status,
-            prompt_hash=prompt_hash,
-            model_preset=model_preset,
-            inputs=_serialise_payload(inputs or {}),
-            outputs=_serialise_payload(outputs) if outputs is not None else None,
-            citations=serialise_citations(citations),
-            claim_cards=serialise_claim_cards(claim_cards),
-            audit_metadata=_serialise_payload(audit_metadata)
+        row = {
+            "workflow": workflow,
+            "status": status,
+            "prompt_hash": prompt_hash,
+            "model_preset": model_preset,
+            "inputs": _serialise_payload(inputs or {}),
+            "outputs": _serialise_payload(outputs) if outputs is not None else None,
+            "citations": serialise_citations(citations),
+            "claim_cards": serialise_claim_cards(claim_cards),
+            "audit_metadata": _serialise_payload(audit_metadata)
             if audit_metadata is not None
             else None,
-        )
-        session = self._session_factory()
+            "created_at": datetime.now(UTC),
+        }
+        bind = self._session_factory.kw.get("bind")
+        # Sessions bound to a connection share it with the caller, so only a
+        # pooled engine can be written from the background thread.
+        if isinstance(bind, Engine) and not self._use_synchronous(synchronous):
+            try:
+                get_audit_log_batcher().submit(bind, row)
+                return None
+            except RuntimeError:  # pragma: no cover - raced with shutdown
+                LOGGER.debug("Audit batcher closed; writing inline", exc_info=True)
+        self._write_now(row)
+        return None
+
+    def _write_now(self, row: dict[str, Any]) -> None:
+        session = self._session_factory()  # type: ignore[misc]
         try:
-            session.add(record)
+            session.add(AuditLog(**row))
             session.commit()
         except SQLAlchemyError:  # pragma: no cover - defensive persistence guard
             session.rollback()
@@ -209,10 +664,18 @@ def purge_audit_logs(
 
 
 __all__ = [
+    "AuditLogBatcher",
+    "AuditLogSpool",
+    "AuditLogStats",
     "AuditLogWriter",
+    "audit_log_stats",
     "compute_prompt_hash",
     "fetch_recent_audit_logs",
+    "flush_audit_logs",
+    "get_audit_log_batcher",
     "purge_audit_logs",
+    "replay_audit_spool",
     "serialise_citations",
     "serialise_claim_cards",
+    "shutdown_audit_log_writer",
 ]
@@ -1,4 +1,23 @@
-"""Redis caching helpers for guardrailed RAG workflows."""
+"""Two-tier answer cache for guardrailed RAG workflows.
+
+Answers are cached in two tiers. The *local* tier is a size-bounded LRU inside
+the process: repeat questions are answered without a network round trip and
+keep being served while Redis is unreachable. The *shared* tier is Redis, where
+payloads are stored compressed (zstd when ``zstandard`` is installed, zlib
+otherwise) so every worker can reuse them. Lookups try the local tier first and
+promote shared hits into it.
+
+Every entry records the ``updated_at`` stamp of the documents its passages came
+from. Lookups pass the current stamps and an entry whose documents changed
+after it was written is dropped and reported as stale.
+
+When ``rag_cache_semantic_threshold`` is set the cache also keeps an
+in-process index of question embeddings. An exact-key miss then falls back to
+the answer cached for the most similar earlier question, as long as the cosine
+similarity clears the threshold and retrieval returned the same set of
+passages for the same user and model. The chat workflow still runs its
+guardrail checks on every cached answer against the current citations.
+"""
 
 from __future__ import annotations
 
@@ -6,24 +25,60 @@ import hashlib
 import json
 import logging
 import re
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Protocol, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
 from theo.application.facades.runtime import allow_insecure_startup
 from theo.application.facades.settings import get_settings
 from theo.application.facades.version import get_git_sha
 from theo.application.facades.telemetry import log_workflow_event, record_counter
-from theo.application.telemetry import RAG_CACHE_EVENTS_METRIC
+from theo.application.telemetry import (
+    RAG_CACHE_EVENTS_METRIC,
+    RAG_CACHE_TIER_EVENTS_METRIC,
+)
+from theo.infrastructure.api.app.persistence_models import Document
 
 try:  # pragma: no cover - optional dependency guard
     import redis
 except ImportError:  # pragma: no cover - redis is optional at runtime
     redis = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional dependency guard
+    import zstandard
+except ImportError:  # pragma: no cover - zlib is used instead
+    zstandard = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .models import RAGAnswer
+
 
 LOGGER = logging.getLogger(__name__)
-_CACHE_TTL_SECONDS = 30 * 60
+
+CACHE_TIERS: tuple[str, ...] = ("local", "shared", "semantic")
+
+_ZSTD_PREFIX = b"zs:"
+_ZLIB_PREFIX = b"zl:"
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, zlib.error)
+if zstandard is not None:  # pragma: no cover - depends on the optional codec
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
+_STAT_FIELDS = {
+    "hit": "hits",
+    "miss": "misses",
+    "stale": "stale",
+    "store": "stores",
+    "eviction": "evictions",
+}
 
 
 def _normalise_segment(value: str | None, default: str) -> str:
@@ -31,6 +86,89 @@ def _normalise_segment(value: str | None, default: str) -> str:
     return re.sub(r"[^a-zA-Z0-9._-]", "_", segment)
 
 
+def _normalise_question(question: str) -> str:
+    return " ".join(re.findall(r"\w+", question.lower()))
+
+
+def _compress(raw: bytes) -> bytes:
+    if zstandard is not None:
+        return _ZSTD_PREFIX + zstandard.ZstdCompressor(level=3).compress(raw)
+    return _ZLIB_PREFIX + zlib.compress(raw, 6)
+
+
+def _decompress(raw: bytes | str) -> bytes:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    if raw.startswith(_ZSTD_PREFIX):
+        if zstandard is None:
+            raise ValueError("zstd payload found but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(raw[len(_ZSTD_PREFIX) :])
+    if raw.startswith(_ZLIB_PREFIX):
+        return zlib.decompress(raw[len(_ZLIB_PREFIX) :])
+    # Entries written before payloads were compressed are plain JSON.
+    return raw
+
+
+def _cosine(left: Sequence[float], right: Sequence[float]) -> float:
+    if not left or len(left) != len(right):
+        return 0.0
+    dot = sum(a * b for a, b in zip(left, right))
+    left_norm = sum(a * a for a in left) ** 0.5
+    right_norm = sum(b * b for b in right) ** 0.5
+    if not left_norm or not right_norm:
+        return 0.0
+    return dot / (left_norm * right_norm)
+
+
+def _semantic_scope(key: str, passage_ids: Iterable[str]) -> str:
+    # Keys end in ``:<retrieval digest>:<prompt hash>``; the rest pins the
+    # build, user and model, which a reused answer must share.
+    prefix = key.rsplit(":", 2)[0]
+    digest = hashlib.sha256(
+        "\x1f".join(sorted(str(value) for value in passage_ids)).encode("utf-8")
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def _versions_match(
+    payload: Mapping[str, Any], doc_versions: Mapping[str, str] | None
+) -> bool:
+    if doc_versions is None:
+        return True
+    cached = payload.get("doc_versions")
+    if not isinstance(cached, Mapping):
+        return True
+    return all(doc_versions.get(doc_id) == stamp for doc_id, stamp in cached.items())
+
+
+def document_version_stamps(
+    session: Session, document_ids: Iterable[str | None]
+) -> dict[str, str]:
+    """Return the ``updated_at`` stamp of each document in *document_ids*."""
+
+    ids = sorted({str(doc_id) for doc_id in document_ids if doc_id})
+    if not ids:
+        return {}
+    try:
+        rows = session.execute(
+            select(Document.id, Document.updated_at).where(Document.id.in_(ids))
+        ).all()
+    except SQLAlchemyError:
+        # Unknown stamps never match a recorded one, so cached answers for
+        # these documents are treated as stale rather than served blindly.
+        LOGGER.debug("failed to load document version stamps", exc_info=True)
+        return {}
+    return {
+        str(doc_id): updated_at.isoformat() if updated_at is not None else ""
+        for doc_id, updated_at in rows
+    }
+
+
+class QuestionEmbedder(Protocol):
+    def embed_query(self, prompt: str) -> list[float] | None:
+        ...
+
+
 @dataclass(slots=True)
 class CacheLookupResult:
     status: str
@@ -38,12 +176,78 @@ class CacheLookupResult:
     cache_key: str | None = None
 
 
+@dataclass(slots=True)
+class CacheTierStats:
+    """Lookup outcomes for one cache tier since the cache was created."""
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    payload: dict[str, Any]
+    size: int
+    expires_at: float
+
+
 class RAGCache:
-    """Thin wrapper around Redis for caching guardrailed answers."""
+    """Local LRU in front of a compressed Redis tier for guardrailed answers."""
 
-    def __init__(self, *, redis_module: Any | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        redis_module: Any | None = None,
+        ttl_seconds: int | None = None,
+        local_max_entries: int | None = None,
+        local_max_bytes: int | None = None,
+        semantic_threshold: float | None = None,
+        embedder: QuestionEmbedder | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._redis_module = redis_module if redis_module is not None else redis
         self._client: Any | None = None
+        self._ttl_seconds = ttl_seconds
+        self._local_max_entries = local_max_entries
+        self._local_max_bytes = local_max_bytes
+        self._semantic_threshold = semantic_threshold
+        self._embedder = embedder
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._local_bytes = 0
+        # scope -> {cache key: question embedding}, plus LRU order over keys.
+        self._semantic: dict[str, dict[str, list[float]]] = {}
+        self._semantic_order: OrderedDict[str, str] = OrderedDict()
+        self._stats = {tier: CacheTierStats() for tier in CACHE_TIERS}
+
+    # Configuration -------------------------------------------------------
+    @property
+    def ttl_seconds(self) -> int:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return get_settings().rag_cache_ttl_seconds
+
+    @property
+    def local_max_entries(self) -> int:
+        if self._local_max_entries is not None:
+            return self._local_max_entries
+        return get_settings().rag_cache_local_max_entries
+
+    @property
+    def local_max_bytes(self) -> int:
+        if self._local_max_bytes is not None:
+            return self._local_max_bytes
+        return get_settings().rag_cache_local_max_bytes
+
+    @property
+    def semantic_threshold(self) -> float | None:
+        if self._semantic_threshold is not None:
+            return self._semantic_threshold
+        return get_settings().rag_cache_semantic_threshold
 
     # Redis initialisation -------------------------------------------------
     def _initialise_client(self) -> Any | None:
@@ -63,10 +267,10 @@ class RAGCache:
             return self._client
         try:
             settings = get_settings()
+            # Payloads are compressed bytes, so responses stay undecoded.
             self._client = self._redis_module.Redis.from_url(  # type: ignore[assignment]
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
             )
         except Exception as exc:  # pragma: no cover - network/config errors
             LOGGER.debug("failed to initialise redis client", exc_info=True)
@@ -110,19 +314,200 @@ class RAGCache:
         model_segment = _normalise_segment(model_label, "default")
         return f"rag:{version}:{user_segment}:{model_segment}:{retrieval_digest}:{prompt_hash}"
 
+    # Statistics ----------------------------------------------------------
+    def _record(self, tier: str, event: str, amount: int = 1) -> None:
+        with self._lock:
+            stats = self._stats[tier]
+            attribute = _STAT_FIELDS[event]
+            setattr(stats, attribute, getattr(stats, attribute) + amount)
+        record_counter(
+            RAG_CACHE_TIER_EVENTS_METRIC,
+            amount=float(amount),
+            labels={"tier": tier, "event": event},
+        )
+
+    def stats(self) -> dict[str, CacheTierStats]:
+        """Return a snapshot of hit/miss/stale counters for each tier."""
+
+        with self._lock:
+            return {tier: replace(stats) for tier, stats in self._stats.items()}
+
+    # Local tier ----------------------------------------------------------
+    def _local_get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._local_pop(key)
+                return None
+            self._local.move_to_end(key)
+            return dict(entry.payload)
+
+    def _local_pop(self, key: str) -> None:
+        entry = self._local.pop(key, None)
+        if entry is not None:
+            self._local_bytes -= entry.size
+
+    def _local_put(self, key: str, payload: dict[str, Any], size: int) -> None:
+        max_entries = self.local_max_entries
+        max_bytes = self.local_max_bytes
+        if max_entries <= 0 or size > max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            self._local_pop(key)
+            self._local[key] = _LocalEntry(
+                payload=payload,
+                size=size,
+                expires_at=self._clock() + self.ttl_seconds,
+            )
+            self._local_bytes += size
+            while len(self._local) > max_entries or self._local_bytes > max_bytes:
+                victim, entry = self._local.popitem(last=False)
+                self._local_bytes -= entry.size
+                evicted += 1
+        self._record("local", "store")
+        if evicted:
+            self._record("local", "eviction", evicted)
+
+    # Semantic index ------------------------------------------------------
+    def _embed(self, question: str) -> list[float] | None:
+        text = _normalise_question(question)
+        if not text:
+            return None
+        if self._embedder is None:
+            from ..memory_index import MemoryIndex
+
+            self._embedder = MemoryIndex()
+        return self._embedder.embed_query(text)
+
+    def _index_question(
+        self, key: str, question: str, passage_ids: Collection[str]
+    ) -> None:
+        vector = self._embed(question)
+        if not vector:
+            return
+        scope = _semantic_scope(key, passage_ids)
+        limit = max(self.local_max_entries, 1)
+        with self._lock:
+            self._semantic_forget(key)
+            self._semantic.setdefault(scope, {})[key] = vector
+            self._semantic_order[key] = scope
+            while len(self._semantic_order) > limit:
+                victim, _ = next(iter(self._semantic_order.items()))
+                self._semantic_forget(victim)
+
+    def _semantic_forget(self, key: str) -> None:
+        scope = self._semantic_order.pop(key, None)
+        if scope is None:
+            return
+        keys = self._semantic.get(scope)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._semantic[scope]
+
+    def _load_similar(
+        self,
+        key: str,
+        *,
+        question: str,
+        passage_ids: Collection[str],
+        doc_versions: Mapping[str, str] | None,
+        threshold: float,
+    ) -> dict[str, Any] | None:
+        scope = _semantic_scope(key, passage_ids)
+        with self._lock:
+            candidates = [
+                (candidate, vector)
+                for candidate, vector in self._semantic.get(scope, {}).items()
+                if candidate != key
+            ]
+        best_key, best_score = None, threshold
+        vector = self._embed(question) if candidates else None
+        if vector:
+            for candidate, candidate_vector in candidates:
+                score = _cosine(vector, candidate_vector)
+                if score >= best_score:
+                    best_key, best_score = candidate, score
+        payload = self._load_exact(best_key, doc_versions) if best_key else None
+        if payload is None:
+            if best_key is not None:
+                with self._lock:
+                    self._semantic_forget(best_key)
+            self._record("semantic", "miss")
+            return None
+        self._record("semantic", "hit")
+        # Alias the answer under the new key so a repeat is an exact hit.
+        size = len(json.dumps(payload).encode("utf-8"))
+        self._local_put(key, payload, size)
+        return payload
+
     # Persistence ---------------------------------------------------------
-    def load(self, key: str) -> dict[str, Any] | None:
+    def _load_exact(
+        self, key: str, doc_versions: Mapping[str, str] | None
+    ) -> dict[str, Any] | None:
+        payload = self._local_get(key)
+        if payload is not None:
+            if _versions_match(payload, doc_versions):
+                self._record("local", "hit")
+                return payload
+            self._record("local", "stale")
+            self.delete(key)
+            return None
+        if self.local_max_entries > 0:
+            self._record("local", "miss")
+
         raw = self._execute(lambda client: client.get(key))
         if not raw:
+            self._record("shared", "miss")
             return None
         try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError:
-            LOGGER.debug("invalid JSON payload in cache for key %s", key, exc_info=True)
-            return None
+            data = _decompress(raw)
+            payload = json.loads(data)
+        except _DECODE_ERRORS:
+            LOGGER.debug("invalid payload in cache for key %s", key, exc_info=True)
+            payload = None
         if not isinstance(payload, dict):
+            self._record("shared", "miss")
             return None
-        return payload
+        if not _versions_match(payload, doc_versions):
+            self._record("shared", "stale")
+            self.delete(key)
+            return None
+        self._record("shared", "hit")
+        self._local_put(key, payload, len(data))
+        return dict(payload)
+
+    def load(
+        self,
+        key: str,
+        *,
+        doc_versions: Mapping[str, str] | None = None,
+        question: str | None = None,
+        passage_ids: Collection[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the cached payload for *key*, trying each tier in turn.
+
+        ``doc_versions`` maps document ids to their current version stamps;
+        entries recorded against other stamps are dropped. ``question`` and
+        ``passage_ids`` enable the semantic fallback when it is configured.
+        """
+
+        payload = self._load_exact(key, doc_versions)
+        if payload is not None:
+            return payload
+        threshold = self.semantic_threshold
+        if threshold is None or not question or passage_ids is None:
+            return None
+        return self._load_similar(
+            key,
+            question=question,
+            passage_ids=passage_ids,
+            doc_versions=doc_versions,
+            threshold=threshold,
+        )
 
     def store(
         self,
@@ -130,23 +515,49 @@ class RAGCache:
         *,
         answer: "RAGAnswer",
         validation: dict[str, Any] | None,
+        doc_versions: Mapping[str, str] | None = None,
+        question: str | None = None,
+        passage_ids: Collection[str] | None = None,
     ) -> None:
         payload = {
             "answer": answer.model_dump(mode="json"),
             "validation": validation,
             "model_name": answer.model_name,
             "cached_at": datetime.now(UTC).isoformat(),
+            "doc_versions": dict(doc_versions or {}),
         }
         try:
-            serialised = json.dumps(payload)
+            serialised = json.dumps(payload).encode("utf-8")
         except TypeError:
             LOGGER.debug("failed to serialise cache payload", exc_info=True)
             return
-        self._execute(lambda client: client.set(key, serialised, ex=_CACHE_TTL_SECONDS))
+        self._local_put(key, payload, len(serialised))
+        compressed = _compress(serialised)
+        ttl = self.ttl_seconds
+        if self._execute(lambda client: client.set(key, compressed, ex=ttl)):
+            self._record("shared", "store")
+        if (
+            question
+            and passage_ids is not None
+            and self.semantic_threshold is not None
+        ):
+            self._index_question(key, question, passage_ids)
 
     def delete(self, key: str) -> None:
+        with self._lock:
+            self._local_pop(key)
+            self._semantic_forget(key)
         self._execute(lambda client: client.delete(key))
 
+    def clear_local(self) -> None:
+        """Drop the in-process tier and semantic index (Redis is untouched)."""
+
+        with self._lock:
+            self._local.clear()
+            self._local_bytes = 0
+            self._semantic.clear()
+            self._semantic_order.clear()
+
     # Convenience ---------------------------------------------------------
     def lookup(
         self,
@@ -155,6 +566,9 @@ class RAGCache:
         model_label: str | None,
         prompt: str,
         retrieval_digest: str,
+        doc_versions: Mapping[str, str] | None = None,
+        question: str | None = None,
+        passage_ids: Collection[str] | None = None,
     ) -> CacheLookupResult:
         key = self.build_key(
             user_id=user_id,
@@ -162,7 +576,12 @@ class RAGCache:
             prompt=prompt,
             retrieval_digest=retrieval_digest,
         )
-        payload = self.load(key)
+        payload = self.load(
+            key,
+            doc_versions=doc_versions,
+            question=question,
+            passage_ids=passage_ids,
+        )
         status = "hit" if payload else "miss"
         return CacheLookupResult(status=status, payload=payload, cache_key=key)
 
@@ -188,8 +607,11 @@ def record_cache_status(status: str, *, cache_key_suffix: str | None = None) ->
 
 
 __all__ = [
+    "CACHE_TIERS",
     "CacheLookupResult",
+    "CacheTierStats",
     "RAGCache",
+    "document_version_stamps",
     "extract_cache_key_suffix",
     "record_cache_status",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping
 from typing import Any
 
 from .cache import RAGCache
@@ -10,6 +11,22 @@ from .models import RAGAnswer
 DEFAULT_CACHE = RAGCache()
 
 
+def _lookup_context(
+    *,
+    doc_versions: Mapping[str, str] | None,
+    question: str | None,
+    passage_ids: Collection[str] | None,
+) -> dict[str, Any]:
+    # Only forward what the caller supplied so simple caches that accept just
+    # the key keep working.
+    context = {
+        "doc_versions": doc_versions,
+        "question": question,
+        "passage_ids": passage_ids,
+    }
+    return {name: value for name, value in context.items() if value is not None}
+
+
 def build_cache_key(
     *,
     user_id: str | None,
@@ -28,10 +45,22 @@ def build_cache_key(
     )
 
 
-def load_cached_answer(key: str, *, cache: RAGCache = DEFAULT_CACHE) -> dict[str, Any] | None:
-    """Load a cached answer payload if present."""
+def load_cached_answer(
+    key: str,
+    *,
+    cache: RAGCache = DEFAULT_CACHE,
+    doc_versions: Mapping[str, str] | None = None,
+    question: str | None = None,
+    passage_ids: Collection[str] | None = None,
+) -> dict[str, Any] | None:
+    """Load a cached answer payload if present and still current."""
 
-    return cache.load(key)
+    return cache.load(
+        key,
+        **_lookup_context(
+            doc_versions=doc_versions, question=question, passage_ids=passage_ids
+        ),
+    )
 
 
 def store_cached_answer(
@@ -40,10 +69,20 @@ def store_cached_answer(
     answer: RAGAnswer,
     validation: dict[str, Any] | None,
     cache: RAGCache = DEFAULT_CACHE,
+    doc_versions: Mapping[str, str] | None = None,
+    question: str | None = None,
+    passage_ids: Collection[str] | None = None,
 ) -> None:
     """Persist an answer and its validation metadata to the cache."""
 
-    cache.store(key, answer=answer, validation=validation)
+    cache.store(
+        key,
+        answer=answer,
+        validation=validation,
+        **_lookup_context(
+            doc_versions=doc_versions, question=question, passage_ids=passage_ids
+        ),
+    )
 
 
 __all__ = [
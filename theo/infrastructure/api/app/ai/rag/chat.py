@@ -14,7 +14,11 @@ from theo.application.facades.telemetry import instrument_workflow, set_span_att
 from ..registry import LLMModel, LLMRegistry, get_llm_registry
 from ..router import get_router
 from ..trails import TrailStepDigest
-from .cache import extract_cache_key_suffix, record_cache_status
+from .cache import (
+    document_version_stamps,
+    extract_cache_key_suffix,
+    record_cache_status,
+)
 from .cache_ops import (
     DEFAULT_CACHE,
     RAGCache,
@@ -220,6 +224,10 @@ class GuardedAnswerPipeline:
         prompt = prompt_context.build_prompt(question)
 
         retrieval_digest = build_retrieval_digest(ordered_results)
+        passage_ids = [str(result.id) for result in ordered_results]
+        doc_versions = document_version_stamps(
+            self.session, (result.document_id for result in ordered_results)
+        )
         last_error: GenerationError | None = None
         selected_model: LLMModel | None = None
 
@@ -243,7 +251,13 @@ class GuardedAnswerPipeline:
             validation_result = None
             model_output = None
 
-            cached_payload = load_cached_answer(cache_key, cache=self.cache)
+            cached_payload = load_cached_answer(
+                cache_key,
+                cache=self.cache,
+                doc_versions=doc_versions,
+                question=question,
+                passage_ids=passage_ids,
+            )
             if cached_payload:
                 cache_status = "hit"
                 try:
@@ -472,6 +486,9 @@ class GuardedAnswerPipeline:
                 answer=answer,
                 validation=validation_result,
                 cache=self.cache,
+                doc_versions=doc_versions,
+                question=question,
+                passage_ids=passage_ids,
             )
             if cache_status == "refresh":
                 record_cache_status("refresh", cache_key_suffix=cache_key_suffix)
@@ -8,6 +8,8 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Callable, Iterable, Pattern
 
+from .text_analysis import TextAnalysis, analyse_text
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -30,6 +32,9 @@ class FallacyRule:
     severity: str
     description: str
     detector: Callable[[str], Iterable[str]]
+    # Cheap precondition evaluated against the shared token analysis; rules
+    # whose anchor words are absent are skipped without running the regex.
+    requires: Callable[[TextAnalysis], bool] | None = None
 
 
 class FallacyDetector:
@@ -103,18 +108,33 @@ class FallacyDetector:
                     self.AFFIRMING_CONSEQUENT_PATTERN,
                     _affirming_consequent_filter,
                 ),
+                requires=_anchored("if"),
             ),
             FallacyRule(
                 "ad_hominem",
                 "high",
                 "Attack on person rather than argument",
                 detector=_regex_detector(self.AD_HOMINEM_PATTERN),
+                requires=_anchored(
+                    "he",
+                    "she",
+                    "they",
+                    "author",
+                    "scholar",
+                    "critic",
+                    "critics",
+                    "skeptic",
+                    "skeptics",
+                    "opponent",
+                    "opponents",
+                ),
             ),
             FallacyRule(
                 "appeal_to_authority",
                 "medium",
                 "Argument relies on authority without warrant",
                 detector=_regex_detector(self.APPEAL_TO_AUTHORITY_PATTERN),
+                requires=_anchored("says", "claims", "argues", "teaches"),
             ),
             FallacyRule(
                 "circular_reasoning",
@@ -124,12 +144,14 @@ class FallacyDetector:
                     text,
                     self.CIRCULAR_REASONING_PATTERN,
                 ),
+                requires=_anchored("bible", "scripture", "text"),
             ),
             FallacyRule(
                 "straw_man",
                 "high",
                 "Misrepresenting opponent's position",
                 detector=_regex_detector(self.STRAW_MAN_PATTERN),
+                requires=_anchored("critics", "skeptics", "opponents"),
             ),
             FallacyRule(
                 "false_dichotomy",
@@ -139,6 +161,7 @@ class FallacyDetector:
                     self.FALSE_DICHOTOMY_PATTERN,
                     _false_dichotomy_filter,
                 ),
+                requires=_anchored("either"),
             ),
             FallacyRule(
                 "proof_texting",
@@ -149,35 +172,50 @@ class FallacyDetector:
                     self.PROOF_TEXTING_PATTERN,
                     self.CITATION_TOKEN_PATTERN,
                 ),
+                requires=_has_digits,
             ),
             FallacyRule(
                 "verse_isolation",
                 "medium",
                 "Treating verse out of literary context",
                 detector=_regex_detector(self.VERSE_ISOLATION_PATTERN),
+                requires=_anchored("clearly", "obviously", "plainly"),
             ),
             FallacyRule(
                 "eisegesis",
                 "medium",
                 "Reading meaning into text rather than from it",
                 detector=_regex_detector(self.EISEGESIS_PATTERN),
+                requires=_anchored("meant", "means", "refers"),
             ),
             FallacyRule(
                 "chronological_snobbery",
                 "low",
                 "Dismissing ideas based on era",
                 detector=_regex_detector(self.CHRONOLOGICAL_SNOBBERY_PATTERN),
+                requires=_anchored("ancient", "primitive", "outdated", "modern"),
             ),
         ]
 
-    def detect(self, text: str) -> list[FallacyWarning]:
-        """Detect fallacies in the given text."""
+    def detect(
+        self, text: str, *, analysis: TextAnalysis | None = None
+    ) -> list[FallacyWarning]:
+        """Detect fallacies in the given text.
+
+        ``analysis`` may be supplied by callers that already tokenised ``text``
+        so the token pass is shared with their own checks.
+        """
+
+        if analysis is None or analysis.text != text:
+            analysis = analyse_text(text)
 
         grouped: dict[str, list[FallacyWarning]] = defaultdict(list)
         seen_snippets: dict[str, set[str]] = defaultdict(set)
         occurrence_counts: dict[str, int] = defaultdict(int)
 
         for rule in self.rules:
+            if rule.requires is not None and not rule.requires(analysis):
+                continue
             for snippet in rule.detector(text):
                 normalised = _normalise_snippet(snippet)
                 occurrence_counts[rule.fallacy_type] += 1
@@ -239,6 +277,19 @@ class FallacyDetector:
 # Helper utilities ---------------------------------------------------------
 
 
+def _anchored(*words: str) -> Callable[[TextAnalysis], bool]:
+    anchors = frozenset(words)
+
+    def _requires(analysis: TextAnalysis) -> bool:
+        return not anchors.isdisjoint(analysis.vocabulary)
+
+    return _requires
+
+
+def _has_digits(analysis: TextAnalysis) -> bool:
+    return analysis.has_digits
+
+
 def _regex_detector(
     pattern: Pattern[str],
     filter_fn: Callable[[re.Match[str], str], bool] | None = None,
@@ -310,6 +361,12 @@ def _detect_proof_texting(
     return matches
 
 
+_SIMPLE_CIRCULAR_PATTERN = re.compile(
+    r"\b(?P<claim>[A-Za-z\s]+?)\s+because\s+(?:the\s+)?(?:bible|scripture|text)\s+(?:says|teaches)\s+(?P<support>[^.?!]+)",
+    re.IGNORECASE,
+)
+
+
 def _detect_circular_reasoning(
     text: str,
     pattern: Pattern[str],
@@ -319,11 +376,7 @@ def _detect_circular_reasoning(
         if _circular_reasoning_filter(match, text):
             matches.append(match.group(0))
 
-    simple_pattern = re.compile(
-        r"\b(?P<claim>[A-Za-z\s]+?)\s+because\s+(?:the\s+)?(?:bible|scripture|text)\s+(?:says|teaches)\s+(?P<support>[^.?!]+)",
-        re.IGNORECASE,
-    )
-    for match in simple_pattern.finditer(text):
+    for match in _SIMPLE_CIRCULAR_PATTERN.finditer(text):
         claim = match.group("claim") or ""
         support = match.group("support") or ""
         if "says so" in match.group(0).lower():
@@ -353,15 +406,23 @@ def _jaccard_similarity(left: str, right: str) -> float:
     return len(intersection) / len(union)
 
 
+_DEFAULT_DETECTOR: FallacyDetector | None = None
+
+
 # Module-level convenience function
-def detect_fallacies(text: str) -> list[FallacyWarning]:
+def detect_fallacies(
+    text: str, *, analysis: TextAnalysis | None = None
+) -> list[FallacyWarning]:
     """Detect logical fallacies in text.
 
     Args:
         text: The text to analyze for fallacies
+        analysis: Optional pre-computed token analysis of ``text``
 
     Returns:
         List of detected fallacy warnings
     """
-    detector = FallacyDetector()
-    return detector.detect(text)
+    global _DEFAULT_DETECTOR
+    if _DEFAULT_DETECTOR is None:
+        _DEFAULT_DETECTOR = FallacyDetector()
+    return _DEFAULT_DETECTOR.detect(text, analysis=analysis)
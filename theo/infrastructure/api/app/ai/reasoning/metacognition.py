@@ -12,6 +12,7 @@ from typing import Iterable
 from ..clients import LanguageModelClient
 from ..rag.guardrail_helpers import scrub_adversarial_language
 from .fallacies import FallacyWarning, detect_fallacies
+from .text_analysis import KeywordTable, TextAnalysis, analyse_text
 
 LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +71,85 @@ SKEPTICAL_MARKERS = {
     "problematic",
 }
 
+OVERCONFIDENT_MARKERS = {
+    "obviously",
+    "clearly",
+    "certainly",
+    "undeniably",
+}
+
+_ANALYSIS_KEYWORDS = KeywordTable.build(
+    {
+        "negation": NEGATION_WORDS,
+        "apologetic": APOLOGETIC_MARKERS,
+        "skeptical": SKEPTICAL_MARKERS,
+        "overconfident": OVERCONFIDENT_MARKERS,
+    }
+)
+
+# Substrings that must appear for the line-oriented alternative scan to match.
+_ALTERNATIVE_LINE_ANCHORS = ("alternative", "another")
+
+# Inline alternative-interpretation patterns paired with words that must occur
+# in the text for the pattern to have any chance of matching.
+_ALTERNATIVE_INLINE_PATTERNS: tuple[tuple[frozenset[str], re.Pattern[str]], ...] = (
+    (
+        frozenset({"alternatively"}),
+        re.compile(r"\balternatively[,\s]+(?P<clause>[^.?!\n]+)", re.IGNORECASE),
+    ),
+    (
+        frozenset({"another"}),
+        re.compile(
+            r"\banother interpretation is that\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"another"}),
+        re.compile(
+            r"\banother possibility is\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"some"}),
+        re.compile(
+            r"\bsome\s+(?:scholars|commentators|interpreters|traditions|theologians|readers)\s+"
+            r"(?:argue|interpret|understand|see|suggest|hold)\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"others"}),
+        re.compile(
+            r"\b(?:while\s+)?others\s+(?:argue|interpret|understand|see|suggest|contend|hold)\s+"
+            r"(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"critics"}),
+        re.compile(
+            r"\bcritics\s+(?:argue|contend|suggest|claim)\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"one"}),
+        re.compile(
+            r"\bone\s+(?:view|reading)\s+(?:is|holds)\s+that\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        frozenset({"another"}),
+        re.compile(
+            r"\banother\s+(?:view|reading)\s+(?:is|holds)\s+that\s+(?P<clause>[^.?!\n]+)",
+            re.IGNORECASE,
+        ),
+    ),
+)
+
 
 _STOPWORDS = {
     "the",
@@ -176,10 +256,12 @@ def critique_reasoning(
     """
     critique = Critique(reasoning_quality=DEFAULT_QUALITY_SCORE)
 
-    combined_text = f"{reasoning_trace}\n{answer}".strip()
+    # Tokenise once; fallacy, bias and alternative checks share the analysis.
+    analysis = _analyse(reasoning_trace, answer)
+    combined_text = analysis.text
 
     # Detect logical fallacies
-    fallacies = detect_fallacies(combined_text)
+    fallacies = detect_fallacies(combined_text, analysis=analysis)
     critique.fallacies_found = fallacies
 
     high_fallacies = sum(1 for f in fallacies if f.severity == "high")
@@ -205,7 +287,7 @@ def critique_reasoning(
         )
 
     # Check for perspective bias
-    bias_warnings = _detect_bias(reasoning_trace, answer)
+    bias_warnings = _detect_bias(reasoning_trace, answer, analysis=analysis)
     critique.bias_warnings = bias_warnings
 
     if bias_warnings:
@@ -213,7 +295,7 @@ def critique_reasoning(
 
     # Surface alternative interpretations explicitly mentioned in the reasoning
     critique.alternative_interpretations = _extract_alternative_interpretations(
-        reasoning_trace, answer
+        reasoning_trace, answer, analysis=analysis
     )
 
     total_penalty = _calculate_total_penalty(
@@ -409,28 +491,31 @@ def _extract_snippet_keywords(snippet: str) -> set[str]:
     return set(words)
 
 
-def _detect_bias(reasoning_trace: str, answer: str) -> list[str]:
-    """Detect perspective bias in reasoning with context-aware heuristics."""
+def _analyse(reasoning_trace: str, answer: str) -> TextAnalysis:
+    return analyse_text(f"{reasoning_trace}\n{answer}".strip(), _ANALYSIS_KEYWORDS)
 
-    combined_text = f"{reasoning_trace}\n{answer}".strip()
-    if not combined_text:
-        return []
 
-    sentences = [
-        sentence.strip()
-        for sentence in re.split(r"[.!?]+", combined_text)
-        if sentence and sentence.strip()
-    ]
+def _detect_bias(
+    reasoning_trace: str, answer: str, *, analysis: TextAnalysis | None = None
+) -> list[str]:
+    """Detect perspective bias in reasoning with context-aware heuristics."""
 
-    if not sentences:
+    if analysis is None:
+        analysis = _analyse(reasoning_trace, answer)
+    if not analysis.sentence_starts:
         return []
 
-    bias_counts = Counter({"apologetic": 0, "skeptical": 0})
-
-    for sentence in sentences:
-        lowered = sentence.lower()
-        bias_counts["apologetic"] += _count_bias_markers(lowered, APOLOGETIC_MARKERS)
-        bias_counts["skeptical"] += _count_bias_markers(lowered, SKEPTICAL_MARKERS)
+    # Bias markers are only cancelled by negations in the same sentence.
+    bias_counts = Counter(
+        {
+            category: sum(
+                1
+                for position, _word in analysis.positions(category)
+                if not analysis.is_negated(position, within_sentence=True)
+            )
+            for category in ("apologetic", "skeptical")
+        }
+    )
 
     total_markers = bias_counts["apologetic"] + bias_counts["skeptical"]
     warnings: list[str] = []
@@ -449,41 +534,25 @@ def _detect_bias(reasoning_trace: str, answer: str) -> list[str]:
                 "Reasoning emphasizes skeptical objections; consider constructive theological readings."
             )
 
-    overconfident_matches = [
-        match
-        for match in re.finditer(r"\b(obviously|clearly|certainly|undeniably)\b", combined_text, re.IGNORECASE)
-        if not _is_negated(combined_text.lower(), match.start())
-    ]
+    overconfident = any(
+        not analysis.is_negated(position)
+        for position, _word in analysis.positions("overconfident")
+    )
 
-    if overconfident_matches:
+    if overconfident:
         warnings.append("Overconfident language detected – supply supporting evidence or soften claims.")
 
     return warnings
 
 
-def _count_bias_markers(sentence: str, markers: set[str]) -> int:
-    count = 0
-    for marker in markers:
-        pattern = re.compile(rf"\b{re.escape(marker)}\b")
-        for match in pattern.finditer(sentence):
-            if not _is_negated(sentence, match.start()):
-                count += 1
-    return count
-
-
-def _is_negated(text: str, position: int) -> bool:
-    window_start = max(0, position - 25)
-    window = text[window_start:position]
-    return any(
-        re.search(rf"\b{negation}\b", window)
-        for negation in NEGATION_WORDS
-    )
-
-
-def _extract_alternative_interpretations(reasoning_trace: str, answer: str) -> list[str]:
+def _extract_alternative_interpretations(
+    reasoning_trace: str, answer: str, *, analysis: TextAnalysis | None = None
+) -> list[str]:
     """Extract alternative interpretations explicitly called out in the text."""
 
     combined_text = f"{reasoning_trace}\n{answer}"
+    if analysis is None:
+        analysis = _analyse(reasoning_trace, answer)
     interpretations: list[str] = []
     seen: set[str] = set()
 
@@ -493,7 +562,13 @@ def _extract_alternative_interpretations(reasoning_trace: str, answer: str) -> l
             seen.add(candidate.lower())
             interpretations.append(candidate)
 
-    for raw_line in combined_text.splitlines():
+    lowered_text = analysis.lowered
+    line_candidates = (
+        combined_text.splitlines()
+        if any(anchor in lowered_text for anchor in _ALTERNATIVE_LINE_ANCHORS)
+        else []
+    )
+    for raw_line in line_candidates:
         cleaned_line = raw_line.strip()
         if not cleaned_line:
             continue
@@ -530,41 +605,9 @@ def _extract_alternative_interpretations(reasoning_trace: str, answer: str) -> l
             _add_candidate(after)
 
     # Capture inline sentences such as "Alternatively, ..." that may not be line-separated
-    inline_patterns = [
-        re.compile(r"\balternatively[,\s]+(?P<clause>[^.?!\n]+)", re.IGNORECASE),
-        re.compile(
-            r"\banother interpretation is that\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\banother possibility is\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\bsome\s+(?:scholars|commentators|interpreters|traditions|theologians|readers)\s+"
-            r"(?:argue|interpret|understand|see|suggest|hold)\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\b(?:while\s+)?others\s+(?:argue|interpret|understand|see|suggest|contend|hold)\s+"
-            r"(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\bcritics\s+(?:argue|contend|suggest|claim)\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\bone\s+(?:view|reading)\s+(?:is|holds)\s+that\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-        re.compile(
-            r"\banother\s+(?:view|reading)\s+(?:is|holds)\s+that\s+(?P<clause>[^.?!\n]+)",
-            re.IGNORECASE,
-        ),
-    ]
-
-    for pattern in inline_patterns:
+    for anchors, pattern in _ALTERNATIVE_INLINE_PATTERNS:
+        if not analysis.has_any(anchors):
+            continue
         for match in pattern.finditer(combined_text):
             clause = match.group("clause")
             _add_candidate(clause)
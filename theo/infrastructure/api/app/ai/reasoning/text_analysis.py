@@ -0,0 +1,151 @@
+"""Single-pass lexical analysis shared by the post-generation reasoning checks.
+
+``critique_reasoning`` and :class:`~.fallacies.FallacyDetector` used to walk
+the same answer many times: sentences were re-split for every check, each bias
+marker compiled its own regex per sentence, and every fallacy pattern scanned
+the whole text even when none of its keywords were present. ``analyse_text``
+tokenises the text and splits sentences once, and locates every bias, negation
+and confidence marker with a single combined keyword regex. Downstream checks then read the
+positions they care about from the resulting :class:`TextAnalysis` and skip
+the expensive patterns whose anchor words never occur.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping
+
+NEGATION_WINDOW_CHARS = 25
+
+_TOKEN_RE = re.compile(r"\w+")
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]+")
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordTable:
+    """Mapping of lower-cased words to the categories they belong to.
+
+    ``pattern`` is a single alternation over every keyword so all categories
+    are located in one regex scan instead of one scan per marker.
+    """
+
+    categories: Mapping[str, frozenset[str]]
+    pattern: re.Pattern[str] | None = None
+
+    @classmethod
+    def build(cls, groups: Mapping[str, Iterable[str]]) -> "KeywordTable":
+        table: dict[str, set[str]] = defaultdict(set)
+        for category, words in groups.items():
+            for word in words:
+                table[word.lower()].add(category)
+        pattern = None
+        if table:
+            # Longest first so that shared prefixes resolve to the full word.
+            alternation = "|".join(
+                re.escape(word) for word in sorted(table, key=len, reverse=True)
+            )
+            pattern = re.compile(rf"\b(?:{alternation})\b")
+        return cls(
+            {word: frozenset(values) for word, values in table.items()}, pattern
+        )
+
+
+EMPTY_KEYWORDS = KeywordTable({})
+
+
+@dataclass(slots=True)
+class TextAnalysis:
+    """Tokens, sentence spans and keyword hits for one piece of text.
+
+    All offsets index into :attr:`lowered`.
+    """
+
+    text: str
+    lowered: str
+    sentence_starts: list[int]
+    sentence_ends: list[int]
+    vocabulary: frozenset[str]
+    hits: dict[str, list[tuple[int, str]]] = field(default_factory=dict)
+
+    def has_any(self, words: Iterable[str]) -> bool:
+        vocabulary = self.vocabulary
+        return any(word in vocabulary for word in words)
+
+    @property
+    def has_digits(self) -> bool:
+        return any(not word.isalpha() for word in self.vocabulary)
+
+    def positions(self, category: str) -> list[tuple[int, str]]:
+        """Return ``(offset, word)`` pairs classified under ``category``."""
+
+        return self.hits.get(category, [])
+
+    def sentence_start_for(self, position: int) -> int:
+        index = bisect_right(self.sentence_starts, position) - 1
+        return self.sentence_starts[index] if index >= 0 else 0
+
+    def is_negated(self, position: int, *, within_sentence: bool = False) -> bool:
+        """Return ``True`` when a negation word closely precedes ``position``."""
+
+        window_start = max(0, position - NEGATION_WINDOW_CHARS)
+        if within_sentence:
+            window_start = max(window_start, self.sentence_start_for(position))
+        negations = self.hits.get("negation")
+        if not negations:
+            return False
+        index = bisect_left(negations, (window_start, ""))
+        while index < len(negations):
+            start, word = negations[index]
+            if start >= position:
+                return False
+            if start + len(word) <= position:
+                return True
+            index += 1
+        return False
+
+
+def analyse_text(text: str, table: KeywordTable = EMPTY_KEYWORDS) -> TextAnalysis:
+    """Tokenise ``text`` once and classify each word against ``table``."""
+
+    lowered = text.lower()
+    vocabulary = frozenset(_TOKEN_RE.findall(lowered))
+    hits: dict[str, list[tuple[int, str]]] = defaultdict(list)
+    if table.pattern is not None:
+        categories = table.categories
+        for match in table.pattern.finditer(lowered):
+            word = match.group()
+            for category in categories[word]:
+                hits[category].append((match.start(), word))
+
+    sentence_starts: list[int] = []
+    sentence_ends: list[int] = []
+    cursor = 0
+    for match in _SENTENCE_BREAK_RE.finditer(lowered):
+        if lowered[cursor : match.start()].strip():
+            sentence_starts.append(cursor)
+            sentence_ends.append(match.start())
+        cursor = match.end()
+    if lowered[cursor:].strip():
+        sentence_starts.append(cursor)
+        sentence_ends.append(len(lowered))
+
+    return TextAnalysis(
+        text=text,
+        lowered=lowered,
+        sentence_starts=sentence_starts,
+        sentence_ends=sentence_ends,
+        vocabulary=vocabulary,
+        hits=dict(hits),
+    )
+
+
+__all__ = [
+    "EMPTY_KEYWORDS",
+    "KeywordTable",
+    "NEGATION_WINDOW_CHARS",
+    "TextAnalysis",
+    "analyse_text",
+]
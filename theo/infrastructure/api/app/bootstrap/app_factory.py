@@ -44,6 +44,7 @@ from .middleware import (
     configure_cors,
     get_security_dependencies,
     install_error_reporting,
+    register_query_instrumentation,
     register_trace_handlers as _base_register_trace_handlers,
 )
 from .routes import (
@@ -347,6 +348,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     )
     configure_cors(app, allow_origins=resolved_settings.cors_allowed_origins)
     install_error_reporting(app)
+    register_query_instrumentation(app, resolved_settings)
     register_health_routes(app)
     register_trace_handlers(app)
 
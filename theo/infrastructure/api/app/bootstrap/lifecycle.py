@@ -74,6 +74,20 @@ async def lifespan(_: FastAPI):
                         "Skipping reference data seeding due to database error", exc_info=exc
                     )
 
+            try:
+                from ..ai.audit_logging import replay_audit_spool
+
+                replay_audit_spool(engine)
+            except Exception as exc:  # pragma: no cover - defensive startup guard
+                logger.warning("Failed to replay spooled audit logs", exc_info=exc)
+
+        try:
+            from ..routes.realtime import start_notebook_broker
+
+            await start_notebook_broker()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning("Failed to start notebook event broker", exc_info=exc)
+
         # Start background discovery scheduler
         try:
             from ..workers.discovery_scheduler import start_discovery_scheduler
@@ -86,6 +100,20 @@ async def lifespan(_: FastAPI):
 
         yield
     finally:
+        try:
+            from ..routes.realtime import shutdown_notebook_broker
+
+            await shutdown_notebook_broker()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.debug("Error closing notebook event broker", exc_info=exc)
+
+        try:
+            from ..ai.audit_logging import shutdown_audit_log_writer
+
+            shutdown_audit_log_writer()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.debug("Error flushing audit log writer", exc_info=exc)
+
         # Stop discovery scheduler
         if discovery_scheduler:
             try:
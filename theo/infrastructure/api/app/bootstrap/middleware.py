@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import logging
+from typing import Any, Iterable
 
 from fastapi import Depends, FastAPI, Request, status
 from fastapi.exception_handlers import (
@@ -15,15 +16,29 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import RequestResponseEndpoint
 from starlette.responses import Response
 
+from theo.application.facades.telemetry import record_histogram
+from theo.application.telemetry import DB_REQUEST_QUERY_COUNT_METRIC
+
+from ..db.query_instrumentation import (
+    InstrumentationConfig,
+    install_query_instrumentation,
+    track_queries,
+)
 from ..debug import ErrorReportingMiddleware
 from ..errors import TheoError
 from ..ingest.exceptions import UnsupportedSourceError
 from ..adapters.security import require_principal
 from ..tracing import TRACE_ID_HEADER_NAME, get_current_trace_headers
 
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER_NAME = "X-DB-Query-Count"
+QUERY_TIME_HEADER_NAME = "X-DB-Query-Time-Ms"
+
 __all__ = [
     "configure_cors",
     "install_error_reporting",
+    "register_query_instrumentation",
     "register_trace_handlers",
     "get_security_dependencies",
 ]
@@ -60,6 +75,54 @@ def install_error_reporting(app: FastAPI) -> None:
     )
 
 
+def _route_label(request: Request) -> str:
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    return f"{request.method} {path}"
+
+
+def register_query_instrumentation(app: FastAPI, settings: Any) -> None:
+    """Count the statements each request issues and report them in headers.
+
+    Installs the cursor listeners from :mod:`..db.query_instrumentation` and
+    wraps every request in :func:`track_queries`. Responses carry
+    ``X-DB-Query-Count`` and ``X-DB-Query-Time-Ms`` so tests and load runs can
+    watch per-route query budgets; requests above ``db_request_query_budget``
+    are logged.
+    """
+
+    if not getattr(settings, "db_query_instrumentation_enabled", True):
+        return
+    install_query_instrumentation(config=InstrumentationConfig.from_settings(settings))
+    budget = getattr(settings, "db_request_query_budget", None)
+
+    @app.middleware("http")
+    async def track_request_queries(request: Request, call_next: RequestResponseEndpoint):
+        with track_queries(f"{request.method} {request.url.path}") as stats:
+            response = await call_next(request)
+        stats.label = _route_label(request)
+        response.headers[QUERY_COUNT_HEADER_NAME] = str(stats.count)
+        response.headers[QUERY_TIME_HEADER_NAME] = f"{stats.total_ms:.1f}"
+        if stats.count:
+            record_histogram(
+                DB_REQUEST_QUERY_COUNT_METRIC,
+                value=stats.count,
+                labels={"route": stats.label},
+            )
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "Request exceeded its query budget",
+                extra={
+                    "event": "db.query_budget_exceeded",
+                    "route": stats.label,
+                    "queries": stats.count,
+                    "budget": budget,
+                    "repeated": stats.repeated()[:3],
+                },
+            )
+        return response
+
+
 def _attach_trace_headers(response: Response, trace_headers: dict[str, str] | None = None) -> Response:
     headers = trace_headers or get_current_trace_headers()
     for key, value in headers.items():
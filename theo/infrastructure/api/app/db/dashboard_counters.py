@@ -0,0 +1,359 @@
+"""Per-day rollups behind the dashboard metrics.
+
+``get_dashboard_summary`` used to count every document, note, discovery and
+notebook on each request, plus two range counts per metric for the weekly
+delta, so the dashboard slowed down as the corpus grew. :class:`DashboardCounter`
+keeps one row per metric and UTC day instead, and the dashboard reads totals
+and both periods from those rows in a single grouped query.
+
+Counters are maintained by mapper events: inserting a row adds one to the day
+of its timestamp, deleting it subtracts one, and updates that move the
+timestamp (notebooks are ranked by ``updated_at``) shift the count between
+days. The events fire for ORM flushes only, so bulk SQL writes and rows whose
+timestamp was never loaded drift the rollups; :func:`reconcile_dashboard_counters`
+recounts everything and runs on a schedule to correct that drift.
+
+The events only accumulate deltas on the session. They are applied once the
+session commits, in a short transaction of their own, so concurrent writers
+do not hold the shared ``(metric, day)`` rows locked for the whole ingest.
+Rolled back sessions discard their deltas. A delta that fails to apply, or
+lands after a reconcile already counted its rows, is corrected by the next
+reconcile.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Date, case, cast, delete, event, func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+
+from theo.application.facades.settings_store import load_setting, save_setting
+from theo.infrastructure.api.app.persistence_models import (
+    DashboardCounter,
+    Discovery,
+    Document,
+    Notebook,
+    ResearchNote,
+)
+
+logger = logging.getLogger(__name__)
+
+READY_SETTING_KEY = "dashboard.counters"
+
+# Metric id -> (model, timestamp attribute bucketed into days).
+METRICS: dict[str, tuple[type, str]] = {
+    "documents": (Document, "created_at"),
+    "notes": (ResearchNote, "created_at"),
+    "discoveries": (Discovery, "created_at"),
+    "notebooks": (Notebook, "updated_at"),
+}
+
+_counters = DashboardCounter.__table__
+
+
+def counter_day(value: object) -> date | None:
+    """Return the UTC day a timestamp is counted under."""
+
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _increment(connection: Connection, metric: str, day: date, delta: int) -> None:
+    dialect = connection.dialect.name
+    if dialect in {"sqlite", "postgresql"}:
+        insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        stmt = insert(_counters).values(metric=metric, day=day, row_count=delta)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[_counters.c.metric, _counters.c.day],
+                set_={"row_count": _counters.c.row_count + stmt.excluded.row_count},
+            )
+        )
+        return
+    result = connection.execute(
+        update(_counters)
+        .where(_counters.c.metric == metric, _counters.c.day == day)
+        .values(row_count=_counters.c.row_count + delta)
+    )
+    if not result.rowcount:
+        connection.execute(
+            _counters.insert().values(metric=metric, day=day, row_count=delta)
+        )
+
+
+_TABLES_PRESENT: "WeakKeyDictionary[Engine, bool]" = WeakKeyDictionary()
+
+# ``Session.info`` key holding the ``(metric, day) -> delta`` map of a session.
+_PENDING_KEY = "dashboard_counter_deltas"
+
+
+def _counters_present(connection: Connection) -> bool:
+    engine = connection.engine
+    present = _TABLES_PRESENT.get(engine)
+    if present is None:
+        present = inspect(connection).has_table(_counters.name)
+        _TABLES_PRESENT[engine] = present
+    return present
+
+
+def _defer(
+    connection: Connection, target: Any, metric: str, day: date, delta: int
+) -> None:
+    if not _counters_present(connection):
+        return
+    session = object_session(target)
+    if session is None:  # pragma: no cover - mapper events run in a flush
+        _increment(connection, metric, day, delta)
+        return
+    pending = session.info.setdefault(_PENDING_KEY, defaultdict(int))
+    pending[(metric, day)] += delta
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    changes = sorted(item for item in (pending or {}).items() if item[1])
+    if not changes:
+        return
+    bind = session.get_bind(mapper=DashboardCounter)
+    try:
+        if isinstance(bind, Connection):
+            # The caller owns the transaction; there is nothing to separate.
+            for (metric, day), delta in changes:
+                _increment(bind, metric, day, delta)
+            return
+        # Keys are sorted so concurrent writers lock rows in the same order.
+        with bind.begin() as connection:
+            for (metric, day), delta in changes:
+                _increment(connection, metric, day, delta)
+    except SQLAlchemyError:
+        logger.warning(
+            "Dashboard counter update failed; left for reconcile", exc_info=True
+        )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after ``after_commit`` has taken the deltas of a committed session.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _loaded_day(target: Any, attribute: str) -> date | None:
+    # Never trigger a load mid-flush; unloaded timestamps are left to the
+    # reconcile job.
+    return counter_day(inspect(target).dict.get(attribute))
+
+
+def _register(metric: str, model: type, attribute: str) -> None:
+    # Days counted for instances whose update is being flushed, captured before
+    # ``onupdate`` defaults overwrite the timestamp.
+    previous_days: "WeakKeyDictionary[Any, date | None]" = WeakKeyDictionary()
+
+    def _after_insert(_mapper: Any, connection: Connection, target: Any) -> None:
+        day = _loaded_day(target, attribute)
+        if day is not None:
+            _defer(connection, target, metric, day, 1)
+
+    def _after_delete(_mapper: Any, connection: Connection, target: Any) -> None:
+        day = _loaded_day(target, attribute)
+        if day is not None:
+            _defer(connection, target, metric, day, -1)
+
+    def _before_update(_mapper: Any, _connection: Connection, target: Any) -> None:
+        history = inspect(target).attrs[attribute].history
+        committed = history.deleted or history.unchanged
+        previous_days[target] = counter_day(committed[0]) if committed else None
+
+    def _after_update(_mapper: Any, connection: Connection, target: Any) -> None:
+        previous = previous_days.pop(target, None)
+        current = _loaded_day(target, attribute)
+        if previous is None or current is None or previous == current:
+            return
+        _defer(connection, target, metric, previous, -1)
+        _defer(connection, target, metric, current, 1)
+
+    event.listen(model, "after_insert", _after_insert)
+    event.listen(model, "after_delete", _after_delete)
+    if attribute == "updated_at":
+        event.listen(model, "before_update", _before_update)
+        event.listen(model, "after_update", _after_update)
+
+
+for _metric, (_model, _attribute) in METRICS.items():
+    _register(_metric, _model, _attribute)
+
+
+@dataclass(slots=True)
+class CounterSummary:
+    """Total and period counts for one metric."""
+
+    total: int = 0
+    current: int = 0
+    previous: int = 0
+
+
+def load_dashboard_counters(
+    session: Session, *, current_start: date, previous_start: date
+) -> dict[str, CounterSummary]:
+    """Return totals plus current and previous period counts for every metric.
+
+    Periods are day aligned: the current period covers days on or after
+    ``current_start`` and the previous one ``[previous_start, current_start)``.
+    """
+
+    in_current = _counters.c.day >= current_start
+    in_previous = (_counters.c.day >= previous_start) & (
+        _counters.c.day < current_start
+    )
+    rows = session.execute(
+        select(
+            _counters.c.metric,
+            func.coalesce(func.sum(_counters.c.row_count), 0),
+            func.coalesce(
+                func.sum(case((in_current, _counters.c.row_count), else_=0)), 0
+            ),
+            func.coalesce(
+                func.sum(case((in_previous, _counters.c.row_count), else_=0)), 0
+            ),
+        ).group_by(_counters.c.metric)
+    )
+    summaries = {metric: CounterSummary() for metric in METRICS}
+    for metric, total, current, previous in rows:
+        summaries[metric] = CounterSummary(
+            total=int(total), current=int(current), previous=int(previous)
+        )
+    return summaries
+
+
+_READY: "WeakKeyDictionary[Engine, bool]" = WeakKeyDictionary()
+
+
+def dashboard_counters_ready(session: Session) -> bool:
+    """Return ``True`` once :func:`reconcile_dashboard_counters` has run.
+
+    The flag is cached per engine once set so the dashboard does not pay for
+    the settings lookup on every request.
+    """
+
+    engine = session.get_bind()
+    if isinstance(engine, Connection):
+        engine = engine.engine
+    if _READY.get(engine):
+        return True
+    try:
+        payload = load_setting(session, READY_SETTING_KEY, default=None)
+    except (SQLAlchemyError, ValueError):
+        session.rollback()
+        logger.debug("Dashboard counter state unavailable", exc_info=True)
+        return False
+    ready = isinstance(payload, dict) and bool(payload.get("ready"))
+    if ready:
+        _READY[engine] = True
+    return ready
+
+
+@dataclass(slots=True)
+class ReconcileStats:
+    """Outcome of a :func:`reconcile_dashboard_counters` run."""
+
+    rows: int = 0
+    corrected: dict[str, int] = field(default_factory=dict)
+
+
+def _day_expression(connection: Connection, column: Any) -> Any:
+    if connection.dialect.name == "sqlite":
+        return func.date(column)
+    if connection.dialect.name == "postgresql":
+        return cast(func.timezone("UTC", column), Date)
+    return cast(column, Date)
+
+
+def _actual_counts(connection: Connection) -> dict[tuple[str, date], int]:
+    counts: dict[tuple[str, date], int] = {}
+    for metric, (model, attribute) in METRICS.items():
+        day = _day_expression(connection, getattr(model, attribute)).label("day")
+        for value, count in connection.execute(
+            select(day, func.count()).select_from(model).group_by(day)
+        ):
+            bucket = date.fromisoformat(value) if isinstance(value, str) else value
+            if bucket is not None:
+                counts[(metric, bucket)] = int(count)
+    return counts
+
+
+def reconcile_dashboard_counters(session: Session) -> ReconcileStats:
+    """Recount every metric from its source table and correct drifted rows.
+
+    Existing counter rows are locked before recounting (``FOR UPDATE`` where the
+    database supports it) so increments from concurrent writers either land
+    before the recount sees their rows or wait and apply on top of it.
+    """
+
+    connection = session.connection()
+    _TABLES_PRESENT.pop(connection.engine, None)
+    stored: Mapping[tuple[str, date], int] = {
+        (row.metric, row.day): int(row.row_count)
+        for row in connection.execute(select(_counters).with_for_update())
+    }
+    actual = _actual_counts(connection)
+
+    stats = ReconcileStats(rows=len(actual))
+    inserts: list[dict[str, object]] = []
+    for key in sorted(set(stored) | set(actual)):
+        metric, day = key
+        expected = actual.get(key, 0)
+        recorded = stored.get(key)
+        if recorded == expected or (recorded is None and expected == 0):
+            continue
+        stats.corrected[metric] = stats.corrected.get(metric, 0) + 1
+        if expected == 0:
+            connection.execute(
+                delete(_counters).where(
+                    _counters.c.metric == metric, _counters.c.day == day
+                )
+            )
+        elif recorded is None:
+            inserts.append({"metric": metric, "day": day, "row_count": expected})
+        else:
+            connection.execute(
+                update(_counters)
+                .where(_counters.c.metric == metric, _counters.c.day == day)
+                .values(row_count=expected)
+            )
+    if inserts:
+        connection.execute(_counters.insert(), inserts)
+    if stats.corrected:
+        logger.info(
+            "Dashboard counters reconciled", extra={"corrected": stats.corrected}
+        )
+    save_setting(session, READY_SETTING_KEY, {"ready": True, "rows": stats.rows})
+    return stats
+
+
+__all__ = [
+    "METRICS",
+    "READY_SETTING_KEY",
+    "CounterSummary",
+    "ReconcileStats",
+    "counter_day",
+    "dashboard_counters_ready",
+    "load_dashboard_counters",
+    "reconcile_dashboard_counters",
+]
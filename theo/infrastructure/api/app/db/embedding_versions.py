@@ -0,0 +1,619 @@
+"""Blue/green rollout of embedding models using shadow vectors.
+
+The live index is ``passage_embeddings``; it is written by ingest with the
+configured ``embedding_model``. To switch models without a window of mixed or
+dimension-mismatched vectors, a new model is first *registered* as a shadow
+version and its vectors are backfilled into ``passage_embedding_versions``
+while search keeps serving the live vectors. :func:`compare_embedding_versions`
+reports how far the new model's neighbourhoods drift from the current ones,
+and :func:`cutover_embedding_version` flips the active pointer in a single
+settings write. :func:`rollback_embedding_version` flips it back.
+
+The shadow table's ``embedding`` column has no fixed dimension, so on
+PostgreSQL every version gets its own partial HNSW index over
+``embedding::vector(dim)`` restricted to its ``model_version``. Queries built
+with :func:`version_distance` and :func:`version_criterion` repeat that
+expression and inline the version key so the planner can use the index.
+
+Search and ingest consult :func:`active_embedding_version`, which caches the
+registry for a few seconds so the lookup stays off the hot path; a cutover in
+another process takes effect once that cache expires.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    String,
+    cast,
+    func,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from theo.adapters.persistence.types import VectorType
+from theo.application.embeddings import text_hash
+from theo.application.facades.settings import get_settings
+from theo.application.facades.settings_store import load_setting, save_setting
+from theo.infrastructure.api.app.persistence_models import (
+    Passage,
+    PassageEmbedding,
+    PassageEmbeddingVersion,
+)
+
+from ..ingest.embeddings import get_embedding_service
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_SETTING_KEY = "embeddings.versions"
+REGISTRY_CACHE_SECONDS = 5.0
+
+STATUS_SHADOW = "shadow"
+STATUS_ACTIVE = "active"
+STATUS_RETIRED = "retired"
+
+# pgvector cannot build HNSW indexes on ``vector`` columns wider than this.
+HNSW_MAX_DIMENSIONS = 2000
+
+
+def version_key(model: str, dimension: int) -> str:
+    return f"{model}@{dimension}"
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingVersion:
+    """One embedding model version and where its vectors live."""
+
+    key: str
+    model: str
+    dimension: int
+    legacy: bool = False
+
+    @classmethod
+    def live(cls) -> "EmbeddingVersion":
+        """Return the version backed by the ``passage_embeddings`` table."""
+
+        settings = get_settings()
+        return cls(
+            key=version_key(settings.embedding_model, settings.embedding_dim),
+            model=settings.embedding_model,
+            dimension=settings.embedding_dim,
+            legacy=True,
+        )
+
+
+@dataclass(slots=True)
+class EmbeddingVersionRegistry:
+    """Persisted state of the blue/green rollout."""
+
+    active: str | None = None
+    previous: str | None = None
+    versions: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "EmbeddingVersionRegistry":
+        if not isinstance(payload, dict):
+            return cls()
+        versions = payload.get("versions")
+        return cls(
+            active=payload.get("active") or None,
+            previous=payload.get("previous") or None,
+            versions=dict(versions) if isinstance(versions, dict) else {},
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "previous": self.previous,
+            "versions": self.versions,
+        }
+
+    def resolve(self, key: str | None) -> EmbeddingVersion:
+        live = EmbeddingVersion.live()
+        if key is None or key == live.key:
+            return live
+        entry = self.versions.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return EmbeddingVersion(
+            key=key, model=str(entry["model"]), dimension=int(entry["dimension"])
+        )
+
+    def active_version(self) -> EmbeddingVersion:
+        try:
+            return self.resolve(self.active)
+        except KeyError:
+            logger.warning(
+                "Active embedding version missing from registry; using live",
+                extra={"version": self.active},
+            )
+            return EmbeddingVersion.live()
+
+    def shadow_versions(self) -> list[EmbeddingVersion]:
+        return [
+            self.resolve(key)
+            for key, entry in self.versions.items()
+            if entry.get("status") == STATUS_SHADOW
+        ]
+
+
+_CACHE: dict[tuple[int, str], tuple[float, EmbeddingVersionRegistry]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(session: Session) -> tuple[int, str]:
+    bind = getattr(session, "bind", None)
+    return id(bind), str(getattr(bind, "url", ""))
+
+
+def clear_embedding_version_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def load_embedding_registry(session: Session) -> EmbeddingVersionRegistry:
+    return EmbeddingVersionRegistry.from_payload(
+        load_setting(session, REGISTRY_SETTING_KEY, default=None)
+    )
+
+
+def _cached_registry(session: Session) -> EmbeddingVersionRegistry:
+    key = _cache_key(session)
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+    try:
+        registry = load_embedding_registry(session)
+    except Exception:  # pragma: no cover - registry must never break search
+        logger.debug("Embedding version registry unavailable", exc_info=True)
+        rollback = getattr(session, "rollback", None)
+        if callable(rollback):
+            rollback()
+        registry = EmbeddingVersionRegistry()
+    with _CACHE_LOCK:
+        _CACHE[key] = (now + REGISTRY_CACHE_SECONDS, registry)
+    return registry
+
+
+def active_embedding_version(session: Session) -> EmbeddingVersion:
+    """Return the version search should use for query and passage vectors."""
+
+    return _cached_registry(session).active_version()
+
+
+def _save_registry(session: Session, registry: EmbeddingVersionRegistry) -> None:
+    save_setting(session, REGISTRY_SETTING_KEY, registry.to_payload())
+    clear_embedding_version_cache()
+
+
+def version_index_name(version: EmbeddingVersion) -> str:
+    digest = hashlib.blake2b(version.key.encode("utf-8"), digest_size=6).hexdigest()
+    return f"ix_passage_embedding_versions_hnsw_{digest}"
+
+
+def _version_index_ddl(version: EmbeddingVersion) -> str:
+    key = version.key.replace("'", "''")
+    return (
+        f"CREATE INDEX IF NOT EXISTS {version_index_name(version)} "
+        "ON passage_embedding_versions USING hnsw "
+        f"((embedding::vector({int(version.dimension)})) vector_cosine_ops) "
+        f"WHERE model_version = '{key}'"
+    )
+
+
+def ensure_version_index(session: Session, version: EmbeddingVersion) -> bool:
+    """Create the partial HNSW index serving ``version``; return whether it exists.
+
+    Only PostgreSQL has vector indexes; other dialects rank in Python.
+    """
+
+    if version.legacy or session.get_bind().dialect.name != "postgresql":
+        return False
+    if version.dimension > HNSW_MAX_DIMENSIONS:
+        logger.warning(
+            "Embedding version too wide for an HNSW index; searches will scan",
+            extra={"version": version.key, "dimension": version.dimension},
+        )
+        return False
+    session.execute(text(_version_index_ddl(version)))
+    session.commit()
+    return True
+
+
+def version_criterion(version: EmbeddingVersion) -> ColumnElement[bool]:
+    """Select ``version``'s rows with the key inlined to match its index."""
+
+    return PassageEmbeddingVersion.model_version == literal(
+        version.key, String, literal_execute=True
+    )
+
+
+def version_distance(
+    version: EmbeddingVersion, vector: Sequence[float]
+) -> ColumnElement[float]:
+    """Cosine distance from ``vector`` using the expression the index covers."""
+
+    vector_type = VectorType(version.dimension)
+    return cast(PassageEmbeddingVersion.embedding, vector_type).op(
+        "<=>", return_type=Float()
+    )(literal(list(vector), type_=vector_type))
+
+
+def register_shadow_version(
+    session: Session, model: str, dimension: int
+) -> EmbeddingVersion:
+    """Register ``model`` as a shadow version to backfill alongside the live one."""
+
+    registry = load_embedding_registry(session)
+    version = EmbeddingVersion(
+        key=version_key(model, dimension), model=model, dimension=dimension
+    )
+    if version.key == registry.active_version().key:
+        raise ValueError(f"{version.key} is already the active embedding version")
+    registry.versions[version.key] = {
+        "model": model,
+        "dimension": dimension,
+        "status": STATUS_SHADOW,
+        "registered_at": datetime.now(UTC).isoformat(),
+    }
+    _save_registry(session, registry)
+    ensure_version_index(session, version)
+    return version
+
+
+def _missing_passages(version: EmbeddingVersion):
+    present = (
+        select(PassageEmbeddingVersion.passage_id)
+        .where(PassageEmbeddingVersion.passage_id == Passage.id)
+        .where(PassageEmbeddingVersion.model_version == version.key)
+        .exists()
+    )
+    return ~present
+
+
+def count_missing_embeddings(session: Session, version: EmbeddingVersion) -> int:
+    if version.legacy:
+        return 0
+    return int(
+        session.scalar(
+            select(func.count(Passage.id)).where(_missing_passages(version))
+        )
+        or 0
+    )
+
+
+def _embed_rows(
+    session: Session,
+    version: EmbeddingVersion,
+    rows: Sequence[tuple[str, str | None]],
+    embed: Callable[[list[str]], Sequence[Sequence[float]]],
+) -> None:
+    texts = [(text or "").strip() for _, text in rows]
+    vectors = embed(texts)
+    if len(vectors) != len(rows):
+        raise RuntimeError("Embedding backend returned mismatched batch size")
+    now = datetime.now(UTC)
+    session.bulk_insert_mappings(
+        PassageEmbeddingVersion,
+        [
+            {
+                "passage_id": passage_id,
+                "model_version": version.key,
+                "embedding": [float(component) for component in vector],
+                "text_hash": text_hash(text),
+                "created_at": now,
+            }
+            for (passage_id, _), text, vector in zip(rows, texts, vectors)
+        ],
+    )
+
+
+@dataclass(slots=True)
+class ShadowBackfillResult:
+    version: str
+    embedded: int
+    remaining: int
+
+
+def backfill_shadow_embeddings(
+    session: Session,
+    version_key_or_model: str,
+    *,
+    batch_size: int = 64,
+    max_batches: int | None = None,
+) -> ShadowBackfillResult:
+    """Embed passages that lack a vector for the given shadow version.
+
+    Each batch is committed on its own, and only passages without a row for
+    the version are selected, so the backfill resumes wherever it stopped and
+    also picks up passages ingested while it ran.
+    """
+
+    registry = load_embedding_registry(session)
+    version = registry.resolve(version_key_or_model)
+    if version.legacy:
+        raise ValueError("The live embedding version is maintained by ingest")
+    service = get_embedding_service(version.model, version.dimension)
+
+    embedded = 0
+    batches = 0
+    after_id: str | None = None
+    while max_batches is None or batches < max_batches:
+        stmt = (
+            select(Passage.id, Passage.text)
+            .where(_missing_passages(version))
+            .order_by(Passage.id)
+            .limit(batch_size)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Passage.id > after_id)
+        rows = [tuple(row) for row in session.execute(stmt)]
+        if not rows:
+            break
+        _embed_rows(
+            session,
+            version,
+            rows,
+            lambda texts: service.embed(texts, batch_size=batch_size),
+        )
+        session.commit()
+        embedded += len(rows)
+        batches += 1
+        after_id = rows[-1][0]
+
+    remaining = count_missing_embeddings(session, version)
+    logger.info(
+        "Shadow embedding backfill advanced",
+        extra={"version": version.key, "embedded": embedded, "remaining": remaining},
+    )
+    return ShadowBackfillResult(
+        version=version.key, embedded=embedded, remaining=remaining
+    )
+
+
+def record_version_embeddings(session: Session, passages: Sequence[Passage]) -> None:
+    """Write vectors for non-live versions while ingest persists passages.
+
+    Called after the ingest flush. With only the live version configured
+    this costs a cached registry lookup.
+    """
+
+    if not passages:
+        return
+    registry = _cached_registry(session)
+    targets = [
+        version
+        for version in (registry.active_version(), *registry.shadow_versions())
+        if not version.legacy
+    ]
+    if not targets:
+        return
+    rows = [(passage.id, passage.text) for passage in passages]
+    for version in dict.fromkeys(targets):
+        service = get_embedding_service(version.model, version.dimension)
+        _embed_rows(session, version, rows, service.embed)
+
+
+def cutover_embedding_version(
+    session: Session, key: str, *, require_complete: bool = True
+) -> EmbeddingVersion:
+    """Atomically make ``key`` the version used by search and ingest."""
+
+    registry = load_embedding_registry(session)
+    version = registry.resolve(key)
+    current = registry.active_version()
+    if version.key == current.key:
+        return version
+    if require_complete:
+        missing = count_missing_embeddings(session, version)
+        if missing:
+            raise ValueError(
+                f"{missing} passage(s) lack {version.key} vectors; "
+                "finish the shadow backfill before cutting over"
+            )
+    # Versions registered before their index existed get it before serving.
+    ensure_version_index(session, version)
+    if not current.legacy:
+        registry.versions[current.key]["status"] = STATUS_RETIRED
+    if not version.legacy:
+        registry.versions[version.key]["status"] = STATUS_ACTIVE
+    registry.previous = current.key
+    registry.active = version.key
+    _save_registry(session, registry)
+    logger.info(
+        "Embedding version cut over",
+        extra={"active": version.key, "previous": current.key},
+    )
+    return version
+
+
+def rollback_embedding_version(session: Session) -> EmbeddingVersion:
+    """Restore the version that was active before the last cutover."""
+
+    registry = load_embedding_registry(session)
+    if registry.previous is None:
+        raise ValueError("No previous embedding version to roll back to")
+    return cutover_embedding_version(
+        session, registry.previous, require_complete=False
+    )
+
+
+def _version_vectors(version: EmbeddingVersion):
+    if version.legacy:
+        return PassageEmbedding.embedding, PassageEmbedding.passage_id, None
+    return (
+        PassageEmbeddingVersion.embedding,
+        PassageEmbeddingVersion.passage_id,
+        version_criterion(version),
+    )
+
+
+def _vector_for(
+    session: Session, version: EmbeddingVersion, passage_id: str
+) -> list[float] | None:
+    column, id_column, criterion = _version_vectors(version)
+    stmt = select(column).where(id_column == passage_id)
+    if criterion is not None:
+        stmt = stmt.where(criterion)
+    return session.scalar(stmt)
+
+
+def _cosine_distance(left: Sequence[float], right: Sequence[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    return 1.0 - dot / norm if norm else 1.0
+
+
+def nearest_passage_ids(
+    session: Session,
+    version: EmbeddingVersion,
+    vector: Sequence[float],
+    top_k: int,
+) -> list[str]:
+    """Return the ``top_k`` passages nearest to ``vector`` under ``version``."""
+
+    column, id_column, criterion = _version_vectors(version)
+    bind = session.get_bind()
+    if bind.dialect.name == "postgresql":
+        if version.legacy:
+            vector_type = VectorType(version.dimension)
+            distance = func.cosine_distance(
+                column, literal(list(vector), type_=vector_type)
+            )
+        else:
+            distance = version_distance(version, vector)
+        stmt = select(id_column).order_by(distance).limit(top_k)
+        if criterion is not None:
+            stmt = stmt.where(criterion)
+        return list(session.scalars(stmt))
+
+    # Other dialects have no vector operators; rank exactly in Python.
+    stmt = select(id_column, column)
+    if criterion is not None:
+        stmt = stmt.where(criterion)
+    scored = sorted(
+        (_cosine_distance(vector, candidate), passage_id)
+        for passage_id, candidate in session.execute(stmt)
+        if candidate
+    )
+    return [passage_id for _, passage_id in scored[:top_k]]
+
+
+def compare_embedding_versions(
+    session: Session,
+    baseline: str | None,
+    candidate: str,
+    *,
+    sample_queries: int = 20,
+    top_k: int = 10,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Compare neighbourhoods of sampled passages under two versions.
+
+    Mirrors the HNSW recall sampler: each sampled passage acts as a query in
+    both versions and the report gives the overlap of their ``top_k``
+    neighbours alongside per-version query latency.
+    """
+
+    registry = load_embedding_registry(session)
+    old = registry.resolve(baseline) if baseline else registry.active_version()
+    new = registry.resolve(candidate)
+    metrics: dict[str, Any] = {
+        "baseline": old.key,
+        "candidate": new.key,
+        "sample_size": 0,
+        "top_k": top_k,
+        "avg_overlap": None,
+        "min_overlap": None,
+        "max_overlap": None,
+        "avg_baseline_latency_ms": None,
+        "avg_candidate_latency_ms": None,
+        "candidate_coverage": None,
+    }
+
+    total = session.scalar(select(func.count(Passage.id))) or 0
+    if total:
+        metrics["candidate_coverage"] = 1.0 - (
+            count_missing_embeddings(session, new) / total
+        )
+
+    _, new_ids, new_criterion = _version_vectors(new)
+    id_stmt = select(new_ids)
+    if new_criterion is not None:
+        id_stmt = id_stmt.where(new_criterion)
+    passage_ids = list(session.scalars(id_stmt))
+    sampler = random.Random(seed)
+    sampled = sampler.sample(passage_ids, min(sample_queries, len(passage_ids)))
+
+    overlaps: list[float] = []
+    old_latencies: list[float] = []
+    new_latencies: list[float] = []
+    for passage_id in sampled:
+        old_vector = _vector_for(session, old, passage_id)
+        new_vector = _vector_for(session, new, passage_id)
+        if not old_vector or not new_vector:
+            continue
+        started = time.perf_counter()
+        old_neighbours = nearest_passage_ids(session, old, old_vector, top_k)
+        old_latencies.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        new_neighbours = nearest_passage_ids(session, new, new_vector, top_k)
+        new_latencies.append(time.perf_counter() - started)
+        if not old_neighbours:
+            continue
+        overlaps.append(len(set(old_neighbours) & set(new_neighbours)) / len(old_neighbours))
+
+    if not overlaps:
+        return metrics
+    metrics["sample_size"] = len(overlaps)
+    metrics["avg_overlap"] = float(sum(overlaps) / len(overlaps))
+    metrics["min_overlap"] = float(min(overlaps))
+    metrics["max_overlap"] = float(max(overlaps))
+    metrics["avg_baseline_latency_ms"] = float(
+        sum(old_latencies) / len(old_latencies) * 1000.0
+    )
+    metrics["avg_candidate_latency_ms"] = float(
+        sum(new_latencies) / len(new_latencies) * 1000.0
+    )
+    return metrics
+
+
+__all__ = [
+    "EmbeddingVersion",
+    "EmbeddingVersionRegistry",
+    "HNSW_MAX_DIMENSIONS",
+    "REGISTRY_SETTING_KEY",
+    "ShadowBackfillResult",
+    "active_embedding_version",
+    "backfill_shadow_embeddings",
+    "clear_embedding_version_cache",
+    "compare_embedding_versions",
+    "count_missing_embeddings",
+    "cutover_embedding_version",
+    "ensure_version_index",
+    "load_embedding_registry",
+    "nearest_passage_ids",
+    "record_version_embeddings",
+    "register_shadow_version",
+    "rollback_embedding_version",
+    "version_criterion",
+    "version_distance",
+    "version_index_name",
+    "version_key",
+]
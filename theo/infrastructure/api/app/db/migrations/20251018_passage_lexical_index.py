@@ -0,0 +1,13 @@
+"""Build the FTS5 lexical index used by the SQLite fallback retriever."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+
+from theo.infrastructure.api.app.retriever.lexical_index import rebuild_lexical_index
+
+
+def upgrade(*, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    if getattr(engine.dialect, "name", None) != "sqlite":
+        return
+    rebuild_lexical_index(engine)
@@ -0,0 +1,18 @@
+"""Create and backfill the materialised verse timeline rollups."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.db.verse_timeline import rebuild_verse_timeline
+from theo.infrastructure.api.app.persistence_models import (
+    VerseTimelineDocument,
+    VerseTimelineRollup,
+)
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    VerseTimelineRollup.__table__.create(bind=engine, checkfirst=True)
+    VerseTimelineDocument.__table__.create(bind=engine, checkfirst=True)
+    rebuild_verse_timeline(session)
@@ -0,0 +1,32 @@
+"""Record the model and text hash that produced each passage embedding."""
+
+from __future__ import annotations
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.orm import Session
+
+_COLUMNS = {
+    "embedding_model": "VARCHAR(255)",
+    "text_hash": "VARCHAR(64)",
+}
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    try:
+        existing = {
+            column.get("name")
+            for column in inspect(engine).get_columns("passage_embeddings")
+        }
+    except NoSuchTableError:
+        return
+
+    with engine.begin() as connection:
+        for name, column_type in _COLUMNS.items():
+            if name in existing:
+                continue
+            connection.exec_driver_sql(
+                f"ALTER TABLE passage_embeddings ADD COLUMN {name} {column_type}"
+            )
+    session.flush()
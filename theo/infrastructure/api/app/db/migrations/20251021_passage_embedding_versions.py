@@ -0,0 +1,12 @@
+"""Create the shadow vector table used for embedding model rollouts."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.persistence_models import PassageEmbeddingVersion
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    PassageEmbeddingVersion.__table__.create(bind=engine, checkfirst=True)
@@ -0,0 +1,12 @@
+"""Create the precomputed passage feature table used by the reranker."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.persistence_models import PassageFeature
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    PassageFeature.__table__.create(bind=engine, checkfirst=True)
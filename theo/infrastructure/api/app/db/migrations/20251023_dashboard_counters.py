@@ -0,0 +1,30 @@
+"""Create and backfill the per-day dashboard counters."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.db.dashboard_counters import (
+    reconcile_dashboard_counters,
+)
+from theo.infrastructure.api.app.persistence_models import (
+    DashboardCounter,
+    Notebook,
+    ResearchNote,
+)
+
+# Indexes that keep the dashboard activity feed an ordered ``LIMIT`` scan.
+_ACTIVITY_INDEXES = {
+    "ix_research_notes_created_at",
+    "ix_notebooks_updated_at",
+}
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    DashboardCounter.__table__.create(bind=engine, checkfirst=True)
+    for table in (ResearchNote.__table__, Notebook.__table__):
+        for index in table.indexes:
+            if index.name in _ACTIVITY_INDEXES:
+                index.create(bind=engine, checkfirst=True)
+    reconcile_dashboard_counters(session)
@@ -0,0 +1,25 @@
+"""Record the frontmatter fingerprint used to deduplicate re-ingested files."""
+
+from __future__ import annotations
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.orm import Session
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    try:
+        existing = {
+            column.get("name") for column in inspect(engine).get_columns("documents")
+        }
+    except NoSuchTableError:
+        return
+
+    if "frontmatter_sha256" in existing:
+        return
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "ALTER TABLE documents ADD COLUMN frontmatter_sha256 VARCHAR(64)"
+        )
+    session.flush()
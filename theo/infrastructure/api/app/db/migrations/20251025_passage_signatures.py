@@ -0,0 +1,16 @@
+"""Create the MinHash signature and LSH band tables for near-duplicate passages."""
+
+from __future__ import annotations
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.persistence_models import (
+    PassageSignature,
+    PassageSignatureBand,
+)
+
+
+def upgrade(*, session: Session, engine: Engine) -> None:  # pragma: no cover - executed via migration runner
+    PassageSignature.__table__.create(bind=engine, checkfirst=True)
+    PassageSignatureBand.__table__.create(bind=engine, checkfirst=True)
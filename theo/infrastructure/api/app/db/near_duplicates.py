@@ -0,0 +1,408 @@
+"""Near-duplicate passage detection with MinHash signatures and LSH bands.
+
+Sermon transcripts, reposted articles and re-issued commentaries produce
+passages whose text is almost, but not byte-for-byte, identical. Each passage
+gets a MinHash signature over its word shingles; the signature is split into
+``bands`` and every band is hashed into ``passage_signature_bands``. Two
+passages that share any band bucket are candidates, and a candidate whose
+signature agrees on at least ``near_duplicate_threshold`` of its positions (the
+MinHash estimate of shingle Jaccard similarity) is a near duplicate. The new
+passage then joins the candidate's cluster, so every cluster is keyed by the
+first passage that was indexed for it.
+
+Ingest calls :func:`record_passage_signatures` once passages are flushed;
+:func:`backfill_passage_signatures` indexes passages that predate the tables.
+:func:`collapse_near_duplicates` keeps the best-ranked passage of each cluster
+in a result list.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Protocol, TypeVar
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from sqlalchemy import delete, insert, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from theo.application.facades.settings import get_settings
+from theo.infrastructure.api.app.persistence_models import (
+    Document,
+    Passage,
+    PassageSignature,
+    PassageSignatureBand,
+)
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD_PATTERN = re.compile(r"\w+")
+_LOOKUP_CHUNK = 500
+
+_signatures = PassageSignature.__table__
+_bands = PassageSignatureBand.__table__
+
+_TABLES_PRESENT: WeakKeyDictionary[Engine, bool] = WeakKeyDictionary()
+
+
+class _ClusterMember(Protocol):
+    """Search result shape that :func:`collapse_near_duplicates` can collapse."""
+
+    @property
+    def id(self) -> object: ...
+
+    meta: dict[str, Any] | None
+
+
+_ResultT = TypeVar("_ResultT", bound=_ClusterMember)
+
+
+class MinHasher:
+    """Compute MinHash signatures and LSH band keys for passage text.
+
+    Permutations are derived from ``seed``, so signatures are stable across
+    processes and can be compared with ones stored by earlier ingests.
+    """
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(
+                f"near-duplicate bands ({bands}) must divide num_perm ({num_perm})"
+            )
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    @classmethod
+    def from_settings(cls) -> "MinHasher":
+        settings = get_settings()
+        return cls(
+            num_perm=settings.near_duplicate_num_perm,
+            bands=settings.near_duplicate_bands,
+            shingle_size=settings.near_duplicate_shingle_size,
+        )
+
+    def shingles(self, text: str) -> set[str]:
+        """Return the case-folded word shingles of ``text``."""
+
+        words = _WORD_PATTERN.findall(text.casefold())
+        if not words:
+            return set()
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)}
+        size = self.shingle_size
+        return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """Return the ``uint32`` MinHash signature, or ``None`` for empty text."""
+
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (a * x + b) mod p: products of two 32-bit values fit in uint64.
+        permuted = (np.outer(hashes, self._a) % _MERSENNE_PRIME + self._b) % (
+            _MERSENNE_PRIME
+        )
+        signature: np.ndarray = (permuted & _MAX_HASH).min(axis=0).astype(np.uint32)
+        return signature
+
+    def band_keys(self, signature: np.ndarray) -> list[str]:
+        """Return one bucket key per band of ``signature``."""
+
+        keys: list[str] = []
+        for band, rows in enumerate(np.split(signature, self.bands)):
+            digest = blake2b(rows.tobytes(), digest_size=8).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+
+def estimate_jaccard(left: np.ndarray, right: np.ndarray) -> float:
+    """Estimate the shingle Jaccard similarity of two signatures."""
+
+    if left.shape != right.shape or not left.size:
+        return 0.0
+    return float(np.count_nonzero(left == right)) / left.size
+
+
+def _decode(signature: bytes) -> np.ndarray:
+    decoded: np.ndarray = np.frombuffer(signature, dtype=np.uint32)
+    return decoded
+
+
+def _tables_present(connection: Connection) -> bool:
+    engine = connection.engine
+    present = _TABLES_PRESENT.get(engine)
+    if present is None:
+        present = inspect(connection).has_table(_bands.name)
+        _TABLES_PRESENT[engine] = present
+    return present
+
+
+def _chunks(values: Sequence[str], size: int = _LOOKUP_CHUNK) -> Iterable[Sequence[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+@dataclass(slots=True)
+class _Indexed:
+    passage_id: str
+    signature: np.ndarray
+    cluster_id: str
+
+
+def index_passage_texts(
+    session: Session,
+    passages: Sequence[tuple[str, str]],
+    *,
+    hasher: MinHasher | None = None,
+    threshold: float | None = None,
+) -> int:
+    """Index ``(passage_id, text)`` pairs; return how many were near duplicates.
+
+    Candidates are looked up for the whole batch in one pass over the band
+    table, and passages in the same batch are matched against each other as
+    well, so repeated boilerplate inside one document collapses too.
+    """
+
+    threshold = (
+        get_settings().near_duplicate_threshold if threshold is None else threshold
+    )
+    if not passages or threshold is None:
+        return 0
+    hasher = hasher or MinHasher.from_settings()
+
+    pending: list[tuple[str, np.ndarray, list[str]]] = []
+    # Passages without indexable text get an empty signature so backfills
+    # do not pick them up again; they never match anything.
+    signature_rows: list[dict[str, Any]] = []
+    for passage_id, text in passages:
+        signature = hasher.signature(text or "")
+        if signature is None:
+            signature_rows.append(
+                {
+                    "passage_id": passage_id,
+                    "signature": b"",
+                    "cluster_id": passage_id,
+                    "similarity": None,
+                }
+            )
+        else:
+            pending.append((passage_id, signature, hasher.band_keys(signature)))
+
+    connection = session.connection()
+    buckets: dict[str, list[str]] = defaultdict(list)
+    keys = sorted({key for _, _, band_keys in pending for key in band_keys})
+    for chunk in _chunks(keys):
+        for band_key, passage_id in connection.execute(
+            select(_bands.c.band_key, _bands.c.passage_id).where(
+                _bands.c.band_key.in_(chunk)
+            )
+        ):
+            buckets[band_key].append(passage_id)
+
+    known: dict[str, _Indexed] = {}
+    candidate_ids = sorted({pid for members in buckets.values() for pid in members})
+    for chunk in _chunks(candidate_ids):
+        for passage_id, signature, cluster_id in connection.execute(
+            select(
+                _signatures.c.passage_id,
+                _signatures.c.signature,
+                _signatures.c.cluster_id,
+            ).where(_signatures.c.passage_id.in_(chunk))
+        ):
+            known[passage_id] = _Indexed(passage_id, _decode(signature), cluster_id)
+
+    band_rows: list[dict[str, Any]] = []
+    duplicates = 0
+    for passage_id, signature, band_keys in pending:
+        best: _Indexed | None = None
+        best_similarity = 0.0
+        seen: set[str] = set()
+        for key in band_keys:
+            for candidate_id in buckets.get(key, ()):
+                if candidate_id in seen or candidate_id == passage_id:
+                    continue
+                seen.add(candidate_id)
+                candidate = known.get(candidate_id)
+                if candidate is None:
+                    continue
+                score = estimate_jaccard(signature, candidate.signature)
+                if score > best_similarity:
+                    best, best_similarity = candidate, score
+        similarity: float | None = None
+        if best is not None and best_similarity >= threshold:
+            cluster_id, similarity = best.cluster_id, best_similarity
+            duplicates += 1
+        else:
+            cluster_id = passage_id
+
+        known[passage_id] = _Indexed(passage_id, signature, cluster_id)
+        for key in band_keys:
+            buckets[key].append(passage_id)
+        signature_rows.append(
+            {
+                "passage_id": passage_id,
+                "signature": signature.tobytes(),
+                "cluster_id": cluster_id,
+                "similarity": similarity,
+            }
+        )
+        band_rows.extend(
+            {"band_key": key, "passage_id": passage_id} for key in band_keys
+        )
+
+    if signature_rows:
+        connection.execute(insert(_signatures), signature_rows)
+    if band_rows:
+        connection.execute(insert(_bands), band_rows)
+    return duplicates
+
+
+def record_passage_signatures(session: Session, passages: Sequence[Passage]) -> int:
+    """Index freshly flushed ingest passages when detection is enabled.
+
+    Runs inside the ingest transaction; returns the number of passages that
+    joined an existing cluster.
+    """
+
+    if not passages or get_settings().near_duplicate_threshold is None:
+        return 0
+    if not _tables_present(session.connection()):
+        return 0
+    duplicates = index_passage_texts(
+        session, [(str(passage.id), passage.text) for passage in passages]
+    )
+    if duplicates:
+        logger.debug(
+            "Linked near-duplicate passages",
+            extra={"passages": len(passages), "duplicates": duplicates},
+        )
+    return duplicates
+
+
+@dataclass(slots=True)
+class SignatureBackfillResult:
+    indexed: int = 0
+    duplicates: int = 0
+
+
+def backfill_passage_signatures(
+    session: Session,
+    *,
+    batch_size: int = 500,
+    rebuild: bool = False,
+    hasher: MinHasher | None = None,
+) -> SignatureBackfillResult:
+    """Index passages without a signature, oldest documents first.
+
+    Processing in document creation order keeps the earliest copy of a text
+    as its cluster key. Each batch is committed on its own. ``rebuild`` drops
+    the existing index first, which is required after changing the number of
+    permutations, bands or the shingle size.
+    """
+
+    hasher = hasher or MinHasher.from_settings()
+    threshold = get_settings().near_duplicate_threshold or 1.0
+    if rebuild:
+        session.execute(delete(_bands))
+        session.execute(delete(_signatures))
+        session.commit()
+
+    result = SignatureBackfillResult()
+    while True:
+        rows = session.execute(
+            select(Passage.id, Passage.text)
+            .join(Document, Document.id == Passage.document_id)
+            .outerjoin(_signatures, _signatures.c.passage_id == Passage.id)
+            .where(_signatures.c.passage_id.is_(None))
+            .order_by(Document.created_at, Passage.document_id, Passage.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        batch = [(str(passage_id), text or "") for passage_id, text in rows]
+        result.duplicates += index_passage_texts(
+            session, batch, hasher=hasher, threshold=threshold
+        )
+        session.commit()
+        result.indexed += len(batch)
+    return result
+
+
+def load_cluster_ids(session: Session, passage_ids: Sequence[str]) -> dict[str, str]:
+    """Return the near-duplicate cluster of each indexed passage."""
+
+    clusters: dict[str, str] = {}
+    unique = list(dict.fromkeys(passage_ids))
+    for chunk in _chunks(unique):
+        clusters.update(
+            session.execute(
+                select(_signatures.c.passage_id, _signatures.c.cluster_id).where(
+                    _signatures.c.passage_id.in_(chunk)
+                )
+            ).all()
+        )
+    return clusters
+
+
+def collapse_near_duplicates(
+    session: Session, results: Sequence[_ResultT], *, limit: int | None = None
+) -> list[_ResultT]:
+    """Keep the first result of every near-duplicate cluster.
+
+    ``results`` must be ordered best first and expose ``id`` and ``meta``. The
+    ids of collapsed passages are listed under ``meta["near_duplicates"]`` of
+    the result that represents their cluster.
+    """
+
+    if not results or not _tables_present(session.connection()):
+        return list(results)[:limit]
+    clusters = load_cluster_ids(session, [str(result.id) for result in results])
+    kept: dict[str, _ResultT] = {}
+    for result in results:
+        cluster = clusters.get(str(result.id), str(result.id))
+        representative = kept.get(cluster)
+        if representative is None:
+            kept[cluster] = result
+            continue
+        meta = dict(representative.meta or {})
+        meta["near_duplicates"] = [*meta.get("near_duplicates", ()), str(result.id)]
+        representative.meta = meta
+    return list(kept.values())[:limit]
+
+
+__all__ = [
+    "MinHasher",
+    "SignatureBackfillResult",
+    "backfill_passage_signatures",
+    "collapse_near_duplicates",
+    "estimate_jaccard",
+    "index_passage_texts",
+    "load_cluster_ids",
+    "record_passage_signatures",
+]
@@ -0,0 +1,534 @@
+"""Per-request query accounting and slow-query plan capture.
+
+``execute_with_metrics`` and ``query_with_monitoring`` time the statements
+they wrap, which tells us *that* a search or dashboard request got slower but
+not *why*. This module hooks SQLAlchemy's ``before_cursor_execute`` and
+``after_cursor_execute`` events so every statement is seen, whoever issued it:
+
+* Inside :func:`track_queries` (the API middleware opens one per request) each
+  statement is counted and timed, and grouped by a fingerprint of its SQL with
+  literals and bound values stripped. A fingerprint that repeats more than
+  ``db_n_plus_one_threshold`` times in one request is logged as an N+1
+  pattern.
+* Statements slower than ``db_slow_query_ms`` are recorded in a bounded ring
+  buffer served by ``/admin/db/slow-queries``. Read-only statements also get
+  their plan: ``EXPLAIN (ANALYZE, BUFFERS)`` on PostgreSQL, run inside a
+  savepoint so a failure cannot poison the caller's transaction, and
+  ``EXPLAIN QUERY PLAN`` on SQLite. ``EXPLAIN ANALYZE`` runs the query a
+  second time, so each statement shape is explained at most once per
+  ``db_slow_query_explain_interval_seconds``.
+
+Tests use :func:`query_budget` to pin how many statements a code path or
+route may issue.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from theo.application.facades.settings import get_settings
+from theo.application.facades.telemetry import record_counter
+from theo.application.telemetry import (
+    DB_N_PLUS_ONE_EVENTS_METRIC,
+    DB_SLOW_QUERY_EVENTS_METRIC,
+)
+
+logger = logging.getLogger(__name__)
+
+_START_TIMES_KEY = "theo_query_start_times"
+_EXPLAIN_SAVEPOINT = "theo_explain_plan"
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER_PATTERN = re.compile(
+    r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?|\b\d+(?:\.\d+)?\b"
+)
+_IN_LIST_PATTERN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_PATTERN = re.compile(
+    r"\bVALUES\s*\([^()]*\)(?:\s*,\s*\([^()]*\))*", re.IGNORECASE
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_WRITE_KEYWORDS = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|CREATE|DROP|ALTER|TRUNCATE)\b", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize_statement(statement: str) -> str:
+    """Return *statement* with literals, parameters and IN lists collapsed."""
+
+    text = _COMMENT_PATTERN.sub(" ", statement)
+    text = _STRING_PATTERN.sub("?", text)
+    text = _PARAMETER_PATTERN.sub("?", text)
+    text = _IN_LIST_PATTERN.sub("IN (...)", text)
+    text = _VALUES_PATTERN.sub("VALUES (...)", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_statement(statement: str) -> str:
+    """Return a short stable identifier for the shape of *statement*."""
+
+    normalized = normalize_statement(statement).encode("utf-8")
+    return hashlib.blake2b(normalized, digest_size=8).hexdigest()
+
+
+def _is_read_only(statement: str) -> bool:
+    head = statement.lstrip().split(None, 1)
+    if not head:
+        return False
+    keyword = head[0].upper()
+    if keyword == "SELECT":
+        return True
+    # Data-modifying CTEs would really write when run under EXPLAIN ANALYZE.
+    return keyword == "WITH" and not _WRITE_KEYWORDS.search(statement)
+
+
+@dataclass(frozen=True)
+class InstrumentationConfig:
+    """Thresholds applied by the cursor event listeners."""
+
+    slow_query_ms: float | None = 500.0
+    n_plus_one_threshold: int = 10
+    buffer_size: int = 50
+    explain_interval_seconds: float = 300.0
+
+    @classmethod
+    def from_settings(cls, settings: Any | None = None) -> "InstrumentationConfig":
+        settings = settings or get_settings()
+        defaults = cls()
+        return cls(
+            slow_query_ms=getattr(
+                settings, "db_slow_query_ms", defaults.slow_query_ms
+            ),
+            n_plus_one_threshold=getattr(
+                settings, "db_n_plus_one_threshold", defaults.n_plus_one_threshold
+            ),
+            buffer_size=getattr(
+                settings, "db_slow_query_buffer_size", defaults.buffer_size
+            ),
+            explain_interval_seconds=getattr(
+                settings,
+                "db_slow_query_explain_interval_seconds",
+                defaults.explain_interval_seconds,
+            ),
+        )
+
+
+@dataclass
+class QueryStats:
+    """Statements observed within one :func:`track_queries` scope."""
+
+    label: str | None = None
+    count: int = 0
+    total_seconds: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    statements: dict[str, str] = field(default_factory=dict)
+    n_plus_one: list[str] = field(default_factory=list)
+    parent: QueryStats | None = field(default=None, repr=False)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000.0
+
+    def record(self, fingerprint: str, statement: str, duration: float) -> int:
+        """Count one statement and return how often its shape has run."""
+
+        self.count += 1
+        self.total_seconds += duration
+        self.fingerprints[fingerprint] += 1
+        self.statements.setdefault(fingerprint, statement)
+        if self.parent is not None:
+            self.parent.record(fingerprint, statement, duration)
+        return self.fingerprints[fingerprint]
+
+    def repeated(self, minimum: int = 2) -> list[tuple[str, int]]:
+        """Return ``(statement, count)`` for shapes run at least *minimum* times."""
+
+        return [
+            (normalize_statement(self.statements[fingerprint]), count)
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= minimum
+        ]
+
+
+@dataclass(frozen=True)
+class SlowQueryRecord:
+    """A statement that exceeded the slow-query threshold."""
+
+    fingerprint: str
+    statement: str
+    duration_ms: float
+    dialect: str
+    captured_at: datetime
+    label: str | None = None
+    plan: tuple[str, ...] | None = None
+    plan_error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "duration_ms": round(self.duration_ms, 3),
+            "dialect": self.dialect,
+            "captured_at": self.captured_at.isoformat(),
+            "label": self.label,
+            "plan": list(self.plan) if self.plan is not None else None,
+            "plan_error": self.plan_error,
+        }
+
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of recent :class:`SlowQueryRecord` entries."""
+
+    def __init__(self, maxlen: int = 50) -> None:
+        self._lock = threading.Lock()
+        self._records: deque[SlowQueryRecord] = deque(maxlen=maxlen)
+        self._explained_at: dict[str, float] = {}
+
+    @property
+    def maxlen(self) -> int:
+        return self._records.maxlen or 0
+
+    def resize(self, maxlen: int) -> None:
+        with self._lock:
+            if maxlen != self._records.maxlen:
+                self._records = deque(self._records, maxlen=maxlen)
+
+    def append(self, record: SlowQueryRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def claim_explain(self, fingerprint: str, interval_seconds: float) -> bool:
+        """Return ``True`` if *fingerprint* is due for a fresh plan."""
+
+        now = time.monotonic()
+        with self._lock:
+            last = self._explained_at.get(fingerprint)
+            if last is not None and now - last < interval_seconds:
+                return False
+            if len(self._explained_at) >= 4096:
+                self._explained_at.clear()
+            self._explained_at[fingerprint] = now
+            return True
+
+    def snapshot(self) -> list[SlowQueryRecord]:
+        """Return the buffered records, newest first."""
+
+        with self._lock:
+            return list(reversed(self._records))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._explained_at.clear()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by :func:`query_budget` when a block issues too many statements."""
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "theo_query_stats", default=None
+)
+_config = InstrumentationConfig()
+_slow_query_log = SlowQueryLog(_config.buffer_size)
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Return the process-wide slow-query ring buffer."""
+
+    return _slow_query_log
+
+
+def get_instrumentation_config() -> InstrumentationConfig:
+    return _config
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the stats of the innermost active :func:`track_queries` scope."""
+
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(label: str | None = None) -> Iterator[QueryStats]:
+    """Count and time the statements issued inside the block.
+
+    Statements run on worker threads are included as long as the thread
+    inherited this context (``run_in_threadpool`` and ``asyncio.to_thread`` do).
+    Nested scopes also count towards every enclosing scope.
+    """
+
+    stats = QueryStats(label=label, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def query_budget(
+    max_queries: int,
+    *,
+    max_repeats: int | None = None,
+    label: str | None = None,
+) -> Iterator[QueryStats]:
+    """Fail when the block issues more than *max_queries* statements.
+
+    *max_repeats* additionally caps how often a single statement shape may run,
+    which catches N+1 loops that stay under the overall budget on small
+    fixtures. The instrumentation must be installed on the engine in use.
+    """
+
+    with track_queries(label) as stats:
+        yield stats
+    problems: list[str] = []
+    if stats.count > max_queries:
+        problems.append(f"{stats.count} statements issued, budget is {max_queries}")
+    if max_repeats is not None:
+        worst = max(stats.fingerprints.values(), default=0)
+        if worst > max_repeats:
+            problems.append(
+                f"a statement ran {worst} times, limit is {max_repeats}"
+            )
+    if problems:
+        repeated = "\n".join(
+            f"  {count}x {statement}" for statement, count in stats.repeated()[:5]
+        )
+        message = "; ".join(problems)
+        if label:
+            message = f"{label}: {message}"
+        if repeated:
+            message = f"{message}\nRepeated statements:\n{repeated}"
+        raise QueryBudgetExceeded(message)
+
+
+def explain_statement(
+    connection: Connection, statement: str, parameters: Any = None
+) -> tuple[str, ...]:
+    """Return the query plan of *statement* as text lines.
+
+    Runs on the raw DBAPI connection so the ``EXPLAIN`` itself is not seen by
+    the cursor listeners.
+    """
+
+    dialect = connection.dialect.name
+    dbapi_connection = connection.connection.dbapi_connection
+    cursor = dbapi_connection.cursor()
+    try:
+        if dialect == "postgresql":
+            return _explain_postgresql(dbapi_connection, cursor, statement, parameters)
+        if dialect == "sqlite":
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            return _format_sqlite_plan(cursor.fetchall())
+        raise NotImplementedError(f"EXPLAIN capture is not supported on {dialect}")
+    finally:
+        cursor.close()
+
+
+def _explain_postgresql(
+    dbapi_connection: Any, cursor: Any, statement: str, parameters: Any
+) -> tuple[str, ...]:
+    use_savepoint = not getattr(dbapi_connection, "autocommit", False)
+    if use_savepoint:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+    try:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters or None)
+        rows = cursor.fetchall()
+    except Exception:
+        if use_savepoint:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        raise
+    if use_savepoint:
+        cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+    return tuple(str(row[0]) for row in rows)
+
+
+def _format_sqlite_plan(rows: list[tuple[Any, ...]]) -> tuple[str, ...]:
+    depths: dict[int, int] = {}
+    lines: list[str] = []
+    for node_id, parent_id, _unused, detail in rows:
+        depth = depths.get(parent_id, -1) + 1
+        depths[node_id] = depth
+        lines.append(f"{'  ' * depth}{detail}")
+    return tuple(lines)
+
+
+def _before_cursor_execute(
+    conn: Connection, cursor, statement, parameters, context, executemany
+) -> None:
+    started = time.perf_counter()
+    if context is not None:
+        context._theo_query_started = started
+    else:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(started)
+
+
+def _after_cursor_execute(
+    conn: Connection, cursor, statement, parameters, context, executemany
+) -> None:
+    if context is not None:
+        # Popped so a listener attached to both an engine and the Engine
+        # class counts the statement once.
+        started = vars(context).pop("_theo_query_started", None)
+    else:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        started = start_times.pop() if start_times else None
+    if started is None:
+        return
+    duration = time.perf_counter() - started
+    stats = _current_stats.get()
+    config = _config
+    slow = (
+        config.slow_query_ms is not None
+        and duration * 1000.0 >= config.slow_query_ms
+    )
+    if stats is None and not slow:
+        return
+
+    fingerprint = fingerprint_statement(statement)
+    if stats is not None:
+        repeats = stats.record(fingerprint, statement, duration)
+        if repeats == config.n_plus_one_threshold + 1:
+            stats.n_plus_one.append(fingerprint)
+            record_counter(DB_N_PLUS_ONE_EVENTS_METRIC)
+            logger.warning(
+                "Possible N+1 query pattern",
+                extra={
+                    "event": "db.n_plus_one",
+                    "label": stats.label,
+                    "fingerprint": fingerprint,
+                    "repeats": repeats,
+                    "statement": normalize_statement(statement),
+                },
+            )
+    if slow:
+        _capture_slow_query(
+            conn,
+            statement,
+            parameters,
+            executemany=executemany,
+            duration=duration,
+            fingerprint=fingerprint,
+            label=stats.label if stats is not None else None,
+        )
+
+
+def _capture_slow_query(
+    conn: Connection,
+    statement: str,
+    parameters: Any,
+    *,
+    executemany: bool,
+    duration: float,
+    fingerprint: str,
+    label: str | None,
+) -> None:
+    dialect = conn.dialect.name
+    plan: tuple[str, ...] | None = None
+    plan_error: str | None = None
+    if (
+        not executemany
+        and _is_read_only(statement)
+        and _slow_query_log.claim_explain(
+            fingerprint, _config.explain_interval_seconds
+        )
+    ):
+        try:
+            plan = explain_statement(conn, statement, parameters)
+        except Exception as exc:  # pragma: no cover - depends on the backend
+            plan_error = f"{type(exc).__name__}: {exc}"
+            logger.debug("Failed to capture query plan", exc_info=True)
+
+    record_counter(
+        DB_SLOW_QUERY_EVENTS_METRIC,
+        labels={"dialect": dialect, "explained": str(plan is not None).lower()},
+    )
+    _slow_query_log.append(
+        SlowQueryRecord(
+            fingerprint=fingerprint,
+            statement=statement,
+            duration_ms=duration * 1000.0,
+            dialect=dialect,
+            captured_at=datetime.now(UTC),
+            label=label,
+            plan=plan,
+            plan_error=plan_error,
+        )
+    )
+    logger.info(
+        "Slow query",
+        extra={
+            "event": "db.slow_query",
+            "label": label,
+            "fingerprint": fingerprint,
+            "duration_ms": round(duration * 1000.0, 3),
+        },
+    )
+
+
+def install_query_instrumentation(
+    target: Engine | type[Engine] = Engine,
+    *,
+    config: InstrumentationConfig | None = None,
+) -> None:
+    """Attach the cursor listeners to *target* and apply *config*.
+
+    The default target is the :class:`~sqlalchemy.engine.Engine` class, which
+    covers every engine the process creates, including ones rebuilt by
+    ``configure_engine``. Calling this again only refreshes the configuration.
+    """
+
+    global _config
+    _config = config or InstrumentationConfig.from_settings()
+    _slow_query_log.resize(_config.buffer_size)
+    if not any(
+        event.contains(candidate, "before_cursor_execute", _before_cursor_execute)
+        for candidate in {target, Engine}
+    ):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstall_query_instrumentation(target: Engine | type[Engine] = Engine) -> None:
+    """Detach the listeners added by :func:`install_query_instrumentation`."""
+
+    if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.remove(target, "before_cursor_execute", _before_cursor_execute)
+        event.remove(target, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = [
+    "InstrumentationConfig",
+    "QueryBudgetExceeded",
+    "QueryStats",
+    "SlowQueryLog",
+    "SlowQueryRecord",
+    "current_query_stats",
+    "explain_statement",
+    "fingerprint_statement",
+    "get_instrumentation_config",
+    "get_slow_query_log",
+    "install_query_instrumentation",
+    "normalize_statement",
+    "query_budget",
+    "track_queries",
+    "uninstall_query_instrumentation",
+]
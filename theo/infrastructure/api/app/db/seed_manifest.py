@@ -0,0 +1,145 @@
+"""Content-hash manifest used to skip unchanged reference seed datasets."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Table, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from theo.application.facades.settings_store import load_setting, save_setting
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SETTING_KEY = "reference_seeds.manifest"
+
+# Bump when the seed loaders change how rows are derived from the bundled
+# files so that every dataset is re-applied once after an upgrade.
+SEED_LOADER_VERSION = "2"
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _iter_dataset_files(paths: Iterable[Path]) -> Iterable[tuple[str, Path | None]]:
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_dir():
+            for child in sorted(item for item in path.rglob("*") if item.is_file()):
+                yield (child.relative_to(path.parent).as_posix(), child)
+        elif path.is_file():
+            yield (path.name, path)
+        else:
+            yield (path.name, None)
+
+
+def dataset_digest(paths: Iterable[Path], *, salt: str = "") -> str:
+    """Return a SHA-256 digest covering the names and bytes of ``paths``.
+
+    Directories are walked recursively in sorted order and missing files
+    contribute a marker, so adding, removing or editing any input changes the
+    digest.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(f"loader={SEED_LOADER_VERSION};salt={salt}".encode("utf-8"))
+    for name, path in _iter_dataset_files(paths):
+        digest.update(b"\0file:" + name.encode("utf-8") + b"\0")
+        if path is None:
+            digest.update(b"<missing>")
+            continue
+        with path.open("rb") as handle:
+            while chunk := handle.read(_READ_CHUNK_SIZE):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _count_rows(session: Session, tables: Sequence[Table]) -> int | None:
+    total = 0
+    for table in tables:
+        try:
+            count = session.execute(select(func.count()).select_from(table)).scalar()
+            total += int(count or 0)
+        except SQLAlchemyError:
+            session.rollback()
+            return None
+    return total
+
+
+@dataclass(slots=True)
+class SeedManifest:
+    """Per-database record of which dataset digests have been applied.
+
+    Entries store the digest alongside the row count observed after seeding so
+    a truncated or rebuilt table is re-seeded even when the files are unchanged.
+    """
+
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def load(cls, session: Session) -> "SeedManifest":
+        try:
+            payload = load_setting(session, MANIFEST_SETTING_KEY, default=None)
+        except Exception:
+            session.rollback()
+            logger.debug(
+                "Seed manifest unavailable; seeding all datasets", exc_info=True
+            )
+            payload = None
+        entries = payload if isinstance(payload, dict) else {}
+        return cls(
+            entries={
+                key: value for key, value in entries.items() if isinstance(value, dict)
+            }
+        )
+
+    def is_current(
+        self, session: Session, label: str, digest: str, tables: Sequence[Table]
+    ) -> bool:
+        """Return ``True`` when ``label`` was last applied from ``digest``."""
+
+        entry = self.entries.get(label)
+        if not entry or entry.get("digest") != digest:
+            return False
+        expected_rows = entry.get("rows")
+        if expected_rows is None or not tables:
+            return True
+        return _count_rows(session, tables) == expected_rows
+
+    def record(
+        self, session: Session, label: str, digest: str, tables: Sequence[Table]
+    ) -> None:
+        self.entries[label] = {
+            "digest": digest,
+            "rows": _count_rows(session, tables) if tables else None,
+        }
+        self.dirty = True
+
+    def forget(self, label: str) -> None:
+        if self.entries.pop(label, None) is not None:
+            self.dirty = True
+
+    def save(self, session: Session) -> None:
+        if not self.dirty:
+            return
+        try:
+            save_setting(session, MANIFEST_SETTING_KEY, self.entries)
+        except Exception:
+            session.rollback()
+            logger.warning("Failed to persist reference seed manifest", exc_info=True)
+            return
+        self.dirty = False
+
+
+__all__ = [
+    "MANIFEST_SETTING_KEY",
+    "SEED_LOADER_VERSION",
+    "SeedManifest",
+    "dataset_digest",
+]
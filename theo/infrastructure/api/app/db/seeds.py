@@ -14,7 +14,7 @@ from pathlib import Path
 from uuid import NAMESPACE_URL, uuid5
 
 import yaml
-from sqlalchemy import Table, delete, inspect
+from sqlalchemy import Table, delete, insert, inspect, select, update
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
@@ -24,12 +24,18 @@ from theo.adapters.persistence.sqlite import dispose_sqlite_engine
 from theo.infrastructure.api.app.persistence_models import (
     CommentaryExcerptSeed,
     ContradictionSeed,
+    GeoAncientPlace,
+    GeoModernLocation,
     GeoPlace,
     HarmonySeed,
 )
 from theo.application.services.geo import seed_openbible_geo
+from theo.application.services.geo.seed_openbible_geo import (
+    DATA_ROOT as OPENBIBLE_GEO_ROOT,
+)
 
 from ..ingest.osis import expand_osis_reference
+from .seed_manifest import SeedManifest, dataset_digest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[5]
 SEED_ROOT = PROJECT_ROOT / "data" / "seeds"
@@ -162,6 +168,65 @@ def _assign_range(record, start_attr: str, end_attr: str, reference: str | None)
     return changed
 
 
+def _apply_seed_rows(
+    session: Session,
+    model: type,
+    rows: Iterable[dict[str, object]],
+    *,
+    key: str = "id",
+) -> tuple[int, int, int]:
+    """Diff ``rows`` against ``model`` by natural key and apply the changes in bulk.
+
+    Existing rows are read with a single ``SELECT``; new keys are inserted with
+    one multi-row ``INSERT``, changed rows are updated by primary key in one
+    executemany ``UPDATE`` and keys absent from ``rows`` are deleted. Returns
+    ``(inserted, updated, deleted)``. Keys in ``rows`` that are not columns of
+    ``model`` are ignored.
+    """
+
+    table = model.__table__
+    desired: dict[object, dict[str, object]] = {}
+    for row in rows:
+        # Older schemas may lack optional columns such as verse ranges.
+        desired[row[key]] = {name: value for name, value in row.items() if name in table.c}
+    if not desired:
+        return (0, 0, 0)
+
+    columns = [name for name in next(iter(desired.values())) if name != key]
+    existing = {
+        row[0]: tuple(row[1:])
+        for row in session.execute(
+            select(table.c[key], *(table.c[name] for name in columns))
+        )
+    }
+
+    inserts: list[dict[str, object]] = []
+    updates: list[dict[str, object]] = []
+    touch_updated_at = "updated_at" in table.c and "updated_at" not in columns
+    now = datetime.now(UTC)
+    for identifier, row in desired.items():
+        current = existing.get(identifier)
+        if current is None:
+            inserts.append(row)
+            continue
+        if current == tuple(row[name] for name in columns):
+            continue
+        changed = dict(row)
+        if touch_updated_at:
+            changed["updated_at"] = now
+        updates.append(changed)
+
+    stale = [identifier for identifier in existing if identifier not in desired]
+
+    if inserts:
+        session.execute(insert(table), inserts)
+    if updates:
+        session.execute(update(model), updates)
+    if stale:
+        session.execute(delete(table).where(table.c[key].in_(stale)))
+    return (len(inserts), len(updates), len(stale))
+
+
 def _get_session_connection(session: Session) -> tuple[Connection | None, bool]:
     """Return a connection bound to ``session`` and whether it should be closed."""
 
@@ -766,23 +831,25 @@ def _run_with_sqlite_lock_retry(
 
 def _run_seed_with_perspective_guard(
     session: Session,
-    seed_fn: Callable[[Session], None],
+    seed_fn: Callable[[Session], bool | None],
     dataset_label: str,
     *,
     max_attempts: int = MISSING_COLUMN_MAX_ATTEMPTS,
-) -> None:
-    """Execute *seed_fn* while gracefully handling missing perspective columns."""
+) -> bool:
+    """Execute *seed_fn* while gracefully handling missing perspective columns.
+
+    Returns ``True`` only when *seed_fn* reports that the dataset was applied.
+    """
 
     attempts = 0
     while attempts < max_attempts:
         try:
-            seed_fn(session)
-            return
+            return seed_fn(session) is not False
         except OperationalError as exc:
             if getattr(exc, "_theoria_missing_column_handled", False):
                 attempts += 1
                 if attempts >= 2:
-                    return
+                    return False
                 continue
             handled = _handle_missing_perspective_error(session, dataset_label, exc)
             if not handled:
@@ -796,9 +863,10 @@ def _run_seed_with_perspective_guard(
             dataset_label,
             attempts,
         )
+    return False
 
 
-def seed_contradiction_claims(session: Session) -> None:
+def seed_contradiction_claims(session: Session) -> bool:
     """Load contradiction seeds into the database in an idempotent manner."""
 
     table = ContradictionSeed.__table__
@@ -814,7 +882,7 @@ def seed_contradiction_claims(session: Session) -> None:
         )
     except OperationalError as exc:
         if _handle_missing_perspective_error(session, "contradiction", exc):
-            return
+            return False
         raise
 
     table_exists = _table_exists(session, table.name, schema=table.schema)
@@ -837,7 +905,7 @@ def seed_contradiction_claims(session: Session) -> None:
                     "Skipping contradiction seeds because table recreation failed",
                     exc_info=True,
                 )
-                return
+                return False
             else:
                 if rebuilt and not table_exists:
                     logger.info(
@@ -852,7 +920,7 @@ def seed_contradiction_claims(session: Session) -> None:
                 )
 
     if not perspective_ready:
-        return
+        return False
 
     range_columns = [
         column
@@ -872,7 +940,7 @@ def seed_contradiction_claims(session: Session) -> None:
         "contradiction",
         range_columns,
     ):
-        return
+        return False
 
     payload = _iter_seed_entries(
         SEED_ROOT / "contradictions.json",
@@ -880,8 +948,56 @@ def seed_contradiction_claims(session: Session) -> None:
         SEED_ROOT / "contradictions_catalog.yaml",
     )
 
+    def _rows() -> list[dict[str, object]]:
+        rows: list[dict[str, object]] = []
+        for entry in payload:
+            osis_a = entry.get("osis_a")
+            osis_b = entry.get("osis_b")
+            if not osis_a or not osis_b:
+                continue
+            osis_a_value = str(osis_a)
+            osis_b_value = str(osis_b)
+            start_a, end_a = _verse_bounds(osis_a_value)
+            start_b, end_b = _verse_bounds(osis_b_value)
+            source = entry.get("source") or "community"
+            perspective = (entry.get("perspective") or "skeptical").strip().lower()
+            identifier = str(
+                uuid5(
+                    CONTRADICTION_NAMESPACE,
+                    "|".join(
+                        [
+                            osis_a_value.lower(),
+                            osis_b_value.lower(),
+                            source.lower(),
+                            perspective,
+                        ]
+                    ),
+                )
+            )
+            rows.append(
+                {
+                    "id": identifier,
+                    "osis_a": osis_a_value,
+                    "osis_b": osis_b_value,
+                    "summary": entry.get("summary"),
+                    "source": source,
+                    "tags": _coerce_list(entry.get("tags")),
+                    "weight": float(entry.get("weight", 1.0)),
+                    "perspective": perspective,
+                    "start_verse_id_a": start_a,
+                    "end_verse_id_a": end_a,
+                    "start_verse_id": start_a,
+                    "end_verse_id": end_a,
+                    "start_verse_id_b": start_b,
+                    "end_verse_id_b": end_b,
+                }
+            )
+        return rows
+
+    skipped = False
+
     def _load(target_session: Session) -> None:
-        seen_ids: set[str] = set()
+        nonlocal skipped
         if not _table_has_column(
             target_session, table.name, "perspective", schema=table.schema
         ):
@@ -890,132 +1006,27 @@ def seed_contradiction_claims(session: Session) -> None:
                 "Skipping %s seeds because 'perspective' column is missing",
                 "contradiction",
             )
+            skipped = True
             return
         try:
-            for entry in payload:
-                osis_a = entry.get("osis_a")
-                osis_b = entry.get("osis_b")
-                if not osis_a or not osis_b:
-                    continue
-                osis_a_value = str(osis_a)
-                osis_b_value = str(osis_b)
-                start_a, end_a = _verse_bounds(osis_a_value)
-                start_b, end_b = _verse_bounds(osis_b_value)
-                source = entry.get("source") or "community"
-                perspective = (entry.get("perspective") or "skeptical").strip().lower()
-                identifier = str(
-                    uuid5(
-                        CONTRADICTION_NAMESPACE,
-                        "|".join(
-                            [
-                                str(osis_a).lower(),
-                                str(osis_b).lower(),
-                                source.lower(),
-                                perspective,
-                            ]
-                        ),
-                    )
-                )
-                seen_ids.add(identifier)
-                try:
-                    record = target_session.get(ContradictionSeed, identifier)
-                except OperationalError as exc:
-                    handled = _handle_missing_perspective_error(
-                        target_session, "contradiction", exc
-                    )
-                    if not handled:
-                        raise
-                    setattr(exc, "_theoria_missing_column_handled", True)
-                    raise
-                tags = _coerce_list(entry.get("tags"))
-                weight = float(entry.get("weight", 1.0))
-                summary = entry.get("summary")
-                range_a = _verse_range(str(osis_a))
-                range_b = _verse_range(str(osis_b))
-                start_a = range_a[0] if range_a else None
-                end_a = range_a[1] if range_a else None
-                start_b = range_b[0] if range_b else None
-                end_b = range_b[1] if range_b else None
-
-                if record is None:
-                    record_kwargs = {
-                        "id": identifier,
-                        "osis_a": osis_a_value,
-                        "osis_b": osis_b_value,
-                        "summary": summary,
-                        "source": source,
-                        "tags": tags,
-                        "weight": weight,
-                        "perspective": perspective,
-                    }
-                    if hasattr(ContradictionSeed, "start_verse_id_a"):
-                        record_kwargs["start_verse_id_a"] = start_a
-                    if hasattr(ContradictionSeed, "end_verse_id_a"):
-                        record_kwargs["end_verse_id_a"] = end_a
-                    if hasattr(ContradictionSeed, "start_verse_id"):
-                        record_kwargs["start_verse_id"] = start_a
-                    if hasattr(ContradictionSeed, "end_verse_id"):
-                        record_kwargs["end_verse_id"] = end_a
-                    if hasattr(ContradictionSeed, "start_verse_id_b"):
-                        record_kwargs["start_verse_id_b"] = start_b
-                    if hasattr(ContradictionSeed, "end_verse_id_b"):
-                        record_kwargs["end_verse_id_b"] = end_b
-
-                    record = ContradictionSeed(**record_kwargs)
-                    target_session.add(record)
-                else:
-                    if record.osis_a != osis_a_value:
-                        record.osis_a = osis_a_value
-                    if record.osis_b != osis_b_value:
-                        record.osis_b = osis_b_value
-                    if record.summary != summary:
-                        record.summary = summary
-                    if record.source != source:
-                        record.source = source
-                    if record.tags != tags:
-                        record.tags = tags
-                    if record.weight != weight:
-                        record.weight = weight
-                    if record.perspective != perspective:
-                        record.perspective = perspective
-                    if hasattr(record, "start_verse_id_a") and record.start_verse_id_a != start_a:
-                        record.start_verse_id_a = start_a
-                    if hasattr(record, "end_verse_id_a") and record.end_verse_id_a != end_a:
-                        record.end_verse_id_a = end_a
-                    if hasattr(record, "start_verse_id_b") and record.start_verse_id_b != start_b:
-                        record.start_verse_id_b = start_b
-                    if hasattr(record, "end_verse_id_b") and record.end_verse_id_b != end_b:
-                        record.end_verse_id_b = end_b
-                    if hasattr(record, "start_verse_id") and hasattr(record, "end_verse_id"):
-                        _assign_range(record, "start_verse_id", "end_verse_id", str(osis_a))
-                    if hasattr(record, "start_verse_id_b") and hasattr(record, "end_verse_id_b"):
-                        _assign_range(
-                            record,
-                            "start_verse_id_b",
-                            "end_verse_id_b",
-                            str(osis_b),
-                        )
+            _apply_seed_rows(target_session, ContradictionSeed, _rows())
         except OperationalError as exc:
             if getattr(exc, "_theoria_missing_column_handled", False):
                 raise
             if _handle_missing_perspective_error(
                 target_session, "contradiction", exc
             ):
-                return
+                setattr(exc, "_theoria_missing_column_handled", True)
             raise
 
-        if seen_ids:
-            target_session.execute(
-                delete(ContradictionSeed).where(~ContradictionSeed.id.in_(seen_ids))
-            )
-
-    _run_with_sqlite_lock_retry(session, "contradiction", _load)
+    applied = _run_with_sqlite_lock_retry(session, "contradiction", _load)
 
     if payload:
         logger.info("Ensured %d contradiction seeds are present", len(payload))
+    return applied and not skipped
 
 
-def seed_harmony_claims(session: Session) -> None:
+def seed_harmony_claims(session: Session) -> bool:
     """Load harmony seeds from bundled YAML/JSON files."""
 
     table = HarmonySeed.__table__
@@ -1026,7 +1037,7 @@ def seed_harmony_claims(session: Session) -> None:
         required_columns=("created_at",) if hasattr(HarmonySeed, "created_at") else None,
         allow_repair=True,
     ):
-        return
+        return False
 
     harmony_range_columns = [
         column
@@ -1046,7 +1057,7 @@ def seed_harmony_claims(session: Session) -> None:
         "harmony",
         harmony_range_columns,
     ):
-        return
+        return False
 
     payload = _iter_seed_entries(
         SEED_ROOT / "harmonies.yaml",
@@ -1054,10 +1065,10 @@ def seed_harmony_claims(session: Session) -> None:
         SEED_ROOT / "harmonies_additional.yaml",
     )
     if not payload:
-        return
+        return True
 
     def _load(target_session: Session) -> None:
-        seen_ids: set[str] = set()
+        rows: list[dict[str, object]] = []
         for entry in payload:
             osis_a = entry.get("osis_a")
             osis_b = entry.get("osis_b")
@@ -1075,106 +1086,38 @@ def seed_harmony_claims(session: Session) -> None:
                     HARMONY_NAMESPACE,
                     "|".join(
                         [
-                            str(osis_a).lower(),
-                            str(osis_b).lower(),
+                            osis_a_value.lower(),
+                            osis_b_value.lower(),
                             source.lower(),
                             perspective,
                         ]
                     ),
                 )
             )
-            seen_ids.add(identifier)
-            record = target_session.get(HarmonySeed, identifier)
-            tags = _coerce_list(entry.get("tags"))
-            weight = float(entry.get("weight", 1.0))
-            range_a = _verse_range(str(osis_a))
-            range_b = _verse_range(str(osis_b))
-            start_a = range_a[0] if range_a else None
-            end_a = range_a[1] if range_a else None
-            start_b = range_b[0] if range_b else None
-            end_b = range_b[1] if range_b else None
-
-            if record is None:
-                record_kwargs = {
+            rows.append(
+                {
                     "id": identifier,
                     "osis_a": osis_a_value,
                     "osis_b": osis_b_value,
                     "summary": summary,
                     "source": source,
-                    "tags": tags,
-                    "weight": weight,
+                    "tags": _coerce_list(entry.get("tags")),
+                    "weight": float(entry.get("weight", 1.0)),
                     "perspective": perspective,
+                    "start_verse_id_a": start_a,
+                    "end_verse_id_a": end_a,
+                    "start_verse_id": start_a,
+                    "end_verse_id": end_a,
+                    "start_verse_id_b": start_b,
+                    "end_verse_id_b": end_b,
                 }
-                if hasattr(HarmonySeed, "start_verse_id_a"):
-                    record_kwargs["start_verse_id_a"] = start_a
-                if hasattr(HarmonySeed, "end_verse_id_a"):
-                    record_kwargs["end_verse_id_a"] = end_a
-                if hasattr(HarmonySeed, "start_verse_id"):
-                    record_kwargs["start_verse_id"] = start_a
-                if hasattr(HarmonySeed, "end_verse_id"):
-                    record_kwargs["end_verse_id"] = end_a
-                if hasattr(HarmonySeed, "start_verse_id_b"):
-                    record_kwargs["start_verse_id_b"] = start_b
-                if hasattr(HarmonySeed, "end_verse_id_b"):
-                    record_kwargs["end_verse_id_b"] = end_b
-
-                record = HarmonySeed(**record_kwargs)
-                target_session.add(record)
-            else:
-                updated = False
-                if record.osis_a != osis_a_value:
-                    record.osis_a = osis_a_value
-                    updated = True
-                if record.osis_b != osis_b_value:
-                    record.osis_b = osis_b_value
-                    updated = True
-                if record.summary != summary:
-                    record.summary = summary
-                    updated = True
-                if record.source != source:
-                    record.source = source
-                    updated = True
-                if record.tags != tags:
-                    record.tags = tags
-                    updated = True
-                if record.weight != weight:
-                    record.weight = weight
-                    updated = True
-                if record.perspective != perspective:
-                    record.perspective = perspective
-                    updated = True
-                if hasattr(record, "start_verse_id_a") and record.start_verse_id_a != start_a:
-                    record.start_verse_id_a = start_a
-                    updated = True
-                if hasattr(record, "end_verse_id_a") and record.end_verse_id_a != end_a:
-                    record.end_verse_id_a = end_a
-                    updated = True
-                if hasattr(record, "start_verse_id_b") and record.start_verse_id_b != start_b:
-                    record.start_verse_id_b = start_b
-                    updated = True
-                if hasattr(record, "end_verse_id_b") and record.end_verse_id_b != end_b:
-                    record.end_verse_id_b = end_b
-                if hasattr(record, "start_verse_id") and hasattr(record, "end_verse_id"):
-                    if _assign_range(record, "start_verse_id", "end_verse_id", str(osis_a)):
-                        updated = True
-                if hasattr(record, "start_verse_id_b") and hasattr(record, "end_verse_id_b"):
-                    if _assign_range(
-                        record,
-                        "start_verse_id_b",
-                        "end_verse_id_b",
-                        str(osis_b),
-                    ):
-                        updated = True
-                if updated:
-                    record.updated_at = datetime.now(UTC)
-
-        if seen_ids:
-            target_session.execute(delete(HarmonySeed).where(~HarmonySeed.id.in_(seen_ids)))
-
-    _run_with_sqlite_lock_retry(session, "harmony", _load)
-
-
-def seed_commentary_excerpts(session: Session) -> None:
+            )
+        _apply_seed_rows(target_session, HarmonySeed, rows)
+
+    return _run_with_sqlite_lock_retry(session, "harmony", _load)
+
+
+def seed_commentary_excerpts(session: Session) -> bool:
     """Seed curated commentary excerpts into the catalogue."""
 
     table = CommentaryExcerptSeed.__table__
@@ -1187,14 +1130,14 @@ def seed_commentary_excerpts(session: Session) -> None:
         else None,
         allow_repair=True,
     ):
-        return
+        return False
     if not _ensure_range_columns(
         session,
         table,
         "commentary excerpt",
         ("start_verse_id", "end_verse_id"),
     ):
-        return
+        return False
 
     payload = _iter_seed_entries(
         SEED_ROOT / "commentaries.yaml",
@@ -1202,10 +1145,10 @@ def seed_commentary_excerpts(session: Session) -> None:
         SEED_ROOT / "commentaries_additional.yaml",
     )
     if not payload:
-        return
+        return True
 
     def _load(target_session: Session) -> None:
-        seen_ids: set[str] = set()
+        rows: list[dict[str, object]] = []
         for entry in payload:
             osis = entry.get("osis")
             excerpt = entry.get("excerpt")
@@ -1218,137 +1161,64 @@ def seed_commentary_excerpts(session: Session) -> None:
             identifier = str(
                 uuid5(
                     COMMENTARY_NAMESPACE,
-                    "|".join([str(osis).lower(), source.lower(), perspective, excerpt[:64].lower()]),
+                    "|".join(
+                        [osis_value.lower(), source.lower(), perspective, excerpt[:64].lower()]
+                    ),
                 )
             )
-            seen_ids.add(identifier)
-            record = target_session.get(CommentaryExcerptSeed, identifier)
-            tags = _coerce_list(entry.get("tags"))
-            title = entry.get("title")
-            verse_range = _verse_range(str(osis))
-            start_value = verse_range[0] if verse_range else None
-            end_value = verse_range[1] if verse_range else None
-
-            if record is None:
-                record = CommentaryExcerptSeed(
-                    id=identifier,
-                    osis=osis_value,
-                    title=title,
-                    excerpt=excerpt,
-                    source=source,
-                    perspective=perspective,
-                    tags=tags,
-                    start_verse_id=start_value,
-                    end_verse_id=end_value,
-                )
-                target_session.add(record)
-            else:
-                updated = False
-                if record.osis != osis_value:
-                    record.osis = osis_value
-                    updated = True
-                if record.title != title:
-                    record.title = title
-                    updated = True
-                if record.excerpt != excerpt:
-                    record.excerpt = excerpt
-                    updated = True
-                if record.source != source:
-                    record.source = source
-                    updated = True
-                if record.perspective != perspective:
-                    record.perspective = perspective
-                    updated = True
-                if record.tags != tags:
-                    record.tags = tags
-                    updated = True
-                if record.start_verse_id != start_verse_id:
-                    record.start_verse_id = start_verse_id
-                    updated = True
-                if record.end_verse_id != end_verse_id:
-                    record.end_verse_id = end_verse_id
-                if _assign_range(record, "start_verse_id", "end_verse_id", str(osis)):
-                    updated = True
-                if updated:
-                    record.updated_at = datetime.now(UTC)
-
-        if seen_ids:
-            target_session.execute(
-                delete(CommentaryExcerptSeed).where(~CommentaryExcerptSeed.id.in_(seen_ids))
+            rows.append(
+                {
+                    "id": identifier,
+                    "osis": osis_value,
+                    "title": entry.get("title"),
+                    "excerpt": excerpt,
+                    "source": source,
+                    "perspective": perspective,
+                    "tags": _coerce_list(entry.get("tags")),
+                    "start_verse_id": start_verse_id,
+                    "end_verse_id": end_verse_id,
+                }
             )
+        _apply_seed_rows(target_session, CommentaryExcerptSeed, rows)
 
-    _run_with_sqlite_lock_retry(session, "commentary excerpt", _load)
+    return _run_with_sqlite_lock_retry(session, "commentary excerpt", _load)
 
 
-def seed_geo_places(session: Session) -> None:
+def seed_geo_places(session: Session) -> bool:
     """Load geographical reference data."""
 
     seed_path = SEED_ROOT / "geo_places.json"
     if not seed_path.exists():
-        return
+        return True
 
     payload = _load_structured(seed_path)
     if not payload:
-        return
+        return True
 
     def _load(target_session: Session) -> None:
-        seen_slugs: set[str] = set()
+        rows: list[dict[str, object]] = []
         for entry in payload:
             slug = entry.get("slug")
             name = entry.get("name")
             if not slug or not name:
                 continue
-            aliases = _coerce_list(entry.get("aliases"))
-            sources = entry.get("sources")
-            confidence = entry.get("confidence")
             lat = entry.get("lat")
             lng = entry.get("lng")
+            confidence = entry.get("confidence")
+            rows.append(
+                {
+                    "slug": str(slug),
+                    "name": str(name),
+                    "lat": float(lat) if lat is not None else None,
+                    "lng": float(lng) if lng is not None else None,
+                    "confidence": float(confidence) if confidence is not None else None,
+                    "aliases": _coerce_list(entry.get("aliases")),
+                    "sources": entry.get("sources"),
+                }
+            )
+        _apply_seed_rows(target_session, GeoPlace, rows, key="slug")
 
-            seen_slugs.add(str(slug))
-            record = target_session.get(GeoPlace, slug)
-            if record is None:
-                record = GeoPlace(
-                    slug=str(slug),
-                    name=str(name),
-                    lat=float(lat) if lat is not None else None,
-                    lng=float(lng) if lng is not None else None,
-                    confidence=float(confidence) if confidence is not None else None,
-                    aliases=aliases,
-                    sources=sources,
-                )
-                target_session.add(record)
-            else:
-                new_lat = float(lat) if lat is not None else None
-                new_lng = float(lng) if lng is not None else None
-                new_confidence = float(confidence) if confidence is not None else None
-
-                changed = False
-                if record.name != name:
-                    record.name = str(name)
-                    changed = True
-                if record.lat != new_lat:
-                    record.lat = new_lat
-                    changed = True
-                if record.lng != new_lng:
-                    record.lng = new_lng
-                    changed = True
-                if record.confidence != new_confidence:
-                    record.confidence = new_confidence
-                    changed = True
-                if record.aliases != aliases:
-                    record.aliases = aliases
-                    changed = True
-                if record.sources != sources:
-                    record.sources = sources
-                    changed = True
-                if changed:
-                    record.updated_at = datetime.now(UTC)
-
-        target_session.execute(
-            delete(GeoPlace).where(~GeoPlace.slug.in_(seen_slugs))
-        )
-
-    _run_with_sqlite_lock_retry(session, "geo place", _load)
+    return _run_with_sqlite_lock_retry(session, "geo place", _load)
 
 
 
@@ -1424,13 +1294,91 @@ def _repair_missing_perspective_columns(session: Session) -> None:
                     _dispose_sqlite_engine(engine)
 
 
-def seed_reference_data(session: Session) -> None:
-    """Entry point for loading all bundled reference datasets."""
+def _seed_openbible_geo_dataset(session: Session) -> bool:
+    seed_openbible_geo(session)
+    return True
+
+
+def _reference_datasets() -> tuple[
+    tuple[str, tuple[Path, ...], tuple[Table, ...], Callable[[Session], bool]], ...
+]:
+    """Describe each bundled dataset as ``(label, inputs, tables, loader)``."""
+
+    return (
+        (
+            "contradiction",
+            (
+                SEED_ROOT / "contradictions.json",
+                SEED_ROOT / "contradictions_additional.json",
+                SEED_ROOT / "contradictions_catalog.yaml",
+            ),
+            (ContradictionSeed.__table__,),
+            lambda session: _run_seed_with_perspective_guard(
+                session, seed_contradiction_claims, "contradiction"
+            ),
+        ),
+        (
+            "harmony",
+            (
+                SEED_ROOT / "harmonies.yaml",
+                SEED_ROOT / "harmonies.json",
+                SEED_ROOT / "harmonies_additional.yaml",
+            ),
+            (HarmonySeed.__table__,),
+            lambda session: _run_seed_with_perspective_guard(
+                session, seed_harmony_claims, "harmony"
+            ),
+        ),
+        (
+            "commentary excerpt",
+            (
+                SEED_ROOT / "commentaries.yaml",
+                SEED_ROOT / "commentaries.json",
+                SEED_ROOT / "commentaries_additional.yaml",
+            ),
+            (CommentaryExcerptSeed.__table__,),
+            lambda session: _run_seed_with_perspective_guard(
+                session, seed_commentary_excerpts, "commentary excerpt"
+            ),
+        ),
+        (
+            "geo place",
+            (SEED_ROOT / "geo_places.json",),
+            (GeoPlace.__table__,),
+            lambda session: seed_geo_places(session) is not False,
+        ),
+        (
+            "openbible geo",
+            (OPENBIBLE_GEO_ROOT / "data", OPENBIBLE_GEO_ROOT / "geometry"),
+            (GeoAncientPlace.__table__, GeoModernLocation.__table__),
+            _seed_openbible_geo_dataset,
+        ),
+    )
+
+
+def seed_reference_data(session: Session, *, force: bool = False) -> None:
+    """Entry point for loading all bundled reference datasets.
+
+    Each dataset's input files are hashed and compared with the manifest stored
+    in ``app_settings``; datasets whose digest (and row count) are unchanged are
+    skipped entirely, so restarting a replica against an up-to-date database
+    only costs a handful of cheap queries. Pass ``force=True`` to re-apply
+    every dataset regardless of the manifest.
+    """
 
     logger.info("Seeding reference datasets during application startup")
     _repair_missing_perspective_columns(session)
-    _run_seed_with_perspective_guard(session, seed_contradiction_claims, "contradiction")
-    _run_seed_with_perspective_guard(session, seed_harmony_claims, "harmony")
-    _run_seed_with_perspective_guard(session, seed_commentary_excerpts, "commentary excerpt")
-    seed_geo_places(session)
-    seed_openbible_geo(session)
+    manifest = SeedManifest.load(session)
+    for label, inputs, tables, loader in _reference_datasets():
+        digest = dataset_digest(inputs)
+        current = not force and manifest.is_current(session, label, digest, tables)
+        # Loaders manage their own transactions; release the bookkeeping reads.
+        session.commit()
+        if current:
+            logger.debug("Skipping unchanged %s seeds", label)
+            continue
+        if loader(session):
+            manifest.record(session, label, digest, tables)
+        else:
+            manifest.forget(label)
+    manifest.save(session)
@@ -0,0 +1,677 @@
+"""Precomputed verse adjacency graph for multi-hop exploration.
+
+``get_verse_graph`` answers one hop by querying mentions and seed tables for a
+single verse. Walking further out would need another round of queries per
+frontier node, so this module compiles every verse relationship into a
+compressed sparse row (CSR) graph:
+
+* passage co-mentions (two references cited by the same passage),
+* contradiction and harmony seeds,
+* commentary excerpt seeds (verse → commentary leaf nodes), and
+* cross-references.
+
+Nodes are distinct OSIS references (plus commentary leaves) ordered by their
+first verse id so a query range is resolved to nodes with a binary search.
+The arrays are written as flat native-endian files and memory-mapped on load,
+so worker processes share one copy through the page cache.
+
+Rebuilds are incremental: edges are produced per *segment* (each seed table,
+the cross-reference table and each document's passages) and cached with a
+fingerprint of their source rows. Only segments whose fingerprint changed are
+recomputed before the CSR arrays are reassembled.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import shutil
+import sys
+import threading
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from theo.application.facades.settings import get_settings
+from theo.infrastructure.api.app.persistence_models import (
+    CommentaryExcerptSeed,
+    ContradictionSeed,
+    CrossReference,
+    Document,
+    HarmonySeed,
+    Passage,
+)
+
+from ..ingest.osis import expand_osis_reference
+from .verse_graph import _normalize_perspective, _normalize_tags
+
+logger = logging.getLogger(__name__)
+
+EDGE_KINDS: tuple[str, ...] = (
+    "co_mention",
+    "contradiction",
+    "harmony",
+    "commentary",
+    "crossref",
+)
+NODE_VERSE = 0
+NODE_COMMENTARY = 1
+
+FORMAT_VERSION = 1
+_COMMENTARY_PREFIX = "commentary:"
+_CURRENT_POINTER = "CURRENT"
+_SEGMENT_CACHE = "segments.json"
+# A passage citing dozens of references would add a quadratic number of
+# co-mention edges; only the first few distinct references are paired.
+MAX_CO_MENTION_REFERENCES = 12
+
+_KIND_CODES = {kind: code for code, kind in enumerate(EDGE_KINDS)}
+
+_ARRAY_FILES: dict[str, str] = {
+    "node_kind": "B",
+    "node_start": "i",
+    "node_end": "i",
+    "indptr": "i",
+    "indices": "i",
+    "edge_kind": "B",
+    "edge_weight": "f",
+    "edge_payload": "i",
+}
+
+
+@lru_cache(maxsize=16384)
+def _reference_bounds(reference: str) -> tuple[int, int] | None:
+    try:
+        verse_ids = expand_osis_reference(reference)
+    except Exception:  # pragma: no cover - defensive guard for malformed refs
+        return None
+    if not verse_ids:
+        return None
+    return min(verse_ids), max(verse_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class AdjacencyEdge:
+    """One traversed edge, oriented away from the query."""
+
+    source: int
+    target: int
+    kind: str
+    weight: float
+    payload: dict[str, Any] | None
+    depth: int
+
+
+@dataclass(slots=True)
+class Neighbourhood:
+    """Result of a k-hop traversal."""
+
+    depths: dict[int, int]
+    edges: list[AdjacencyEdge]
+
+
+class VerseAdjacency:
+    """Immutable CSR graph over verse references."""
+
+    def __init__(
+        self,
+        *,
+        labels: Sequence[str],
+        payloads: Sequence[dict[str, Any] | None],
+        verse_node_count: int,
+        max_span: int,
+        arrays: dict[str, Sequence[Any]],
+        handles: Sequence[Any] = (),
+    ) -> None:
+        self.labels = list(labels)
+        self.payloads = list(payloads)
+        self.verse_node_count = verse_node_count
+        self.max_span = max_span
+        self._arrays = arrays
+        self._handles = list(handles)
+        self._index = {label: node for node, label in enumerate(self.labels)}
+
+    @property
+    def node_count(self) -> int:
+        return len(self.labels)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._arrays["indices"])
+
+    def node_id(self, label: str) -> int | None:
+        return self._index.get(label)
+
+    def node_kind(self, node: int) -> int:
+        return self._arrays["node_kind"][node]
+
+    def node_bounds(self, node: int) -> tuple[int, int]:
+        return self._arrays["node_start"][node], self._arrays["node_end"][node]
+
+    def nodes_for_range(self, start: int, end: int) -> list[int]:
+        """Return verse nodes whose range intersects ``[start, end]``."""
+
+        starts = self._arrays["node_start"]
+        ends = self._arrays["node_end"]
+        lower = bisect_left(starts, start - self.max_span, 0, self.verse_node_count)
+        upper = bisect_right(starts, end, 0, self.verse_node_count)
+        return [node for node in range(lower, upper) if ends[node] >= start]
+
+    def neighbours(self, node: int) -> Iterable[tuple[int, int]]:
+        """Yield ``(neighbour, edge_index)`` pairs for ``node``."""
+
+        indptr = self._arrays["indptr"]
+        indices = self._arrays["indices"]
+        for edge in range(indptr[node], indptr[node + 1]):
+            yield indices[edge], edge
+
+    def neighbourhood(
+        self,
+        seeds: Iterable[int],
+        *,
+        depth: int,
+        kinds: Iterable[str] | None = None,
+    ) -> Neighbourhood:
+        """Breadth-first walk up to ``depth`` hops along edges of ``kinds``.
+
+        Each undirected edge is reported once, oriented from the endpoint
+        reached first. Commentary leaves are never expanded further.
+        """
+
+        allowed = {
+            _KIND_CODES[kind] for kind in (kinds or EDGE_KINDS) if kind in _KIND_CODES
+        }
+        edge_kind = self._arrays["edge_kind"]
+        edge_weight = self._arrays["edge_weight"]
+        edge_payload = self._arrays["edge_payload"]
+        node_kind = self._arrays["node_kind"]
+
+        depths: dict[int, int] = {node: 0 for node in seeds}
+        frontier = list(depths)
+        edges: list[AdjacencyEdge] = []
+        seen_edges: set[tuple[int, int, int]] = set()
+        for hop in range(1, depth + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                if node_kind[node] != NODE_VERSE:
+                    continue
+                for neighbour, edge in self.neighbours(node):
+                    code = edge_kind[edge]
+                    if code not in allowed:
+                        continue
+                    payload_index = edge_payload[edge]
+                    key = (min(node, neighbour), max(node, neighbour), payload_index)
+                    if payload_index < 0:
+                        key = (key[0], key[1], -1 - code)
+                    if key in seen_edges:
+                        continue
+                    if neighbour in depths and depths[neighbour] < hop - 1:
+                        continue
+                    seen_edges.add(key)
+                    edges.append(
+                        AdjacencyEdge(
+                            source=node,
+                            target=neighbour,
+                            kind=EDGE_KINDS[code],
+                            weight=float(edge_weight[edge]),
+                            payload=self.payloads[payload_index]
+                            if payload_index >= 0
+                            else None,
+                            depth=hop,
+                        )
+                    )
+                    if neighbour not in depths:
+                        depths[neighbour] = hop
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+            if not frontier:
+                break
+        return Neighbourhood(depths=depths, edges=edges)
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[Sequence[Any]], *, bounds: dict[str, tuple[int, int]]
+    ) -> "VerseAdjacency":
+        """Assemble a CSR graph from ``(kind, a, b, weight, payload)`` edges.
+
+        Payload-free edges between the same pair (co-mentions) are merged and
+        their weights summed.
+        """
+
+        merged: dict[tuple[str, str, str], float] = defaultdict(float)
+        seeded: list[tuple[str, str, str, float, dict[str, Any]]] = []
+        for kind, source, target, weight, payload in edges:
+            if source == target or kind not in _KIND_CODES:
+                continue
+            if source not in bounds or target not in bounds:
+                continue
+            if payload is None:
+                low, high = sorted((source, target))
+                merged[(kind, low, high)] += float(weight)
+            else:
+                seeded.append((kind, source, target, float(weight), payload))
+
+        used = {label for key in merged for label in key[1:]}
+        used.update(
+            label for _, source, target, _, _ in seeded for label in (source, target)
+        )
+        verse_labels = sorted(
+            (label for label in used if not label.startswith(_COMMENTARY_PREFIX)),
+            key=lambda label: (*bounds[label], label),
+        )
+        commentary_labels = sorted(
+            label for label in used if label.startswith(_COMMENTARY_PREFIX)
+        )
+        labels = verse_labels + commentary_labels
+        index = {label: node for node, label in enumerate(labels)}
+
+        payloads: list[dict[str, Any] | None] = []
+        adjacency: list[list[tuple[int, int, float, int]]] = [[] for _ in labels]
+        for (kind, low, high), weight in merged.items():
+            a, b = index[low], index[high]
+            code = _KIND_CODES[kind]
+            adjacency[a].append((b, code, weight, -1))
+            adjacency[b].append((a, code, weight, -1))
+        for kind, source, target, weight, payload in seeded:
+            a, b = index[source], index[target]
+            code = _KIND_CODES[kind]
+            payloads.append(payload)
+            adjacency[a].append((b, code, weight, len(payloads) - 1))
+            adjacency[b].append((a, code, weight, len(payloads) - 1))
+
+        arrays: dict[str, array] = {
+            name: array(code) for name, code in _ARRAY_FILES.items()
+        }
+        arrays["indptr"].append(0)
+        max_span = 0
+        for node, label in enumerate(labels):
+            start, end = bounds[label]
+            is_commentary = label.startswith(_COMMENTARY_PREFIX)
+            arrays["node_kind"].append(NODE_COMMENTARY if is_commentary else NODE_VERSE)
+            arrays["node_start"].append(start)
+            arrays["node_end"].append(end)
+            if not is_commentary:
+                max_span = max(max_span, end - start)
+            for neighbour, code, weight, payload_index in sorted(adjacency[node]):
+                arrays["indices"].append(neighbour)
+                arrays["edge_kind"].append(code)
+                arrays["edge_weight"].append(weight)
+                arrays["edge_payload"].append(payload_index)
+            arrays["indptr"].append(len(arrays["indices"]))
+
+        return cls(
+            labels=labels,
+            payloads=payloads,
+            verse_node_count=len(verse_labels),
+            max_span=max_span,
+            arrays=arrays,
+        )
+
+    def write(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, code in _ARRAY_FILES.items():
+            values = self._arrays[name]
+            data = values if isinstance(values, array) else array(code, values)
+            (directory / f"{name}.bin").write_bytes(data.tobytes())
+        meta = {
+            "format": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "labels": self.labels,
+            "payloads": self.payloads,
+            "verse_node_count": self.verse_node_count,
+            "max_span": self.max_span,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def open(cls, directory: Path) -> "VerseAdjacency":
+        """Load a graph written by :meth:`write`, memory-mapping its arrays."""
+
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported verse adjacency format in {directory}")
+        native = meta.get("byteorder") == sys.byteorder
+        arrays: dict[str, Sequence[Any]] = {}
+        handles: list[Any] = []
+        for name, code in _ARRAY_FILES.items():
+            path = directory / f"{name}.bin"
+            if not native or path.stat().st_size == 0:
+                values = array(code)
+                values.frombytes(path.read_bytes())
+                if not native:
+                    values.byteswap()
+                arrays[name] = values
+                continue
+            with path.open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            handles.append(mapped)
+            arrays[name] = memoryview(mapped).cast(code)
+        return cls(
+            labels=meta["labels"],
+            payloads=meta["payloads"],
+            verse_node_count=int(meta["verse_node_count"]),
+            max_span=int(meta["max_span"]),
+            arrays=arrays,
+            handles=handles,
+        )
+
+
+def _pair_payload(seed: Any, *, default_perspective: str) -> dict[str, Any]:
+    return {
+        "seed_id": seed.id,
+        "osis_a": seed.osis_a,
+        "osis_b": seed.osis_b,
+        "summary": seed.summary,
+        "source": seed.source,
+        "tags": _normalize_tags(seed.tags),
+        "weight": float(seed.weight) if seed.weight is not None else None,
+        "perspective": _normalize_perspective(
+            seed.perspective, default=default_perspective
+        ),
+    }
+
+
+def _pair_seed_edges(session: Session, model: Any, kind: str, perspective: str):
+    edges: list[list[Any]] = []
+    for seed in session.scalars(select(model).order_by(model.id)):
+        if not seed.osis_a or not seed.osis_b:
+            continue
+        payload = _pair_payload(seed, default_perspective=perspective)
+        edges.append(
+            [kind, seed.osis_a, seed.osis_b, payload["weight"] or 1.0, payload]
+        )
+    return edges
+
+
+def _commentary_edges(session: Session) -> list[list[Any]]:
+    edges: list[list[Any]] = []
+    for seed in session.scalars(
+        select(CommentaryExcerptSeed).order_by(CommentaryExcerptSeed.id)
+    ):
+        if not seed.osis:
+            continue
+        payload = {
+            "seed_id": seed.id,
+            "osis": seed.osis,
+            "title": seed.title,
+            "excerpt": seed.excerpt,
+            "source": seed.source,
+            "tags": _normalize_tags(seed.tags),
+            "perspective": _normalize_perspective(seed.perspective, default="neutral"),
+        }
+        edges.append(
+            ["commentary", seed.osis, f"{_COMMENTARY_PREFIX}{seed.id}", 1.0, payload]
+        )
+    return edges
+
+
+def _crossref_edges(session: Session) -> list[list[Any]]:
+    edges: list[list[Any]] = []
+    for row in session.scalars(select(CrossReference).order_by(CrossReference.id)):
+        payload = {
+            "seed_id": row.id,
+            "summary": row.summary,
+            "source": row.dataset,
+            "relation_type": row.relation_type,
+            "weight": row.weight,
+        }
+        edges.append(
+            ["crossref", row.source_osis, row.target_osis, row.weight or 1.0, payload]
+        )
+    return edges
+
+
+def _passage_references(osis_ref: str | None, meta: Any) -> list[str]:
+    references: list[str] = []
+    if isinstance(meta, dict):
+        values = meta.get("osis_refs_all")
+        if isinstance(values, (list, tuple)):
+            references.extend(str(value) for value in values if value)
+    if osis_ref:
+        references.append(osis_ref)
+    return list(dict.fromkeys(references))[:MAX_CO_MENTION_REFERENCES]
+
+
+def _document_edges(session: Session, document_id: str) -> list[list[Any]]:
+    edges: list[list[Any]] = []
+    for osis_ref, meta in session.execute(
+        select(Passage.osis_ref, Passage.meta)
+        .where(Passage.document_id == document_id)
+        .order_by(Passage.id)
+    ):
+        references = _passage_references(osis_ref, meta)
+        for offset, first in enumerate(references):
+            for second in references[offset + 1 :]:
+                edges.append(["co_mention", first, second, 1.0, None])
+    return edges
+
+
+def _table_fingerprint(session: Session, model: Any) -> list[Any]:
+    columns = [func.count()]
+    for name in ("updated_at", "created_at"):
+        column = getattr(model, name, None)
+        if column is not None:
+            columns.append(func.max(column))
+    row = session.execute(select(*columns).select_from(model)).one()
+    return [str(value) if value is not None else None for value in row]
+
+
+def _document_fingerprints(session: Session) -> dict[str, list[Any]]:
+    rows = session.execute(
+        select(Document.id, Document.updated_at, func.count(Passage.id))
+        .join(Passage, Passage.document_id == Document.id)
+        .group_by(Document.id, Document.updated_at)
+    )
+    return {
+        f"document:{document_id}": [str(updated_at), int(count)]
+        for document_id, updated_at, count in rows
+    }
+
+
+@dataclass(slots=True)
+class RebuildStats:
+    reused: int = 0
+    rebuilt: int = 0
+    removed: int = 0
+    nodes: int = 0
+    edges: int = 0
+    version: str | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+def default_adjacency_dir() -> Path:
+    return Path(get_settings().storage_root) / "verse_adjacency"
+
+
+def _read_segment_cache(directory: Path) -> dict[str, Any]:
+    path = directory / _SEGMENT_CACHE
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def rebuild_verse_adjacency(
+    session: Session, directory: Path | None = None
+) -> tuple[VerseAdjacency, RebuildStats]:
+    """Refresh changed edge segments and publish a new memory-mapped graph."""
+
+    directory = directory or default_adjacency_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    cache = _read_segment_cache(directory)
+    stats = RebuildStats()
+
+    producers = {
+        "seeds:contradiction": (
+            lambda: _table_fingerprint(session, ContradictionSeed),
+            lambda: _pair_seed_edges(
+                session, ContradictionSeed, "contradiction", "skeptical"
+            ),
+        ),
+        "seeds:harmony": (
+            lambda: _table_fingerprint(session, HarmonySeed),
+            lambda: _pair_seed_edges(session, HarmonySeed, "harmony", "apologetic"),
+        ),
+        "seeds:commentary": (
+            lambda: _table_fingerprint(session, CommentaryExcerptSeed),
+            lambda: _commentary_edges(session),
+        ),
+        "crossrefs": (
+            lambda: _table_fingerprint(session, CrossReference),
+            lambda: _crossref_edges(session),
+        ),
+    }
+
+    segments: dict[str, Any] = {}
+    fingerprints = {key: fingerprint() for key, (fingerprint, _) in producers.items()}
+    fingerprints.update(_document_fingerprints(session))
+    for key, fingerprint in fingerprints.items():
+        cached = cache.get(key)
+        if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+            segments[key] = cached
+            stats.reused += 1
+            continue
+        if key in producers:
+            edges = producers[key][1]()
+        else:
+            edges = _document_edges(session, key.split(":", 1)[1])
+        segments[key] = {"fingerprint": fingerprint, "edges": edges}
+        stats.rebuilt += 1
+    stats.removed = len(set(cache) - set(segments))
+
+    all_edges = [edge for segment in segments.values() for edge in segment["edges"]]
+    bounds: dict[str, tuple[int, int]] = {}
+    for _kind, source, target, _, payload in all_edges:
+        for label in (source, target):
+            if label in bounds:
+                continue
+            reference = (
+                payload.get("osis") if label.startswith(_COMMENTARY_PREFIX) else label
+            )
+            resolved = _reference_bounds(reference) if reference else None
+            if resolved is not None:
+                bounds[label] = resolved
+    adjacency = VerseAdjacency.from_edges(all_edges, bounds=bounds)
+
+    version = uuid.uuid4().hex
+    staging = directory / f".{version}.tmp"
+    adjacency.write(staging)
+    staging.rename(directory / version)
+    previous = _current_version(directory)
+    _write_atomic(directory / _SEGMENT_CACHE, json.dumps(segments))
+    _write_atomic(directory / _CURRENT_POINTER, version)
+    if previous and previous != version:
+        # Open readers keep their mappings; the files disappear once closed.
+        shutil.rmtree(directory / previous, ignore_errors=True)
+
+    stats.nodes = adjacency.node_count
+    stats.edges = adjacency.edge_count // 2
+    stats.version = version
+    logger.info(
+        "Verse adjacency rebuilt",
+        extra={
+            "reused_segments": stats.reused,
+            "rebuilt_segments": stats.rebuilt,
+            "nodes": stats.nodes,
+            "edges": stats.edges,
+        },
+    )
+    return adjacency, stats
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    staging.write_text(content, encoding="utf-8")
+    os.replace(staging, path)
+
+
+def _current_version(directory: Path) -> str | None:
+    try:
+        version = (directory / _CURRENT_POINTER).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return version or None
+
+
+_LOADED: dict[Path, tuple[str, VerseAdjacency]] = {}
+_BUILDING: set[Path] = set()
+_LOAD_LOCK = threading.Lock()
+
+
+def _build_in_background(engine: Any, directory: Path) -> None:
+    """Rebuild the graph for ``directory`` on a daemon thread, at most once."""
+
+    with _LOAD_LOCK:
+        if directory in _BUILDING:
+            return
+        _BUILDING.add(directory)
+
+    def _run() -> None:
+        try:
+            with Session(bind=engine) as session:
+                rebuild_verse_adjacency(session, directory)
+        except Exception:  # pragma: no cover - logged for operators
+            logger.exception("Background verse adjacency build failed")
+        finally:
+            with _LOAD_LOCK:
+                _BUILDING.discard(directory)
+
+    threading.Thread(target=_run, name="verse-adjacency-build", daemon=True).start()
+
+
+def get_verse_adjacency(
+    session: Session, directory: Path | None = None
+) -> VerseAdjacency:
+    """Return the published graph without building it on the request path.
+
+    When nothing has been published yet (or the published files are
+    unreadable) a rebuild is started in the background and the previously
+    loaded graph, or an empty one, is served until it lands. The scheduled
+    ``refresh_verse_adjacency`` task keeps the published graph current.
+    """
+
+    directory = (directory or default_adjacency_dir()).resolve()
+    with _LOAD_LOCK:
+        version = _current_version(directory)
+        loaded = _LOADED.get(directory)
+        if loaded is not None and loaded[0] == version:
+            return loaded[1]
+        if version is not None:
+            try:
+                adjacency = VerseAdjacency.open(directory / version)
+            except (OSError, ValueError):
+                logger.warning("Verse adjacency unreadable; rebuilding", exc_info=True)
+            else:
+                _LOADED[directory] = (version, adjacency)
+                return adjacency
+    # Use the engine rather than a connection the caller may be holding.
+    _build_in_background(session.get_bind().engine, directory)
+    if loaded is not None:
+        return loaded[1]
+    return VerseAdjacency.from_edges([], bounds={})
+
+
+__all__ = [
+    "AdjacencyEdge",
+    "EDGE_KINDS",
+    "Neighbourhood",
+    "NODE_COMMENTARY",
+    "NODE_VERSE",
+    "RebuildStats",
+    "VerseAdjacency",
+    "default_adjacency_dir",
+    "get_verse_adjacency",
+    "rebuild_verse_adjacency",
+]
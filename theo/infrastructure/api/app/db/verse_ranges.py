@@ -0,0 +1,233 @@
+"""Resumable backfill of canonical verse ranges for legacy passages.
+
+Passages written before verse ranges were tracked only carry an ``osis_ref``
+(and sometimes OSIS metadata), so verse lookups had to re-derive their ranges
+in Python on every request. :func:`backfill_verse_ranges` computes
+``osis_verse_ids``/``osis_start_verse_id``/``osis_end_verse_id`` for those rows
+in keyset-paginated batches, checkpointing after each batch so interrupted
+runs resume where they stopped. Once every batch has been applied the
+completion marker lets the verse retriever rely on the indexed range columns
+alone; ingest populates the same columns for new passages.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from theo.application.facades.settings_store import load_setting, save_setting
+from theo.infrastructure.api.app.persistence_models import Passage, PassageVerse
+
+from ..ingest.osis import canonical_verse_range
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_SETTING_KEY = "passages.verse_range_backfill"
+DEFAULT_BATCH_SIZE = 500
+
+_META_REFERENCE_KEYS = (
+    "primary_osis",
+    "osis_refs_all",
+    "osis_refs_detected",
+    "osis_refs_hints",
+    "osis_refs_unmatched",
+)
+
+
+def passage_reference_candidates(passage: Passage) -> list[str]:
+    """Collect OSIS reference strings associated with *passage*."""
+
+    references: set[str] = set()
+    if passage.osis_ref:
+        references.add(passage.osis_ref)
+
+    meta = passage.meta
+    if isinstance(meta, dict):
+        for key in _META_REFERENCE_KEYS:
+            value = meta.get(key)
+            if isinstance(value, str):
+                if value:
+                    references.add(value)
+            elif isinstance(value, (list, tuple, set)):
+                for item in value:
+                    if item:
+                        references.add(str(item))
+
+    return sorted(ref for ref in references if ref)
+
+
+def _normalise_ids(values: Any) -> list[int]:
+    normalised: list[int] = []
+    if not values:
+        return normalised
+    for value in values:
+        try:
+            normalised.append(int(value))
+        except (TypeError, ValueError):
+            continue
+    return normalised
+
+
+def resolve_passage_verse_ids(passage: Passage) -> list[int] | None:
+    """Return the sorted verse identifiers a legacy passage refers to.
+
+    Stored ``osis_verse_ids`` win over re-parsing references, mirroring the
+    order in which the retriever's Python fallback resolved ranges.
+    """
+
+    stored = _normalise_ids(passage.osis_verse_ids)
+    if stored:
+        return sorted(set(stored))
+    verse_ids, _, _ = canonical_verse_range(passage_reference_candidates(passage))
+    return verse_ids
+
+
+@dataclass(slots=True)
+class VerseRangeBackfillState:
+    """Checkpoint persisted between backfill batches."""
+
+    last_id: str | None = None
+    processed: int = 0
+    updated: int = 0
+    completed: bool = False
+    completed_at: str | None = None
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "VerseRangeBackfillState":
+        if not isinstance(payload, dict):
+            return cls()
+        return cls(
+            last_id=payload.get("last_id") or None,
+            processed=int(payload.get("processed") or 0),
+            updated=int(payload.get("updated") or 0),
+            completed=bool(payload.get("completed")),
+            completed_at=payload.get("completed_at") or None,
+        )
+
+
+def load_backfill_state(session: Session) -> VerseRangeBackfillState:
+    try:
+        payload = load_setting(session, BACKFILL_SETTING_KEY, default=None)
+    except (SQLAlchemyError, ValueError):
+        session.rollback()
+        logger.debug("Verse range backfill state unavailable", exc_info=True)
+        payload = None
+    return VerseRangeBackfillState.from_payload(payload)
+
+
+def verse_ranges_backfilled(session: Session) -> bool:
+    """Return ``True`` once every legacy passage has canonical range columns."""
+
+    return load_backfill_state(session).completed
+
+
+def _apply_batch(session: Session, batch: list[Passage]) -> int:
+    passage_ids = [passage.id for passage in batch]
+    linked = set(
+        session.scalars(
+            select(PassageVerse.passage_id)
+            .where(PassageVerse.passage_id.in_(passage_ids))
+            .distinct()
+        )
+    )
+
+    updated = 0
+    for passage in batch:
+        verse_ids = resolve_passage_verse_ids(passage)
+        if not verse_ids:
+            continue
+        if passage.osis_verse_ids is None:
+            passage.osis_verse_ids = verse_ids
+        passage.osis_start_verse_id = verse_ids[0]
+        passage.osis_end_verse_id = verse_ids[-1]
+        if passage.id not in linked:
+            session.add_all(
+                PassageVerse(passage_id=passage.id, verse_id=verse_id)
+                for verse_id in verse_ids
+            )
+        updated += 1
+    return updated
+
+
+def backfill_verse_ranges(
+    session: Session,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: int | None = None,
+    restart: bool = False,
+) -> VerseRangeBackfillState:
+    """Populate verse range columns for passages that lack them.
+
+    Batches are selected with keyset pagination on ``Passage.id`` and each
+    batch commits together with its checkpoint, so the job can be stopped at
+    any point (or bounded with ``max_batches``) and resumed later. ``restart``
+    discards the checkpoint and rescans from the beginning.
+    """
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    state = VerseRangeBackfillState() if restart else load_backfill_state(session)
+    if state.completed:
+        return state
+
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        stmt = (
+            select(Passage)
+            .where(
+                or_(
+                    Passage.osis_start_verse_id.is_(None),
+                    Passage.osis_end_verse_id.is_(None),
+                )
+            )
+            .order_by(Passage.id)
+            .limit(batch_size)
+        )
+        if state.last_id is not None:
+            stmt = stmt.where(Passage.id > state.last_id)
+        batch = list(session.scalars(stmt))
+        if not batch:
+            state.completed = True
+            state.completed_at = datetime.now(UTC).isoformat()
+            save_setting(session, BACKFILL_SETTING_KEY, asdict(state))
+            logger.info(
+                "Verse range backfill complete",
+                extra={"processed": state.processed, "updated": state.updated},
+            )
+            break
+
+        state.updated += _apply_batch(session, batch)
+        state.processed += len(batch)
+        state.last_id = batch[-1].id
+        # ``save_setting`` commits, persisting the batch and its checkpoint
+        # atomically.
+        save_setting(session, BACKFILL_SETTING_KEY, asdict(state))
+        batches += 1
+
+    return state
+
+
+def reset_verse_range_backfill(session: Session) -> None:
+    """Clear the completion marker so the retriever resumes legacy scans."""
+
+    save_setting(session, BACKFILL_SETTING_KEY, None)
+
+
+__all__ = [
+    "BACKFILL_SETTING_KEY",
+    "DEFAULT_BATCH_SIZE",
+    "VerseRangeBackfillState",
+    "backfill_verse_ranges",
+    "load_backfill_state",
+    "passage_reference_candidates",
+    "reset_verse_range_backfill",
+    "resolve_passage_verse_ids",
+    "verse_ranges_backfilled",
+]
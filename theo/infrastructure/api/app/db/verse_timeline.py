@@ -0,0 +1,494 @@
+"""Materialised verse timeline rollups.
+
+``get_verse_timeline`` used to bucket raw passages by publication date on
+every request, so timelines for heavily cited chapters cost time proportional
+to the corpus. The rollups in :class:`VerseTimelineRollup` store, for every
+timeline granularity and bucket, how many passages *start* at each verse and
+how many *cover* each verse after their first one. Overlap with a query range
+``[a, b]`` then reduces to one indexed range scan: the ``start`` rows for
+verses in ``[a, b]`` plus the ``cover`` row at ``a`` count every overlapping
+passage exactly once.
+
+Rollups are maintained per document. Ingest adds a document's contribution
+once its passages are flushed and deleting a document through the ORM
+subtracts it again; :func:`rebuild_verse_timeline` recomputes everything for
+backfills and reconciliation (for example after bulk SQL deletes or
+publication-date edits).
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    event,
+    insert,
+    inspect,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from theo.application.facades.settings_store import load_setting, save_setting
+from theo.infrastructure.api.app.persistence_models import (
+    Document,
+    Passage,
+    VerseTimelineDocument,
+    VerseTimelineRollup,
+)
+
+try:  # pragma: no cover - pythonbible is a hard dependency of ingest
+    from pythonbible.verses import VERSE_IDS as _CANONICAL_VERSE_IDS
+except ImportError:  # pragma: no cover - spans then only record their start
+    _CANONICAL_VERSE_IDS: tuple[int, ...] = ()
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES: tuple[str, ...] = ("week", "month", "quarter", "year")
+SAMPLE_LIMIT = 10
+READY_SETTING_KEY = "verse_timeline.rollups"
+
+_START = "start"
+_COVER = "cover"
+_LOOKUP_CHUNK = 500
+
+_rollups = VerseTimelineRollup.__table__
+_records = VerseTimelineDocument.__table__
+
+_RollupKey = tuple[str, date, str, int]
+
+
+def bucket_start(moment: date, granularity: str) -> date:
+    """Return the first day of the ``granularity`` bucket containing ``moment``."""
+
+    if granularity == "week":
+        return moment - timedelta(days=moment.weekday())
+    if granularity == "month":
+        return moment.replace(day=1)
+    if granularity == "quarter":
+        return moment.replace(month=3 * ((moment.month - 1) // 3) + 1, day=1)
+    if granularity == "year":
+        return moment.replace(month=1, day=1)
+    raise ValueError(f"Unsupported timeline granularity: {granularity}")
+
+
+def _covered_verses(start: int, end: int) -> Sequence[int]:
+    """Return canonical verse ids in ``(start, end]``."""
+
+    if end <= start:
+        return ()
+    lower = bisect_right(_CANONICAL_VERSE_IDS, start)
+    upper = bisect_right(_CANONICAL_VERSE_IDS, end)
+    return _CANONICAL_VERSE_IDS[lower:upper]
+
+
+def _reference_date(pub_date: object, created_at: object) -> date | None:
+    if isinstance(pub_date, datetime):
+        return pub_date.date()
+    if isinstance(pub_date, date):
+        return pub_date
+    if isinstance(created_at, datetime):
+        return created_at.date()
+    if isinstance(created_at, date):
+        return created_at
+    return None
+
+
+@dataclass(slots=True)
+class _Delta:
+    count: int = 0
+    documents: list[str] = field(default_factory=list)
+    passages: list[str] = field(default_factory=list)
+
+
+def _collect_deltas(
+    deltas: dict[_RollupKey, _Delta],
+    document_id: str,
+    reference_date: date,
+    passages: Iterable[Sequence[object]],
+) -> None:
+    buckets = [
+        (granularity, bucket_start(reference_date, granularity))
+        for granularity in GRANULARITIES
+    ]
+    for passage_id, start, end in passages:
+        start_id, end_id = int(start), int(end)
+        verse_keys = [(_START, start_id)]
+        verse_keys.extend(
+            (_COVER, verse_id) for verse_id in _covered_verses(start_id, end_id)
+        )
+        for granularity, bucket in buckets:
+            for kind, verse_id in verse_keys:
+                delta = deltas.setdefault(
+                    (granularity, bucket, kind, verse_id), _Delta()
+                )
+                delta.count += 1
+                # Rows only keep ``SAMPLE_LIMIT`` ids, and the ids a document
+                # contributes are always a prefix of its passages, so capped
+                # deltas still remove everything a document added.
+                if (
+                    len(delta.documents) < SAMPLE_LIMIT
+                    and document_id not in delta.documents
+                ):
+                    delta.documents.append(document_id)
+                if len(delta.passages) < SAMPLE_LIMIT:
+                    delta.passages.append(str(passage_id))
+
+
+def _merge_sample(
+    existing: Sequence[str] | None, additions: Iterable[str]
+) -> list[str]:
+    sample = list(existing or [])
+    for value in additions:
+        if len(sample) >= SAMPLE_LIMIT:
+            break
+        if value not in sample:
+            sample.append(value)
+    return sample
+
+
+def _apply_deltas(
+    connection: Connection, deltas: dict[_RollupKey, _Delta], *, sign: int
+) -> None:
+    grouped: dict[tuple[str, date, str], dict[int, _Delta]] = defaultdict(dict)
+    for (granularity, bucket, kind, verse_id), delta in deltas.items():
+        grouped[(granularity, bucket, kind)][verse_id] = delta
+
+    inserts: list[dict[str, object]] = []
+    updates: list[dict[str, object]] = []
+    removals: list[dict[str, object]] = []
+    for (granularity, bucket, kind), by_verse in grouped.items():
+        verse_ids = sorted(by_verse)
+        for offset in range(0, len(verse_ids), _LOOKUP_CHUNK):
+            chunk = verse_ids[offset : offset + _LOOKUP_CHUNK]
+            existing = {
+                row.verse_id: row
+                for row in connection.execute(
+                    select(_rollups).where(
+                        _rollups.c.granularity == granularity,
+                        _rollups.c.bucket_start == bucket,
+                        _rollups.c.kind == kind,
+                        _rollups.c.verse_id.in_(chunk),
+                    )
+                )
+            }
+            for verse_id in chunk:
+                delta = by_verse[verse_id]
+                key = {
+                    "k_granularity": granularity,
+                    "k_bucket_start": bucket,
+                    "k_kind": kind,
+                    "k_verse_id": verse_id,
+                }
+                row = existing.get(verse_id)
+                if sign > 0:
+                    if row is None:
+                        inserts.append(
+                            {
+                                "granularity": granularity,
+                                "bucket_start": bucket,
+                                "kind": kind,
+                                "verse_id": verse_id,
+                                "mention_count": delta.count,
+                                "document_ids": delta.documents[:SAMPLE_LIMIT],
+                                "passage_ids": delta.passages[:SAMPLE_LIMIT],
+                            }
+                        )
+                        continue
+                    updates.append(
+                        {
+                            **key,
+                            "mention_count": row.mention_count + delta.count,
+                            "document_ids": _merge_sample(
+                                row.document_ids, delta.documents
+                            ),
+                            "passage_ids": _merge_sample(
+                                row.passage_ids, delta.passages
+                            ),
+                        }
+                    )
+                    continue
+                if row is None:
+                    continue
+                remaining = row.mention_count - delta.count
+                if remaining <= 0:
+                    removals.append(key)
+                    continue
+                updates.append(
+                    {
+                        **key,
+                        "mention_count": remaining,
+                        "document_ids": [
+                            value
+                            for value in row.document_ids or []
+                            if value not in delta.documents
+                        ],
+                        "passage_ids": [
+                            value
+                            for value in row.passage_ids or []
+                            if value not in delta.passages
+                        ],
+                    }
+                )
+
+    key_clause = and_(
+        _rollups.c.granularity == bindparam("k_granularity"),
+        _rollups.c.bucket_start == bindparam("k_bucket_start"),
+        _rollups.c.kind == bindparam("k_kind"),
+        _rollups.c.verse_id == bindparam("k_verse_id"),
+    )
+    if inserts:
+        connection.execute(insert(_rollups), inserts)
+    if updates:
+        connection.execute(
+            update(_rollups)
+            .where(key_clause)
+            .values(
+                mention_count=bindparam("mention_count"),
+                document_ids=bindparam("document_ids"),
+                passage_ids=bindparam("passage_ids"),
+            ),
+            updates,
+        )
+    if removals:
+        connection.execute(delete(_rollups).where(key_clause), removals)
+
+
+def _document_passages(connection: Connection, document_id: str) -> list[list[object]]:
+    passages = Passage.__table__
+    rows = connection.execute(
+        select(
+            passages.c.id, passages.c.osis_start_verse_id, passages.c.osis_end_verse_id
+        )
+        .where(passages.c.document_id == document_id)
+        .where(passages.c.osis_start_verse_id.isnot(None))
+        .where(passages.c.osis_end_verse_id.isnot(None))
+        .order_by(passages.c.id)
+    )
+    return [[str(row[0]), int(row[1]), int(row[2])] for row in rows]
+
+
+def remove_document_from_timeline(connection: Connection, document_id: str) -> None:
+    """Subtract the contribution previously recorded for ``document_id``."""
+
+    record = connection.execute(
+        select(_records.c.reference_date, _records.c.passages).where(
+            _records.c.document_id == document_id
+        )
+    ).first()
+    if record is None:
+        return
+    reference_date, passages = record
+    deltas: dict[_RollupKey, _Delta] = {}
+    _collect_deltas(deltas, document_id, reference_date, passages or [])
+    _apply_deltas(connection, deltas, sign=-1)
+    connection.execute(delete(_records).where(_records.c.document_id == document_id))
+
+
+def add_document_to_timeline(connection: Connection, document_id: str) -> None:
+    """Add (or refresh) the rollup contribution of ``document_id``."""
+
+    remove_document_from_timeline(connection, document_id)
+    documents = Document.__table__
+    row = connection.execute(
+        select(documents.c.pub_date, documents.c.created_at).where(
+            documents.c.id == document_id
+        )
+    ).first()
+    if row is None:
+        return
+    reference_date = _reference_date(row[0], row[1])
+    passages = _document_passages(connection, document_id)
+    if reference_date is None or not passages:
+        return
+    deltas: dict[_RollupKey, _Delta] = {}
+    _collect_deltas(deltas, document_id, reference_date, passages)
+    _apply_deltas(connection, deltas, sign=1)
+    connection.execute(
+        insert(_records).values(
+            document_id=document_id,
+            reference_date=reference_date,
+            passages=passages,
+        )
+    )
+
+
+_TABLES_PRESENT: "WeakKeyDictionary[Engine, bool]" = WeakKeyDictionary()
+
+
+def _rollup_tables_present(connection: Connection) -> bool:
+    engine = connection.engine
+    present = _TABLES_PRESENT.get(engine)
+    if present is None:
+        present = inspect(connection).has_table(_records.name)
+        _TABLES_PRESENT[engine] = present
+    return present
+
+
+def timeline_rollups_ready(session: Session) -> bool:
+    """Return ``True`` once :func:`rebuild_verse_timeline` has populated rollups."""
+
+    try:
+        payload = load_setting(session, READY_SETTING_KEY, default=None)
+    except (SQLAlchemyError, ValueError):
+        session.rollback()
+        logger.debug("Verse timeline rollup state unavailable", exc_info=True)
+        return False
+    return isinstance(payload, dict) and bool(payload.get("ready"))
+
+
+def record_document_timeline(session: Session, document_id: str) -> None:
+    """Maintain rollups for a freshly persisted document when they are in use.
+
+    Runs inside the ingest transaction, so lookup failures propagate instead
+    of rolling the caller's session back.
+    """
+
+    connection = session.connection()
+    if not _rollup_tables_present(connection):
+        return
+    payload = load_setting(session, READY_SETTING_KEY, default=None)
+    if isinstance(payload, dict) and payload.get("ready"):
+        add_document_to_timeline(connection, document_id)
+
+
+def rebuild_verse_timeline(session: Session, *, batch_size: int = 500) -> int:
+    """Recompute every rollup from passages; return the number of documents."""
+
+    connection = session.connection()
+    connection.execute(delete(_rollups))
+    connection.execute(delete(_records))
+
+    documents = Document.__table__
+    passages_table = Passage.__table__
+    total = 0
+    last_id: str | None = None
+    while True:
+        stmt = (
+            select(documents.c.id, documents.c.pub_date, documents.c.created_at)
+            .order_by(documents.c.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            stmt = stmt.where(documents.c.id > last_id)
+        batch = connection.execute(stmt).all()
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        dates = {
+            row[0]: _reference_date(row[1], row[2])
+            for row in batch
+            if _reference_date(row[1], row[2]) is not None
+        }
+        by_document: dict[str, list[list[object]]] = defaultdict(list)
+        if dates:
+            for passage_id, document_id, start, end in connection.execute(
+                select(
+                    passages_table.c.id,
+                    passages_table.c.document_id,
+                    passages_table.c.osis_start_verse_id,
+                    passages_table.c.osis_end_verse_id,
+                )
+                .where(passages_table.c.document_id.in_(list(dates)))
+                .where(passages_table.c.osis_start_verse_id.isnot(None))
+                .where(passages_table.c.osis_end_verse_id.isnot(None))
+                .order_by(passages_table.c.id)
+            ):
+                by_document[document_id].append([str(passage_id), int(start), int(end)])
+        # Apply each batch before reading the next so memory stays bounded
+        # by ``batch_size`` documents rather than the whole corpus.
+        deltas: dict[_RollupKey, _Delta] = {}
+        records: list[dict[str, object]] = []
+        for document_id, passages in by_document.items():
+            reference_date = dates[document_id]
+            _collect_deltas(deltas, document_id, reference_date, passages)
+            records.append(
+                {
+                    "document_id": document_id,
+                    "reference_date": reference_date,
+                    "passages": passages,
+                }
+            )
+        _apply_deltas(connection, deltas, sign=1)
+        if records:
+            connection.execute(insert(_records), records)
+        total += len(records)
+
+    save_setting(session, READY_SETTING_KEY, {"ready": True, "documents": total})
+    logger.info("Verse timeline rollups rebuilt", extra={"documents": total})
+    return total
+
+
+@dataclass(slots=True)
+class TimelineRollupBucket:
+    bucket_start: date
+    count: int = 0
+    document_ids: list[str] = field(default_factory=list)
+    passage_ids: list[str] = field(default_factory=list)
+
+
+def query_timeline_rollups(
+    session: Session, range_start: int, range_end: int, granularity: str
+) -> list[TimelineRollupBucket]:
+    """Return per-bucket mention counts for passages overlapping the verse range."""
+
+    rows = session.execute(
+        select(
+            _rollups.c.bucket_start,
+            _rollups.c.mention_count,
+            _rollups.c.document_ids,
+            _rollups.c.passage_ids,
+        ).where(
+            _rollups.c.granularity == granularity,
+            or_(
+                and_(
+                    _rollups.c.kind == _START,
+                    _rollups.c.verse_id.between(range_start, range_end),
+                ),
+                and_(_rollups.c.kind == _COVER, _rollups.c.verse_id == range_start),
+            ),
+        )
+    )
+    buckets: dict[date, TimelineRollupBucket] = {}
+    for bucket, count, document_ids, passage_ids in rows:
+        entry = buckets.setdefault(bucket, TimelineRollupBucket(bucket_start=bucket))
+        entry.count += int(count or 0)
+        entry.document_ids.extend(document_ids or [])
+        entry.passage_ids.extend(passage_ids or [])
+    for entry in buckets.values():
+        entry.document_ids = sorted(set(entry.document_ids))
+        entry.passage_ids = sorted(set(entry.passage_ids))
+    return [buckets[key] for key in sorted(buckets)]
+
+
+@event.listens_for(Document, "before_delete")
+def _remove_deleted_document(_mapper, connection: Connection, target: Document) -> None:
+    if _rollup_tables_present(connection):
+        remove_document_from_timeline(connection, target.id)
+
+
+__all__ = [
+    "GRANULARITIES",
+    "READY_SETTING_KEY",
+    "SAMPLE_LIMIT",
+    "TimelineRollupBucket",
+    "add_document_to_timeline",
+    "bucket_start",
+    "query_timeline_rollups",
+    "rebuild_verse_timeline",
+    "record_document_timeline",
+    "remove_document_from_timeline",
+    "timeline_rollups_ready",
+]
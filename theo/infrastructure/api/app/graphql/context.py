@@ -12,6 +12,8 @@ from theo.application.services import ApplicationContainer
 from theo.application.security import Principal
 from theo.application.services.bootstrap import resolve_application
 
+from .loaders import GraphQLLoaders
+
 
 class GraphQLContext(BaseContext):
     """Request-scoped objects made available to GraphQL resolvers."""
@@ -31,6 +33,7 @@ class GraphQLContext(BaseContext):
         self.principal = principal
         self.application = application
         self.research_service = research_service
+        self.loaders = GraphQLLoaders(session)
 
 
 async def get_graphql_context(
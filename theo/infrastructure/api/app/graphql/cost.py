@@ -0,0 +1,182 @@
+"""Static query cost analysis guarding GraphQL fan-out."""
+
+from __future__ import annotations
+
+from typing import Type
+
+from strawberry.extensions import AddValidationRules
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    ValidationContext,
+    ValidationRule,
+    get_named_type,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+)
+
+DEFAULT_MAX_QUERY_COST = 5000
+MAX_PAGE_SIZE = 100
+# Assumed length of list fields that take no paging argument (edges, nodes,
+# annotations, ...).
+DEFAULT_LIST_SIZE = 20
+PAGE_ARGUMENTS = ("limit", "k")
+
+
+class QueryCostLimiter(AddValidationRules):
+    """Reject operations whose worst-case object count exceeds ``max_cost``.
+
+    Every non-leaf field costs the number of objects it can resolve, which is
+    its own list size multiplied by the list sizes of its ancestors. Paging
+    arguments given as literals are taken at face value; arguments passed as
+    variables are assumed to hit ``max_page_size`` because variables are not
+    known during validation.
+    """
+
+    def __init__(
+        self,
+        max_cost: int = DEFAULT_MAX_QUERY_COST,
+        *,
+        max_page_size: int = MAX_PAGE_SIZE,
+        default_list_size: int = DEFAULT_LIST_SIZE,
+    ) -> None:
+        super().__init__(
+            [create_cost_validator(max_cost, max_page_size, default_list_size)]
+        )
+
+
+def _list_size(node: FieldNode, *, max_page_size: int, default_list_size: int) -> int:
+    for argument in node.arguments or ():
+        if argument.name.value not in PAGE_ARGUMENTS:
+            continue
+        if isinstance(argument.value, IntValueNode):
+            return max(1, int(argument.value.value))
+        return max_page_size
+    return default_list_size
+
+
+def estimate_cost(
+    context: ValidationContext,
+    selection_set: SelectionSetNode | None,
+    parent_type: GraphQLObjectType,
+    multiplier: int,
+    *,
+    max_page_size: int,
+    default_list_size: int,
+    visited_fragments: frozenset[str] = frozenset(),
+) -> int:
+    """Return the worst-case number of objects resolved by *selection_set*."""
+
+    if selection_set is None:
+        return 0
+    total = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            name = selection.name.value
+            if name.startswith("__"):
+                continue
+            field = parent_type.fields.get(name)
+            if field is None:
+                continue
+            field_type = get_nullable_type(field.type)
+            named_type = get_named_type(field_type)
+            if is_leaf_type(named_type) or not isinstance(
+                named_type, GraphQLObjectType
+            ):
+                continue
+            size = (
+                _list_size(
+                    selection,
+                    max_page_size=max_page_size,
+                    default_list_size=default_list_size,
+                )
+                if is_list_type(field_type)
+                else 1
+            )
+            instances = multiplier * size
+            total += instances + estimate_cost(
+                context,
+                selection.selection_set,
+                named_type,
+                instances,
+                max_page_size=max_page_size,
+                default_list_size=default_list_size,
+                visited_fragments=visited_fragments,
+            )
+        elif isinstance(selection, InlineFragmentNode):
+            total += estimate_cost(
+                context,
+                selection.selection_set,
+                parent_type,
+                multiplier,
+                max_page_size=max_page_size,
+                default_list_size=default_list_size,
+                visited_fragments=visited_fragments,
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            if fragment is None or name in visited_fragments:
+                continue
+            total += estimate_cost(
+                context,
+                fragment.selection_set,
+                parent_type,
+                multiplier,
+                max_page_size=max_page_size,
+                default_list_size=default_list_size,
+                visited_fragments=visited_fragments | {name},
+            )
+    return total
+
+
+def create_cost_validator(
+    max_cost: int, max_page_size: int, default_list_size: int
+) -> Type[ValidationRule]:
+    class QueryCostValidator(ValidationRule):
+        def enter_operation_definition(
+            self, node: OperationDefinitionNode, *_args
+        ) -> None:
+            schema = self.context.schema
+            root = {
+                OperationType.QUERY: schema.query_type,
+                OperationType.MUTATION: schema.mutation_type,
+                OperationType.SUBSCRIPTION: schema.subscription_type,
+            }.get(node.operation)
+            if root is None:
+                return
+            cost = estimate_cost(
+                self.context,
+                node.selection_set,
+                root,
+                1,
+                max_page_size=max_page_size,
+                default_list_size=default_list_size,
+            )
+            if cost > max_cost:
+                self.report_error(
+                    GraphQLError(
+                        f"Query cost {cost} exceeds the maximum of {max_cost}.",
+                        node,
+                    )
+                )
+
+    return QueryCostValidator
+
+
+__all__ = [
+    "DEFAULT_MAX_QUERY_COST",
+    "MAX_PAGE_SIZE",
+    "QueryCostLimiter",
+    "create_cost_validator",
+    "estimate_cost",
+]
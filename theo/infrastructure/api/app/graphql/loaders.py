@@ -0,0 +1,78 @@
+"""Per-request DataLoaders that batch GraphQL lookups into IN-queries."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from strawberry.dataloader import DataLoader
+
+from theo.infrastructure.api.app.persistence_models import Document, Passage
+
+from ..models.documents import DocumentAnnotationResponse
+from ..retriever.annotations import load_annotations_for_documents
+
+
+class GraphQLLoaders:
+    """DataLoaders bound to the session of a single GraphQL request.
+
+    Each loader coalesces every key requested while resolving one level of the
+    query into a single ``IN`` query, so a list of fifty passages asking for
+    their documents costs one statement rather than fifty. Loaders cache per
+    request only; a fresh instance is created for every execution context.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self.documents: DataLoader[str, Document | None] = DataLoader(
+            load_fn=self._load_documents
+        )
+        self.passages: DataLoader[str, Passage | None] = DataLoader(
+            load_fn=self._load_passages
+        )
+        self.passages_by_document: DataLoader[str, list[Passage]] = DataLoader(
+            load_fn=self._load_passages_by_document
+        )
+        self.annotations_by_document: DataLoader[
+            str, list[DocumentAnnotationResponse]
+        ] = DataLoader(load_fn=self._load_annotations_by_document)
+
+    async def _load_documents(self, keys: Sequence[str]) -> list[Document | None]:
+        rows = self._session.scalars(select(Document).where(Document.id.in_(keys)))
+        by_id = {row.id: row for row in rows}
+        return [by_id.get(key) for key in keys]
+
+    async def _load_passages(self, keys: Sequence[str]) -> list[Passage | None]:
+        rows = self._session.scalars(select(Passage).where(Passage.id.in_(keys)))
+        by_id = {row.id: row for row in rows}
+        return [by_id.get(key) for key in keys]
+
+    async def _load_passages_by_document(
+        self, keys: Sequence[str]
+    ) -> list[list[Passage]]:
+        stmt = (
+            select(Passage)
+            .where(Passage.document_id.in_(keys))
+            .order_by(
+                Passage.document_id,
+                Passage.page_no.asc(),
+                Passage.t_start.asc(),
+                Passage.start_char.asc(),
+            )
+        )
+        grouped: dict[str, list[Passage]] = defaultdict(list)
+        for passage in self._session.scalars(stmt):
+            grouped[passage.document_id].append(passage)
+            self.passages.prime(passage.id, passage)
+        return [grouped.get(key, []) for key in keys]
+
+    async def _load_annotations_by_document(
+        self, keys: Sequence[str]
+    ) -> list[list[DocumentAnnotationResponse]]:
+        grouped = load_annotations_for_documents(self._session, keys)
+        return [list(grouped.get(key, [])) for key in keys]
+
+
+__all__ = ["GraphQLLoaders"]
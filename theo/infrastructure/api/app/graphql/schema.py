@@ -9,16 +9,38 @@ from strawberry.types import Info
 
 from theo.domain import DocumentId
 
+from ..models.search import HybridSearchFilters, HybridSearchRequest
+from ..models.verses import VerseMentionsFilters
+from ..retriever.graph import get_verse_graph
+from ..retriever.hybrid import hybrid_search
+from ..retriever.verses import get_mentions_for_osis
 from .context import GraphQLContext
+from .cost import MAX_PAGE_SIZE, QueryCostLimiter
 from .types import (
     DocumentInput,
     DocumentType,
     IngestDocumentPayload,
     InsightType,
+    PassageType,
+    SearchResultType,
+    VerseGraphType,
+    VerseMentionType,
     VerseType,
 )
 
 
+def _page_size(value: int) -> int:
+    return max(1, min(int(value), MAX_PAGE_SIZE))
+
+
+def _mention_filters(
+    source_type: str | None, collection: str | None, author: str | None
+) -> VerseMentionsFilters:
+    return VerseMentionsFilters(
+        source_type=source_type, collection=collection, author=author
+    )
+
+
 @strawberry.type
 class Query:
     """Root GraphQL query type."""
@@ -81,6 +103,99 @@ class Query:
             insights.append(InsightType.from_overview("manuscript", bullet))
         return insights
 
+    @strawberry.field
+    def search(
+        self,
+        info: Info[GraphQLContext, Any],
+        query: str | None = None,
+        osis: str | None = None,
+        k: int = 10,
+        collection: str | None = None,
+        author: str | None = None,
+        source_type: str | None = None,
+    ) -> list[SearchResultType]:
+        """Run hybrid lexical/vector search over indexed passages."""
+
+        request = HybridSearchRequest(
+            query=query,
+            osis=osis,
+            k=_page_size(k),
+            filters=HybridSearchFilters(
+                collection=collection, author=author, source_type=source_type
+            ),
+        )
+        results = hybrid_search(info.context.session, request)
+        return [SearchResultType.from_result(result) for result in results]
+
+    @strawberry.field
+    def verse_mentions(
+        self,
+        info: Info[GraphQLContext, Any],
+        osis: str,
+        limit: int = 50,
+        after: str | None = None,
+        source_type: str | None = None,
+        collection: str | None = None,
+        author: str | None = None,
+    ) -> list[VerseMentionType]:
+        """Return passages mentioning ``osis``, paginated by passage id."""
+
+        mentions = get_mentions_for_osis(
+            info.context.session,
+            osis,
+            _mention_filters(source_type, collection, author),
+            limit=_page_size(limit),
+            after=after,
+        )
+        return [
+            VerseMentionType(
+                passage=PassageType.from_record(mention.passage),
+                context_snippet=mention.context_snippet,
+            )
+            for mention in mentions
+        ]
+
+    @strawberry.field
+    def verse_graph(
+        self,
+        info: Info[GraphQLContext, Any],
+        osis: str,
+        depth: int = 1,
+        edge_kinds: list[str] | None = None,
+        source_type: str | None = None,
+        collection: str | None = None,
+        author: str | None = None,
+    ) -> VerseGraphType:
+        """Return the mention and relationship graph around ``osis``."""
+
+        if not 1 <= depth <= 3:
+            raise ValueError("depth must be between 1 and 3")
+        graph = get_verse_graph(
+            info.context.session,
+            osis,
+            _mention_filters(source_type, collection, author),
+            depth=depth,
+            edge_kinds=edge_kinds,
+        )
+        return VerseGraphType.from_response(graph)
+
+    @strawberry.field
+    async def passages_by_document(
+        self,
+        info: Info[GraphQLContext, Any],
+        document_id: strawberry.ID,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[PassageType]:
+        """Return a document's passages in reading order."""
+
+        passages = await info.context.loaders.passages_by_document.load(
+            str(document_id)
+        )
+        start = max(0, offset)
+        window = passages[start : start + _page_size(limit)]
+        return [PassageType.from_record(passage) for passage in window]
+
 
 @strawberry.type
 class Mutation:
@@ -99,6 +214,10 @@ class Mutation:
         return IngestDocumentPayload.from_document_id(document_id)
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[QueryCostLimiter()],
+)
 
 __all__ = ["schema", "Query", "Mutation"]
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import strawberry
+from strawberry.types import Info
 
 from theo.domain import Document, DocumentId, DocumentMetadata
 from theo.domain.research.overview import OverviewBullet
 from theo.domain.research.scripture import Verse as DomainVerse
 
+from ..models.documents import DocumentAnnotationResponse
+from ..models.search import HybridSearchResult
+from ..models.verses import VerseGraphEdge, VerseGraphNode, VerseGraphResponse
+from .context import GraphQLContext
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from theo.infrastructure.api.app.persistence_models import (
+        Document as DocumentRecord,
+    )
+
 
 @strawberry.type
 class DocumentMetadataType:
@@ -140,12 +152,257 @@ class IngestDocumentPayload:
         return IngestDocumentPayload(document_id=str(document_id))
 
 
+@strawberry.type
+class AnnotationType:
+    """Annotation attached to an indexed document."""
+
+    id: strawberry.ID
+    document_id: strawberry.ID = strawberry.field(name="documentId")
+    type: str
+    body: str
+    passage_ids: list[str] = strawberry.field(name="passageIds")
+    stance: str | None = None
+    created_at: datetime | None = strawberry.field(default=None, name="createdAt")
+
+    @staticmethod
+    def from_response(annotation: DocumentAnnotationResponse) -> "AnnotationType":
+        return AnnotationType(
+            id=annotation.id,
+            document_id=annotation.document_id,
+            type=annotation.type,
+            body=annotation.body,
+            passage_ids=list(annotation.passage_ids),
+            stance=annotation.stance,
+            created_at=annotation.created_at,
+        )
+
+
+@strawberry.type
+class DocumentSummaryType:
+    """Indexed document row resolved through the request's DataLoaders."""
+
+    id: strawberry.ID
+    title: str | None = None
+    collection: str | None = None
+    source_type: str | None = strawberry.field(default=None, name="sourceType")
+    source_url: str | None = strawberry.field(default=None, name="sourceUrl")
+    authors: list[str] = strawberry.field(default_factory=list)
+    year: int | None = None
+    created_at: datetime | None = strawberry.field(default=None, name="createdAt")
+
+    @strawberry.field
+    async def passages(
+        self,
+        info: Info[GraphQLContext, Any],
+        limit: int = 50,
+    ) -> list["PassageType"]:
+        """Return the document's passages in reading order."""
+
+        passages = await info.context.loaders.passages_by_document.load(str(self.id))
+        return [PassageType.from_record(passage) for passage in passages[:limit]]
+
+    @strawberry.field
+    async def annotations(
+        self, info: Info[GraphQLContext, Any]
+    ) -> list[AnnotationType]:
+        """Return annotations recorded against the document."""
+
+        annotations = await info.context.loaders.annotations_by_document.load(
+            str(self.id)
+        )
+        return [AnnotationType.from_response(item) for item in annotations]
+
+    @staticmethod
+    def from_record(record: "DocumentRecord") -> "DocumentSummaryType":
+        return DocumentSummaryType(
+            id=record.id,
+            title=record.title,
+            collection=record.collection,
+            source_type=record.source_type,
+            source_url=record.source_url,
+            authors=list(record.authors or []),
+            year=record.year,
+            created_at=record.created_at,
+        )
+
+
+@strawberry.type
+class PassageType:
+    """A passage of an indexed document."""
+
+    id: strawberry.ID
+    document_id: strawberry.ID = strawberry.field(name="documentId")
+    text: str
+    osis_ref: str | None = strawberry.field(default=None, name="osisRef")
+    page_no: int | None = strawberry.field(default=None, name="pageNo")
+    t_start: float | None = strawberry.field(default=None, name="tStart")
+    t_end: float | None = strawberry.field(default=None, name="tEnd")
+    start_char: int | None = strawberry.field(default=None, name="startChar")
+    end_char: int | None = strawberry.field(default=None, name="endChar")
+
+    @strawberry.field
+    async def document(
+        self, info: Info[GraphQLContext, Any]
+    ) -> DocumentSummaryType | None:
+        """Return the document containing the passage."""
+
+        record = await info.context.loaders.documents.load(str(self.document_id))
+        if record is None:
+            return None
+        return DocumentSummaryType.from_record(record)
+
+    @strawberry.field
+    async def annotations(
+        self, info: Info[GraphQLContext, Any]
+    ) -> list[AnnotationType]:
+        """Return document annotations that reference this passage."""
+
+        annotations = await info.context.loaders.annotations_by_document.load(
+            str(self.document_id)
+        )
+        passage_id = str(self.id)
+        return [
+            AnnotationType.from_response(item)
+            for item in annotations
+            if passage_id in item.passage_ids
+        ]
+
+    @staticmethod
+    def from_record(passage: Any) -> "PassageType":
+        """Build from an ORM passage or the API ``Passage`` model."""
+
+        return PassageType(
+            id=passage.id,
+            document_id=passage.document_id,
+            text=passage.text,
+            osis_ref=passage.osis_ref,
+            page_no=passage.page_no,
+            t_start=passage.t_start,
+            t_end=passage.t_end,
+            start_char=passage.start_char,
+            end_char=passage.end_char,
+        )
+
+
+@strawberry.type
+class SearchResultType:
+    """Ranked hybrid search hit."""
+
+    passage: PassageType
+    rank: int
+    snippet: str
+    score: float | None = None
+    document_title: str | None = strawberry.field(default=None, name="documentTitle")
+    highlights: list[str] = strawberry.field(default_factory=list)
+    lexical_score: float | None = strawberry.field(default=None, name="lexicalScore")
+    vector_score: float | None = strawberry.field(default=None, name="vectorScore")
+
+    @staticmethod
+    def from_result(result: HybridSearchResult) -> "SearchResultType":
+        return SearchResultType(
+            passage=PassageType.from_record(result),
+            rank=result.rank,
+            snippet=result.snippet,
+            score=result.score,
+            document_title=result.document_title,
+            highlights=list(result.highlights or []),
+            lexical_score=result.lexical_score,
+            vector_score=result.vector_score,
+        )
+
+
+@strawberry.type
+class VerseMentionType:
+    """Passage mentioning a requested verse range."""
+
+    passage: PassageType
+    context_snippet: str = strawberry.field(name="contextSnippet")
+
+
+@strawberry.type
+class VerseGraphNodeType:
+    """Node of the verse relationship graph."""
+
+    id: strawberry.ID
+    label: str
+    kind: str
+    osis: str | None = None
+
+    @staticmethod
+    def from_model(node: VerseGraphNode) -> "VerseGraphNodeType":
+        return VerseGraphNodeType(
+            id=node.id, label=node.label, kind=node.kind, osis=node.osis
+        )
+
+
+@strawberry.type
+class VerseGraphEdgeType:
+    """Edge of the verse relationship graph."""
+
+    id: strawberry.ID
+    source: str
+    target: str
+    kind: str
+    summary: str | None = None
+    perspective: str | None = None
+    weight: float | None = None
+    tags: list[str] = strawberry.field(default_factory=list)
+    authors: list[str] = strawberry.field(default_factory=list)
+    source_type: str | None = strawberry.field(default=None, name="sourceType")
+    collection: str | None = None
+    related_osis: str | None = strawberry.field(default=None, name="relatedOsis")
+    source_label: str | None = strawberry.field(default=None, name="sourceLabel")
+
+    @staticmethod
+    def from_model(edge: VerseGraphEdge) -> "VerseGraphEdgeType":
+        return VerseGraphEdgeType(
+            id=edge.id,
+            source=edge.source,
+            target=edge.target,
+            kind=edge.kind,
+            summary=edge.summary,
+            perspective=edge.perspective,
+            weight=edge.weight,
+            tags=list(edge.tags or []),
+            authors=list(edge.authors or []),
+            source_type=edge.source_type,
+            collection=edge.collection,
+            related_osis=edge.related_osis,
+            source_label=edge.source_label,
+        )
+
+
+@strawberry.type
+class VerseGraphType:
+    """Mentions and seed relationships surrounding an OSIS reference."""
+
+    osis: str
+    nodes: list[VerseGraphNodeType]
+    edges: list[VerseGraphEdgeType]
+
+    @staticmethod
+    def from_response(graph: VerseGraphResponse) -> "VerseGraphType":
+        return VerseGraphType(
+            osis=graph.osis,
+            nodes=[VerseGraphNodeType.from_model(node) for node in graph.nodes],
+            edges=[VerseGraphEdgeType.from_model(edge) for edge in graph.edges],
+        )
+
+
 __all__ = [
+    "AnnotationType",
     "DocumentInput",
     "DocumentMetadataInput",
     "DocumentMetadataType",
+    "DocumentSummaryType",
     "DocumentType",
     "InsightType",
     "IngestDocumentPayload",
+    "PassageType",
+    "SearchResultType",
+    "VerseGraphEdgeType",
+    "VerseGraphNodeType",
+    "VerseGraphType",
+    "VerseMentionType",
     "VerseType",
 ]
@@ -1,16 +1,23 @@
 """Infrastructure adapters for the Theo Engine API."""
 
-from .ingestion_service import IngestionService, get_ingestion_service
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .registry import (
     RouterRegistration,
     iter_router_registrations,
     register_router,
 )
-from .retrieval_service import (
-    RetrievalService,
-    get_retrieval_service,
-    reset_reranker_cache,
-)
+
+if TYPE_CHECKING:  # pragma: no cover - re-exported lazily via ``__getattr__``
+    from .ingestion_service import IngestionService, get_ingestion_service
+    from .retrieval_service import (
+        RetrievalService,
+        get_retrieval_service,
+        reset_reranker_cache,
+    )
 
 __all__ = [
     "IngestionService",
@@ -22,3 +29,21 @@ __all__ = [
     "iter_router_registrations",
     "register_router",
 ]
+
+# The services import the ingest pipeline and the rerankers; callers that only
+# need one of them should not pay for the other.
+_ATTRIBUTE_EXPORTS = {
+    "IngestionService": ".ingestion_service",
+    "get_ingestion_service": ".ingestion_service",
+    "RetrievalService": ".retrieval_service",
+    "get_retrieval_service": ".retrieval_service",
+    "reset_reranker_cache": ".retrieval_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ATTRIBUTE_EXPORTS:
+        value = getattr(import_module(_ATTRIBUTE_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
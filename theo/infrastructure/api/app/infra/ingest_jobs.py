@@ -0,0 +1,430 @@
+"""Bounded worker pool and job bookkeeping for API ingestion.
+
+The ingest routes are ``async`` but the pipelines they drive are synchronous
+and can spend seconds parsing, embedding and persisting a large upload. Running
+them inline stalls the event loop for every other request, so the routes hand
+the work to an :class:`IngestJobPool` instead. The pool admits at most
+``workers + queue_depth`` jobs; beyond that :meth:`IngestJobPool.submit` raises
+:class:`IngestQueueFull` and the route answers 429 with a ``Retry-After`` hint
+rather than letting work pile up in memory.
+
+Asynchronous jobs are tracked in the ``ingestion_jobs`` table. A
+:class:`JobProgressRecorder` installed as the pipeline's progress reporter
+folds stage updates into the job payload so ``/jobs/{id}/events`` can stream
+them. Progress rows are written by a single background writer, never by the
+pipeline thread itself: on SQLite the pipeline holds the write lock while it
+persists, and waiting on it from the same thread would deadlock.
+
+Pool workers never touch the request's session. Each job, progress write and
+status update opens its own session (and so its own connection) through
+:func:`job_session`; the ``/jobs/{id}/events`` poller does the same.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
+
+from theo.adapters.persistence.ingestion_job_repository import (
+    SQLAlchemyIngestionJobRepository,
+)
+from theo.application.facades.settings import Settings, get_settings
+
+from ..ingest.progress import progress_reporter
+from ..persistence_models import IngestionJob
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Bind = Engine | Connection
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed"})
+
+# Attempts (and the backoff between them) for the final status write. A
+# document that was committed must not end up on a job left "processing".
+_STATUS_UPDATE_ATTEMPTS = 4
+_STATUS_UPDATE_BACKOFF_SECONDS = 0.05
+
+_session_factories: WeakKeyDictionary[Engine, sessionmaker[Session]] = (
+    WeakKeyDictionary()
+)
+_session_factories_lock = threading.Lock()
+
+
+def job_session(bind: Bind) -> Session:
+    """Open a session of its own on *bind* for job work or bookkeeping.
+
+    Sessions come from one ``sessionmaker`` per engine, so each checks out a
+    separate connection instead of sharing the request's.
+    """
+
+    if not isinstance(bind, Engine):
+        return Session(bind=bind, autoflush=False, expire_on_commit=False)
+    with _session_factories_lock:
+        factory = _session_factories.get(bind)
+        if factory is None:
+            factory = sessionmaker(
+                bind=bind, autoflush=False, expire_on_commit=False, future=True
+            )
+            _session_factories[bind] = factory
+    return factory()
+
+
+class IngestQueueFull(RuntimeError):
+    """Raised when the ingest pool cannot admit another job."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Ingest queue is saturated")
+        self.retry_after = retry_after
+
+
+class IngestJobPool:
+    """Thread pool with a hard bound on running plus queued jobs."""
+
+    def __init__(
+        self, *, max_workers: int, queue_depth: int, retry_after: int = 5
+    ) -> None:
+        if max_workers < 1 or queue_depth < 0:
+            raise ValueError("max_workers must be positive and queue_depth >= 0")
+        self.max_workers = max_workers
+        self.capacity = max_workers + queue_depth
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="theo-ingest"
+        )
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted jobs that are running or waiting for a worker."""
+
+        return self._in_flight
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """Schedule *fn* or raise :class:`IngestQueueFull` without blocking.
+
+        The caller's context variables are copied into the worker so request
+        scoped state (tracing, settings overrides) follows the job.
+        """
+
+        if not self._slots.acquire(blocking=False):
+            raise IngestQueueFull(self.retry_after)
+        with self._lock:
+            self._in_flight += 1
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(context.run, fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _future: self._release())
+        return future
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run *fn* on the pool and await its result without blocking the loop."""
+
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+
+_pool_lock = threading.Lock()
+_pool: IngestJobPool | None = None
+_pool_key: tuple[int, int, int] | None = None
+
+
+def get_ingest_job_pool(settings: Settings | None = None) -> IngestJobPool:
+    """Return the process-wide ingest pool sized from *settings*."""
+
+    global _pool, _pool_key
+    resolved = settings or get_settings()
+    key = (
+        resolved.ingest_worker_threads,
+        resolved.ingest_queue_depth,
+        resolved.ingest_retry_after_seconds,
+    )
+    with _pool_lock:
+        if _pool is None or _pool_key != key:
+            previous = _pool
+            _pool = IngestJobPool(
+                max_workers=key[0], queue_depth=key[1], retry_after=key[2]
+            )
+            _pool_key = key
+            if previous is not None:
+                # Jobs already admitted finish on the old pool.
+                previous.shutdown(wait=False)
+        return _pool
+
+
+def reset_ingest_job_pool() -> None:
+    """Discard the shared pool so the next call rebuilds it (used by tests)."""
+
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = None
+        _pool_key = None
+
+
+_writer_lock = threading.Lock()
+_writer: ThreadPoolExecutor | None = None
+
+
+def _progress_writer() -> ThreadPoolExecutor:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="theo-ingest-progress"
+            )
+        return _writer
+
+
+class JobProgressRecorder:
+    """Fold pipeline progress into ``IngestionJob.payload``.
+
+    Stage transitions are written as they happen; ``running`` updates within a
+    stage (embedding batches) are coalesced to at most one write per
+    ``min_interval`` seconds. Writes are queued on a shared single-thread
+    writer so the pipeline never waits on the database to report progress;
+    :meth:`flush` blocks until everything recorded so far is stored.
+    """
+
+    def __init__(
+        self, job_id: str, bind: Bind, *, min_interval: float = 0.25
+    ) -> None:
+        self.job_id = job_id
+        self._bind = bind
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._started: dict[str, float] = {}
+        self._current: str | None = None
+        self._version = 0
+        self._written = 0
+        self._last_write = float("-inf")
+        self._pending: Future[None] | None = None
+
+    def __call__(self, stage: str, status: str, detail: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            entry = self._stages.setdefault(stage, {})
+            transition = entry.get("status") != status
+            entry.update(detail)
+            entry["status"] = status
+            started = self._started.setdefault(stage, now)
+            if status != "running":
+                entry["elapsed_ms"] = round((now - started) * 1000.0, 1)
+            self._current = stage
+            self._version += 1
+            if not transition and now - self._last_write < self._min_interval:
+                return
+            self._last_write = now
+        self._schedule()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "stage": self._current,
+                "stages": {name: dict(entry) for name, entry in self._stages.items()},
+            }
+
+    def flush(self) -> None:
+        """Write any coalesced progress and wait for pending writes."""
+
+        with self._lock:
+            dirty = self._version != self._written
+        if dirty:
+            self._schedule()
+        pending = self._pending
+        if pending is not None:
+            pending.result()
+
+    def _schedule(self) -> None:
+        self._pending = _progress_writer().submit(self._write)
+
+    def _write(self) -> None:
+        with self._lock:
+            if self._version == self._written:
+                return
+            version = self._version
+        payload = self.snapshot()
+        try:
+            with job_session(self._bind) as session:
+                SQLAlchemyIngestionJobRepository(session).merge_payload(
+                    self.job_id, payload
+                )
+                session.commit()
+        except Exception:
+            logger.warning(
+                "Failed to record progress for ingest job %s",
+                self.job_id,
+                exc_info=True,
+            )
+            return
+        with self._lock:
+            self._written = max(self._written, version)
+
+
+def create_ingest_job(
+    bind: Bind, *, job_type: str, payload: dict[str, Any] | None = None
+) -> str:
+    """Insert a queued ``IngestionJob`` row and return its id."""
+
+    with job_session(bind) as session:
+        job = IngestionJob(job_type=job_type, status="queued", payload=payload)
+        session.add(job)
+        session.commit()
+        return job.id
+
+
+def update_ingest_job(
+    bind: Bind,
+    job_id: str,
+    *,
+    status: str | None = None,
+    error: str | None = None,
+    document_id: str | None = None,
+    task_id: str | None = None,
+) -> None:
+    """Update the bookkeeping columns of ``job_id`` in its own transaction."""
+
+    with job_session(bind) as session:
+        if status is not None:
+            SQLAlchemyIngestionJobRepository(session).update_status(
+                job_id, status=status, error=error, document_id=document_id
+            )
+        if task_id is not None:
+            job = session.get(IngestionJob, job_id)
+            if job is not None:
+                job.task_id = task_id
+        session.commit()
+
+
+def finish_ingest_job(
+    bind: Bind,
+    job_id: str,
+    *,
+    status: str,
+    error: str | None = None,
+    document_id: str | None = None,
+) -> bool:
+    """Record the terminal *status* of ``job_id``, retrying transient errors.
+
+    A job that is already ``completed`` is never downgraded to ``failed``.
+    Returns whether the row holds *status* afterwards.
+    """
+
+    for attempt in range(1, _STATUS_UPDATE_ATTEMPTS + 1):
+        try:
+            with job_session(bind) as session:
+                current = session.scalar(
+                    select(IngestionJob.status).where(IngestionJob.id == job_id)
+                )
+                if current == "completed" and status != "completed":
+                    return False
+                SQLAlchemyIngestionJobRepository(session).update_status(
+                    job_id, status=status, error=error, document_id=document_id
+                )
+                session.commit()
+            return True
+        except DBAPIError:
+            if attempt == _STATUS_UPDATE_ATTEMPTS:
+                logger.exception(
+                    "Failed to record %s status for ingest job %s", status, job_id
+                )
+                return False
+            time.sleep(_STATUS_UPDATE_BACKOFF_SECONDS * attempt)
+    return False  # pragma: no cover - loop always returns
+
+
+def run_in_job_session(bind: Bind, work: Callable[[Session], T]) -> T:
+    """Run *work* in a session opened on the current (pool) thread and commit."""
+
+    with job_session(bind) as session:
+        result = work(session)
+        session.commit()
+        return result
+
+
+def run_ingest_job(
+    bind: Bind,
+    job_id: str,
+    work: Callable[[Session], Any],
+    *,
+    on_success: Callable[[Any], None] | None = None,
+    cleanup: Callable[[], None] | None = None,
+) -> Any | None:
+    """Execute *work* for ``job_id`` inside a fresh session, recording progress.
+
+    Intended to run on an :class:`IngestJobPool` worker. Failures are stored on
+    the job rather than raised, because nobody awaits an asynchronous job.
+    """
+
+    recorder = JobProgressRecorder(job_id, bind)
+    try:
+        update_ingest_job(bind, job_id, status="processing")
+        with job_session(bind) as session, progress_reporter(recorder):
+            document = work(session)
+            session.commit()
+            document_id = getattr(document, "id", None)
+    except Exception as exc:
+        logger.exception("Ingest job %s failed", job_id)
+        recorder.flush()
+        finish_ingest_job(bind, job_id, status="failed", error=str(exc))
+        return None
+    finally:
+        if cleanup is not None:
+            cleanup()
+    # The document is committed from here on; bookkeeping failures must not
+    # turn the job into a failure.
+    recorder.flush()
+    finish_ingest_job(
+        bind,
+        job_id,
+        status="completed",
+        document_id=str(document_id) if document_id is not None else None,
+    )
+    if on_success is not None:
+        try:
+            on_success(document)
+        except Exception:  # pragma: no cover - follow-up work is best effort
+            logger.exception("Post-ingest hook failed for job %s", job_id)
+    return document
+
+
+__all__ = [
+    "IngestJobPool",
+    "IngestQueueFull",
+    "JobProgressRecorder",
+    "TERMINAL_JOB_STATUSES",
+    "create_ingest_job",
+    "finish_ingest_job",
+    "get_ingest_job_pool",
+    "job_session",
+    "reset_ingest_job_pool",
+    "run_in_job_session",
+    "run_ingest_job",
+    "update_ingest_job",
+]
@@ -0,0 +1,376 @@
+"""Cross-process fan-out backends for notebook realtime events.
+
+Each API worker holds its own websocket connections, so a notebook update
+handled by one worker has to reach collaborators connected to the others, and
+``/realtime/notebooks/{id}/poll`` must report the same version whichever
+worker answers. A :class:`NotebookEventBackend` provides both halves: an
+atomic per-notebook version counter shared by every worker and a subscription
+that yields events published by any of them.
+
+* :class:`InMemoryNotebookEventBackend` keeps everything in the process and is
+  the default for single-worker deployments.
+* :class:`SQLiteNotebookEventBackend` stores versions and a short event log in
+  a WAL-mode SQLite file; workers on one host (and tests) poll the log.
+* :class:`RedisNotebookEventBackend` increments versions and publishes events
+  in a single Lua script so the version order matches the delivery order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, DefaultDict, Protocol
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from theo.application.facades.settings import Settings
+
+try:  # pragma: no cover - optional dependency guard
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - redis is optional at runtime
+    redis_asyncio = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class NotebookEvent:
+    """A notebook update as seen by subscribers."""
+
+    notebook_id: str
+    version: int
+    payload: dict[str, Any]
+    origin: str
+
+
+class NotebookEventBackend(Protocol):
+    """Shared version counter and event bus for notebook updates."""
+
+    distributed: bool
+
+    async def publish(
+        self, notebook_id: str, payload: dict[str, Any], *, origin: str
+    ) -> int:
+        """Bump the notebook version, fan the event out and return the version."""
+
+    async def current_version(self, notebook_id: str) -> int:
+        ...
+
+    async def subscribe(self) -> AsyncIterator[NotebookEvent]:
+        """Subscribe, then return an iterator over events published from now on.
+
+        Events published by any process after this coroutine returns are
+        delivered through the iterator.
+        """
+
+    async def close(self) -> None:
+        ...
+
+
+def _encode_event(event: NotebookEvent) -> str:
+    return json.dumps(
+        {
+            "notebook_id": event.notebook_id,
+            "origin": event.origin,
+            "payload": event.payload,
+        },
+        separators=(",", ":"),
+    )
+
+
+async def _no_events() -> AsyncIterator[NotebookEvent]:
+    return
+    yield  # pragma: no cover - makes this an async generator
+
+
+class InMemoryNotebookEventBackend:
+    """Process-local backend; nothing crosses worker boundaries."""
+
+    distributed = False
+
+    def __init__(self) -> None:
+        self._versions: DefaultDict[str, int] = defaultdict(int)
+
+    async def publish(
+        self, notebook_id: str, payload: dict[str, Any], *, origin: str
+    ) -> int:
+        self._versions[notebook_id] += 1
+        return self._versions[notebook_id]
+
+    async def current_version(self, notebook_id: str) -> int:
+        return self._versions[notebook_id]
+
+    async def subscribe(self) -> AsyncIterator[NotebookEvent]:
+        # Local events are delivered directly by the broker; there is never
+        # anything to receive from other processes.
+        return _no_events()
+
+    async def close(self) -> None:
+        return None
+
+
+_SQLITE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS notebook_versions (
+        notebook_id TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS notebook_events (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        notebook_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        body TEXT NOT NULL
+    )
+    """,
+)
+
+
+class SQLiteNotebookEventBackend:
+    """Versions and a bounded event log in a shared WAL-mode SQLite file.
+
+    Publishing bumps the version and appends to the log in one ``BEGIN
+    IMMEDIATE`` transaction, so versions are gap-free and ordered like the
+    log. Subscribers poll for rows past the last sequence number they saw;
+    the log keeps the newest ``retention`` events, which only needs to cover
+    the polling interval.
+    """
+
+    distributed = True
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        poll_interval: float = 0.1,
+        retention: int = 1000,
+    ) -> None:
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SQLITE_SCHEMA:
+                connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def _publish(self, notebook_id: str, body: str) -> int:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT INTO notebook_versions (notebook_id, version) "
+                    "VALUES (?, 1) ON CONFLICT(notebook_id) "
+                    "DO UPDATE SET version = version + 1",
+                    (notebook_id,),
+                )
+                (version,) = connection.execute(
+                    "SELECT version FROM notebook_versions WHERE notebook_id = ?",
+                    (notebook_id,),
+                ).fetchone()
+                cursor = connection.execute(
+                    "INSERT INTO notebook_events (notebook_id, version, body) "
+                    "VALUES (?, ?, ?)",
+                    (notebook_id, version, body),
+                )
+                connection.execute(
+                    "DELETE FROM notebook_events WHERE seq <= ?",
+                    (cursor.lastrowid - self.retention,),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return int(version)
+
+    def _version(self, notebook_id: str) -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT version FROM notebook_versions WHERE notebook_id = ?",
+                (notebook_id,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def _last_sequence(self) -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM notebook_events"
+            ).fetchone()
+        return int(row[0])
+
+    def _events_after(self, sequence: int) -> list[tuple[int, str, int, str]]:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT seq, notebook_id, version, body FROM notebook_events "
+                "WHERE seq > ? ORDER BY seq",
+                (sequence,),
+            ).fetchall()
+
+    async def publish(
+        self, notebook_id: str, payload: dict[str, Any], *, origin: str
+    ) -> int:
+        body = _encode_event(NotebookEvent(notebook_id, 0, payload, origin))
+        return await asyncio.to_thread(self._publish, notebook_id, body)
+
+    async def current_version(self, notebook_id: str) -> int:
+        return await asyncio.to_thread(self._version, notebook_id)
+
+    async def subscribe(self) -> AsyncIterator[NotebookEvent]:
+        # Fix the starting point before returning rather than on first
+        # iteration so events published in between are not skipped.
+        sequence = await asyncio.to_thread(self._last_sequence)
+        return self._poll(sequence)
+
+    async def _poll(self, sequence: int) -> AsyncIterator[NotebookEvent]:
+        while True:
+            rows = await asyncio.to_thread(self._events_after, sequence)
+            for row_sequence, notebook_id, version, body in rows:
+                sequence = row_sequence
+                decoded = json.loads(body)
+                yield NotebookEvent(
+                    notebook_id=notebook_id,
+                    version=int(version),
+                    payload=decoded.get("payload") or {},
+                    origin=decoded.get("origin") or "",
+                )
+            if not rows:
+                await asyncio.sleep(self.poll_interval)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Bump the version and publish "<version>:<event json>" atomically so every
+# subscriber observes versions in increasing order.
+_REDIS_PUBLISH_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', KEYS[2], version .. ':' .. ARGV[1])
+return version
+"""
+
+
+class RedisNotebookEventBackend:
+    """Redis counters plus pub/sub for multi-host deployments."""
+
+    distributed = True
+
+    def __init__(
+        self,
+        url: str | None = None,
+        *,
+        client: Any | None = None,
+        prefix: str = "theo:notebooks",
+    ) -> None:
+        if client is None:
+            if redis_asyncio is None:
+                raise RuntimeError(
+                    "The redis notebook event backend requires the 'redis' package"
+                )
+            if not url:
+                raise ValueError("The redis notebook event backend requires a URL")
+            client = redis_asyncio.Redis.from_url(url)
+        self._client = client
+        self._prefix = prefix
+        self.channel = f"{prefix}:events"
+
+    def _version_key(self, notebook_id: str) -> str:
+        return f"{self._prefix}:version:{notebook_id}"
+
+    async def publish(
+        self, notebook_id: str, payload: dict[str, Any], *, origin: str
+    ) -> int:
+        body = _encode_event(NotebookEvent(notebook_id, 0, payload, origin))
+        version = await self._client.eval(
+            _REDIS_PUBLISH_SCRIPT, 2, self._version_key(notebook_id), self.channel, body
+        )
+        return int(version)
+
+    async def current_version(self, notebook_id: str) -> int:
+        value = await self._client.get(self._version_key(notebook_id))
+        return int(value) if value is not None else 0
+
+    async def subscribe(self) -> AsyncIterator[NotebookEvent]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self.channel)
+        return self._listen(pubsub)
+
+    async def _listen(self, pubsub: Any) -> AsyncIterator[NotebookEvent]:
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                event = decode_redis_message(message.get("data"))
+                if event is not None:
+                    yield event
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.close()
+
+    async def close(self) -> None:
+        close = getattr(self._client, "aclose", None) or self._client.close
+        await close()
+
+
+def decode_redis_message(data: bytes | str | None) -> NotebookEvent | None:
+    """Parse a ``"<version>:<json>"`` message published by the Lua script."""
+
+    if data is None:
+        return None
+    text = data.decode("utf-8") if isinstance(data, bytes) else data
+    version, _, body = text.partition(":")
+    try:
+        decoded = json.loads(body)
+        return NotebookEvent(
+            notebook_id=decoded["notebook_id"],
+            version=int(version),
+            payload=decoded.get("payload") or {},
+            origin=decoded.get("origin") or "",
+        )
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring malformed notebook event message")
+        return None
+
+
+def build_notebook_event_backend(settings: "Settings") -> NotebookEventBackend:
+    """Instantiate the backend selected by ``notebook_events_backend``."""
+
+    backend = getattr(settings, "notebook_events_backend", "memory")
+    if backend == "sqlite":
+        path = settings.notebook_events_sqlite_path or (
+            Path(settings.storage_root) / "notebook-events.sqlite"
+        )
+        return SQLiteNotebookEventBackend(path)
+    if backend == "redis":
+        return RedisNotebookEventBackend(settings.redis_url)
+    return InMemoryNotebookEventBackend()
+
+
+__all__ = [
+    "InMemoryNotebookEventBackend",
+    "NotebookEvent",
+    "NotebookEventBackend",
+    "RedisNotebookEventBackend",
+    "SQLiteNotebookEventBackend",
+    "build_notebook_event_backend",
+    "decode_redis_message",
+]
@@ -23,6 +23,8 @@ from ..analytics.experiments import (
     summarise_reranker_outcome,
 )
 from ..models.search import HybridSearchRequest, HybridSearchResult
+from ..ranking.cross_encoder import CrossEncoderReranker, get_cross_encoder
+from ..ranking.feature_store import PassageFeatureStore, get_passage_feature_store
 from ..ranking.mlflow_integration import is_mlflow_uri, mlflow_signature
 from ..ranking.re_ranker import Reranker, load_reranker
 from ..retriever.hybrid import hybrid_search
@@ -219,6 +221,8 @@ class RetrievalService:
     experimental_reranker_loaders: MutableMapping[
         str, Callable[[Settings, Mapping[str, str]], tuple[Reranker | None, str | None]]
     ] = field(default_factory=dict)
+    feature_store_loader: Callable[[Session], PassageFeatureStore | None] | None = None
+    cross_encoder: CrossEncoderReranker | None = None
 
     def __post_init__(self) -> None:
         if self.experiment_analytics is None:
@@ -240,7 +244,7 @@ class RetrievalService:
             rewrite_metadata = rewrite_result.metadata
 
         results = [item for item in self.search_fn(session, search_request)]
-        baseline = [item.model_copy(deep=True) for item in results]
+        baseline = [item.model_copy() for item in results]
         reranker_header: str | None = None
         experiments = dict(experiments or {})
         strategy = self._resolve_reranker_strategy(experiments)
@@ -292,6 +296,7 @@ class RetrievalService:
                 top_n,
                 log_reference=model_path,
                 log_extra={"strategy": strategy},
+                feature_store=self._feature_store_for(session, reranker),
             )
             if rerank_success:
                 rerank_applied = True
@@ -299,7 +304,7 @@ class RetrievalService:
         self._record_experiments(
             experiments=experiments,
             baseline=baseline,
-            variant=[item.model_copy(deep=True) for item in results],
+            variant=[item.model_copy() for item in results],
             strategy=strategy,
             rerank_applied=rerank_applied,
             reranker_header=reranker_header,
@@ -342,11 +347,30 @@ class RetrievalService:
                     reranker,
                     top_n,
                     log_reference=formatted_reference or header_reference,
+                    feature_store=self._feature_store_for(session, reranker),
                 )
                 if rerank_success:
                     reranker_header = formatted_reference
                     rerank_applied = True
 
+        if self.cross_encoder is not None and results and search_request.query:
+            cross_encoder = self.cross_encoder
+            results, cross_encoder_applied = self._rerank_results(
+                results,
+                cross_encoder,
+                min(len(results), cross_encoder.top_n),
+                log_reference=cross_encoder.model_name,
+                log_extra={"stage": "cross_encoder"},
+                query=search_request.query,
+            )
+            if cross_encoder_applied:
+                rerank_applied = True
+                reranker_header = (
+                    f"{reranker_header}+{cross_encoder.model_name}"
+                    if reranker_header
+                    else cross_encoder.model_name
+                )
+
         if rewrite_metadata and rewrite_metadata.get("rewrite_applied"):
             for item in results:
                 base_meta = dict(item.meta) if item.meta else {}
@@ -358,17 +382,23 @@ class RetrievalService:
     def _rerank_results(
         self,
         results: Sequence[HybridSearchResult],
-        reranker: Reranker,
+        reranker: Reranker | CrossEncoderReranker,
         top_n: int,
         *,
         log_reference: str | Path | None = None,
         log_extra: Mapping[str, object] | None = None,
+        feature_store: PassageFeatureStore | None = None,
+        query: str | None = None,
     ) -> tuple[list[HybridSearchResult], bool]:
-        """Apply the supplied ``reranker`` to the top ``top_n`` results."""
+        """Apply the supplied ``reranker`` to the top ``top_n`` results.
+
+        Rerankers flagged ``requires_query`` (cross-encoders) also receive the
+        search ``query``.
+        """
 
         result_list = list(results)
         if not result_list or top_n <= 0:
-            return [item.model_copy(deep=True) for item in result_list], False
+            return [item.model_copy() for item in result_list], False
 
         top_n = min(len(result_list), top_n)
         leading_results = result_list[:top_n]
@@ -386,7 +416,16 @@ class RetrievalService:
 
         start_time = time.perf_counter()
         try:
-            reranked_leading = list(reranker.rerank(leading_results))
+            if getattr(reranker, "requires_query", False):
+                reranked_leading = list(
+                    reranker.rerank(leading_results, query=query or "")
+                )
+            elif feature_store is not None:
+                reranked_leading = list(
+                    reranker.rerank(leading_results, feature_store=feature_store)
+                )
+            else:
+                reranked_leading = list(reranker.rerank(leading_results))
         except Exception as exc:  # pragma: no cover - defensive logging
             duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
             failure_payload = {
@@ -400,7 +439,7 @@ class RetrievalService:
                 SEARCH_RERANKER_EVENTS_METRIC,
                 labels={"event": "failed"},
             )
-            return [item.model_copy(deep=True) for item in result_list], False
+            return [item.model_copy() for item in result_list], False
 
         duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
 
@@ -412,7 +451,7 @@ class RetrievalService:
                 identifier = str(getattr(candidate, "id", ""))
                 if identifier and identifier in seen_ids:
                     continue
-                clone = candidate.model_copy(deep=True)
+                clone = candidate.model_copy()
                 reranked_leading.append(clone)
                 if identifier:
                     seen_ids.add(identifier)
@@ -422,7 +461,7 @@ class RetrievalService:
 
         reranked_results: list[HybridSearchResult] = list(reranked_leading)
         for offset, item in enumerate(trailing_results, start=1):
-            clone = item.model_copy(deep=True)
+            clone = item.model_copy()
             clone.rank = len(reranked_leading) + offset
             reranked_results.append(clone)
 
@@ -446,6 +485,24 @@ class RetrievalService:
 
         return reranked_results, True
 
+    def _feature_store_for(
+        self, session: Session, reranker: Reranker
+    ) -> PassageFeatureStore | None:
+        """Return precomputed passage features when ``reranker`` consumes them."""
+
+        if self.feature_store_loader is None:
+            return None
+        if not getattr(reranker, "uses_feature_store", False):
+            return None
+        try:
+            return self.feature_store_loader(session)
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception(
+                "search.feature_store_failed",
+                extra={"event": "search.feature_store_failed"},
+            )
+            return None
+
     def _should_rerank(self) -> bool:
         if not getattr(self.settings, "reranker_enabled", False):
             return False
@@ -556,6 +613,8 @@ def get_retrieval_service(
         search_fn=hybrid_search,
         reranker_cache=_DEFAULT_RERANKER_CACHE,
         query_rewriter=_DEFAULT_QUERY_REWRITER,
+        feature_store_loader=get_passage_feature_store,
+        cross_encoder=get_cross_encoder(settings),
     )
 
 
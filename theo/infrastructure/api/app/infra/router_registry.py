@@ -13,6 +13,7 @@ except Exception:  # pragma: no cover - import failure logged via registration s
     graphql_router = None
 
 from ..routes import (
+    admin,
     ai,
     analytics,
     creators,
@@ -111,6 +112,7 @@ _DEFAULT_REGISTRATIONS.extend(
             prefix="/realtime",
             tags=("realtime",),
         ),
+        RouterRegistration(router=admin.router, prefix="/admin", tags=("admin",)),
     ]
 )
 
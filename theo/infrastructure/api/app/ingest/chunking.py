@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from .parsers import TranscriptSegment
 
@@ -22,6 +23,14 @@ class Chunk:
     speakers: list[str] | None = None
 
 
+@dataclass(slots=True)
+class TextBlock:
+    """A page or paragraph of parsed text fed to :func:`iter_chunks`."""
+
+    text: str
+    page_no: int | None = None
+
+
 @dataclass(slots=True)
 class _Paragraph:
     text: str
@@ -30,18 +39,33 @@ class _Paragraph:
 
     @property
     def tokens(self) -> int:
-        return len(_tokenise(self.text))
+        return len(self.text.split())
 
 
 def _tokenise(text: str) -> list[str]:
     return [token for token in text.split() if token]
 
 
+# A sentence ends at terminal punctuation not immediately followed by a letter
+# or digit (so "3.14" and "e.g" stay intact).
+_SENTENCE_END_RE = re.compile(r"[.?!](?![^\W_])")
+
+
+def _stripped_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Return the bounds of ``text[start:end]`` with surrounding whitespace removed."""
+
+    raw = text[start:end]
+    stripped = raw.strip()
+    if not stripped:
+        return start, start
+    lead = len(raw) - len(raw.lstrip())
+    return start + lead, start + lead + len(stripped)
+
+
 def _split_long_paragraph(paragraph: _Paragraph, hard_cap: int) -> Iterable[_Paragraph]:
     """Split a paragraph into pseudo-sentences when it breaches the hard cap."""
 
-    tokens = _tokenise(paragraph.text)
-    if len(tokens) <= hard_cap:
+    if paragraph.tokens <= hard_cap:
         yield paragraph
         return
 
@@ -49,116 +73,127 @@ def _split_long_paragraph(paragraph: _Paragraph, hard_cap: int) -> Iterable[_Par
     text = paragraph.text
     cursor = paragraph.start
     sentence_start = 0
-    for idx, char in enumerate(text):
-        if char not in {".", "?", "!"}:
-            continue
-        next_idx = idx + 1
-        if next_idx < len(text) and text[next_idx].isalnum():
-            continue
-        segment = text[sentence_start : next_idx + 1].strip()
-        if not segment:
+    for match in _SENTENCE_END_RE.finditer(text):
+        # The boundary character after the punctuation (normally whitespace)
+        # is consumed with the sentence.
+        boundary = min(match.end() + 1, len(text))
+        start, end = _stripped_span(text, sentence_start, boundary)
+        if start == end:
             continue
-        offset = text.find(segment, sentence_start)
-        start = cursor + offset
-        end = start + len(segment)
-        yield _Paragraph(text=segment, start=start, end=end)
-        sentence_start = next_idx + 1
+        yield _Paragraph(text=text[start:end], start=cursor + start, end=cursor + end)
+        sentence_start = boundary
 
-    tail = text[sentence_start:].strip()
-    if tail:
-        offset = text.find(tail, sentence_start)
-        start = cursor + offset
-        end = start + len(tail)
-        yield _Paragraph(text=tail, start=start, end=end)
+    start, end = _stripped_span(text, sentence_start, len(text))
+    if start != end:
+        yield _Paragraph(text=text[start:end], start=cursor + start, end=cursor + end)
 
 
-def _iter_paragraphs(text: str) -> Iterable[_Paragraph]:
+def _iter_paragraphs(text: str, *, base: int = 0) -> Iterator[_Paragraph]:
+    """Yield blank-line separated paragraphs with offsets relative to ``base``."""
+
     cursor = 0
-    for raw in text.split("\n\n"):
-        if not raw.strip():
-            cursor += len(raw) + 2
-            continue
-        stripped = raw.strip()
-        start = text.find(stripped, cursor)
-        if start == -1:
-            start = cursor
-        end = start + len(stripped)
-        cursor = end
-        yield _Paragraph(text=stripped, start=start, end=end)
+    length = len(text)
+    while True:
+        boundary = text.find("\n\n", cursor)
+        stop = length if boundary == -1 else boundary
+        start, end = _stripped_span(text, cursor, stop)
+        if start != end:
+            yield _Paragraph(text=text[start:end], start=base + start, end=base + end)
+        if boundary == -1:
+            return
+        cursor = boundary + 2
 
 
-def chunk_text(
-    text: str,
+def iter_chunks(
+    blocks: Iterable[TextBlock | str],
     *,
     max_tokens: int = 900,
     min_tokens: int = 500,
     hard_cap: int = 1200,
-) -> list[Chunk]:
-    """Chunk text by paragraphs while respecting token budgets."""
-
-    if not text.strip():
-        return [Chunk(text="", start_char=0, end_char=0, index=0)]
+    separator: str = "\n",
+) -> Iterator[Chunk]:
+    """Lazily chunk a stream of text blocks while respecting token budgets.
 
-    paragraphs: list[_Paragraph] = []
-    for paragraph in _iter_paragraphs(text):
-        paragraphs.extend(list(_split_long_paragraph(paragraph, hard_cap)))
+    Offsets index into ``separator.join(block.text for block in blocks)`` so
+    parsers can stream pages without materialising the whole document. Chunks
+    never span blocks with different page numbers, and only the paragraphs of
+    the chunk under construction are held in memory.
+    """
 
-    chunks: list[Chunk] = []
     buffer: list[_Paragraph] = []
+    buffer_page: int | None = None
     token_count = 0
+    index = 0
 
-    def flush() -> None:
-        nonlocal buffer, token_count
+    def flush() -> Chunk | None:
+        nonlocal buffer, token_count, index
         if not buffer:
-            return
-        chunk_text_value = "\n\n".join(part.text for part in buffer)
-        start = buffer[0].start
-        end = buffer[-1].end
-        chunks.append(
-            Chunk(
-                text=chunk_text_value,
-                start_char=start,
-                end_char=end,
-                page_no=None,
-                index=len(chunks),
-            )
+            return None
+        chunk = Chunk(
+            text="\n\n".join(part.text for part in buffer),
+            start_char=buffer[0].start,
+            end_char=buffer[-1].end,
+            page_no=buffer_page,
+            index=index,
         )
+        index += 1
         buffer = []
         token_count = 0
+        return chunk
 
-    for paragraph in paragraphs:
-        para_tokens = paragraph.tokens
-        if (
-            buffer
-            and token_count + para_tokens > max_tokens
-            and token_count >= min_tokens
-        ):
-            flush()
+    offset = 0
+    for raw_block in blocks:
+        block = TextBlock(raw_block) if isinstance(raw_block, str) else raw_block
+        if buffer and block.page_no != buffer_page:
+            if (chunk := flush()) is not None:
+                yield chunk
+        buffer_page = block.page_no
 
-        if token_count and token_count + para_tokens > hard_cap:
-            flush()
+        for paragraph in _iter_paragraphs(block.text, base=offset):
+            for piece in _split_long_paragraph(paragraph, hard_cap):
+                piece_tokens = piece.tokens
+                if (
+                    buffer
+                    and token_count + piece_tokens > max_tokens
+                    and token_count >= min_tokens
+                ):
+                    if (chunk := flush()) is not None:
+                        yield chunk
 
-        buffer.append(paragraph)
-        token_count += para_tokens
+                if token_count and token_count + piece_tokens > hard_cap:
+                    if (chunk := flush()) is not None:
+                        yield chunk
 
-        if token_count >= hard_cap:
-            flush()
+                buffer.append(piece)
+                token_count += piece_tokens
 
-    flush()
+                if token_count >= hard_cap:
+                    if (chunk := flush()) is not None:
+                        yield chunk
 
-    if not chunks:
-        stripped = text.strip()
-        chunks.append(
-            Chunk(
-                text=stripped,
-                start_char=0,
-                end_char=len(stripped),
-                page_no=None,
-                index=0,
-            )
-        )
+        offset += len(block.text) + len(separator)
 
-    return chunks
+    if (chunk := flush()) is not None:
+        yield chunk
+
+
+def chunk_text(
+    text: str,
+    *,
+    max_tokens: int = 900,
+    min_tokens: int = 500,
+    hard_cap: int = 1200,
+) -> list[Chunk]:
+    """Chunk text by paragraphs while respecting token budgets."""
+
+    if not text.strip():
+        return [Chunk(text="", start_char=0, end_char=0, index=0)]
+
+    return list(
+        iter_chunks(
+            [text], max_tokens=max_tokens, min_tokens=min_tokens, hard_cap=hard_cap
+        )
+    )
 
 
 def chunk_transcript(
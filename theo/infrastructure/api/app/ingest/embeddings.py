@@ -40,11 +40,6 @@ except ModuleNotFoundError:  # pragma: no cover - fallback used in unit tests
         def __init__(self, *_args: object, **_kwargs: object) -> None:
             raise NotImplementedError("sqlalchemy is not installed")
 
-try:  # pragma: no cover - heavy dependency may be unavailable in tests
-    from FlagEmbedding import FlagModel as _RuntimeFlagModel
-except Exception:  # pragma: no cover - optional dependency
-    _RuntimeFlagModel = None
-
 
 class _EmbeddingBackend(Protocol):
     """Protocol representing the minimal surface of the embedding backend."""
@@ -57,20 +52,24 @@ from theo.application.facades.settings import get_settings
 from theo.application.facades.resilience import ResilienceError, ResilienceSettings, resilient_operation
 from theo.application.facades.telemetry import set_span_attribute
 
+from ..utils.imports import import_optional
+
 _LOGGER = logging.getLogger(__name__)
 _TRACER = trace.get_tracer("theo.embedding")
 
 
-def _flag_model_enabled() -> bool:
-    """Return True when the runtime embedding model should be used."""
+def _flag_model_class() -> type | None:
+    """Return ``FlagModel`` when the runtime embedding model should be used.
+
+    ``FlagEmbedding`` is imported here, on first use, because it drags in
+    torch and transformers.
+    """
 
-    if _RuntimeFlagModel is None:
-        return False
     if os.environ.get("THEO_FORCE_EMBEDDING_FALLBACK"):
-        return False
+        return None
     if os.environ.get("PYTEST_CURRENT_TEST"):
-        return False
-    return True
+        return None
+    return import_optional("FlagEmbedding", "FlagModel")
 
 
 def _normalise(vector: Sequence[float]) -> list[float]:
@@ -129,9 +128,10 @@ class EmbeddingService:
             return self._model
         with self._lock:
             if self._model is None:
-                if _flag_model_enabled():
+                flag_model = _flag_model_class()
+                if flag_model is not None:
                     try:
-                        self._model = _RuntimeFlagModel(  # type: ignore[call-arg]
+                        self._model = flag_model(  # type: ignore[call-arg]
                             self.model_name,
                             use_fp16=False,
                         )
@@ -258,15 +258,38 @@ class EmbeddingService:
 
 
 _service: EmbeddingService | None = None
+_versioned_services: dict[tuple[str, int], EmbeddingService] = {}
+_versioned_lock = threading.Lock()
 _NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
 
 
-def get_embedding_service() -> EmbeddingService:
-    """Return a process-wide embedding service instance."""
+def get_embedding_service(
+    model_name: str | None = None, dimension: int | None = None
+) -> EmbeddingService:
+    """Return a process-wide embedding service instance.
+
+    Without arguments the configured model is used. Passing ``model_name`` and
+    ``dimension`` returns a shared service for that model version, which is
+    how search embeds queries for a model that has been cut over and how
+    shadow vectors are produced for a model being rolled out.
+    """
 
     global _service
+    settings = get_settings()
+    if model_name is not None and (
+        model_name != settings.embedding_model
+        or (dimension is not None and dimension != settings.embedding_dim)
+    ):
+        key = (model_name, dimension or settings.embedding_dim)
+        with _versioned_lock:
+            service = _versioned_services.get(key)
+            if service is None:
+                service = EmbeddingService(
+                    key[0], key[1], cache_max_size=settings.embedding_cache_size
+                )
+                _versioned_services[key] = service
+        return service
     if _service is None:
-        settings = get_settings()
         _service = EmbeddingService(
             settings.embedding_model,
             settings.embedding_dim,
@@ -276,11 +299,15 @@ def get_embedding_service() -> EmbeddingService:
 
 
 def clear_embedding_cache() -> None:
-    """Clear cached embeddings held by the shared service instance."""
+    """Clear cached embeddings held by the shared service instances."""
 
     global _service
     if _service is not None:
         _service.clear_cache()
+    with _versioned_lock:
+        services = list(_versioned_services.values())
+    for service in services:
+        service.clear_cache()
 
 
 def lexical_representation(session: Session, text: str) -> ClauseElement | str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from collections.abc import Mapping
@@ -169,6 +170,14 @@ def serialise_frontmatter(frontmatter: FrontmatterMapping) -> str:
     return _FrontmatterJSON(json.dumps(normalised, indent=2, ensure_ascii=False))
 
 
+def frontmatter_fingerprint(frontmatter: FrontmatterMapping) -> str:
+    """Return a stable SHA-256 of *frontmatter*, independent of key order."""
+
+    normalised = json.loads(serialise_frontmatter(frontmatter))
+    payload = json.dumps(normalised, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def ensure_list(value: object) -> list[str] | None:
     if value is None:
         return None
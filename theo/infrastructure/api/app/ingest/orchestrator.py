@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Iterable, List
 
+from .progress import report_progress, stage_kind
 from .stages import Enricher, IngestContext, Parser, Persister, SourceFetcher
 
 
@@ -48,9 +49,18 @@ class IngestOrchestrator:
         state: dict[str, Any] = initial_state.copy() if initial_state else {}
         stages: list[StageExecution] = []
         failures: list[StageExecution] = []
+        # Consecutive stages of the same kind (a parser and its enrichers)
+        # are reported as a single progress stage.
+        progress_stage: str | None = None
 
         for stage in self._stages:
             stage_name = getattr(stage, "name", stage.__class__.__name__)
+            kind = stage_kind(stage)
+            if kind is not None and kind != progress_stage:
+                if progress_stage is not None:
+                    report_progress(progress_stage, "completed")
+                progress_stage = kind
+                report_progress(kind, "running")
             attempts = 0
             stage_state: dict[str, Any] | None = None
             error: Exception | None = None
@@ -97,6 +107,8 @@ class IngestOrchestrator:
                     )
                     stages.append(failure)
                     failures.append(failure)
+                    if progress_stage is not None:
+                        report_progress(progress_stage, "failed", error=str(error))
                     return OrchestratorResult(
                         status="failed",
                         state=state,
@@ -115,6 +127,13 @@ class IngestOrchestrator:
                     stages.append(execution)
                     break
 
+            # A stage may resolve the request early (e.g. a duplicate payload
+            # that reuses an existing document); later stages are skipped.
+            if state.get("short_circuit"):
+                break
+
+        if progress_stage is not None:
+            report_progress(progress_stage, "completed")
         return OrchestratorResult(
             status="success",
             state=state,
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable, Sequence
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Sequence
 
 try:  # pragma: no cover - exercised via regression tests when optional dep present
     from defusedxml import ElementTree as ET
@@ -40,6 +41,18 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when ``defusedxml`` m
 import pythonbible as pb
 from pythonbible import NormalizedReference
 
+try:  # pragma: no cover - parser internals vary across pythonbible releases
+    from pythonbible.parser import (
+        DASH as _PB_DASH,
+        HTML_MDASH as _PB_HTML_MDASH,
+        HTML_NDASH as _PB_HTML_NDASH,
+        SCRIPTURE_REFERENCE_REGULAR_EXPRESSION as _PB_REFERENCE_RE,
+        convert_all_roman_numerals_to_integers as _pb_convert_roman_numerals,
+        normalize_reference as _pb_normalize_reference,
+    )
+except ImportError:  # pragma: no cover - fall back to the public API
+    _PB_REFERENCE_RE = None
+
 from theo.domain.research.osis import (
     expand_osis_reference,
     format_osis,
@@ -59,6 +72,7 @@ __all__ = [
     "canonicalize_osis_id",
     "combine_references",
     "detect_osis_references",
+    "iter_detected_osis",
     "canonical_verse_range",
     "osis_intersects",
     "classify_osis_matches",
@@ -285,6 +299,16 @@ def combine_references(
 ) -> NormalizedReference | None:
     """Return a minimal covering range for contiguous references in the same book."""
 
+    return _combine_resolved(
+        references,
+        [tuple(pb.convert_reference_to_verse_ids(ref)) for ref in references],
+    )
+
+
+def _combine_resolved(
+    references: Sequence[NormalizedReference],
+    verse_ids_per_reference: Sequence[Sequence[int]],
+) -> NormalizedReference | None:
     if not references:
         return None
 
@@ -293,8 +317,8 @@ def combine_references(
         return references[0]
 
     verse_ids: list[int] = []
-    for ref in references:
-        verse_ids.extend(pb.convert_reference_to_verse_ids(ref))
+    for ids in verse_ids_per_reference:
+        verse_ids.extend(ids)
 
     if not verse_ids:
         return references[0]
@@ -317,19 +341,76 @@ def combine_references(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _ResolvedMatch:
+    references: tuple[NormalizedReference, ...]
+    osis: tuple[str, ...]
+    verse_ids: tuple[tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=8192)
+def _resolve_reference_match(reference_text: str) -> _ResolvedMatch:
+    """Normalise one matched reference string, memoised across chunks.
+
+    Commentaries cite the same handful of passages over and over, and
+    normalisation (not the regex scan) dominates detection cost.
+    """
+
+    references = tuple(_pb_normalize_reference(reference_text))
+    return _ResolvedMatch(
+        references=references,
+        osis=tuple(format_osis(ref) for ref in references),
+        verse_ids=tuple(
+            tuple(pb.convert_reference_to_verse_ids(ref)) for ref in references
+        ),
+    )
+
+
+def _iter_reference_matches(text: str) -> Iterator[_ResolvedMatch]:
+    clean_text = _pb_convert_roman_numerals(text)
+    clean_text = clean_text.replace(_PB_HTML_NDASH, _PB_DASH).replace(
+        _PB_HTML_MDASH, _PB_DASH
+    )
+    for match in _PB_REFERENCE_RE.finditer(clean_text):
+        yield _resolve_reference_match(match[0])
+
+
 def detect_osis_references(text: str) -> DetectedOsis:
     """Detect OSIS references in arbitrary text."""
 
-    normalized = pb.get_references(text)
+    if _PB_REFERENCE_RE is None:  # pragma: no cover - legacy pythonbible
+        legacy_refs = pb.get_references(text)
+        if not legacy_refs:
+            return DetectedOsis(primary=None, all=[])
+        legacy_osis = [format_osis(ref) for ref in legacy_refs]
+        legacy_primary = combine_references(legacy_refs)
+        return DetectedOsis(
+            primary=format_osis(legacy_primary) if legacy_primary else legacy_osis[0],
+            all=legacy_osis,
+        )
+
+    normalized: list[NormalizedReference] = []
+    all_refs: list[str] = []
+    verse_ids: list[tuple[int, ...]] = []
+    for resolved in _iter_reference_matches(text):
+        normalized.extend(resolved.references)
+        all_refs.extend(resolved.osis)
+        verse_ids.extend(resolved.verse_ids)
     if not normalized:
         return DetectedOsis(primary=None, all=[])
 
-    all_refs = [format_osis(ref) for ref in normalized]
-    primary_ref = combine_references(normalized)
+    primary_ref = _combine_resolved(normalized, verse_ids)
     primary = format_osis(primary_ref) if primary_ref else all_refs[0]
     return DetectedOsis(primary=primary, all=all_refs)
 
 
+def iter_detected_osis(texts: Iterable[str]) -> Iterator[DetectedOsis]:
+    """Detect references for each text as it is produced by an upstream stage."""
+
+    for text in texts:
+        yield detect_osis_references(text)
+
+
 def _osis_to_readable(reference: str) -> str:
     """Convert an OSIS string into a pythonbible-friendly textual form.
 
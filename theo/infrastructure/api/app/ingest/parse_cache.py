@@ -0,0 +1,293 @@
+"""Content-addressed cache of parser output for file ingestion.
+
+Parsing is the expensive part of ingesting a file: PDF extraction, docling and
+HTML extraction all re-run whenever the same bytes are uploaded again or a
+corpus is re-ingested. :class:`ParseCache` stores the parsed text, chunk list
+(chunks carry their page numbers and character offsets, which is the page map
+the persisters need) and any metadata the parser extracted, keyed by the
+payload ``sha256`` together with the parser name, parser version and the
+options that shape the output (chunk size, page limits...). Changing any of
+those yields a different key, so a chunker tweak that changes
+``max_chunk_tokens`` simply misses the cache rather than serving stale chunks.
+Bump :data:`CACHE_FORMAT_VERSION` when parser or chunker code changes output
+for the same options.
+
+Entries are gzip-compressed JSON files under ``<root>/<key[:2]>/<key>.json.gz``.
+The cache keeps an in-process LRU index ordered by file modification time
+(hits touch the file) and evicts the least recently used entries once the
+total size exceeds ``max_bytes``. Several processes may share one directory;
+entries are written atomically and a missing file is treated as a miss.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from theo.application.facades.telemetry import record_counter
+from theo.application.telemetry import INGEST_PARSE_CACHE_EVENTS_METRIC
+
+from .chunking import Chunk
+from .parsers import ParserResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+_SUFFIX = ".json.gz"
+
+
+@dataclass(slots=True)
+class CachedParse:
+    """Parser output for one payload, as stored in the cache."""
+
+    parser_result: ParserResult
+    text_content: str
+    frontmatter: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ParseCacheStats:
+    """Counters describing the cache since it was opened."""
+
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+def parse_cache_key(
+    sha256: str,
+    *,
+    parser: str,
+    parser_version: str,
+    options: Mapping[str, Any] | None = None,
+) -> str:
+    """Return the cache key for *sha256* parsed with the given parser setup."""
+
+    payload = json.dumps(
+        {
+            "format": CACHE_FORMAT_VERSION,
+            "sha256": sha256,
+            "parser": parser,
+            "parser_version": parser_version,
+            "options": dict(options or {}),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _encode(entry: CachedParse) -> bytes:
+    result = entry.parser_result
+    payload = {
+        "text": result.text,
+        "chunks": [asdict(chunk) for chunk in result.chunks],
+        "parser": result.parser,
+        "parser_version": result.parser_version,
+        "metadata": result.metadata,
+        "text_content": entry.text_content,
+        "frontmatter": entry.frontmatter,
+    }
+    return gzip.compress(
+        json.dumps(payload, ensure_ascii=False).encode("utf-8"), compresslevel=5
+    )
+
+
+def _decode(raw: bytes) -> CachedParse:
+    payload = json.loads(gzip.decompress(raw))
+    parser_result = ParserResult(
+        text=payload["text"],
+        chunks=[Chunk(**chunk) for chunk in payload["chunks"]],
+        parser=payload["parser"],
+        parser_version=payload["parser_version"],
+        metadata=dict(payload.get("metadata") or {}),
+    )
+    return CachedParse(
+        parser_result=parser_result,
+        text_content=payload.get("text_content", parser_result.text),
+        frontmatter=dict(payload.get("frontmatter") or {}),
+    )
+
+
+class ParseCache:
+    """On-disk, size-bounded LRU cache of :class:`CachedParse` entries."""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] | None = None
+        self._bytes = 0
+        self._stats = ParseCacheStats(max_bytes=max_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_SUFFIX}"
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is not None:
+            return self._index
+        found: list[tuple[float, str, int]] = []
+        if self.root.exists():
+            for path in self.root.glob(f"*/*{_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found.append(
+                    (stat.st_mtime, path.name[: -len(_SUFFIX)], stat.st_size)
+                )
+        found.sort()
+        self._index = OrderedDict((key, size) for _mtime, key, size in found)
+        self._bytes = sum(self._index.values())
+        return self._index
+
+    def _forget(self, key: str) -> None:
+        index = self._load_index()
+        size = index.pop(key, None)
+        if size is not None:
+            self._bytes -= size
+
+    def get(self, key: str) -> CachedParse | None:
+        """Return the cached entry for *key* or ``None`` on a miss."""
+
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+            entry = _decode(raw)
+        except FileNotFoundError:
+            entry = None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Discarding unreadable parse cache entry %s", path)
+            with self._lock:
+                self._forget(key)
+            path.unlink(missing_ok=True)
+            entry = None
+
+        with self._lock:
+            index = self._load_index()
+            if entry is None:
+                self._forget(key)
+                self._stats.misses += 1
+            else:
+                if key in index:
+                    index.move_to_end(key)
+                else:
+                    index[key] = len(raw)
+                    self._bytes += len(raw)
+                self._stats.hits += 1
+        if entry is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        record_counter(
+            INGEST_PARSE_CACHE_EVENTS_METRIC,
+            labels={"event": "hit" if entry is not None else "miss"},
+        )
+        return entry
+
+    def put(self, key: str, entry: CachedParse) -> bool:
+        """Store *entry* under *key*; returns ``False`` if it was not cached."""
+
+        try:
+            raw = _encode(entry)
+        except (TypeError, ValueError):
+            # Metadata that is not plain JSON (e.g. YAML dates) is not worth a
+            # lossy encoding; the payload is simply parsed again next time.
+            logger.debug("Parse result for %s is not cacheable", key, exc_info=True)
+            return False
+        if len(raw) > self.max_bytes:
+            return False
+
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(raw)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Unable to write parse cache entry %s", path, exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        evicted: list[str] = []
+        with self._lock:
+            index = self._load_index()
+            self._forget(key)
+            index[key] = len(raw)
+            self._bytes += len(raw)
+            self._stats.stores += 1
+            while self._bytes > self.max_bytes and len(index) > 1:
+                victim, size = index.popitem(last=False)
+                self._bytes -= size
+                evicted.append(victim)
+            self._stats.evictions += len(evicted)
+        for victim in evicted:
+            self._path(victim).unlink(missing_ok=True)
+        record_counter(INGEST_PARSE_CACHE_EVENTS_METRIC, labels={"event": "store"})
+        if evicted:
+            record_counter(
+                INGEST_PARSE_CACHE_EVENTS_METRIC,
+                amount=float(len(evicted)),
+                labels={"event": "evict"},
+            )
+        return True
+
+    def stats(self) -> ParseCacheStats:
+        """Return a snapshot of the cache counters and size."""
+
+        with self._lock:
+            index = self._load_index()
+            stats = self._stats
+            return ParseCacheStats(
+                entries=len(index),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hits=stats.hits,
+                misses=stats.misses,
+                stores=stats.stores,
+                evictions=stats.evictions,
+            )
+
+
+_CACHES: dict[tuple[Path, int], ParseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_parse_cache(settings: Any) -> ParseCache | None:
+    """Return the shared parse cache for *settings*, or ``None`` when disabled."""
+
+    root = getattr(settings, "ingest_parse_cache_dir", None)
+    max_bytes = int(getattr(settings, "ingest_parse_cache_max_bytes", 0) or 0)
+    if root is None or max_bytes <= 0:
+        return None
+    cache_key = (Path(root).resolve(), max_bytes)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(cache_key)
+        if cache is None:
+            cache = _CACHES[cache_key] = ParseCache(cache_key[0], max_bytes=max_bytes)
+        return cache
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "CachedParse",
+    "ParseCache",
+    "ParseCacheStats",
+    "get_parse_cache",
+    "parse_cache_key",
+]
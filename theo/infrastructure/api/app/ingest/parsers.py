@@ -638,11 +638,11 @@ def parse_html_document(path: Path, *, max_tokens: int) -> ParserResult:
 def parse_pdf_document(
     path: Path, *, max_pages: int | None, max_tokens: int
 ) -> ParserResult | _PdfExtractionErrorSentinel:
-    from .chunking import chunk_text
+    from .chunking import TextBlock, iter_chunks
 
     pages = parse_pdf(path, max_pages=max_pages)
-    if pages is PDF_EXTRACTION_UNSUPPORTED:
-        return PDF_EXTRACTION_UNSUPPORTED
+    if isinstance(pages, _PdfExtractionErrorSentinel):
+        return pages
     if not pages:
         return ParserResult(
             text="",
@@ -651,23 +651,16 @@ def parse_pdf_document(
             parser_version=_package_version("pypdf", "5.x"),
         )
 
-    chunks: list["Chunk"] = []
-    index = 0
-    cursor = 0
-    text_parts: list[str] = []
-    for page in pages:
-        text_parts.append(page.text)
-        page_chunks = chunk_text(page.text, max_tokens=max_tokens)
-        for chunk in page_chunks:
-            chunk.page_no = page.page_no
-            chunk.index = index
-            chunk.start_char += cursor
-            chunk.end_char += cursor
-            chunks.append(chunk)
-            index += 1
-        cursor += len(page.text) + 1
-
-    full_text = "\n".join(text_parts)
+    # Pages are streamed through the chunker; offsets index into the pages
+    # joined by newlines and chunks never span a page boundary.
+    chunks = list(
+        iter_chunks(
+            (TextBlock(page.text, page_no=page.page_no) for page in pages),
+            max_tokens=max_tokens,
+        )
+    )
+
+    full_text = "\n".join(page.text for page in pages)
     return ParserResult(
         text=full_text,
         chunks=chunks,
@@ -9,7 +9,7 @@ import tempfile
 from dataclasses import dataclass
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Iterator, Sequence
 from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from sqlalchemy import func
@@ -32,6 +32,10 @@ from theo.infrastructure.api.app.persistence_models import (
 )
 
 from ..creators.verse_perspectives import CreatorVersePerspectiveService
+from ..db import dashboard_counters  # noqa: F401 - registers rollup listeners
+from ..db.embedding_versions import record_version_embeddings
+from ..db.near_duplicates import record_passage_signatures
+from ..db.verse_timeline import record_document_timeline
 from .embeddings import get_embedding_service, lexical_representation
 from .events import emit_document_persisted_event
 from .exceptions import UnsupportedSourceError
@@ -56,7 +60,9 @@ from .osis import (
     canonical_verse_range,
     detect_osis_references,
     expand_osis_reference,
+    iter_detected_osis,
 )
+from .progress import report_progress
 from .sanitizer import sanitize_passage_text
 
 logger = logging.getLogger(__name__)
@@ -100,6 +106,37 @@ def _notify_document_ingested(
     )
 
 
+_EMBEDDING_BATCH_SIZE = 64
+
+
+def _iter_chunk_embeddings(
+    embedding_service: Any,
+    texts: Sequence[str],
+    *,
+    batch_size: int = _EMBEDDING_BATCH_SIZE,
+) -> Iterator[Sequence[float] | None]:
+    """Yield one embedding per text, requesting vectors a batch at a time.
+
+    Large documents produce thousands of chunks; embedding lazily keeps only
+    one batch of vectors alive while passages are being built. Missing vectors
+    (a service returning fewer rows than requested) are yielded as ``None``.
+    """
+
+    total = len(texts)
+    for start in range(0, total, batch_size):
+        batch = texts[start : start + batch_size]
+        vectors = embedding_service.embed(batch)
+        report_progress(
+            "embed",
+            "running",
+            completed=min(start + batch_size, total),
+            total=total,
+        )
+        for offset in range(len(batch)):
+            yield vectors[offset] if offset < len(vectors) else None
+    report_progress("embed", "completed", completed=total, total=total)
+
+
 def _dedupe_preserve_order(values: Iterable[str]) -> list[str]:
     seen: set[str] = set()
     ordered: list[str] = []
@@ -525,6 +562,7 @@ def persist_text_document(
     original_path: Path | None = None,
     raw_content: str | None = None,
     raw_filename: str | None = None,
+    frontmatter_sha256: str | None = None,
 ) -> Document:
     from .chunking import Chunk
 
@@ -564,6 +602,7 @@ def persist_text_document(
         theological_tradition=tradition,
         topic_domains=topic_domains,
         sha256=sha256,
+        frontmatter_sha256=frontmatter_sha256,
     )
 
     try:
@@ -598,7 +637,8 @@ def persist_text_document(
     chunk_hints = ensure_list(frontmatter.get("osis_refs"))
 
     raw_texts, sanitized_texts = sanitise_chunks(chunks)
-    embeddings = context.embedding_service.embed(sanitized_texts)
+    embeddings = _iter_chunk_embeddings(context.embedding_service, sanitized_texts)
+    detections = iter_detected_osis(sanitized_texts)
     sanitized_document_text = "\n\n".join(
         text for text in sanitized_texts if text
     ) or sanitize_passage_text(text_content)
@@ -616,7 +656,7 @@ def persist_text_document(
         )
         raw_text = raw_texts[idx] if idx < len(raw_texts) else chunk.text
 
-        detected = detect_osis_references(sanitized_text)
+        detected = next(detections, None) or detect_osis_references(sanitized_text)
         meta = normalise_passage_meta(
             detected,
             chunk_hints,
@@ -631,7 +671,7 @@ def persist_text_document(
         if topic_domains:
             meta.setdefault("topic_domains", topic_domains)
         osis_value = detected.primary or (chunk_hints[0] if chunk_hints else None)
-        embedding = embeddings[idx] if idx < len(embeddings) else None
+        embedding = next(embeddings, None)
         osis_all: list[str] = []
         if meta.get("osis_refs_all"):
             osis_all.extend(meta["osis_refs_all"])
@@ -695,6 +735,9 @@ def persist_text_document(
                 )
 
     session.flush()
+    record_document_timeline(session, document.id)
+    record_version_embeddings(session, passages)
+    record_passage_signatures(session, passages)
 
     topics = collect_topics(document, frontmatter)
     stance_overrides_raw = frontmatter.get("creator_stances") or {}
@@ -1016,7 +1059,8 @@ def persist_transcript_document(
     chunk_hints = ensure_list(frontmatter.get("osis_refs"))
     raw_texts, sanitized_texts = sanitise_chunks(chunks)
     settings = context.settings
-    embeddings = context.embedding_service.embed(sanitized_texts)
+    embeddings = _iter_chunk_embeddings(context.embedding_service, sanitized_texts)
+    detections = iter_detected_osis(sanitized_texts)
     sanitized_document_text = "\n\n".join(
         text for text in sanitized_texts if text
     )
@@ -1034,7 +1078,7 @@ def persist_transcript_document(
         )
         raw_text = raw_texts[idx] if idx < len(raw_texts) else chunk.text
 
-        detected = detect_osis_references(sanitized_text)
+        detected = next(detections, None) or detect_osis_references(sanitized_text)
         meta = normalise_passage_meta(
             detected,
             chunk_hints,
@@ -1049,7 +1093,7 @@ def persist_transcript_document(
         if topic_domains:
             meta.setdefault("topic_domains", topic_domains)
         osis_value = detected.primary or (chunk_hints[0] if chunk_hints else None)
-        embedding = embeddings[idx] if idx < len(embeddings) else None
+        embedding = next(embeddings, None)
         osis_all: list[str] = []
         if meta.get("osis_refs_all"):
             osis_all.extend(meta["osis_refs_all"])
@@ -1113,6 +1157,9 @@ def persist_transcript_document(
                 )
 
     session.flush()
+    record_document_timeline(session, document.id)
+    record_version_embeddings(session, passages)
+    record_passage_signatures(session, passages)
 
     topics = collect_topics(document, frontmatter)
     stance_overrides_raw = frontmatter.get("creator_stances") or {}
@@ -36,6 +36,7 @@ from .stages import (
 from .stages.enrichers import DocumentEnricher, VerseDetectionEnricher
 from .stages.fetchers import (
     AudioSourceFetcher,
+    DuplicateDocumentFilter,
     FileSourceFetcher,
     OsisSourceFetcher,
     TranscriptSourceFetcher,
@@ -96,6 +97,9 @@ class PipelineDependencies:
     settings: Settings | None = None
     embedding_service: EmbeddingServiceProtocol | None = None
     error_policy: ErrorPolicy | None = None
+    # Return the existing document instead of failing when a file with the
+    # same bytes and frontmatter was already ingested (bulk re-ingestion).
+    reuse_duplicates: bool = False
 
     def build_context(self, *, span) -> IngestContext:
         settings = self.settings or get_settings()
@@ -268,8 +272,12 @@ def run_pipeline_for_file(
     """Execute the file ingestion pipeline synchronously."""
 
     frontmatter_payload = merge_metadata({}, load_frontmatter(frontmatter))
+    reuse_duplicates = (
+        isinstance(dependencies, PipelineDependencies) and dependencies.reuse_duplicates
+    )
     stages = [
         FileSourceFetcher(path=path, frontmatter=frontmatter_payload),
+        DuplicateDocumentFilter(session=session, reuse_existing=reuse_duplicates),
         FileParser(),
         DocumentEnricher(default_title_factory=_file_title_default),
         TextDocumentPersister(session=session),
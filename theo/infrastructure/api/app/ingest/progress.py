@@ -0,0 +1,71 @@
+"""Per-stage progress reporting for ingestion runs.
+
+Pipelines do not know whether they run inline, in the API's ingest pool or in
+a Celery worker, so progress is published through a context variable: callers
+that care install a reporter with :func:`progress_reporter` and every
+:func:`report_progress` call made by the orchestrator and persistence helpers
+on that thread is forwarded to it. Without a reporter the calls are no-ops.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from .stages import Enricher, Parser, Persister, SourceFetcher
+
+logger = logging.getLogger(__name__)
+
+INGEST_STAGES: tuple[str, ...] = ("fetch", "parse", "chunk", "embed", "persist")
+
+ProgressReporter = Callable[[str, str, dict[str, Any]], None]
+
+_reporter: ContextVar[ProgressReporter | None] = ContextVar(
+    "theo_ingest_progress_reporter", default=None
+)
+
+
+@contextmanager
+def progress_reporter(reporter: ProgressReporter) -> Iterator[None]:
+    """Forward :func:`report_progress` calls in this context to *reporter*."""
+
+    token = _reporter.set(reporter)
+    try:
+        yield
+    finally:
+        _reporter.reset(token)
+
+
+def report_progress(stage: str, status: str, **detail: Any) -> None:
+    """Publish a progress update for *stage* (``running``/``completed``/``failed``)."""
+
+    reporter = _reporter.get()
+    if reporter is None:
+        return
+    try:
+        reporter(stage, status, detail)
+    except Exception:  # pragma: no cover - progress must never fail ingestion
+        logger.debug("ingest progress reporter failed", exc_info=True)
+
+
+def stage_kind(stage: Any) -> str | None:
+    """Map an orchestrator stage onto its public progress stage name."""
+
+    if isinstance(stage, SourceFetcher):
+        return "fetch"
+    if isinstance(stage, (Parser, Enricher)):
+        return "parse"
+    if isinstance(stage, Persister):
+        return "persist"
+    return None
+
+
+__all__ = [
+    "INGEST_STAGES",
+    "ProgressReporter",
+    "progress_reporter",
+    "report_progress",
+    "stage_kind",
+]
@@ -9,9 +9,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.persistence_models import Document
+
 from .. import network as ingest_network
 from ..exceptions import UnsupportedSourceError
-from ..metadata import detect_source_type, load_frontmatter, merge_metadata
+from ..metadata import (
+    detect_source_type,
+    frontmatter_fingerprint,
+    load_frontmatter,
+    merge_metadata,
+)
 from ..network import (
     extract_youtube_video_id,
     fetch_web_document,
@@ -44,6 +54,7 @@ class FileSourceFetcher(SourceFetcher):
             "sha256": sha256,
             "source_type": source_type,
             "frontmatter": merged_frontmatter,
+            "frontmatter_sha256": frontmatter_fingerprint(merged_frontmatter),
             "cache_status": "n/a",
             "document_metadata": {
                 "sha256": sha256,
@@ -53,6 +64,56 @@ class FileSourceFetcher(SourceFetcher):
         }
 
 
+@dataclass(slots=True)
+class DuplicateDocumentFilter(SourceFetcher):
+    """Stop before parsing when the fetched payload was already ingested.
+
+    Runs after a fetcher that recorded ``sha256``. A payload whose hash is not
+    stored yet passes through untouched. When it is, the stage either reuses
+    the existing document, if ``reuse_existing`` is set and the caller's
+    frontmatter fingerprint is unchanged, by setting ``short_circuit`` so the
+    orchestrator skips the remaining stages, or fails fast with the same
+    "Document already ingested" error the persisters raise, without parsing
+    the payload first.
+    """
+
+    session: Session
+    reuse_existing: bool = False
+    name: str = "duplicate_document_filter"
+
+    def fetch(self, *, context: Any, state: dict[str, Any]) -> dict[str, Any]:
+        sha256 = state.get("sha256")
+        if not sha256:
+            return {}
+        existing = self.session.execute(
+            select(Document.id, Document.frontmatter_sha256).where(
+                Document.sha256 == sha256
+            )
+        ).first()
+        if existing is None:
+            return {}
+
+        fingerprint = state.get("frontmatter_sha256")
+        if not (
+            self.reuse_existing
+            and fingerprint
+            and existing.frontmatter_sha256 == fingerprint
+        ):
+            raise UnsupportedSourceError("Document already ingested")
+
+        document = self.session.get(Document, existing.id)
+        context.instrumentation.set("ingest.deduplicated", True)
+        context.instrumentation.set("ingest.document_id", existing.id)
+        metadata = dict(state.get("document_metadata") or {})
+        metadata["document_id"] = existing.id
+        return {
+            "document": document,
+            "document_metadata": metadata,
+            "cache_status": "duplicate",
+            "short_circuit": True,
+        }
+
+
 @dataclass(slots=True)
 class UrlSourceFetcher(SourceFetcher):
     """Fetch web documents and associated metadata."""
@@ -18,8 +18,10 @@ from ..metadata import (
     prepare_transcript_chunks,
 )
 from ..osis import OsisDocument, ResolvedCommentaryAnchor
+from ..parse_cache import CachedParse, get_parse_cache, parse_cache_key
 from ..parsers import (
     ParserResult,
+    _package_version,
     load_transcript,
     parse_audio_document,
     parse_docx_document,
@@ -77,9 +79,96 @@ def _hash_parser_result(parser_result: ParserResult) -> str:
     return hashlib.sha256(payload).hexdigest()
 
 
+# Source types whose parse depends only on the payload bytes and settings.
+# Audio parsing also reads the caller's frontmatter, so it is never cached.
+_CACHEABLE_SOURCE_TYPES = frozenset(
+    {"markdown", "txt", "file", "docx", "html", "pdf", "transcript"}
+)
+
+# Distribution whose version is part of the cache key for each source type.
+_PARSER_DISTRIBUTIONS = {
+    "pdf": "pypdf",
+    "docx": "docling",
+    "html": "unstructured",
+}
+
+
+def _parse_cache_key(
+    source_type: str, sha256: str, *, parser: str, settings: Any
+) -> str:
+    distribution = _PARSER_DISTRIBUTIONS.get(source_type)
+    parser_version = (
+        _package_version(distribution, "unknown") if distribution else "builtin"
+    )
+    options: dict[str, Any] = {"max_chunk_tokens": settings.max_chunk_tokens}
+    if source_type == "pdf":
+        options["doc_max_pages"] = settings.doc_max_pages
+    elif source_type == "transcript":
+        options["transcript_max_window"] = getattr(
+            settings, "transcript_max_window", 40.0
+        )
+    return parse_cache_key(
+        sha256,
+        parser=f"{parser}:{source_type}",
+        parser_version=parser_version,
+        options=options,
+    )
+
+
+def _parse_file(
+    source_type: str, path: Path, *, settings: Any, frontmatter: dict[str, Any]
+) -> CachedParse:
+    """Parse *path* and return its output plus the frontmatter it carried."""
+
+    if source_type in {"markdown", "txt", "file"}:
+        text_content, parsed_frontmatter = parse_text_file(path)
+        return CachedParse(
+            parser_result=prepare_text_chunks(text_content, settings=settings),
+            text_content=text_content,
+            frontmatter=parsed_frontmatter,
+        )
+    if source_type == "docx":
+        parser_result = parse_docx_document(path, max_tokens=settings.max_chunk_tokens)
+        return CachedParse(
+            parser_result, parser_result.text, dict(parser_result.metadata)
+        )
+    if source_type == "html":
+        parser_result = parse_html_document(path, max_tokens=settings.max_chunk_tokens)
+        return CachedParse(
+            parser_result, parser_result.text, dict(parser_result.metadata)
+        )
+    if source_type == "pdf":
+        parser_result = prepare_pdf_chunks(path, settings=settings)
+        return CachedParse(parser_result, parser_result.text)
+    if source_type == "transcript":
+        segments = load_transcript(path)
+        parser_result = prepare_transcript_chunks(segments, settings=settings)
+        return CachedParse(parser_result, parser_result.text)
+    if source_type == "audio":
+        parser_result = parse_audio_document(
+            path,
+            max_tokens=settings.max_chunk_tokens,
+            settings=settings,
+            frontmatter=frontmatter,
+        )
+        return CachedParse(
+            parser_result, parser_result.text, dict(parser_result.metadata)
+        )
+    text_content, parsed_frontmatter = parse_text_file(path)
+    return CachedParse(
+        parser_result=prepare_text_chunks(text_content, settings=settings),
+        text_content=text_content,
+        frontmatter=parsed_frontmatter,
+    )
+
+
 @dataclass(slots=True)
 class FileParser(Parser):
-    """Parse local files based on detected source types."""
+    """Parse local files based on detected source types.
+
+    Results are looked up in and stored to the content-addressed parse cache
+    (see :mod:`..parse_cache`) when the fetcher recorded the payload hash.
+    """
 
     name: str = "file_parser"
 
@@ -88,51 +177,37 @@ class FileParser(Parser):
         source_type = state["source_type"]
         path: Path = state["path"]
         frontmatter = dict(state.get("frontmatter") or {})
-        parser_result: ParserResult | None = None
-        text_content = ""
-
-        if source_type in {"markdown", "txt", "file"}:
-            text_content, parsed_frontmatter = parse_text_file(path)
-            frontmatter = merge_metadata(parsed_frontmatter, frontmatter)
-            parser_result = prepare_text_chunks(text_content, settings=settings)
-        elif source_type == "docx":
-            parser_result = parse_docx_document(path, max_tokens=settings.max_chunk_tokens)
-            frontmatter = merge_metadata(parser_result.metadata, frontmatter)
-            text_content = parser_result.text
-        elif source_type == "html":
-            parser_result = parse_html_document(path, max_tokens=settings.max_chunk_tokens)
-            frontmatter = merge_metadata(parser_result.metadata, frontmatter)
-            text_content = parser_result.text
-        elif source_type == "pdf":
-            parser_result = prepare_pdf_chunks(path, settings=settings)
-            text_content = parser_result.text
-        elif source_type == "transcript":
-            segments = load_transcript(path)
-            parser_result = prepare_transcript_chunks(segments, settings=settings)
-            text_content = parser_result.text
-        elif source_type == "audio":
-            parser_result = parse_audio_document(
-                path,
-                max_tokens=settings.max_chunk_tokens,
-                settings=settings,
-                frontmatter=frontmatter,
+
+        sha256 = state.get("sha256")
+        cache = get_parse_cache(settings) if sha256 else None
+        cache_key: str | None = None
+        parsed: CachedParse | None = None
+        if (
+            cache is not None
+            and isinstance(sha256, str)
+            and source_type in _CACHEABLE_SOURCE_TYPES
+        ):
+            cache_key = _parse_cache_key(
+                source_type, sha256, parser=self.name, settings=settings
             )
-            frontmatter = merge_metadata(parser_result.metadata, frontmatter)
-            text_content = parser_result.text
-        else:
-            text_content, parsed_frontmatter = parse_text_file(path)
-            frontmatter = merge_metadata(parsed_frontmatter, frontmatter)
-            parser_result = prepare_text_chunks(text_content, settings=settings)
+            parsed = cache.get(cache_key)
 
-        if parser_result is None:
-            raise UnsupportedSourceError(
-                f"Unable to parse source type {source_type}"
+        cache_status = state.get("cache_status", "n/a")
+        if parsed is not None:
+            cache_status = "hit"
+        else:
+            parsed = _parse_file(
+                source_type, path, settings=settings, frontmatter=frontmatter
             )
+            if cache is not None and cache_key is not None:
+                cache_status = "miss"
+                cache.put(cache_key, parsed)
 
         return {
-            "parser_result": parser_result,
-            "frontmatter": frontmatter,
-            "text_content": text_content,
+            "parser_result": parsed.parser_result,
+            "frontmatter": merge_metadata(parsed.frontmatter, frontmatter),
+            "text_content": parsed.text_content,
+            "cache_status": cache_status,
         }
 
 
@@ -15,6 +15,7 @@ from ..persistence import (
     persist_text_document,
     persist_transcript_document,
 )
+from ..progress import report_progress
 from . import Persister
 
 
@@ -22,6 +23,7 @@ def _set_chunk_metrics(context: Any, parser_result: Any) -> None:
     chunk_count = len(parser_result.chunks)
     context.instrumentation.set("ingest.chunk_count", chunk_count)
     context.instrumentation.set("ingest.batch_size", min(chunk_count, 32))
+    report_progress("chunk", "completed", chunks=chunk_count)
 
 
 @dataclass(slots=True)
@@ -63,6 +65,7 @@ class TextDocumentPersister(Persister):
             original_path=state.get("path"),
             raw_content=state.get("html") or state.get("raw_content"),
             raw_filename=state.get("raw_filename"),
+            frontmatter_sha256=state.get("frontmatter_sha256"),
         )
         context.instrumentation.set("ingest.document_id", document.id)
         metadata.setdefault("document_id", document.id)
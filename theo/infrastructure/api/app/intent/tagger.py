@@ -6,20 +6,27 @@ import logging
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-try:  # pragma: no cover - optional dependency resolution
-    import joblib
-except Exception:  # noqa: BLE001 - handled by fail-open logic
-    joblib = None  # type: ignore[assignment]
+from ..utils.imports import import_optional
 
-try:  # pragma: no cover - optional dependency resolution
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     from sklearn.pipeline import Pipeline
-except Exception:  # noqa: BLE001 - handled by fail-open logic
-    Pipeline = Any  # type: ignore[assignment]
 
 LOGGER = logging.getLogger(__name__)
 
+_UNRESOLVED: Any = object()
+# joblib (and the scikit-learn classes it unpickles) is imported when a tagger
+# is first requested rather than with the chat routes.
+joblib: Any = _UNRESOLVED
+
+
+def _resolve_joblib() -> Any:
+    global joblib
+    if joblib is _UNRESOLVED:
+        joblib = import_optional("joblib")
+    return joblib
+
 
 @dataclass(slots=True)
 class IntentTag:
@@ -87,6 +94,7 @@ class IntentTagger:
         return value, None
 
     def _ensure_loaded(self) -> Pipeline:
+        joblib = _resolve_joblib()
         if joblib is None:
             raise RuntimeError("joblib is required to load intent tagger models")
         if self._pipeline is not None:
@@ -127,7 +135,7 @@ def get_intent_tagger(settings: Any) -> IntentTagger | None:
     if not enabled:
         return None
 
-    if joblib is None:
+    if _resolve_joblib() is None:
         LOGGER.warning("Intent tagger enabled but joblib is not installed")
         return None
 
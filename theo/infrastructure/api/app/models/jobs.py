@@ -75,6 +75,13 @@ class JobQueuedResponse(APIModel):
     status: str
 
 
+class IngestJobAccepted(APIModel):
+    job_id: str
+    status: str
+    status_url: str
+    events_url: str
+
+
 class JobUpdateRequest(APIModel):
     status: str | None = None
     error: str | None = None
@@ -377,3 +377,36 @@ class GeoVerseResponse(APIModel):
     osis: str
     places: list[GeoPlaceOccurrence] = Field(default_factory=list)
     attribution: GeoAttribution | None = None
+
+
+class GeoNearbyLocation(APIModel):
+    modern_id: str
+    name: str
+    lat: float
+    lng: float
+    confidence: float | None = None
+    distance_km: float | None = None
+
+
+class GeoNearbyResponse(APIModel):
+    items: list[GeoNearbyLocation] = Field(default_factory=list)
+
+
+class GeoRegionPassage(APIModel):
+    passage_id: str
+    document_id: str
+    osis_ref: str | None = None
+
+
+class GeoRegionPlace(APIModel):
+    ancient_id: str
+    friendly_id: str
+    classification: str | None = None
+    osis_refs: list[str] = Field(default_factory=list)
+    modern_locations: list[GeoNearbyLocation] = Field(default_factory=list)
+    passages: list[GeoRegionPassage] = Field(default_factory=list)
+
+
+class GeoRegionResponse(APIModel):
+    osis: str
+    places: list[GeoRegionPlace] = Field(default_factory=list)
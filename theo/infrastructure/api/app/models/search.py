@@ -27,6 +27,13 @@ class HybridSearchRequest(APIModel):
     mode: str = Field(
         default="results", description="Search export mode (results or mentions)"
     )
+    collapse_duplicates: bool | None = Field(
+        default=None,
+        description=(
+            "Keep one passage per near-duplicate cluster (defaults to the"
+            " search_collapse_near_duplicates setting)"
+        ),
+    )
 
 
 class HybridSearchResult(Passage):
@@ -25,6 +25,10 @@ class VerseMentionsResponse(APIModel):
     osis: str
     mentions: list[VerseMention]
     total: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as ``cursor`` to fetch the next page of mentions",
+    )
 
 
 class VerseGraphNode(APIModel):
@@ -42,7 +46,9 @@ class VerseGraphEdge(APIModel):
     id: str
     source: str
     target: str
-    kind: Literal["mention", "contradiction", "harmony", "commentary"]
+    kind: Literal[
+        "mention", "contradiction", "harmony", "commentary", "co_mention", "crossref"
+    ]
     summary: str | None = Field(default=None, description="Human readable caption")
     perspective: str | None = Field(default=None, description="Perspective tag for the edge")
     tags: list[str] | None = Field(default=None, description="Topic tags associated with the edge")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-from .features import FEATURE_NAMES, extract_features
+from .features import FEATURE_NAMES, extract_feature_array, extract_features
 from .metrics import dcg, mrr, ndcg
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
@@ -13,6 +13,7 @@ if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
 
 __all__ = [
     "FEATURE_NAMES",
+    "extract_feature_array",
     "extract_features",
     "dcg",
     "mrr",
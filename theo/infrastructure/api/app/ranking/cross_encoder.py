@@ -0,0 +1,259 @@
+"""Query–passage cross-encoder reranking stage.
+
+The estimator reranker only sees retrieval scores, so it cannot tell which of
+two lexically similar passages actually answers the question. A cross-encoder
+reads the query and passage together and does, at the price of a transformer
+forward pass per pair. :class:`CrossEncoderReranker` bounds that price: it
+scores only the leading ``top_n`` results, in batches, stops once the
+per-request latency budget is spent, and remembers every score in a
+:class:`CrossEncoderScoreCache` keyed by ``(query hash, passage id, model)`` so
+repeated and paginated queries skip the model entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, Mapping, Protocol, Sequence
+
+import numpy as np
+
+from ..models.search import HybridSearchResult
+from ..utils.imports import import_optional
+from .re_ranker import _reorder
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from theo.application.facades.settings import Settings
+
+    from .feature_store import PassageFeatureStore
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, str]
+
+
+class CrossEncoderBackend(Protocol):
+    """Minimal surface of a pairwise relevance model (``FlagReranker``)."""
+
+    def compute_score(
+        self, sentence_pairs: Sequence[tuple[str, str]], batch_size: int = ...
+    ) -> Sequence[float] | float:
+        ...
+
+
+def query_fingerprint(query: str) -> str:
+    """Return a stable hash of *query* ignoring case and spacing."""
+
+    normalised = " ".join(query.casefold().split())
+    return hashlib.blake2b(normalised.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CrossEncoderScoreCache:
+    """Thread-safe LRU of cross-encoder scores."""
+
+    def __init__(self, max_entries: int = 20000) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: Iterable[CacheKey]) -> dict[CacheKey, float]:
+        found: dict[CacheKey, float] = {}
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+                self.hits += 1
+        return found
+
+    def put_many(self, scores: Mapping[CacheKey, float]) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            for key, value in scores.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _passage_text(result: HybridSearchResult, max_chars: int) -> str:
+    text = result.text or result.snippet or ""
+    return text[:max_chars]
+
+
+class CrossEncoderReranker:
+    """Rerank the leading results of a query with a cross-encoder."""
+
+    requires_query = True
+
+    def __init__(
+        self,
+        backend: CrossEncoderBackend,
+        *,
+        model_name: str,
+        top_n: int = 20,
+        batch_size: int = 16,
+        latency_budget_ms: float | None = None,
+        cache: CrossEncoderScoreCache | None = None,
+        max_passage_chars: int = 2048,
+    ) -> None:
+        if top_n < 1 or batch_size < 1:
+            raise ValueError("top_n and batch_size must be positive")
+        self._backend = backend
+        self.model_name = model_name
+        self.top_n = top_n
+        self.batch_size = batch_size
+        self.latency_budget_ms = latency_budget_ms
+        self.cache = cache if cache is not None else CrossEncoderScoreCache()
+        self.max_passage_chars = max_passage_chars
+
+    def score(
+        self, query: str, results: Sequence[HybridSearchResult]
+    ) -> np.ndarray:
+        """Return one score per result, NaN where the budget ran out first.
+
+        Cached pairs are answered without calling the model. The remaining
+        pairs are scored in ``batch_size`` batches in result order, so when the
+        latency budget expires it is the lowest-ranked candidates that stay
+        unscored.
+        """
+
+        candidates = list(results)[: self.top_n]
+        scores = np.full(len(candidates), np.nan, dtype=np.float64)
+        if not candidates:
+            return scores
+        fingerprint = query_fingerprint(query)
+        keys = [(fingerprint, str(item.id), self.model_name) for item in candidates]
+        cached = self.cache.get_many(keys)
+        pending: list[int] = []
+        for index, key in enumerate(keys):
+            value = cached.get(key)
+            if value is None:
+                pending.append(index)
+            else:
+                scores[index] = value
+
+        started = time.perf_counter()
+        computed: dict[CacheKey, float] = {}
+        for offset in range(0, len(pending), self.batch_size):
+            if self._budget_spent(started):
+                logger.debug(
+                    "cross-encoder budget exhausted with %d pairs unscored",
+                    len(pending) - offset,
+                )
+                break
+            batch = pending[offset : offset + self.batch_size]
+            pairs = [
+                (query, _passage_text(candidates[index], self.max_passage_chars))
+                for index in batch
+            ]
+            raw = self._backend.compute_score(pairs, batch_size=self.batch_size)
+            batch_scores = np.asarray(raw, dtype=np.float64).reshape(-1)
+            for index, value in zip(batch, batch_scores):
+                scores[index] = value
+                computed[keys[index]] = float(value)
+        self.cache.put_many(computed)
+        return scores
+
+    def rerank(
+        self,
+        results: Sequence[HybridSearchResult],
+        *,
+        query: str,
+        feature_store: "PassageFeatureStore | None" = None,
+    ) -> list[HybridSearchResult]:
+        """Return *results* re-ordered by cross-encoder relevance to *query*."""
+
+        results_list = list(results)
+        return _reorder(results_list, self.score(query, results_list))
+
+    def _budget_spent(self, started: float) -> bool:
+        if self.latency_budget_ms is None:
+            return False
+        return (time.perf_counter() - started) * 1000.0 >= self.latency_budget_ms
+
+
+_cross_encoder_lock = threading.Lock()
+_cross_encoders: dict[tuple[object, ...], CrossEncoderReranker | None] = {}
+
+
+def get_cross_encoder(settings: "Settings") -> CrossEncoderReranker | None:
+    """Return the process-wide cross-encoder configured in *settings*.
+
+    Returns ``None`` when no model is configured or the ``ml`` extra that
+    provides ``FlagEmbedding`` is not installed. The model is loaded once per
+    configuration and shared, together with its score cache, by every request.
+    """
+
+    model_name = getattr(settings, "reranker_cross_encoder_model", None)
+    if not model_name:
+        return None
+    key = (
+        model_name,
+        settings.reranker_cross_encoder_top_n,
+        settings.reranker_cross_encoder_batch_size,
+        settings.reranker_cross_encoder_budget_ms,
+        settings.reranker_cross_encoder_cache_size,
+    )
+    with _cross_encoder_lock:
+        if key in _cross_encoders:
+            return _cross_encoders[key]
+        reranker: CrossEncoderReranker | None = None
+        # FlagEmbedding pulls in torch and transformers; only pay for that
+        # once a cross-encoder is actually configured.
+        flag_reranker = import_optional("FlagEmbedding", "FlagReranker")
+        if flag_reranker is None:
+            logger.warning(
+                "Cross-encoder %s configured but FlagEmbedding is not installed",
+                model_name,
+            )
+        else:
+            try:
+                backend = flag_reranker(model_name, use_fp16=False)
+            except Exception:  # pragma: no cover - defensive logging
+                logger.exception("Failed to load cross-encoder %s", model_name)
+            else:
+                reranker = CrossEncoderReranker(
+                    backend,
+                    model_name=model_name,
+                    top_n=settings.reranker_cross_encoder_top_n,
+                    batch_size=settings.reranker_cross_encoder_batch_size,
+                    latency_budget_ms=settings.reranker_cross_encoder_budget_ms,
+                    cache=CrossEncoderScoreCache(
+                        settings.reranker_cross_encoder_cache_size
+                    ),
+                )
+        # Only the current configuration is kept so a settings change
+        # releases the previous model.
+        _cross_encoders.clear()
+        _cross_encoders[key] = reranker
+        return reranker
+
+
+__all__ = [
+    "CrossEncoderBackend",
+    "CrossEncoderReranker",
+    "CrossEncoderScoreCache",
+    "get_cross_encoder",
+    "query_fingerprint",
+]
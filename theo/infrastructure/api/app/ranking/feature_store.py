@@ -0,0 +1,337 @@
+"""Precomputed per-passage ranking features.
+
+Per-request scores only describe how well a passage matched the query. The
+signals here describe the passage itself: how users reacted to it
+(``FeedbackEvent`` rows, including the ``used_in_answer`` events written by
+``record_used_citation_feedback``), how trustworthy its document is, how long
+it is and how densely it cites scripture. They are aggregated offline by
+:func:`rebuild_passage_features` into ``passage_features`` and loaded into a
+:class:`PassageFeatureStore`, a dense float32 matrix with a passage-id index,
+so the reranker adds them with one vectorised gather per query.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from theo.infrastructure.api.app.persistence_models import (
+    Document,
+    FeedbackEvent,
+    FeedbackEventAction,
+    Passage,
+    PassageFeature,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_FEATURE_NAMES: tuple[str, ...] = (
+    "feedback_positive",
+    "feedback_negative",
+    "feedback_views",
+    "citation_count",
+    "provenance_score",
+    "passage_length",
+    "osis_density",
+)
+FEATURE_STORE_CACHE_SECONDS = 300.0
+_REBUILD_BATCH_SIZE = 5000
+
+_POSITIVE_ACTIONS = frozenset(
+    {FeedbackEventAction.CLICK, FeedbackEventAction.COPY, FeedbackEventAction.LIKE}
+)
+
+
+@dataclass(slots=True)
+class FeatureRebuildStats:
+    passages: int
+    with_feedback: int
+    duration_seconds: float
+
+
+def _action(value: object) -> FeedbackEventAction | None:
+    try:
+        return FeedbackEventAction(getattr(value, "value", value))
+    except ValueError:
+        return None
+
+
+def _feedback_counts(session: Session) -> dict[str, dict[FeedbackEventAction, int]]:
+    stmt = (
+        select(FeedbackEvent.passage_id, FeedbackEvent.action, func.count())
+        .where(FeedbackEvent.passage_id.is_not(None))
+        .group_by(FeedbackEvent.passage_id, FeedbackEvent.action)
+    )
+    counts: dict[str, dict[FeedbackEventAction, int]] = defaultdict(dict)
+    for passage_id, raw_action, total in session.execute(stmt):
+        action = _action(raw_action)
+        if action is not None:
+            counts[str(passage_id)][action] = int(total)
+    return counts
+
+
+def _verse_count(
+    verse_ids: Sequence[int] | None, start: int | None, end: int | None
+) -> int:
+    if verse_ids:
+        return len(verse_ids)
+    if start is not None and end is not None and end >= start:
+        return end - start + 1
+    return 0
+
+
+def passage_feature_row(
+    *,
+    tokens: int | None,
+    text_length: int | None,
+    verse_count: int,
+    provenance: int | None,
+    feedback: dict[FeedbackEventAction, int] | None = None,
+) -> dict[str, float]:
+    """Return the stored feature values for one passage."""
+
+    feedback = feedback or {}
+    positive = sum(feedback.get(action, 0) for action in _POSITIVE_ACTIONS)
+    token_count = tokens if tokens else max(1, (text_length or 0) // 5)
+    return {
+        "feedback_positive": math.log1p(positive),
+        "feedback_negative": math.log1p(feedback.get(FeedbackEventAction.DISLIKE, 0)),
+        "feedback_views": math.log1p(feedback.get(FeedbackEventAction.VIEW, 0)),
+        "citation_count": math.log1p(
+            feedback.get(FeedbackEventAction.USED_IN_ANSWER, 0)
+        ),
+        "provenance_score": (provenance or 0) / 100.0,
+        "passage_length": math.log1p(token_count),
+        "osis_density": verse_count * 100.0 / token_count,
+    }
+
+
+def rebuild_passage_features(
+    session: Session, *, batch_size: int = _REBUILD_BATCH_SIZE
+) -> FeatureRebuildStats:
+    """Recompute ``passage_features`` for every passage and commit."""
+
+    started = time.perf_counter()
+    feedback = _feedback_counts(session)
+    computed_at = datetime.now(UTC)
+    session.execute(delete(PassageFeature))
+
+    total = 0
+    after_id: str | None = None
+    while True:
+        stmt = (
+            select(
+                Passage.id,
+                Passage.tokens,
+                func.length(Passage.text),
+                Passage.osis_verse_ids,
+                Passage.osis_start_verse_id,
+                Passage.osis_end_verse_id,
+                Document.provenance_score,
+            )
+            .join(Document, Document.id == Passage.document_id)
+            .order_by(Passage.id)
+            .limit(batch_size)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Passage.id > after_id)
+        rows = session.execute(stmt).all()
+        if not rows:
+            break
+        payload = []
+        for passage_id, tokens, length, verse_ids, start, end, provenance in rows:
+            values = passage_feature_row(
+                tokens=tokens,
+                text_length=length,
+                verse_count=_verse_count(verse_ids, start, end),
+                provenance=provenance,
+                feedback=feedback.get(passage_id),
+            )
+            payload.append(
+                {"passage_id": passage_id, "computed_at": computed_at, **values}
+            )
+        session.execute(insert(PassageFeature), payload)
+        total += len(rows)
+        after_id = rows[-1][0]
+
+    session.commit()
+    _expire_passage_feature_store()
+    stats = FeatureRebuildStats(
+        passages=total,
+        with_feedback=len(feedback),
+        duration_seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "ranking.passage_features_rebuilt",
+        extra={
+            "event": "ranking.passage_features_rebuilt",
+            "passages": stats.passages,
+            "with_feedback": stats.with_feedback,
+            "duration_seconds": round(stats.duration_seconds, 3),
+        },
+    )
+    return stats
+
+
+class PassageFeatureStore:
+    """Dense feature matrix indexed by passage id.
+
+    The matrix carries one trailing all-zero row that passages without stored
+    features (ingested since the last rebuild) resolve to.
+    """
+
+    __slots__ = ("_index", "_matrix", "loaded_at")
+
+    def __init__(self, passage_ids: Sequence[str], matrix: np.ndarray) -> None:
+        width = len(STORE_FEATURE_NAMES)
+        matrix = np.asarray(matrix, dtype=np.float32).reshape(-1, width)
+        if matrix.shape[0] != len(passage_ids):
+            raise ValueError("passage_ids and matrix rows must align")
+        self._index = {passage_id: row for row, passage_id in enumerate(passage_ids)}
+        self._matrix = np.vstack([matrix, np.zeros((1, width), dtype=np.float32)])
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def load(cls, session: Session) -> "PassageFeatureStore":
+        columns = [getattr(PassageFeature, name) for name in STORE_FEATURE_NAMES]
+        rows = session.execute(
+            select(PassageFeature.passage_id, *columns).order_by(
+                PassageFeature.passage_id
+            )
+        ).all()
+        passage_ids = [row[0] for row in rows]
+        matrix = np.array([row[1:] for row in rows], dtype=np.float32)
+        return cls(passage_ids, matrix)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, passage_id: object) -> bool:
+        return passage_id in self._index
+
+    def gather(self, passage_ids: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(passage_ids), n_features)`` matrix for *passage_ids*."""
+
+        missing = len(self._index)
+        rows = np.fromiter(
+            (self._index.get(str(pid), missing) for pid in passage_ids),
+            dtype=np.intp,
+            count=len(passage_ids),
+        )
+        return self._matrix[rows]
+
+
+_store_lock = threading.Lock()
+_store: PassageFeatureStore | None = None
+_refreshing = False
+_retry_at = 0.0
+
+
+def refresh_passage_feature_store(
+    session: Session, *, retry_after: float = FEATURE_STORE_CACHE_SECONDS
+) -> PassageFeatureStore | None:
+    """Load the feature table and publish it as the process-wide store.
+
+    The store is built without holding the lock and swapped in with a single
+    assignment, so readers always see either the old or the new matrix. A
+    failed load keeps the current store and suppresses further attempts for
+    *retry_after* seconds.
+    """
+
+    global _store, _retry_at
+    try:
+        store = PassageFeatureStore.load(session)
+    except SQLAlchemyError:
+        session.rollback()
+        logger.debug("passage feature store unavailable", exc_info=True)
+        with _store_lock:
+            _retry_at = time.monotonic() + retry_after
+            return _store
+    with _store_lock:
+        _store = store
+    return store
+
+
+def _refresh_in_background(engine: Any, *, retry_after: float) -> None:
+    global _refreshing
+    with _store_lock:
+        if _refreshing or time.monotonic() < _retry_at:
+            return
+        _refreshing = True
+
+    def _run() -> None:
+        global _refreshing
+        try:
+            with Session(bind=engine) as session:
+                refresh_passage_feature_store(session, retry_after=retry_after)
+        except Exception:  # pragma: no cover - logged for operators
+            logger.exception("passage feature store refresh failed")
+        finally:
+            with _store_lock:
+                _refreshing = False
+
+    threading.Thread(
+        target=_run, name="passage-feature-store-refresh", daemon=True
+    ).start()
+
+
+def get_passage_feature_store(
+    session: Session, *, max_age: float = FEATURE_STORE_CACHE_SECONDS
+) -> PassageFeatureStore | None:
+    """Return the process-wide store, refreshing it in the background.
+
+    Once the store is *max_age* old (or before the first load) a refresh is
+    started on a separate thread and the current store, possibly ``None``, is
+    returned immediately; callers fall back to per-request features until a
+    store is available.
+    """
+
+    current = _store
+    if current is None or time.monotonic() - current.loaded_at >= max_age:
+        # Use the engine rather than a connection the caller may be holding.
+        _refresh_in_background(session.get_bind().engine, retry_after=max_age)
+    return current
+
+
+def _expire_passage_feature_store() -> None:
+    """Mark the cached store stale so the next lookup refreshes it."""
+
+    global _retry_at
+    with _store_lock:
+        if _store is not None:
+            _store.loaded_at = float("-inf")
+        _retry_at = 0.0
+
+
+def invalidate_passage_feature_store() -> None:
+    """Drop the cached store so the next lookup reloads it."""
+
+    global _store, _retry_at
+    with _store_lock:
+        _store = None
+        _retry_at = 0.0
+
+
+__all__ = [
+    "FEATURE_STORE_CACHE_SECONDS",
+    "FeatureRebuildStats",
+    "PassageFeatureStore",
+    "STORE_FEATURE_NAMES",
+    "get_passage_feature_store",
+    "invalidate_passage_feature_store",
+    "passage_feature_row",
+    "rebuild_passage_features",
+    "refresh_passage_feature_store",
+]
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
 
 from ..models.search import HybridSearchResult
 
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .feature_store import PassageFeatureStore
+
 FEATURE_NAMES: tuple[str, ...] = (
     "score",
     "vector_score",
@@ -23,20 +28,39 @@ def _coerce(value: float | int | None) -> float:
     return float(value)
 
 
-def extract_features(results: Sequence[HybridSearchResult]) -> list[list[float]]:
-    """Return a dense feature matrix for the supplied search results."""
-
-    matrix: list[list[float]] = []
-    for result in results:
-        matrix.append(
-            [
-                _coerce(result.score),
-                _coerce(result.vector_score),
-                _coerce(result.lexical_score),
-                _coerce(result.document_score),
-                _coerce(result.document_rank),
-                _coerce(result.rank),
-                _coerce(result.osis_distance),
-            ]
-        )
-    return matrix
+def extract_feature_array(
+    results: Sequence[HybridSearchResult],
+    *,
+    feature_store: "PassageFeatureStore | None" = None,
+) -> np.ndarray:
+    """Return a ``(len(results), n_features)`` float64 feature matrix.
+
+    When ``feature_store`` is given, its precomputed passage features
+    (``STORE_FEATURE_NAMES``) are appended to each row after
+    :data:`FEATURE_NAMES`.
+    """
+
+    count = len(results)
+    matrix = np.fromiter(
+        (
+            _coerce(getattr(result, name))
+            for result in results
+            for name in FEATURE_NAMES
+        ),
+        dtype=np.float64,
+        count=count * len(FEATURE_NAMES),
+    ).reshape(count, len(FEATURE_NAMES))
+    if feature_store is None or not count:
+        return matrix
+    stored = feature_store.gather([str(result.id) for result in results])
+    return np.hstack([matrix, stored.astype(np.float64, copy=False)])
+
+
+def extract_features(
+    results: Sequence[HybridSearchResult],
+    *,
+    feature_store: "PassageFeatureStore | None" = None,
+) -> list[list[float]]:
+    """Return :func:`extract_feature_array` as nested Python lists."""
+
+    return extract_feature_array(results, feature_store=feature_store).tolist()
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import hashlib
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-import joblib  # type: ignore[import]
+import numpy as np
 
 from ..models.search import HybridSearchResult
-from .features import extract_features
+from .features import FEATURE_NAMES, extract_feature_array
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .feature_store import PassageFeatureStore
 from .mlflow_integration import (
     MlflowResolutionError,
     is_mlflow_uri,
@@ -59,17 +62,18 @@ def _load_model(path: Path, *, expected_sha256: str | None = None):
                 "Hash mismatch for reranker model: expected %s but loaded %s"
                 % (expected_sha256, actual_sha256)
             )
+    import joblib  # type: ignore[import]
+
     return joblib.load(artifact_path)
 
 
-def _coerce_scores(raw: object) -> list[float]:
-    if hasattr(raw, "tolist"):
-        raw = raw.tolist()
-    if isinstance(raw, (list, tuple)):
-        if raw and isinstance(raw[0], (list, tuple)):
-            return [float(row[-1]) for row in raw]
-        return [float(value) for value in raw]
-    return [float(raw)]
+def _coerce_scores(raw: object) -> np.ndarray:
+    scores = np.asarray(raw, dtype=np.float64)
+    if scores.ndim == 0:
+        return scores.reshape(1)
+    if scores.ndim == 2:
+        return scores[:, -1]
+    return scores.reshape(-1)
 
 
 def _infer_positive_class_index(classes: Sequence[object]) -> int | None:
@@ -110,108 +114,127 @@ class Reranker:
     def __init__(self, estimator: object):
         self._estimator = estimator
 
-    def score(self, results: Sequence[HybridSearchResult]) -> list[float]:
+    @property
+    def uses_feature_store(self) -> bool:
+        """Whether the estimator was trained with precomputed passage features."""
+
+        from .feature_store import STORE_FEATURE_NAMES
+
+        expected = getattr(self._estimator, "n_features_in_", None)
+        return expected == len(FEATURE_NAMES) + len(STORE_FEATURE_NAMES)
+
+    def score(
+        self,
+        results: Sequence[HybridSearchResult],
+        *,
+        feature_store: "PassageFeatureStore | None" = None,
+    ) -> list[float]:
         """Return scores for each result using the underlying estimator."""
 
-        feature_matrix = extract_features(results)
-        if not feature_matrix:
-            return []
+        return self.score_array(results, feature_store=feature_store).tolist()
+
+    def score_array(
+        self,
+        results: Sequence[HybridSearchResult],
+        *,
+        feature_store: "PassageFeatureStore | None" = None,
+    ) -> np.ndarray:
+        """Return estimator scores for *results* as a float64 vector."""
+
+        features = extract_feature_array(
+            results,
+            feature_store=feature_store if self.uses_feature_store else None,
+        )
+        if not features.shape[0]:
+            return np.empty(0, dtype=np.float64)
         estimator = self._estimator
         if hasattr(estimator, "decision_function"):
-            raw_scores = estimator.decision_function(feature_matrix)
-            return _coerce_scores(raw_scores)
+            return _coerce_scores(estimator.decision_function(features))
         if hasattr(estimator, "predict_proba"):
-            proba = estimator.predict_proba(feature_matrix)
-            if hasattr(proba, "tolist"):
-                proba = proba.tolist()
-            classes: Sequence[object] | None = getattr(estimator, "classes_", None)
-            class_list: list[object] | None = None
-            positive_index: int | None = None
-            if classes is not None:
-                try:
-                    class_list = list(classes)
-                except TypeError:
-                    class_list = None
-            if class_list:
-                positive_index = _infer_positive_class_index(class_list)
-            predictions: Sequence[object] | None = None
-            if (
-                positive_index is None
-                and class_list is not None
-                and hasattr(estimator, "predict")
-            ):
-                raw_predictions = estimator.predict(feature_matrix)
-                if hasattr(raw_predictions, "tolist"):
-                    raw_predictions = raw_predictions.tolist()
-                if isinstance(raw_predictions, Sequence):
-                    predictions = raw_predictions
-            scores: list[float] = []
-            for index, row in enumerate(proba):
-                if isinstance(row, (list, tuple)):
-                    target_index: int | None = None
-                    if positive_index is not None and positive_index < len(row):
-                        target_index = positive_index
-                    elif (
-                        predictions is not None
-                        and class_list is not None
-                        and index < len(predictions)
-                    ):
-                        predicted_label = predictions[index]
-                        try:
-                            predicted_index = class_list.index(predicted_label)
-                        except ValueError:
-                            predicted_index = None
-                        if predicted_index is not None and predicted_index < len(row):
-                            target_index = predicted_index
-                    if target_index is None or target_index >= len(row):
-                        target_index = len(row) - 1
-                    scores.append(float(row[target_index]))
-                else:
-                    scores.append(float(row))
-            return scores
+            return self._positive_probabilities(features)
         if hasattr(estimator, "predict"):
-            raw_scores = estimator.predict(feature_matrix)
-            return _coerce_scores(raw_scores)
+            return _coerce_scores(estimator.predict(features))
         raise TypeError("Estimator does not expose a supported scoring interface")
 
-    def rerank(self, results: Sequence[HybridSearchResult]) -> list[HybridSearchResult]:
-        """Return a new ordering of the supplied results sorted by the reranker."""
+    def _positive_probabilities(self, features: np.ndarray) -> np.ndarray:
+        estimator = self._estimator
+        proba = np.asarray(estimator.predict_proba(features), dtype=np.float64)
+        if proba.ndim != 2:
+            return proba.reshape(-1)
+        rows, width = proba.shape
+        if not rows or not width:
+            return np.empty(0, dtype=np.float64)
+
+        classes: Sequence[object] | None = getattr(estimator, "classes_", None)
+        class_list: list[object] | None = None
+        if classes is not None:
+            try:
+                class_list = list(classes)
+            except TypeError:
+                class_list = None
+        positive_index = (
+            _infer_positive_class_index(class_list) if class_list else None
+        )
+        if positive_index is not None and positive_index < width:
+            return proba[:, positive_index]
+
+        columns = np.full(rows, width - 1, dtype=np.intp)
+        if class_list is not None and hasattr(estimator, "predict"):
+            # Without an identifiable positive class, score each row by the
+            # probability of the label the estimator actually predicted.
+            lookup = {label: index for index, label in enumerate(class_list)}
+            predictions = estimator.predict(features)
+            if hasattr(predictions, "tolist"):
+                predictions = predictions.tolist()
+            if isinstance(predictions, Sequence):
+                for row, label in enumerate(predictions[:rows]):
+                    index = lookup.get(label)
+                    if index is not None and index < width:
+                        columns[row] = index
+        return proba[np.arange(rows), columns]
+
+    def rerank(
+        self,
+        results: Sequence[HybridSearchResult],
+        *,
+        feature_store: "PassageFeatureStore | None" = None,
+    ) -> list[HybridSearchResult]:
+        """Return a new ordering of the supplied results sorted by the reranker.
+
+        Results are shallow-copied with their new ``rank`` and ``score``; the
+        inputs are never mutated.
+        """
 
         results_list = list(results)
-        scores = self.score(results_list)
-        if not scores:
-            return [item.model_copy(deep=True) for item in results_list]
-
-        scored_indices = [
-            (index, score) for index, score in enumerate(scores) if index < len(results_list)
-        ]
-
-        if not scored_indices:
-            return [item.model_copy(deep=True) for item in results_list]
-
-        ordered_indices = [
-            index
-            for index, _ in sorted(
-                scored_indices,
-                key=lambda item: item[1],
-                reverse=True,
-            )
-        ]
+        scores = self.score_array(results_list, feature_store=feature_store)
+        return _reorder(results_list, scores)
 
-        if len(ordered_indices) < len(results_list):
-            covered = {index for index, _ in scored_indices}
-            ordered_indices.extend(
-                index for index in range(len(results_list)) if index not in covered
-            )
 
-        reranked: list[HybridSearchResult] = []
-        for new_rank, index in enumerate(ordered_indices, start=1):
-            source = results_list[index]
-            clone = source.model_copy(deep=True)
-            clone.rank = new_rank
-            clone.score = scores[index] if index < len(scores) else source.score
-            reranked.append(clone)
-        return reranked
+def _reorder(
+    results: list[HybridSearchResult], scores: np.ndarray
+) -> list[HybridSearchResult]:
+    """Sort *results* by descending *scores* into re-ranked copies.
+
+    Results beyond the end of *scores*, or whose score is NaN, keep their
+    original score and relative order after every scored result.
+    """
+
+    scored = min(len(scores), len(results))
+    if not scored:
+        return [item.model_copy() for item in results]
+    head = scores[:scored]
+    valid = ~np.isnan(head)
+    scored_indices = np.flatnonzero(valid)
+    ordered = scored_indices[np.argsort(-head[valid], kind="stable")].tolist()
+    ordered.extend(np.flatnonzero(~valid).tolist())
+    ordered.extend(range(scored, len(results)))
+
+    reranked: list[HybridSearchResult] = []
+    for new_rank, index in enumerate(ordered, start=1):
+        source = results[index]
+        score = float(head[index]) if index < scored and valid[index] else source.score
+        reranked.append(source.model_copy(update={"rank": new_rank, "score": score}))
+    return reranked
 
 
 def load_reranker(
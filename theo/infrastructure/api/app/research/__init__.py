@@ -4,6 +4,13 @@ from .commentaries import search_commentaries
 from .contradictions import search_contradictions
 from .evidence_cards import create_evidence_card, preview_evidence_card
 from .geo import lookup_geo_places, places_for_osis
+from .geo_spatial import (
+    BoundingBox,
+    places_for_osis_in_region,
+    places_in_bbox,
+    places_near,
+    resolve_origin,
+)
 
 __all__ = [
     "search_contradictions",
@@ -12,4 +19,9 @@ __all__ = [
     "preview_evidence_card",
     "lookup_geo_places",
     "places_for_osis",
+    "BoundingBox",
+    "places_for_osis_in_region",
+    "places_in_bbox",
+    "places_near",
+    "resolve_origin",
 ]
@@ -0,0 +1,537 @@
+"""Spatial indexing and proximity queries for biblical geography.
+
+The OpenBible dataset only contains a few thousand coordinate pairs, so the
+index is a uniform latitude/longitude grid held in process memory. It is built
+from the seeded ``geo_location``/``geo_place`` tables through plain SQL and
+therefore behaves identically on SQLite and PostgreSQL deployments. A cheap
+aggregate signature (row counts plus sums over the indexed columns) is checked
+on every lookup so a re-seed, including one that only moves coordinates,
+transparently rebuilds the grid.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.orm import Session
+
+from theo.domain.research.osis import expand_osis_reference
+from theo.infrastructure.api.app.persistence_models import (
+    GeoAncientPlace,
+    GeoModernLocation,
+    GeoPlaceVerse,
+    Passage,
+    PassageVerse,
+)
+
+from ..models.research import (
+    GeoNearbyLocation,
+    GeoRegionPassage,
+    GeoRegionPlace,
+    GeoRegionResponse,
+)
+from .geo import _modern_ids_for_place, _normalize
+
+EARTH_RADIUS_KM = 6371.0088
+_KM_PER_DEGREE_LAT = 111.32
+_DEFAULT_CELL_DEGREES = 0.25
+_VERSE_BATCH_SIZE = 500
+_REGION_PASSAGE_LIMIT = 20
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    """Inclusive latitude/longitude rectangle."""
+
+    min_lat: float
+    min_lng: float
+    max_lat: float
+    max_lng: float
+
+    def __post_init__(self) -> None:
+        if self.min_lat > self.max_lat:
+            raise ValueError("min_lat must not exceed max_lat")
+        if self.min_lng > self.max_lng:
+            raise ValueError("min_lng must not exceed max_lng")
+
+    def contains(self, lat: float, lng: float) -> bool:
+        return (
+            self.min_lat <= lat <= self.max_lat
+            and self.min_lng <= lng <= self.max_lng
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedLocation:
+    """Coordinate entry tracked by :class:`GeoSpatialIndex`."""
+
+    modern_id: str
+    name: str
+    lat: float
+    lng: float
+    confidence: float | None = None
+    ancient_ids: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class SpatialMatch:
+    location: IndexedLocation
+    distance_km: float | None = None
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Return the great-circle distance between two points in kilometres."""
+
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = (
+        math.sin(d_phi / 2.0) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bounding_box(lat: float, lng: float, radius_km: float) -> BoundingBox:
+    """Return a rectangle guaranteed to enclose the circle around ``lat``/``lng``."""
+
+    lat_delta = radius_km / _KM_PER_DEGREE_LAT
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat <= 1e-9:
+        lng_delta = 180.0
+    else:
+        lng_delta = min(180.0, radius_km / (_KM_PER_DEGREE_LAT * cos_lat))
+    return BoundingBox(
+        min_lat=max(-90.0, lat - lat_delta),
+        min_lng=max(-180.0, lng - lng_delta),
+        max_lat=min(90.0, lat + lat_delta),
+        max_lng=min(180.0, lng + lng_delta),
+    )
+
+
+@dataclass(slots=True)
+class GeoSpatialIndex:
+    """Uniform grid over point locations supporting radius and box queries."""
+
+    cell_degrees: float = _DEFAULT_CELL_DEGREES
+    _cells: dict[tuple[int, int], list[IndexedLocation]] = field(
+        default_factory=dict
+    )
+    _by_id: dict[str, IndexedLocation] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.cell_degrees <= 0:
+            raise ValueError("cell_degrees must be positive")
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_degrees),
+            math.floor(lng / self.cell_degrees),
+        )
+
+    def add(self, location: IndexedLocation) -> None:
+        existing = self._by_id.get(location.modern_id)
+        if existing is not None:
+            bucket = self._cells.get(self._cell(existing.lat, existing.lng), [])
+            bucket[:] = [
+                entry for entry in bucket if entry.modern_id != existing.modern_id
+            ]
+        self._by_id[location.modern_id] = location
+        self._cells.setdefault(self._cell(location.lat, location.lng), []).append(
+            location
+        )
+
+    def get(self, modern_id: str) -> IndexedLocation | None:
+        return self._by_id.get(modern_id)
+
+    def find_by_name(self, name: str) -> IndexedLocation | None:
+        """Return the most confident location whose id or name equals ``name``."""
+
+        normalized = _normalize(name)
+        if not normalized:
+            return None
+        candidates = [
+            entry
+            for entry in self._by_id.values()
+            if _normalize(entry.name) == normalized
+            or _normalize(entry.modern_id) == normalized
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda entry: (entry.confidence or 0.0))
+
+    def _iter_box(self, box: BoundingBox) -> Iterator[IndexedLocation]:
+        min_row, min_col = self._cell(box.min_lat, box.min_lng)
+        max_row, max_col = self._cell(box.max_lat, box.max_lng)
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            # Scanning occupied cells is cheaper than walking a huge empty box.
+            for (row, col), bucket in self._cells.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    yield from bucket
+            return
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                yield from self._cells.get((row, col), ())
+
+    def within_bbox(
+        self, box: BoundingBox, *, limit: int | None = None
+    ) -> list[SpatialMatch]:
+        """Return locations inside ``box`` ordered by confidence then name."""
+
+        matches = [
+            SpatialMatch(location=entry)
+            for entry in self._iter_box(box)
+            if box.contains(entry.lat, entry.lng)
+        ]
+        matches.sort(
+            key=lambda match: (
+                -(match.location.confidence or 0.0),
+                match.location.name.casefold(),
+            )
+        )
+        return matches[:limit] if limit is not None else matches
+
+    def within_radius(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        *,
+        limit: int | None = None,
+    ) -> list[SpatialMatch]:
+        """Return locations within ``radius_km`` of the origin, nearest first."""
+
+        if radius_km < 0:
+            raise ValueError("radius_km must be non-negative")
+        box = radius_bounding_box(lat, lng, radius_km)
+        matches: list[SpatialMatch] = []
+        for entry in self._iter_box(box):
+            distance = haversine_km(lat, lng, entry.lat, entry.lng)
+            if distance <= radius_km:
+                matches.append(SpatialMatch(location=entry, distance_km=distance))
+        matches.sort(
+            key=lambda match: (match.distance_km or 0.0, match.location.name.casefold())
+        )
+        return matches[:limit] if limit is not None else matches
+
+
+_CACHE_LOCK = threading.Lock()
+_INDEX_CACHE: "weakref.WeakKeyDictionary[Any, tuple[tuple[Any, ...], GeoSpatialIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cache_key(session: Session) -> Any:
+    bind = session.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _index_signature(session: Session) -> tuple[Any, ...]:
+    """Summarise every column the index is built from in one cheap row.
+
+    Counts alone miss re-seeds that edit coordinates, names or place links in
+    place, so the signature also sums those values.
+    """
+
+    locations = (
+        select(
+            func.count(GeoModernLocation.modern_id),
+            func.sum(GeoModernLocation.latitude),
+            func.sum(GeoModernLocation.longitude),
+            func.sum(func.coalesce(GeoModernLocation.confidence, 0.0)),
+            func.sum(func.length(GeoModernLocation.friendly_id)),
+        )
+        .where(GeoModernLocation.latitude.is_not(None))
+        .where(GeoModernLocation.longitude.is_not(None))
+    )
+    places = select(
+        func.count(GeoAncientPlace.ancient_id),
+        func.sum(func.length(cast(GeoAncientPlace.raw, String))),
+    )
+    return (*session.execute(locations).one(), *session.execute(places).one())
+
+
+def build_geo_spatial_index(
+    session: Session, *, cell_degrees: float = _DEFAULT_CELL_DEGREES
+) -> GeoSpatialIndex:
+    """Load seeded coordinates into a fresh :class:`GeoSpatialIndex`."""
+
+    ancient_by_modern: dict[str, list[str]] = {}
+    for ancient_id, raw in session.execute(
+        select(GeoAncientPlace.ancient_id, GeoAncientPlace.raw)
+    ):
+        if not isinstance(raw, dict):
+            continue
+        for modern_id in _modern_ids_for_place(raw):
+            ancient_by_modern.setdefault(modern_id, []).append(ancient_id)
+
+    index = GeoSpatialIndex(cell_degrees=cell_degrees)
+    rows = session.execute(
+        select(
+            GeoModernLocation.modern_id,
+            GeoModernLocation.friendly_id,
+            GeoModernLocation.latitude,
+            GeoModernLocation.longitude,
+            GeoModernLocation.confidence,
+        )
+        .where(GeoModernLocation.latitude.is_not(None))
+        .where(GeoModernLocation.longitude.is_not(None))
+    )
+    for modern_id, friendly_id, lat, lng, confidence in rows:
+        index.add(
+            IndexedLocation(
+                modern_id=modern_id,
+                name=friendly_id,
+                lat=float(lat),
+                lng=float(lng),
+                confidence=confidence,
+                ancient_ids=tuple(sorted(ancient_by_modern.get(modern_id, ()))),
+            )
+        )
+    return index
+
+
+def get_geo_spatial_index(session: Session) -> GeoSpatialIndex:
+    """Return the cached spatial index for the session's engine, rebuilding if stale."""
+
+    key = _cache_key(session)
+    signature = _index_signature(session)
+    with _CACHE_LOCK:
+        cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index = build_geo_spatial_index(session)
+    with _CACHE_LOCK:
+        _INDEX_CACHE[key] = (signature, index)
+    return index
+
+
+def invalidate_geo_spatial_index() -> None:
+    """Drop every cached spatial index (e.g. after re-seeding geo data)."""
+
+    with _CACHE_LOCK:
+        _INDEX_CACHE.clear()
+
+
+def _nearby_item(match: SpatialMatch) -> GeoNearbyLocation:
+    location = match.location
+    return GeoNearbyLocation(
+        modern_id=location.modern_id,
+        name=location.name,
+        lat=location.lat,
+        lng=location.lng,
+        confidence=location.confidence,
+        distance_km=(
+            round(match.distance_km, 3) if match.distance_km is not None else None
+        ),
+    )
+
+
+def resolve_origin(
+    session: Session,
+    *,
+    lat: float | None = None,
+    lng: float | None = None,
+    place: str | None = None,
+) -> tuple[float, float] | None:
+    """Resolve an explicit coordinate pair or a place name into an origin."""
+
+    if lat is not None and lng is not None:
+        return lat, lng
+    if not place:
+        return None
+    location = get_geo_spatial_index(session).find_by_name(place)
+    if location is None:
+        return None
+    return location.lat, location.lng
+
+
+def places_near(
+    session: Session,
+    *,
+    lat: float,
+    lng: float,
+    radius_km: float,
+    limit: int | None = None,
+) -> list[GeoNearbyLocation]:
+    """Return modern locations within ``radius_km`` of the origin."""
+
+    index = get_geo_spatial_index(session)
+    return [
+        _nearby_item(match)
+        for match in index.within_radius(lat, lng, radius_km, limit=limit)
+    ]
+
+
+def places_in_bbox(
+    session: Session, box: BoundingBox, *, limit: int | None = None
+) -> list[GeoNearbyLocation]:
+    """Return modern locations inside ``box``."""
+
+    index = get_geo_spatial_index(session)
+    return [_nearby_item(match) for match in index.within_bbox(box, limit=limit)]
+
+
+def _batched(values: list[Any], size: int) -> Iterable[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _passages_for_verses(
+    session: Session, verse_ids: set[int], *, limit: int
+) -> dict[int, list[GeoRegionPassage]]:
+    """Return up to ``limit`` passages citing each verse, ordered by passage id."""
+
+    by_verse: dict[int, list[GeoRegionPassage]] = {}
+    for batch in _batched(sorted(verse_ids), _VERSE_BATCH_SIZE):
+        rows = session.execute(
+            select(
+                PassageVerse.verse_id,
+                Passage.id,
+                Passage.document_id,
+                Passage.osis_ref,
+            )
+            .join(Passage, Passage.id == PassageVerse.passage_id)
+            .where(PassageVerse.verse_id.in_(batch))
+            .order_by(PassageVerse.verse_id, Passage.id)
+        )
+        for verse_id, passage_id, document_id, osis_ref in rows:
+            bucket = by_verse.setdefault(verse_id, [])
+            if len(bucket) < limit:
+                bucket.append(
+                    GeoRegionPassage(
+                        passage_id=passage_id,
+                        document_id=document_id,
+                        osis_ref=osis_ref,
+                    )
+                )
+    return by_verse
+
+
+def places_for_osis_in_region(
+    session: Session,
+    osis: str,
+    *,
+    lat: float | None = None,
+    lng: float | None = None,
+    radius_km: float | None = None,
+    bbox: BoundingBox | None = None,
+    passage_limit: int = _REGION_PASSAGE_LIMIT,
+) -> GeoRegionResponse:
+    """Join a verse range with a spatial region.
+
+    Returns the ancient places mentioned within ``osis`` whose modern
+    locations fall inside the region, together with the verse references that
+    mention them and up to ``passage_limit`` corpus passages citing those
+    verses. The region is either a radius around ``lat``/``lng`` or a bounding
+    box; the spatial filter runs first so only candidate places hit the verse
+    tables.
+    """
+
+    index = get_geo_spatial_index(session)
+    if bbox is not None:
+        matches = index.within_bbox(bbox)
+    elif lat is not None and lng is not None and radius_km is not None:
+        matches = index.within_radius(lat, lng, radius_km)
+    else:
+        raise ValueError("Provide either a bounding box or lat/lng with radius_km")
+
+    verse_ids = expand_osis_reference(osis)
+    if not matches or not verse_ids:
+        return GeoRegionResponse(osis=osis, places=[])
+
+    locations_by_ancient: dict[str, list[SpatialMatch]] = {}
+    for match in matches:
+        for ancient_id in match.location.ancient_ids:
+            locations_by_ancient.setdefault(ancient_id, []).append(match)
+    if not locations_by_ancient:
+        return GeoRegionResponse(osis=osis, places=[])
+
+    refs_by_ancient: dict[str, list[str]] = {}
+    for batch in _batched(sorted(locations_by_ancient), _VERSE_BATCH_SIZE):
+        rows = session.execute(
+            select(GeoPlaceVerse.ancient_id, GeoPlaceVerse.osis_ref).where(
+                GeoPlaceVerse.ancient_id.in_(batch)
+            )
+        )
+        for ancient_id, osis_ref in rows:
+            if expand_osis_reference(osis_ref) & verse_ids:
+                refs_by_ancient.setdefault(ancient_id, []).append(osis_ref)
+    if not refs_by_ancient:
+        return GeoRegionResponse(osis=osis, places=[])
+
+    place_rows = session.execute(
+        select(
+            GeoAncientPlace.ancient_id,
+            GeoAncientPlace.friendly_id,
+            GeoAncientPlace.classification,
+        ).where(GeoAncientPlace.ancient_id.in_(list(refs_by_ancient)))
+    ).all()
+
+    verses_by_ancient = {
+        ancient_id: set().union(*(expand_osis_reference(ref) for ref in refs))
+        & verse_ids
+        for ancient_id, refs in refs_by_ancient.items()
+    }
+    passages_by_verse = _passages_for_verses(
+        session, set().union(*verses_by_ancient.values()), limit=passage_limit
+    )
+
+    places: list[GeoRegionPlace] = []
+    for ancient_id, friendly_id, classification in place_rows:
+        refs = refs_by_ancient[ancient_id]
+        refs.sort(key=lambda ref: min(expand_osis_reference(ref), default=0))
+        passages: dict[str, GeoRegionPassage] = {}
+        for verse_id in sorted(verses_by_ancient[ancient_id]):
+            for passage in passages_by_verse.get(verse_id, ()):
+                passages.setdefault(passage.passage_id, passage)
+        places.append(
+            GeoRegionPlace(
+                ancient_id=ancient_id,
+                friendly_id=friendly_id,
+                classification=classification,
+                osis_refs=refs,
+                modern_locations=[
+                    _nearby_item(match) for match in locations_by_ancient[ancient_id]
+                ],
+                passages=list(passages.values())[:passage_limit],
+            )
+        )
+
+    def _sort_key(place: GeoRegionPlace) -> tuple[float, str]:
+        distances = [
+            item.distance_km
+            for item in place.modern_locations
+            if item.distance_km is not None
+        ]
+        return (min(distances) if distances else 0.0, place.friendly_id.casefold())
+
+    places.sort(key=_sort_key)
+    return GeoRegionResponse(osis=osis, places=places)
+
+
+__all__ = [
+    "BoundingBox",
+    "EARTH_RADIUS_KM",
+    "GeoSpatialIndex",
+    "IndexedLocation",
+    "SpatialMatch",
+    "build_geo_spatial_index",
+    "get_geo_spatial_index",
+    "haversine_km",
+    "invalidate_geo_spatial_index",
+    "places_for_osis_in_region",
+    "places_in_bbox",
+    "places_near",
+    "radius_bounding_box",
+    "resolve_origin",
+]
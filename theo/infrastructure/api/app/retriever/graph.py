@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
 
+from ..db.verse_adjacency import (
+    EDGE_KINDS,
+    NODE_COMMENTARY,
+    AdjacencyEdge,
+    VerseAdjacency,
+    get_verse_adjacency,
+)
 from ..db.verse_graph import (
     CommentarySeedRecord,
     PairSeedRecord,
     load_seed_relationships,
 )
-from ..ingest.osis import osis_intersects
+from ..ingest.osis import expand_osis_reference, osis_intersects
 from ..models.base import Passage as PassageSchema
 from ..models.verses import (
     VerseGraphEdge,
@@ -122,26 +130,18 @@ def _build_pair_edge(
     )
 
 
-def get_verse_graph(
-    session: Session,
-    osis: str,
-    filters: VerseMentionsFilters | None = None,
-) -> VerseGraphResponse:
-    """Return a graph-centric view of mentions and seed relationships."""
+GRAPH_EDGE_KINDS: tuple[str, ...] = ("mention", *EDGE_KINDS)
 
-    base_node = VerseGraphNode(
-        id=f"verse:{osis}",
-        label=osis,
-        kind="verse",
-        osis=osis,
-        data=None,
-    )
-
-    node_builder = _NodeBuilder(nodes={base_node.id: base_node})
-    edges: list[VerseGraphEdge] = []
-    perspectives: set[str] = set()
-    source_types: set[str] = set()
 
+def _append_mention_edges(
+    session: Session,
+    osis: str,
+    filters: VerseMentionsFilters | None,
+    base_node: VerseGraphNode,
+    node_builder: _NodeBuilder,
+    edges: list[VerseGraphEdge],
+    source_types: set[str],
+) -> None:
     mentions = get_mentions_for_osis(session, osis, filters)
     for mention in mentions:
         passage = mention.passage
@@ -176,6 +176,171 @@ def get_verse_graph(
             )
         )
 
+
+def _adjacency_node(
+    adjacency: VerseAdjacency, node: int, edge: AdjacencyEdge | None, depth: int
+) -> VerseGraphNode:
+    label = adjacency.labels[node]
+    if adjacency.node_kind(node) == NODE_COMMENTARY and edge and edge.payload:
+        payload = edge.payload
+        return VerseGraphNode(
+            id=label,
+            label=payload.get("title") or payload.get("source") or "Commentary excerpt",
+            kind="commentary",
+            osis=payload.get("osis"),
+            data={
+                "excerpt": payload.get("excerpt"),
+                "source": payload.get("source"),
+                "perspective": payload.get("perspective"),
+                "tags": payload.get("tags"),
+                "depth": depth,
+            },
+        )
+    return VerseGraphNode(
+        id=f"verse:{label}",
+        label=label,
+        kind="verse",
+        osis=label,
+        data={"depth": depth},
+    )
+
+
+def _adjacency_edge(
+    edge: AdjacencyEdge, source_id: str, target_id: str, target_label: str
+) -> VerseGraphEdge:
+    payload = edge.payload or {}
+    seed_id = payload.get("seed_id")
+    if edge.kind == "commentary":
+        edge_id = f"commentary:{seed_id}"
+        related_osis = payload.get("osis")
+        summary = payload.get("excerpt")
+    elif seed_id is not None:
+        edge_id = f"{edge.kind}:{seed_id}:{target_label}"
+        related_osis = target_label
+        summary = payload.get("summary")
+    else:
+        low, high = sorted((source_id, target_id))
+        edge_id = f"{edge.kind}:{low}:{high}"
+        related_osis = target_label
+        summary = None
+    return VerseGraphEdge(
+        id=edge_id,
+        source=source_id,
+        target=target_id,
+        kind=edge.kind,
+        summary=summary,
+        perspective=payload.get("perspective"),
+        tags=payload.get("tags"),
+        weight=payload.get("weight", edge.weight),
+        source_type=None,
+        collection=None,
+        authors=None,
+        seed_id=seed_id,
+        related_osis=related_osis,
+        source_label=payload.get("source"),
+    )
+
+
+def _get_multi_hop_graph(
+    session: Session,
+    osis: str,
+    filters: VerseMentionsFilters | None,
+    *,
+    depth: int,
+    edge_kinds: set[str],
+) -> VerseGraphResponse:
+    base_node = _build_related_verse_node(osis)
+    node_builder = _NodeBuilder(nodes={base_node.id: base_node})
+    edges: list[VerseGraphEdge] = []
+    perspectives: set[str] = set()
+    source_types: set[str] = set()
+
+    if "mention" in edge_kinds:
+        _append_mention_edges(
+            session, osis, filters, base_node, node_builder, edges, source_types
+        )
+
+    verse_ids = expand_osis_reference(osis)
+    relation_kinds = [kind for kind in EDGE_KINDS if kind in edge_kinds]
+    if verse_ids and relation_kinds:
+        adjacency = get_verse_adjacency(session)
+        seeds = adjacency.nodes_for_range(min(verse_ids), max(verse_ids))
+        neighbourhood = adjacency.neighbourhood(
+            seeds, depth=depth, kinds=relation_kinds
+        )
+        # Nodes intersecting the requested reference collapse into the base
+        # node, mirroring how the one-hop graph treats overlapping seeds.
+        node_ids = {node: base_node.id for node in seeds}
+        for edge in neighbourhood.edges:
+            for node in (edge.source, edge.target):
+                if node not in node_ids:
+                    graph_node = node_builder.ensure_node(
+                        _adjacency_node(
+                            adjacency, node, edge, neighbourhood.depths[node]
+                        )
+                    )
+                    node_ids[node] = graph_node.id
+            source_id, target_id = node_ids[edge.source], node_ids[edge.target]
+            if source_id == target_id:
+                continue
+            graph_edge = _adjacency_edge(
+                edge, source_id, target_id, adjacency.labels[edge.target]
+            )
+            if graph_edge.perspective:
+                perspectives.add(graph_edge.perspective)
+            edges.append(graph_edge)
+
+    return VerseGraphResponse(
+        osis=osis,
+        nodes=list(node_builder.nodes.values()),
+        edges=edges,
+        filters=VerseGraphFilters(
+            perspectives=sorted(perspectives),
+            source_types=sorted(source_types),
+        ),
+    )
+
+
+def get_verse_graph(
+    session: Session,
+    osis: str,
+    filters: VerseMentionsFilters | None = None,
+    *,
+    depth: int = 1,
+    edge_kinds: Iterable[str] | None = None,
+) -> VerseGraphResponse:
+    """Return a graph-centric view of mentions and seed relationships.
+
+    ``depth`` greater than one (or an explicit ``edge_kinds`` filter) walks the
+    precomputed verse adjacency graph instead of querying seeds per verse.
+    """
+
+    if depth > 1 or edge_kinds is not None:
+        allowed = set(GRAPH_EDGE_KINDS if edge_kinds is None else edge_kinds)
+        unknown = allowed - set(GRAPH_EDGE_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown edge kinds: {', '.join(sorted(unknown))}")
+        return _get_multi_hop_graph(
+            session, osis, filters, depth=depth, edge_kinds=allowed
+        )
+
+    base_node = VerseGraphNode(
+        id=f"verse:{osis}",
+        label=osis,
+        kind="verse",
+        osis=osis,
+        data=None,
+    )
+
+    node_builder = _NodeBuilder(nodes={base_node.id: base_node})
+    edges: list[VerseGraphEdge] = []
+    perspectives: set[str] = set()
+    source_types: set[str] = set()
+
+    _append_mention_edges(
+        session, osis, filters, base_node, node_builder, edges, source_types
+    )
+
     seed_relationships = load_seed_relationships(session, osis)
 
     def _ensure_pair_edge(seed: PairSeedRecord, relation: str) -> None:
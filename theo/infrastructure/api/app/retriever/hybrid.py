@@ -26,20 +26,34 @@ from sqlalchemy.orm import Session, selectinload
 
 from theo.adapters.persistence.types import VectorType
 from theo.application.facades.settings import get_settings
-from theo.infrastructure.api.app.persistence_models import Document, Passage
-
+from theo.infrastructure.api.app.persistence_models import (
+    Document,
+    Passage,
+    PassageEmbeddingVersion,
+)
+
+from ..db.embedding_versions import (
+    EmbeddingVersion,
+    active_embedding_version,
+    version_criterion,
+    version_distance,
+)
+from ..db.near_duplicates import collapse_near_duplicates
 from ..db.query_optimizations import execute_with_metrics, query_with_monitoring
 from ..ingest.embeddings import get_embedding_service
 from ..ingest.osis import expand_osis_reference, osis_intersects
 from ..models.documents import DocumentAnnotationResponse
 from ..models.search import HybridSearchFilters, HybridSearchRequest, HybridSearchResult
 from .annotations import index_annotations_by_passage, load_annotations_for_documents
+from .lexical_index import get_lexical_index, parse_lexical_query
 from .utils import compose_passage_meta
 
 _TRACER = trace.get_tracer("theo.retriever")
 
 _PRESELECT_CANDIDATE_FACTOR = 3
 _PRESELECT_CANDIDATE_MIN = 50
+# Clusters removed by collapsing are refilled from this many extra results.
+_COLLAPSE_OVERFETCH_FACTOR = 2
 
 
 def _annotate_retrieval_span(
@@ -512,8 +526,31 @@ def _build_base_query(request: HybridSearchRequest):
 
 
 def _build_vector_statement(
-    base_stmt, query_embedding: list[float], limit: int, *, embedding_dim: int
+    base_stmt,
+    query_embedding: list[float],
+    limit: int,
+    *,
+    embedding_dim: int,
+    version: EmbeddingVersion | None = None,
 ):
+    if version is not None and not version.legacy:
+        # Cut-over model versions are served from the shadow vector table,
+        # through the version's partial HNSW index.
+        distance = version_distance(version, query_embedding).label("distance")
+        vector_score_expr = (1.0 - func.coalesce(distance, 1.0)).label("vector_score")
+        return (
+            base_stmt.join(
+                PassageEmbeddingVersion,
+                and_(
+                    PassageEmbeddingVersion.passage_id == Passage.id,
+                    version_criterion(version),
+                ),
+            )
+            .add_columns(distance, vector_score_expr)
+            .order_by(distance.asc())
+            .limit(limit)
+        )
+
     vector_param = literal(query_embedding, type_=VectorType(embedding_dim))
     distance = func.cosine_distance(Passage.embedding, vector_param).label("distance")
     vector_score_expr = (1.0 - func.coalesce(distance, 1.0)).label("vector_score")
@@ -561,10 +598,27 @@ def _fallback_search(
             span, request, cache_status=cache_status, backend="fallback"
         )
 
-        query_tokens = _tokenise(request.query or "")
+        lexical_query = parse_lexical_query(request.query)
+        query_tokens = lexical_query.tokens
+        lexical_index = (
+            get_lexical_index(session) if not lexical_query.is_empty() else None
+        )
+        span.set_attribute(
+            "retrieval.lexical_index",
+            lexical_index.name if lexical_index is not None else "scan",
+        )
 
         stmt = _build_base_query(request)
-        if request.query and not request.osis:
+        if lexical_index is not None:
+            hits = lexical_index.match_subquery(lexical_query)
+            stmt = stmt.add_columns(hits.c.score)
+            if request.osis:
+                stmt = stmt.outerjoin(hits, hits.c.passage_id == Passage.id)
+            else:
+                stmt = stmt.join(hits, hits.c.passage_id == Passage.id).order_by(
+                    hits.c.score.desc()
+                )
+        elif request.query and not request.osis:
             token_clauses = []
             tei_blob = func.json_extract(Passage.meta, "$.tei_search_blob")
             for token in query_tokens:
@@ -584,7 +638,7 @@ def _fallback_search(
         stmt = stmt.limit(limit)
 
         rows = execute_with_metrics(session, stmt, "search.fallback.base").all()
-        doc_ids = [document.id for _passage, document in rows]
+        doc_ids = [row[1].id for row in rows]
         annotations_by_document = load_annotations_for_documents(session, doc_ids)
         annotations_by_passage = index_annotations_by_passage(
             annotations_by_document
@@ -592,7 +646,8 @@ def _fallback_search(
 
         heap: list[tuple[float, int, HybridSearchResult]] = []
         counter = 0
-        for passage, document in rows:
+        for row in rows:
+            passage, document = row[0], row[1]
             if not _passes_author_filter(document, request.filters.author):
                 continue
             if not _passes_guardrail_filters(document, request.filters):
@@ -600,11 +655,21 @@ def _fallback_search(
 
             annotation_notes = annotations_by_passage.get(passage.id, [])
             note_texts = [note.body for note in annotation_notes if note.body]
-            combined_text = (
-                " \n".join([passage.text, *note_texts]) if note_texts else passage.text
-            )
-            lexical = _lexical_score(combined_text, query_tokens)
-            tei_score = _tei_match_score(passage, query_tokens)
+            if lexical_index is not None:
+                # BM25 already covers the passage text and TEI facets; notes
+                # live outside the index and are still counted directly.
+                lexical = float(row[2] or 0.0)
+                if note_texts:
+                    lexical += _lexical_score(" \n".join(note_texts), query_tokens)
+                tei_score = 0.0
+            else:
+                combined_text = (
+                    " \n".join([passage.text, *note_texts])
+                    if note_texts
+                    else passage.text
+                )
+                lexical = _lexical_score(combined_text, query_tokens)
+                tei_score = _tei_match_score(passage, query_tokens)
             osis_distance = _osis_distance_value(passage, request.osis)
             osis_match = bool(osis_distance == 0.0)
             if request.osis and not osis_match and lexical == 0.0:
@@ -659,10 +724,16 @@ def _postgres_hybrid_search(
     session: Session, request: HybridSearchRequest
 ) -> list[HybridSearchResult]:
     settings = get_settings()
-    embedding_service = get_embedding_service()
     dialect = session.bind.dialect if session.bind is not None else None
     if dialect is None or dialect.name != "postgresql":
         return _fallback_search(session, request)
+    version = active_embedding_version(session)
+    # Query vectors must come from the model that produced the served vectors.
+    embedding_service = (
+        get_embedding_service()
+        if version.legacy
+        else get_embedding_service(version.model, version.dimension)
+    )
 
     start = perf_counter()
     cache_status = "miss"
@@ -681,7 +752,11 @@ def _postgres_hybrid_search(
         if request.query:
             query_embedding = embedding_service.embed([request.query])[0]
             vector_stmt = _build_vector_statement(
-                base_stmt, query_embedding, limit, embedding_dim=settings.embedding_dim
+                base_stmt,
+                query_embedding,
+                limit,
+                embedding_dim=settings.embedding_dim,
+                version=version,
             )
             for row in execute_with_metrics(
                 session, vector_stmt, "search.hybrid.vector"
@@ -810,6 +885,26 @@ def _postgres_hybrid_search(
         return results
 
 
+def _collapse_duplicate_results(
+    session: Session,
+    results: list[HybridSearchResult],
+    request: HybridSearchRequest,
+) -> list[HybridSearchResult]:
+    collapsed = collapse_near_duplicates(session, results, limit=request.k)
+    doc_scores: dict[str, float] = {}
+    for idx, result in enumerate(collapsed, start=1):
+        result.rank = idx
+        doc_scores[result.document_id] = max(
+            doc_scores.get(result.document_id, float("-inf")), result.score or 0.0
+        )
+    ordered = sorted(doc_scores.items(), key=lambda item: item[1], reverse=True)
+    doc_ranks = {doc_id: rank for rank, (doc_id, _score) in enumerate(ordered, start=1)}
+    for result in collapsed:
+        result.document_score = doc_scores[result.document_id]
+        result.document_rank = doc_ranks[result.document_id]
+    return collapsed
+
+
 @query_with_monitoring("search.hybrid_search")
 def hybrid_search(
     session: Session, request: HybridSearchRequest
@@ -818,6 +913,14 @@ def hybrid_search(
 
     start = perf_counter()
     cache_status = "miss"
+    collapse = request.collapse_duplicates
+    if collapse is None:
+        collapse = getattr(get_settings(), "search_collapse_near_duplicates", False)
+    backend_request = (
+        request.model_copy(update={"k": request.k * _COLLAPSE_OVERFETCH_FACTOR})
+        if collapse
+        else request
+    )
     with _TRACER.start_as_current_span("retriever.hybrid") as span:
         _annotate_retrieval_span(
             span, request, cache_status=cache_status, backend="hybrid"
@@ -825,10 +928,13 @@ def hybrid_search(
         bind = getattr(session, "bind", None)
         if bind is None or bind.dialect.name != "postgresql":
             span.set_attribute("retrieval.selected_backend", "fallback")
-            results = _fallback_search(session, request)
+            results = _fallback_search(session, backend_request)
         else:
             span.set_attribute("retrieval.selected_backend", "postgresql")
-            results = _postgres_hybrid_search(session, request)
+            results = _postgres_hybrid_search(session, backend_request)
+        if collapse:
+            results = _collapse_duplicate_results(session, results, request)
+            span.set_attribute("retrieval.collapsed_duplicates", True)
         latency_ms = (perf_counter() - start) * 1000.0
         span.set_attribute("retrieval.hit_count", len(results))
         span.set_attribute("retrieval.latency_ms", round(latency_ms, 2))
@@ -0,0 +1,306 @@
+"""Inverted lexical index with BM25 ranking for the non-PostgreSQL retriever.
+
+PostgreSQL deployments rank lexical matches with ``tsvector``/``ts_rank_cd``.
+Other backends previously fell back to ``ILIKE '%token%'`` scans, which read
+every passage and could not weigh rare terms above common ones. This module
+provides a pluggable index abstraction whose SQLite implementation keeps an
+FTS5 virtual table in sync with ``passages`` through triggers, so rows written
+by ingest (or removed by document deletes and cascades) are reflected without
+any application-level bookkeeping.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy import Float, String, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+from sqlalchemy.sql import Subquery
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "passage_fts"
+
+# Column weights passed to ``bm25()``; TEI facets count half as much as body
+# text, mirroring the weighting the substring scorer used to apply.
+_TEXT_WEIGHT = 1.0
+_TEI_WEIGHT = 0.5
+
+_QUERY_PART_RE = re.compile(r'"([^"]*)"?|(\S+)')
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# The statements below spell out ``passage_fts`` rather than interpolating
+# ``FTS_TABLE`` so that every SQL string in this module is a constant.
+_SQLITE_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS passage_fts USING fts5(
+        text,
+        tei,
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS passage_fts_ai AFTER INSERT ON passages BEGIN
+        INSERT INTO passage_fts(rowid, text, tei)
+        VALUES (new.rowid, new.text, json_extract(new.meta, '$.tei_search_blob'));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS passage_fts_ad AFTER DELETE ON passages BEGIN
+        DELETE FROM passage_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS passage_fts_au AFTER UPDATE OF text, meta
+    ON passages BEGIN
+        DELETE FROM passage_fts WHERE rowid = old.rowid;
+        INSERT INTO passage_fts(rowid, text, tei)
+        VALUES (new.rowid, new.text, json_extract(new.meta, '$.tei_search_blob'));
+    END
+    """,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LexicalQuery:
+    """Parsed lexical query made of bare terms, prefixes and phrases.
+
+    Every clause must match (implicit ``AND``), matching the semantics of the
+    per-token filters the fallback retriever applied before the index existed.
+    """
+
+    terms: tuple[str, ...] = ()
+    prefixes: tuple[str, ...] = ()
+    phrases: tuple[tuple[str, ...], ...] = ()
+
+    def is_empty(self) -> bool:
+        return not (self.terms or self.prefixes or self.phrases)
+
+    @property
+    def tokens(self) -> list[str]:
+        """Return every word in the query, in clause order, for highlighting."""
+
+        words: list[str] = [*self.terms, *self.prefixes]
+        for phrase in self.phrases:
+            words.extend(phrase)
+        return words
+
+    def to_fts5(self) -> str:
+        """Render the query using FTS5 syntax with every word quoted."""
+
+        clauses = [f'"{term}"' for term in self.terms]
+        clauses.extend(f'"{prefix}"*' for prefix in self.prefixes)
+        clauses.extend('"' + " ".join(phrase) + '"' for phrase in self.phrases)
+        return " ".join(clauses)
+
+
+def parse_lexical_query(query: str | None) -> LexicalQuery:
+    """Parse ``query`` into terms, ``prefix*`` clauses and ``"quoted phrases"``.
+
+    Words are split on the same boundaries as the FTS5 ``unicode61`` tokenizer
+    so that a bare token containing punctuation (``John's``) is treated as a
+    phrase of its parts rather than silently failing to match.
+    """
+
+    if not query:
+        return LexicalQuery()
+    terms: list[str] = []
+    prefixes: list[str] = []
+    phrases: list[tuple[str, ...]] = []
+    for quoted, bare in _QUERY_PART_RE.findall(query):
+        raw = quoted if quoted else bare
+        is_prefix = not quoted and raw.endswith("*")
+        words = tuple(word.lower() for word in _WORD_RE.findall(raw))
+        if not words:
+            continue
+        if is_prefix and len(words) == 1:
+            prefixes.append(words[0])
+        elif len(words) == 1:
+            terms.append(words[0])
+        else:
+            phrases.append(words)
+    return LexicalQuery(
+        terms=tuple(dict.fromkeys(terms)),
+        prefixes=tuple(dict.fromkeys(prefixes)),
+        phrases=tuple(dict.fromkeys(phrases)),
+    )
+
+
+class LexicalIndex(Protocol):
+    """Backend capable of ranking passages for a :class:`LexicalQuery`."""
+
+    name: str
+
+    def ensure(self, connection: Connection) -> bool:
+        """Create or repair the index; return ``False`` when unsupported."""
+
+    def rebuild(self, connection: Connection) -> None:
+        """Repopulate the index from the ``passages`` table."""
+
+    def match_subquery(self, query: LexicalQuery) -> Subquery:
+        """Return a subquery exposing ``passage_id`` and a BM25 ``score``."""
+
+
+class SQLiteFTS5Index:
+    """BM25-ranked passage index backed by an SQLite FTS5 virtual table."""
+
+    name = "sqlite-fts5"
+
+    def ensure(self, connection: Connection) -> bool:
+        trigger = f"{FTS_TABLE}_ai"
+        names = set(
+            connection.execute(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE name IN ('passages', :table, :trigger)"
+                ),
+                {"table": FTS_TABLE, "trigger": trigger},
+            ).scalars()
+        )
+        if "passages" not in names:
+            return False
+        if FTS_TABLE in names and trigger in names:
+            return True
+        # Either the index is new or ``passages`` was recreated (which drops
+        # its triggers); in both cases the contents must be rebuilt.
+        try:
+            for statement in _SQLITE_SCHEMA:
+                connection.exec_driver_sql(statement)
+        except OperationalError as exc:
+            if "fts5" in str(exc).lower():
+                logger.info("SQLite build lacks FTS5; lexical index disabled")
+                return False
+            raise
+        self.rebuild(connection)
+        return True
+
+    def rebuild(self, connection: Connection) -> None:
+        connection.execute(text("DELETE FROM passage_fts"))
+        connection.execute(
+            text(
+                "INSERT INTO passage_fts(rowid, text, tei) "
+                "SELECT rowid, text, json_extract(meta, '$.tei_search_blob') "
+                "FROM passages"
+            )
+        )
+
+    def match_subquery(self, query: LexicalQuery) -> Subquery:
+        # ``bm25()`` returns lower-is-better values, so negate it to expose a
+        # conventional higher-is-better score to the retriever.
+        stmt = text(
+            "SELECT passages.id AS passage_id, "
+            "-bm25(passage_fts, :text_weight, :tei_weight) AS score "
+            "FROM passage_fts JOIN passages ON passages.rowid = passage_fts.rowid "
+            "WHERE passage_fts MATCH :lexical_query"
+        ).bindparams(
+            lexical_query=query.to_fts5(),
+            text_weight=_TEXT_WEIGHT,
+            tei_weight=_TEI_WEIGHT,
+        )
+        return stmt.columns(passage_id=String, score=Float).subquery("lexical_hits")
+
+
+def _backend_for(dialect_name: str | None) -> LexicalIndex | None:
+    if dialect_name == "sqlite":
+        return SQLiteFTS5Index()
+    return None
+
+
+def ensure_lexical_index(connection: Connection) -> LexicalIndex | None:
+    """Return the lexical index reachable through ``connection``.
+
+    The index is created and backfilled the first time it is requested and is
+    then kept in sync by database triggers, so later calls only probe the
+    schema. Returns ``None`` when the dialect has no index implementation.
+    """
+
+    backend = _backend_for(getattr(connection.dialect, "name", None))
+    if backend is None:
+        return None
+    try:
+        ready = backend.ensure(connection)
+    except OperationalError:
+        logger.warning("Unable to initialise lexical index", exc_info=True)
+        return None
+    return backend if ready else None
+
+
+_prepared_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+_SHARED_POOLS = (StaticPool, SingletonThreadPool)
+
+
+def _is_in_memory(engine: Engine) -> bool:
+    url = engine.url
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def _prepare_engine(engine: Engine) -> None:
+    """Create and backfill the index in its own committed transaction.
+
+    pysqlite autocommits DDL but wraps the backfill ``INSERT`` in the caller's
+    transaction, so building the index inside a read-only session that is later
+    rolled back would leave the table and triggers behind with no rows.
+
+    In-memory databases are only reachable through pools that hand every
+    checkout the same connection (``StaticPool`` or, per thread,
+    ``SingletonThreadPool``); there the committed transaction runs on the
+    caller's own connection. Other pools would open a fresh, empty database.
+    """
+
+    if engine in _prepared_engines:
+        return
+    if _is_in_memory(engine) and not isinstance(engine.pool, _SHARED_POOLS):
+        return
+    with engine.begin() as connection:
+        if ensure_lexical_index(connection) is not None:
+            _prepared_engines.add(engine)
+
+
+def get_lexical_index(session: Session) -> LexicalIndex | None:
+    """Return the lexical index for ``session`` if its backend provides one."""
+
+    bind = getattr(session, "bind", None)
+    if bind is None or getattr(bind.dialect, "name", None) == "postgresql":
+        return None
+    connection_factory = getattr(session, "connection", None)
+    if not callable(connection_factory):
+        return None
+    connection = connection_factory()
+    raw = getattr(connection.connection, "dbapi_connection", None)
+    # A session holding uncommitted writes owns the SQLite write lock, so a
+    # second connection could not create the index until it finishes.
+    if isinstance(bind, Engine) and not getattr(raw, "in_transaction", True):
+        _prepare_engine(bind)
+    return ensure_lexical_index(connection)
+
+
+def rebuild_lexical_index(engine: Engine) -> bool:
+    """Repopulate the index from ``passages``; return ``False`` if unsupported."""
+
+    backend = _backend_for(getattr(engine.dialect, "name", None))
+    if backend is None:
+        return False
+    with engine.begin() as connection:
+        if not backend.ensure(connection):
+            return False
+        backend.rebuild(connection)
+    return True
+
+
+__all__ = [
+    "FTS_TABLE",
+    "LexicalIndex",
+    "LexicalQuery",
+    "SQLiteFTS5Index",
+    "ensure_lexical_index",
+    "get_lexical_index",
+    "parse_lexical_query",
+    "rebuild_lexical_index",
+]
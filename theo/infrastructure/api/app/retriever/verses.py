@@ -11,6 +11,8 @@ from sqlalchemy.orm import Session, joinedload
 
 from theo.infrastructure.api.app.persistence_models import Document, Passage, PassageVerse
 
+from ..db.verse_ranges import passage_reference_candidates, verse_ranges_backfilled
+from ..db.verse_timeline import query_timeline_rollups, timeline_rollups_ready
 from ..ingest.osis import canonical_verse_range, expand_osis_reference
 from ..models.base import Passage as PassageSchema
 from ..models.verses import (
@@ -44,6 +46,7 @@ def _document_ids_for_author(
     *,
     range_start: int | None = None,
     range_end: int | None = None,
+    include_legacy: bool = True,
 ) -> list[str]:
     """Return document identifiers mentioning *author* within *verse_ids*."""
 
@@ -66,7 +69,7 @@ def _document_ids_for_author(
             if isinstance(authors, list) and author in authors:
                 candidate_ids.add(doc_id)
 
-    if verse_ids:
+    if verse_ids and include_legacy:
         legacy_stmt = (
             select(Document.id, Document.authors)
             .join(Passage, Document.passages)
@@ -104,29 +107,7 @@ def _normalize_verse_ids(values: list[int] | list[object] | None) -> list[int]:
 def _extract_passage_references(passage: Passage) -> list[str]:
     """Collect OSIS reference strings associated with *passage*."""
 
-    references: set[str] = set()
-    if passage.osis_ref:
-        references.add(passage.osis_ref)
-
-    meta = passage.meta
-    if isinstance(meta, dict):
-        for key in (
-            "primary_osis",
-            "osis_refs_all",
-            "osis_refs_detected",
-            "osis_refs_hints",
-            "osis_refs_unmatched",
-        ):
-            value = meta.get(key)
-            if isinstance(value, str):
-                if value:
-                    references.add(value)
-            elif isinstance(value, (list, tuple, set)):
-                for item in value:
-                    if item:
-                        references.add(str(item))
-
-    return sorted(ref for ref in references if ref)
+    return passage_reference_candidates(passage)
 
 
 def _passage_overlaps_range(
@@ -339,20 +320,34 @@ def get_mentions_for_osis(
     session: Session,
     osis: str,
     filters: VerseMentionsFilters | None = None,
+    *,
+    limit: int | None = None,
+    after: str | None = None,
 ) -> list[VerseMention]:
-    """Return passages whose OSIS reference intersects the requested range."""
+    """Return passages whose OSIS reference intersects the requested range.
+
+    Without ``limit`` every mention is returned ordered by document title and
+    position. With ``limit`` the mentions are paginated by passage identifier:
+    pass the last returned ``passage.id`` as ``after`` to fetch the next page,
+    which keeps heavily cited verses from materialising every mention at once.
+    """
 
     verse_ids = _resolve_query_ids(osis)
     if not verse_ids:
         return []
 
     range_start, range_end = verse_ids[0], verse_ids[-1]
+    # Legacy rows without range columns are only scanned until the verse
+    # range backfill has been run to completion.
+    include_legacy = not verse_ranges_backfilled(session)
 
     base_stmt = (
         select(Passage)
         .join(Document, Passage.document)
         .options(joinedload(Passage.document))
     )
+    if after is not None:
+        base_stmt = base_stmt.where(Passage.id > after)
 
     allowed_doc_ids: list[str] | None = None
     if filters:
@@ -367,6 +362,7 @@ def get_mentions_for_osis(
                 filters.author,
                 range_start=range_start,
                 range_end=range_end,
+                include_legacy=include_legacy,
             )
             if not allowed_doc_ids:
                 return []
@@ -376,52 +372,60 @@ def get_mentions_for_osis(
     range_stmt = range_stmt.where(Passage.osis_end_verse_id.isnot(None))
     range_stmt = range_stmt.where(Passage.osis_start_verse_id <= range_end)
     range_stmt = range_stmt.where(Passage.osis_end_verse_id >= range_start)
+    if limit is not None:
+        range_stmt = range_stmt.order_by(Passage.id).limit(limit)
 
     result = session.execute(range_stmt.execution_options(stream_results=True))
     passages = list(result.scalars().unique())
     seen_ids = {passage.id for passage in passages}
 
-    bind = session.get_bind()
-    dialect_name = bind.dialect.name if bind is not None else ""
-    overlap_clause = _legacy_overlap_clause(Passage.osis_verse_ids, verse_ids, dialect_name)
-    if overlap_clause is not None:
-        legacy_stmt = (
+    if include_legacy:
+        bind = session.get_bind()
+        dialect_name = bind.dialect.name if bind is not None else ""
+        overlap_clause = _legacy_overlap_clause(
+            Passage.osis_verse_ids, verse_ids, dialect_name
+        )
+        if overlap_clause is not None:
+            legacy_stmt = (
+                base_stmt.where(
+                    or_(
+                        Passage.osis_start_verse_id.is_(None),
+                        Passage.osis_end_verse_id.is_(None),
+                    )
+                )
+                .where(Passage.osis_verse_ids.isnot(None))
+                .where(overlap_clause)
+            )
+            legacy_result = session.execute(
+                legacy_stmt.execution_options(stream_results=True)
+            )
+            for passage in legacy_result.scalars().unique():
+                if passage.id not in seen_ids:
+                    passages.append(passage)
+                    seen_ids.add(passage.id)
+
+        python_stmt = (
             base_stmt.where(
                 or_(
                     Passage.osis_start_verse_id.is_(None),
                     Passage.osis_end_verse_id.is_(None),
                 )
             )
-            .where(Passage.osis_verse_ids.isnot(None))
-            .where(overlap_clause)
+            .where(Passage.osis_verse_ids.is_(None))
+            .where(Passage.osis_ref.isnot(None))
         )
-        legacy_result = session.execute(
-            legacy_stmt.execution_options(stream_results=True)
+        python_result = session.execute(
+            python_stmt.execution_options(stream_results=True)
         )
-        for passage in legacy_result.scalars().unique():
-            if passage.id not in seen_ids:
+        for passage in python_result.scalars().unique():
+            if passage.id in seen_ids:
+                continue
+            if _passage_overlaps_range(passage, range_start, range_end):
                 passages.append(passage)
                 seen_ids.add(passage.id)
 
-    python_stmt = (
-        base_stmt.where(
-            or_(
-                Passage.osis_start_verse_id.is_(None),
-                Passage.osis_end_verse_id.is_(None),
-            )
-        )
-        .where(Passage.osis_verse_ids.is_(None))
-        .where(Passage.osis_ref.isnot(None))
-    )
-    python_result = session.execute(
-        python_stmt.execution_options(stream_results=True)
-    )
-    for passage in python_result.scalars().unique():
-        if passage.id in seen_ids:
-            continue
-        if _passage_overlaps_range(passage, range_start, range_end):
-            passages.append(passage)
-            seen_ids.add(passage.id)
+        if limit is not None:
+            passages = sorted(passages, key=lambda item: item.id)[:limit]
 
     mentions: list[VerseMention] = []
     for passage in passages:
@@ -450,13 +454,14 @@ def get_mentions_for_osis(
         )
         mentions.append(mention)
 
-    mentions.sort(
-        key=lambda item: (
-            item.passage.meta.get("document_title") if item.passage.meta else "",
-            item.passage.page_no or 0,
-            item.passage.t_start or 0.0,
+    if limit is None:
+        mentions.sort(
+            key=lambda item: (
+                item.passage.meta.get("document_title") if item.passage.meta else "",
+                item.passage.page_no or 0,
+                item.passage.t_start or 0.0,
+            )
         )
-    )
     return mentions
 
 
@@ -594,6 +599,44 @@ def _python_timeline(
     return _timeline_from_passages(passages, filters, window, limit)
 
 
+def _rollup_timeline(
+    session: Session,
+    osis: str,
+    window: Literal["week", "month", "quarter", "year"],
+    limit: int | None,
+    range_start: int,
+    range_end: int,
+) -> VerseTimelineResponse:
+    """Build an unfiltered timeline from the materialised verse rollups.
+
+    Document and passage identifiers are samples capped per rollup row.
+    """
+
+    rollups = query_timeline_rollups(session, range_start, range_end, window)
+    if limit and limit > 0:
+        rollups = rollups[-limit:]
+
+    buckets: list[VerseTimelineBucket] = []
+    for rollup in rollups:
+        label, start_dt, end_dt = _period_bounds(rollup.bucket_start, window)
+        buckets.append(
+            VerseTimelineBucket(
+                label=label,
+                start=start_dt,
+                end=end_dt,
+                count=rollup.count,
+                document_ids=rollup.document_ids,
+                sample_passage_ids=rollup.passage_ids,
+            )
+        )
+    return VerseTimelineResponse(
+        osis=osis,
+        window=window,
+        buckets=buckets,
+        total_mentions=sum(bucket.count for bucket in buckets),
+    )
+
+
 def get_verse_timeline(
     session: Session,
     osis: str,
@@ -619,6 +662,12 @@ def get_verse_timeline(
     # we start building the query instead of trying to reference them later.
     range_start, range_end = verse_ids[0], verse_ids[-1]
 
+    has_filters = bool(
+        filters and (filters.source_type or filters.collection or filters.author)
+    )
+    if not has_filters and timeline_rollups_ready(session):
+        return _rollup_timeline(session, osis, window, limit, range_start, range_end)
+
     bind = session.get_bind()
     dialect_name = bind.dialect.name if bind is not None else ""
 
@@ -641,6 +690,7 @@ def get_verse_timeline(
         .where(func.coalesce(Document.pub_date, Document.created_at).isnot(None))
     )
 
+    include_legacy = not verse_ranges_backfilled(session)
     allowed_doc_ids: list[str] | None = None
     if filters:
         if filters.source_type:
@@ -654,6 +704,7 @@ def get_verse_timeline(
                 filters.author,
                 range_start=range_start,
                 range_end=range_end,
+                include_legacy=include_legacy,
             )
             if not allowed_doc_ids:
                 return VerseTimelineResponse(osis=osis, window=window, buckets=[], total_mentions=0)
@@ -690,7 +741,7 @@ def get_verse_timeline(
 
     range_start, range_end = verse_ids[0], verse_ids[-1]
 
-    if not bucket_records:
+    if not bucket_records and include_legacy:
         legacy_buckets, legacy_total = _legacy_timeline(
             session=session,
             verse_ids=verse_ids,
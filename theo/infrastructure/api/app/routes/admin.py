@@ -0,0 +1,37 @@
+"""Operator endpoints for inspecting database behaviour."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Query, status
+
+from theo.application.facades.settings import get_settings
+
+from ..db.query_instrumentation import get_instrumentation_config, get_slow_query_log
+
+router = APIRouter()
+
+
+@router.get("/db/slow-queries", summary="Recently captured slow queries")
+def list_slow_queries(
+    limit: int | None = Query(default=None, ge=1, description="Newest entries to return"),
+) -> dict[str, object]:
+    """Return the slow-query ring buffer, newest first, with captured plans."""
+
+    config = get_instrumentation_config()
+    records = get_slow_query_log().snapshot()
+    if limit is not None:
+        records = records[:limit]
+    return {
+        "slow_query_ms": config.slow_query_ms,
+        "n_plus_one_threshold": config.n_plus_one_threshold,
+        "request_query_budget": get_settings().db_request_query_budget,
+        "capacity": get_slow_query_log().maxlen,
+        "entries": [record.to_dict() for record in records],
+    }
+
+
+@router.delete("/db/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries() -> None:
+    """Empty the slow-query buffer and reset the EXPLAIN rate limit."""
+
+    get_slow_query_log().clear()
@@ -895,6 +895,7 @@ def chat_turn(
             outputs=outputs_payload or {"error": str(exc)},
             citations=citations_payload,
             status="refused",
+            synchronous=True,
         )
         return response
 
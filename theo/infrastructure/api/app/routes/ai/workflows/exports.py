@@ -410,6 +410,7 @@ def sermon_prep_export(
             outputs=outputs_payload or {"error": str(exc)},
             citations=None,
             status="refused",
+            synchronous=True,
         )
         return guardrail_response
     normalized = format.lower()
@@ -483,6 +484,7 @@ def transcript_export(
             outputs={"error": str(exc)},
             citations=None,
             status="refused",
+            synchronous=True,
         )
         raise AIWorkflowError(
             str(exc),
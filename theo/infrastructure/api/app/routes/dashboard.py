@@ -12,6 +12,11 @@ from sqlalchemy.orm import Session
 from theo.adapters.persistence import models
 from theo.application.facades.database import get_session
 
+from ..db.dashboard_counters import (
+    METRICS,
+    dashboard_counters_ready,
+    load_dashboard_counters,
+)
 from ..models.dashboard import (
     DashboardActivity,
     DashboardMetric,
@@ -117,6 +122,49 @@ def _count_total(session: Session, model) -> int:
     return int(session.execute(stmt).scalar_one() or 0)
 
 
+_METRIC_LABELS: dict[str, str] = {
+    "documents": "Documents indexed",
+    "notes": "Research notes",
+    "discoveries": "Discoveries surfaced",
+    "notebooks": "Active notebooks",
+}
+
+
+def _metric_counts(session: Session, now: datetime) -> dict[str, tuple[int, int, int]]:
+    """Return ``(total, current, previous)`` per metric over the last two weeks.
+
+    Reads the per-day rollups when they have been populated and falls back to
+    counting the source tables otherwise. Rollup periods are whole UTC days,
+    with today counted in the current week.
+    """
+
+    if dashboard_counters_ready(session):
+        today = now.date()
+        summaries = load_dashboard_counters(
+            session,
+            current_start=today - timedelta(days=6),
+            previous_start=today - timedelta(days=13),
+        )
+        return {
+            metric_id: (summary.total, summary.current, summary.previous)
+            for metric_id, summary in summaries.items()
+        }
+
+    current_start = now - timedelta(days=7)
+    previous_start = current_start - timedelta(days=7)
+    counts: dict[str, tuple[int, int, int]] = {}
+    for metric_id, (model, attribute) in METRICS.items():
+        current, previous = _period_counts(
+            session,
+            model,
+            getattr(model, attribute),
+            current_start=current_start,
+            previous_start=previous_start,
+        )
+        counts[metric_id] = (_count_total(session, model), current, previous)
+    return counts
+
+
 def _collect_activities(session: Session, limit: int = 8) -> list[DashboardActivity]:
     """Gather a blended feed from recent domain artefacts."""
 
@@ -226,67 +274,17 @@ def get_dashboard_summary(
     """Return personalised dashboard content for the active user."""
 
     now = datetime.now(UTC)
-    current_start = now - timedelta(days=7)
-    previous_start = current_start - timedelta(days=7)
-
-    documents_current, documents_previous = _period_counts(
-        session,
-        models.Document,
-        models.Document.created_at,
-        current_start=current_start,
-        previous_start=previous_start,
-    )
-    notes_current, notes_previous = _period_counts(
-        session,
-        models.ResearchNote,
-        models.ResearchNote.created_at,
-        current_start=current_start,
-        previous_start=previous_start,
-    )
-    discoveries_current, discoveries_previous = _period_counts(
-        session,
-        models.Discovery,
-        models.Discovery.created_at,
-        current_start=current_start,
-        previous_start=previous_start,
-    )
-    notebooks_current, notebooks_previous = _period_counts(
-        session,
-        models.Notebook,
-        models.Notebook.updated_at,
-        current_start=current_start,
-        previous_start=previous_start,
-    )
+    counts = _metric_counts(session, now)
 
     metrics = [
         _build_metric(
-            metric_id="documents",
-            label="Documents indexed",
-            value=_count_total(session, models.Document),
+            metric_id=metric_id,
+            label=label,
+            value=counts[metric_id][0],
             unit=None,
-            delta=_percentage_delta(documents_current, documents_previous),
-        ),
-        _build_metric(
-            metric_id="notes",
-            label="Research notes",
-            value=_count_total(session, models.ResearchNote),
-            unit=None,
-            delta=_percentage_delta(notes_current, notes_previous),
-        ),
-        _build_metric(
-            metric_id="discoveries",
-            label="Discoveries surfaced",
-            value=_count_total(session, models.Discovery),
-            unit=None,
-            delta=_percentage_delta(discoveries_current, discoveries_previous),
-        ),
-        _build_metric(
-            metric_id="notebooks",
-            label="Active notebooks",
-            value=_count_total(session, models.Notebook),
-            unit=None,
-            delta=_percentage_delta(notebooks_current, notebooks_previous),
-        ),
+            delta=_percentage_delta(counts[metric_id][1], counts[metric_id][2]),
+        )
+        for metric_id, label in _METRIC_LABELS.items()
     ]
 
     activity = _collect_activities(session)
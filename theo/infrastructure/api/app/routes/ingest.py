@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, AsyncIterator, Iterator
+from typing import Any, AsyncIterator, Callable, Iterator
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from theo.application.facades.database import get_session
-from theo.application.facades.settings import get_settings
+from theo.application.facades.database import get_engine, get_session
+from theo.application.facades.settings import Settings, get_settings
 
-from ..discoveries.tasks import schedule_discovery_refresh
+from ..discoveries.tasks import run_discovery_refresh, schedule_discovery_refresh
 from ..errors import IngestionError, Severity
 from ..ingest.exceptions import UnsupportedSourceError
 from ..ingest.pipeline import (
@@ -29,6 +40,7 @@ from ..models.documents import (
     SimpleIngestRequest,
     UrlIngestRequest,
 )
+from ..models.jobs import IngestJobAccepted
 from ..persistence_models import Document
 from theo.application.facades.resilience import (
     ResilienceError,
@@ -38,6 +50,14 @@ from theo.application.facades.resilience import (
 from theo.application.security import Principal
 
 from ..adapters.security import require_principal
+from ..infra.ingest_jobs import (
+    IngestQueueFull,
+    create_ingest_job,
+    get_ingest_job_pool,
+    run_in_job_session,
+    run_ingest_job,
+    update_ingest_job,
+)
 from ..infra.ingestion_service import IngestionService, get_ingestion_service
 from ..utils.imports import LazyImportModule
 
@@ -58,8 +78,13 @@ except AttributeError:  # pragma: no cover - compatibility for older Starlette
     _PAYLOAD_TOO_LARGE_STATUS = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
 
 _INGEST_ERROR_RESPONSES = {
+    status.HTTP_202_ACCEPTED: {
+        "model": IngestJobAccepted,
+        "description": "Queued as a background job ('Prefer: respond-async')",
+    },
     status.HTTP_400_BAD_REQUEST: {"description": "Invalid ingest request"},
     _PAYLOAD_TOO_LARGE_STATUS: {"description": "Upload too large"},
+    status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Ingest queue is saturated"},
 }
 
 
@@ -235,6 +260,158 @@ async def _stream_upload_to_path(
     return result
 
 
+def _prefers_async(request: Request, settings: Settings) -> bool:
+    """Return whether the client asked for (or the server defaults to) 202 jobs."""
+
+    prefer = request.headers.get("prefer", "")
+    preferences = {
+        token.split("=", 1)[0].strip().lower()
+        for token in prefer.replace(";", ",").split(",")
+    }
+    if "respond-async" in preferences:
+        return True
+    return bool(getattr(settings, "ingest_respond_async", False))
+
+
+def _queue_saturated(exc: IngestQueueFull) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Ingest queue is full; retry later",
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def _run_in_ingest_pool(
+    work: Callable[[Session], Document], session: Session, settings: Settings
+) -> Document:
+    """Run a pipeline on the bounded ingest pool and await its document.
+
+    Only the bind crosses to the pool thread; *work* gets a session opened
+    there, because the request still owns (and closes) *session*.
+    """
+
+    try:
+        future = get_ingest_job_pool(settings).submit(
+            run_in_job_session, _job_bind(session), work
+        )
+    except IngestQueueFull as exc:
+        raise _queue_saturated(exc) from exc
+    return await asyncio.wrap_future(future)
+
+
+def _job_bind(session: Session) -> Any:
+    if isinstance(session, Session):
+        bind = session.get_bind()
+        if bind is not None:
+            return bind
+    return get_engine()
+
+
+def _enqueue_ingest_job(
+    request: Request,
+    session: Session,
+    settings: Settings,
+    *,
+    job_type: str,
+    source: dict[str, Any],
+    work: Callable[[Session], Document],
+    user_id: str | None,
+    cleanup: Callable[[], None] | None = None,
+    celery_dispatch: Callable[[str], str | None] | None = None,
+) -> JSONResponse:
+    """Record an ``IngestionJob`` and hand *work* to the pool or Celery.
+
+    Returns the 202 response; on success the caller no longer owns any
+    temporary files, which *cleanup* (or the Celery task) removes.
+    """
+
+    bind = _job_bind(session)
+    use_celery = (
+        celery_dispatch is not None
+        and getattr(settings, "ingest_job_backend", "local") == "celery"
+    )
+    pool = None if use_celery else get_ingest_job_pool(settings)
+    if pool is not None and pool.in_flight >= pool.capacity:
+        raise _queue_saturated(IngestQueueFull(pool.retry_after))
+    job_id = create_ingest_job(bind, job_type=job_type, payload={"source": source})
+
+    if use_celery:
+        assert celery_dispatch is not None
+        try:
+            task_id = celery_dispatch(job_id)
+        finally:
+            if cleanup is not None:
+                cleanup()
+        if task_id:
+            update_ingest_job(bind, job_id, task_id=task_id)
+    else:
+        assert pool is not None
+
+        def _after_success(_document: Document) -> None:
+            if user_id:
+                run_discovery_refresh(user_id)
+
+        try:
+            pool.submit(
+                run_ingest_job,
+                bind,
+                job_id,
+                work,
+                on_success=_after_success,
+                cleanup=cleanup,
+            )
+        except IngestQueueFull as exc:
+            update_ingest_job(
+                bind, job_id, status="failed", error="Ingest queue is saturated"
+            )
+            raise _queue_saturated(exc) from exc
+
+    status_url = str(request.url_for("get_job", job_id=job_id))
+    events_url = str(request.url_for("stream_job_events", job_id=job_id))
+    accepted = IngestJobAccepted(
+        job_id=job_id,
+        status="queued",
+        status_url=status_url,
+        events_url=events_url,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=accepted.model_dump(mode="json"),
+        headers={"Location": status_url},
+    )
+
+
+def _dispatch_file_to_celery(
+    settings: Settings,
+    job_id: str,
+    source_path: Path,
+    frontmatter: dict[str, Any] | None,
+) -> str | None:
+    """Move an upload to shared storage and queue ``tasks.process_file``."""
+
+    from ..workers import tasks as worker_tasks
+
+    spool_dir = Path(settings.storage_root) / "ingest-spool" / job_id
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    spooled = spool_dir / source_path.name
+    shutil.move(str(source_path), spooled)
+    async_result = worker_tasks.process_file.delay(
+        job_id, str(spooled), frontmatter, job_id, remove_source=True
+    )
+    return getattr(async_result, "id", None)
+
+
+def _dispatch_url_to_celery(
+    job_id: str, payload: UrlIngestRequest, frontmatter: dict[str, Any] | None
+) -> str | None:
+    from ..workers import tasks as worker_tasks
+
+    async_result = worker_tasks.process_url.delay(
+        job_id, payload.url, payload.source_type, frontmatter, job_id
+    )
+    return getattr(async_result, "id", None)
+
+
 def _encode_event(event: dict[str, Any]) -> bytes:
     payload = json.dumps(event, separators=(",", ":"))
     return f"{payload}\n".encode("utf-8")
@@ -246,6 +423,7 @@ def _encode_event(event: dict[str, Any]) -> bytes:
     responses=_INGEST_ERROR_RESPONSES,
 )
 async def ingest_file(
+    request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     frontmatter: str | None = Form(default=None),
@@ -254,14 +432,15 @@ async def ingest_file(
     ingestion_service: IngestionService = Depends(
         _ingestion_service_with_overrides
     ),
-) -> DocumentIngestResponse:
-    """Accept a file upload and synchronously process it into passages."""
+) -> DocumentIngestResponse | JSONResponse:
+    """Accept a file upload and process it into passages off the event loop."""
 
     tmp_dir = Path(tempfile.mkdtemp(prefix="theo-ingest-"))
     tmp_path = _unique_safe_path(tmp_dir, file.filename, "upload.bin")
     settings = get_settings()
 
     user_id = _principal_subject(principal)
+    handed_off = False
 
     try:
         await _stream_upload_to_path(
@@ -273,11 +452,37 @@ async def ingest_file(
         enriched_frontmatter = _frontmatter_with_owner(parsed_frontmatter, user_id)
         if ingestion_service.run_file_pipeline is _run_pipeline_for_file:
             ingestion_service.run_file_pipeline = run_pipeline_for_file
-        document = ingestion_service.ingest_file(
-            session,
-            tmp_path,
-            enriched_frontmatter,
-        )
+
+        def _work(job_session: Session) -> Document:
+            return ingestion_service.ingest_file(
+                job_session,
+                tmp_path,
+                enriched_frontmatter,
+            )
+
+        if _prefers_async(request, settings):
+            accepted = _enqueue_ingest_job(
+                request,
+                session,
+                settings,
+                job_type="ingest_file",
+                source={
+                    "kind": "file",
+                    "filename": _normalise_upload_name(
+                        file.filename, default="upload.bin"
+                    ),
+                },
+                work=_work,
+                user_id=user_id,
+                cleanup=lambda: _safe_cleanup_temp_directory(tmp_dir),
+                celery_dispatch=lambda job_id: _dispatch_file_to_celery(
+                    settings, job_id, tmp_path, enriched_frontmatter
+                ),
+            )
+            handed_off = True
+            return accepted
+
+        document = await _run_in_ingest_pool(_work, session, settings)
     except IngestionError:
         raise
     except ResilienceError as exc:
@@ -290,7 +495,8 @@ async def ingest_file(
             data={"resilience": exc.metadata.to_dict()},
         ) from exc
     finally:
-        _safe_cleanup_temp_directory(tmp_dir)
+        if not handed_off:
+            _safe_cleanup_temp_directory(tmp_dir)
 
     schedule_discovery_refresh(background_tasks, user_id)
     return DocumentIngestResponse(document_id=document.id, status="processed")
@@ -302,6 +508,7 @@ async def ingest_file(
     responses=_INGEST_ERROR_RESPONSES,
 )
 async def ingest_url(
+    request: Request,
     background_tasks: BackgroundTasks,
     payload: UrlIngestRequest,
     principal: Principal = Depends(require_principal),
@@ -309,18 +516,37 @@ async def ingest_url(
     ingestion_service: IngestionService = Depends(
         _ingestion_service_with_overrides
     ),
-) -> DocumentIngestResponse:
+) -> DocumentIngestResponse | JSONResponse:
     user_id = _principal_subject(principal)
     frontmatter = _frontmatter_with_owner(payload.frontmatter, user_id)
+    settings = get_settings()
     try:
         if ingestion_service.run_url_pipeline is _run_pipeline_for_url:
             ingestion_service.run_url_pipeline = run_pipeline_for_url
-        document = ingestion_service.ingest_url(
-            session,
-            payload.url,
-            source_type=payload.source_type,
-            frontmatter=frontmatter,
-        )
+
+        def _work(job_session: Session) -> Document:
+            return ingestion_service.ingest_url(
+                job_session,
+                payload.url,
+                source_type=payload.source_type,
+                frontmatter=frontmatter,
+            )
+
+        if _prefers_async(request, settings):
+            return _enqueue_ingest_job(
+                request,
+                session,
+                settings,
+                job_type="ingest_url",
+                source={"kind": "url", "url": payload.url},
+                work=_work,
+                user_id=user_id,
+                celery_dispatch=lambda job_id: _dispatch_url_to_celery(
+                    job_id, payload, frontmatter
+                ),
+            )
+
+        document = await _run_in_ingest_pool(_work, session, settings)
     except UnsupportedSourceError as exc:
         raise IngestionError(
             str(exc),
@@ -383,6 +609,7 @@ async def simple_ingest(
     responses=_INGEST_ERROR_RESPONSES,
 )
 async def ingest_transcript(
+    request: Request,
     background_tasks: BackgroundTasks,
     transcript: UploadFile = File(...),
     audio: UploadFile | None = File(default=None),
@@ -392,7 +619,7 @@ async def ingest_transcript(
     ingestion_service: IngestionService = Depends(
         _ingestion_service_with_overrides
     ),
-) -> DocumentIngestResponse:
+) -> DocumentIngestResponse | JSONResponse:
     """Accept a transcript (and optional audio) and process it into passages."""
 
     tmp_dir = Path(tempfile.mkdtemp(prefix="theo-ingest-"))
@@ -405,6 +632,7 @@ async def ingest_transcript(
     limit = getattr(settings, "ingest_upload_max_bytes", None)
 
     user_id = _principal_subject(principal)
+    handed_off = False
 
     try:
         await _stream_upload_to_path(transcript, transcript_path, max_bytes=limit)
@@ -418,20 +646,40 @@ async def ingest_transcript(
         if ingestion_service.run_transcript_pipeline is _run_pipeline_for_transcript:
             ingestion_service.run_transcript_pipeline = run_pipeline_for_transcript
 
-        document = ingestion_service.ingest_transcript(
-            session,
-            transcript_path,
-            frontmatter=enriched_frontmatter,
-            audio_path=audio_path,
-            transcript_filename=_normalise_upload_name(
-                transcript.filename, default="transcript.vtt"
-            ),
-            audio_filename=(
-                _normalise_upload_name(audio.filename, default="audio.bin")
-                if audio and audio.filename
-                else None
-            ),
+        transcript_filename = _normalise_upload_name(
+            transcript.filename, default="transcript.vtt"
         )
+        audio_filename = (
+            _normalise_upload_name(audio.filename, default="audio.bin")
+            if audio and audio.filename
+            else None
+        )
+
+        def _work(job_session: Session) -> Document:
+            return ingestion_service.ingest_transcript(
+                job_session,
+                transcript_path,
+                frontmatter=enriched_frontmatter,
+                audio_path=audio_path,
+                transcript_filename=transcript_filename,
+                audio_filename=audio_filename,
+            )
+
+        if _prefers_async(request, settings):
+            accepted = _enqueue_ingest_job(
+                request,
+                session,
+                settings,
+                job_type="ingest_transcript",
+                source={"kind": "transcript", "filename": transcript_filename},
+                work=_work,
+                user_id=user_id,
+                cleanup=lambda: _safe_cleanup_temp_directory(tmp_dir),
+            )
+            handed_off = True
+            return accepted
+
+        document = await _run_in_ingest_pool(_work, session, settings)
     except IngestionError:
         raise
     except ResilienceError as exc:
@@ -444,7 +692,8 @@ async def ingest_transcript(
             data={"resilience": exc.metadata.to_dict()},
         ) from exc
     finally:
-        _safe_cleanup_temp_directory(tmp_dir)
+        if not handed_off:
+            _safe_cleanup_temp_directory(tmp_dir)
 
     schedule_discovery_refresh(background_tasks, user_id)
     return DocumentIngestResponse(document_id=document.id, status="processed")
@@ -456,6 +705,7 @@ async def ingest_transcript(
     responses=_INGEST_ERROR_RESPONSES,
 )
 async def ingest_audio(
+    request: Request,
     background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     source_type: str = Form(default="user_upload"),
@@ -466,7 +716,7 @@ async def ingest_audio(
     ingestion_service: IngestionService = Depends(
         _ingestion_service_with_overrides
     ),
-) -> DocumentIngestResponse:
+) -> DocumentIngestResponse | JSONResponse:
     """Ingest an audio file (MP3, WAV) or video file (MP4) with transcription."""
     principal_subject = _principal_subject(principal)
 
@@ -501,6 +751,7 @@ async def ingest_audio(
         settings = get_settings()
         limit = getattr(settings, "ingest_upload_max_bytes", None)
         document: Document | None = None
+        handed_off = False
         try:
             await _stream_upload_to_path(
                 audio,
@@ -508,20 +759,43 @@ async def ingest_audio(
                 max_bytes=limit,
             )
 
+            def _work(job_session: Session) -> Document:
+                return ingestion_service.ingest_audio(
+                    job_session,
+                    tmp_path,
+                    source_type=source_type,
+                    frontmatter=enriched_frontmatter,
+                )
+
+            if _prefers_async(request, settings):
+                accepted = _enqueue_ingest_job(
+                    request,
+                    session,
+                    settings,
+                    job_type="ingest_audio",
+                    source={
+                        "kind": "audio",
+                        "filename": _normalise_upload_name(
+                            audio.filename, default="audio.bin"
+                        ),
+                    },
+                    work=_work,
+                    user_id=principal_subject,
+                    cleanup=lambda: _safe_cleanup_temp_directory(tmp_dir),
+                )
+                handed_off = True
+                return accepted
+
             # Process via ingestion service
-            document = ingestion_service.ingest_audio(
-                session,
-                tmp_path,
-                source_type=source_type,
-                frontmatter=enriched_frontmatter,
-            )
+            document = await _run_in_ingest_pool(_work, session, settings)
         finally:
-            _safe_cleanup_temp_directory(tmp_dir)
+            if not handed_off:
+                _safe_cleanup_temp_directory(tmp_dir)
 
         schedule_discovery_refresh(background_tasks, principal_subject)
         return DocumentIngestResponse(document_id=document.id, status="processed")
 
-    except IngestionError:
+    except (IngestionError, HTTPException):
         raise
     except Exception as e:
         raise IngestionError(
@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable, NotRequired, TypedDict, cast
+from typing import Any, AsyncIterator, Callable, NotRequired, TypedDict, cast
 
 from celery.result import AsyncResult
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import Session
 
 from theo.application.facades.database import get_session
 from theo.infrastructure.api.app.persistence_models import Document, IngestionJob
 
+from ..infra.ingest_jobs import TERMINAL_JOB_STATUSES, job_session
 from ..models.jobs import (
     CitationValidationJobRequest,
     HNSWRefreshJobRequest,
@@ -43,6 +47,11 @@ router = APIRouter()
 
 IDEMPOTENCY_TTL = timedelta(minutes=10)
 
+# Job progress is read back from ``ingestion_jobs``; keep polling cheap and
+# emit an SSE comment periodically so idle proxies keep the stream open.
+_JOB_EVENT_POLL_SECONDS = 0.5
+_JOB_EVENT_HEARTBEAT_SECONDS = 15.0
+
 
 class TopicDigestTaskArgs(TypedDict):
     """Keyword arguments passed to the topic digest Celery task."""
@@ -124,6 +133,71 @@ def list_jobs(
     return JobListResponse(jobs=[_serialize_job(job) for job in jobs])
 
 
+def _load_job(bind: Any, job_id: str) -> JobStatus | None:
+    # A session of its own, so polling never shares the pool worker's or the
+    # request's connection.
+    with job_session(bind) as session:
+        job = session.get(IngestionJob, job_id)
+        return _serialize_job(job) if job is not None else None
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_job_events(
+    job_id: str, request: Request, session: Session = Depends(get_session)
+) -> StreamingResponse:
+    """Stream a job's status and per-stage progress as server-sent events.
+
+    A ``progress`` event carrying the serialised job is sent whenever the row
+    changes, and a final ``done`` event once it completes or fails.
+    """
+
+    bind = session.get_bind()
+    initial = await run_in_threadpool(_load_job, bind, job_id)
+    if initial is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+
+    async def _events() -> AsyncIterator[str]:
+        current: JobStatus | None = initial
+        last_sent: str | None = None
+        idle = 0.0
+        while current is not None:
+            encoded = current.model_dump_json()
+            if encoded != last_sent:
+                yield _sse("progress", encoded)
+                last_sent = encoded
+                idle = 0.0
+            if current.status in TERMINAL_JOB_STATUSES:
+                yield _sse("done", encoded)
+                return
+            if idle >= _JOB_EVENT_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(_JOB_EVENT_POLL_SECONDS)
+            idle += _JOB_EVENT_POLL_SECONDS
+            try:
+                current = await run_in_threadpool(_load_job, bind, job_id)
+            except DBAPIError:
+                # Transient read failure (e.g. SQLite busy); poll again.
+                continue
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{job_id}", response_model=JobStatus)
 def get_job(job_id: str, session: Session = Depends(get_session)) -> JobStatus:
     job = session.get(IngestionJob, job_id)
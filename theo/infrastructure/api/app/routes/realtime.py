@@ -3,16 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import threading
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, DefaultDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, DefaultDict
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
 from theo.application.facades.database import get_session
+from theo.application.facades.settings import get_settings
 
+from ..infra.notebook_events import (
+    NotebookEvent,
+    NotebookEventBackend,
+    build_notebook_event_backend,
+)
 from ..models.notebooks import NotebookRealtimeSnapshot
 from theo.application.security import Principal
 
@@ -22,18 +33,78 @@ if TYPE_CHECKING:  # pragma: no cover - used only for type hints
     from ..notebooks.service import NotebookService
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-class NotebookEventBroker:
-    """In-memory notebook event dispatcher supporting websocket and polling."""
+@dataclass(slots=True)
+class _PendingUpdate:
+    payload: dict[str, Any]
+    count: int = 1
+
 
-    def __init__(self) -> None:
+class NotebookEventBroker:
+    """Notebook event dispatcher supporting websocket and polling clients.
+
+    Websockets are tracked per process; versions and cross-process fan-out are
+    delegated to a :class:`NotebookEventBackend`. Updates published through
+    :meth:`publish` within ``coalesce_seconds`` of each other are merged into a
+    single event carrying the latest payload and a ``coalesced`` count, so a
+    bulk edit produces one version bump rather than one per row. Versions only
+    move forward: an event older than one already delivered is dropped.
+
+    The backend's connections belong to one event loop. :meth:`start` binds the
+    server loop at application startup; processes that never run one (CLI
+    tools, workers) get a private loop on a daemon thread instead, so
+    :meth:`publish` never blocks its caller or creates a throwaway loop.
+    """
+
+    def __init__(
+        self,
+        backend: NotebookEventBackend | None = None,
+        *,
+        coalesce_seconds: float | None = None,
+    ) -> None:
         self._connections: DefaultDict[str, set[WebSocket]] = defaultdict(set)
         self._versions: DefaultDict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
+        self._backend = backend
+        self._coalesce_seconds = coalesce_seconds
+        self.origin = uuid4().hex
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._fallback: tuple[asyncio.AbstractEventLoop, threading.Thread] | None = None
+        self._fallback_lock = threading.Lock()
+        self._pending: dict[str, _PendingUpdate] = {}
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed: asyncio.Future[None] | None = None
+
+    @property
+    def backend(self) -> NotebookEventBackend:
+        if self._backend is None:
+            self._backend = build_notebook_event_backend(get_settings())
+        return self._backend
+
+    @property
+    def coalesce_seconds(self) -> float:
+        if self._coalesce_seconds is None:
+            window_ms = getattr(get_settings(), "notebook_events_coalesce_ms", 0.0)
+            self._coalesce_seconds = max(float(window_ms), 0.0) / 1000.0
+        return self._coalesce_seconds
+
+    async def start(self) -> None:
+        """Bind the broker to the running (server) event loop."""
+
+        self._loop = asyncio.get_running_loop()
 
     async def connect(self, notebook_id: str, websocket: WebSocket) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._ensure_listener()
+        if self._subscribed is not None:
+            # Updates published after the client connects must reach it, so
+            # wait until the listener holds its subscription.
+            await asyncio.shield(self._subscribed)
         async with self._lock:
             self._connections[notebook_id].add(websocket)
 
@@ -46,12 +117,135 @@ class NotebookEventBroker:
                 self._connections.pop(notebook_id, None)
 
     def current_version(self, notebook_id: str) -> int:
+        """Return the newest version this process has seen."""
+
+        return self._versions[notebook_id]
+
+    async def fetch_version(self, notebook_id: str) -> int:
+        """Return the shared version, refreshing the local view from the backend."""
+
+        version = await self.backend.current_version(notebook_id)
+        self._advance(notebook_id, version)
         return self._versions[notebook_id]
 
     async def broadcast(self, notebook_id: str, payload: dict[str, Any]) -> None:
+        """Publish *payload* immediately and deliver it to local websockets."""
+
+        body = jsonable_encoder(payload)
+        version = await self.backend.publish(notebook_id, body, origin=self.origin)
+        await self._deliver(notebook_id, version, body)
+
+    def publish(self, notebook_id: str, payload: dict[str, Any]) -> None:
+        """Queue *payload* for broadcast from any thread without blocking.
+
+        Calls made from sync route handlers (running in the threadpool) are
+        handed to the server loop that owns the websockets. Without a running
+        server loop the update goes to the broker's fallback loop.
+        """
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            loop = self._loop = running
+        if loop is None:
+            loop = self._fallback_loop()
+        if loop is running:
+            self._enqueue(notebook_id, payload)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, notebook_id, payload)
+
+    def snapshot(self, notebook_id: str) -> NotebookRealtimeSnapshot:
+        return NotebookRealtimeSnapshot(
+            notebook_id=notebook_id,
+            version=self._versions[notebook_id],
+            updated_at=datetime.now(UTC),
+        )
+
+    async def close(self) -> None:
+        """Stop the listener, flush pending updates and release the backend."""
+
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        if self._subscribed is not None:
+            self._subscribed.cancel()
+            self._subscribed = None
+        for notebook_id in list(self._pending):
+            await self._flush(notebook_id)
+        self._loop = None
+        self._stop_fallback_loop()
+        if self._backend is not None:
+            await self._backend.close()
+
+    def _fallback_loop(self) -> asyncio.AbstractEventLoop:
+        with self._fallback_lock:
+            if self._fallback is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="notebook-events", daemon=True
+                )
+                thread.start()
+                self._fallback = (loop, thread)
+            return self._fallback[0]
+
+    def _stop_fallback_loop(self) -> None:
+        with self._fallback_lock:
+            fallback, self._fallback = self._fallback, None
+        if fallback is None:
+            return
+        loop, thread = fallback
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5.0)
+        if not thread.is_alive():
+            loop.close()
+
+    def _enqueue(self, notebook_id: str, payload: dict[str, Any]) -> None:
+        pending = self._pending.get(notebook_id)
+        if pending is not None:
+            pending.payload = payload
+            pending.count += 1
+            return
+        self._pending[notebook_id] = _PendingUpdate(payload)
+        window = self.coalesce_seconds
+        loop = asyncio.get_running_loop()
+        if window > 0:
+            loop.call_later(window, self._schedule_flush, notebook_id)
+        else:
+            self._schedule_flush(notebook_id)
+        self._ensure_listener()
+
+    def _schedule_flush(self, notebook_id: str) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush(notebook_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, notebook_id: str) -> None:
+        pending = self._pending.pop(notebook_id, None)
+        if pending is None:
+            return
+        payload = dict(pending.payload)
+        if pending.count > 1:
+            payload["coalesced"] = pending.count
+        try:
+            await self.broadcast(notebook_id, payload)
+        except Exception:
+            logger.exception("Failed to publish notebook update for %s", notebook_id)
+
+    def _advance(self, notebook_id: str, version: int) -> bool:
+        if version <= self._versions[notebook_id]:
+            return False
+        self._versions[notebook_id] = version
+        return True
+
+    async def _deliver(
+        self, notebook_id: str, version: int, payload: dict[str, Any]
+    ) -> None:
+        if not self._advance(notebook_id, version):
+            return
         async with self._lock:
-            self._versions[notebook_id] += 1
-            version = self._versions[notebook_id]
             connections = list(self._connections.get(notebook_id, set()))
         message = {"type": "notebook.update", "version": version, **payload}
         for connection in connections:
@@ -60,17 +254,52 @@ class NotebookEventBroker:
             except Exception:
                 await self.disconnect(notebook_id, connection)
 
-    def snapshot(self, notebook_id: str) -> NotebookRealtimeSnapshot:
-        return NotebookRealtimeSnapshot(
-            notebook_id=notebook_id,
-            version=self._versions[notebook_id],
-            updated_at=datetime.now(UTC),
-        )
+    def _ensure_listener(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            return
+        if not self.backend.distributed:
+            return
+        loop = asyncio.get_running_loop()
+        self._subscribed = loop.create_future()
+        self._listener = loop.create_task(self._listen(self._subscribed))
+
+    async def _listen(self, subscribed: asyncio.Future[None]) -> None:
+        while True:
+            try:
+                stream = await self.backend.subscribe()
+                if not subscribed.done():
+                    subscribed.set_result(None)
+                async for event in stream:
+                    if event.origin == self.origin:
+                        continue
+                    await self._deliver(event.notebook_id, event.version, event.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Notebook event subscription failed", exc_info=True)
+            # Never leave connect() waiting on a backend that is down.
+            if not subscribed.done():
+                subscribed.set_result(None)
+            await asyncio.sleep(_LISTENER_RETRY_SECONDS)
 
 
+_LISTENER_RETRY_SECONDS = 1.0
+
 _BROKER = NotebookEventBroker()
 
 
+async def start_notebook_broker() -> None:
+    """Bind the process-wide broker to the server loop (called on app startup)."""
+
+    await _BROKER.start()
+
+
+async def shutdown_notebook_broker() -> None:
+    """Release the process-wide broker's backend (called on app shutdown)."""
+
+    await _BROKER.close()
+
+
 def _service(session: Session, principal: Principal | None) -> "NotebookService":
     from ..notebooks.service import NotebookService
 
@@ -96,12 +325,7 @@ def require_websocket_principal(websocket: WebSocket) -> Principal:
 def publish_notebook_update(notebook_id: str, payload: dict[str, Any]) -> None:
     """Schedule a broadcast to connected notebook collaborators."""
 
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        asyncio.run(_BROKER.broadcast(notebook_id, payload))
-        return
-    loop.create_task(_BROKER.broadcast(notebook_id, payload))
+    _BROKER.publish(notebook_id, payload)
 
 
 @router.websocket("/notebooks/{notebook_id}")
@@ -120,7 +344,7 @@ async def notebook_updates(
             {
                 "type": "notebook.welcome",
                 "notebook_id": notebook_id,
-                "version": _BROKER.current_version(notebook_id),
+                "version": await _BROKER.fetch_version(notebook_id),
             }
         )
         while True:
@@ -137,7 +361,14 @@ async def poll_notebook_events(
 ) -> NotebookRealtimeSnapshot:
     service = _service(session, principal)
     service.ensure_accessible(notebook_id)
+    await _BROKER.fetch_version(notebook_id)
     return _BROKER.snapshot(notebook_id)
 
 
-__all__ = ["router", "publish_notebook_update"]
+__all__ = [
+    "NotebookEventBroker",
+    "publish_notebook_update",
+    "router",
+    "shutdown_notebook_broker",
+    "start_notebook_broker",
+]
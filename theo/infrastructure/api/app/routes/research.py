@@ -26,7 +26,9 @@ from ..models.research import (
     FallacyDetection,
     FallacyDetectRequest,
     FallacyDetectResponse,
+    GeoNearbyResponse,
     GeoPlaceSearchResponse,
+    GeoRegionResponse,
     GeoVerseResponse,
     HistoricityEntry,
     HistoricitySearchResponse,
@@ -55,8 +57,13 @@ from ..models.research import (
     VariantReading,
 )
 from ..research import (
+    BoundingBox,
     lookup_geo_places,
     places_for_osis,
+    places_for_osis_in_region,
+    places_in_bbox,
+    places_near,
+    resolve_origin,
     search_commentaries,
     search_contradictions,
 )
@@ -514,3 +521,99 @@ def lookup_geo_for_verse(
         return GeoVerseResponse(osis=osis)
 
     return places_for_osis(session, osis)
+
+
+def _region_bbox(
+    min_lat: float | None,
+    min_lng: float | None,
+    max_lat: float | None,
+    max_lng: float | None,
+) -> BoundingBox | None:
+    values = (min_lat, min_lng, max_lat, max_lng)
+    if all(value is None for value in values):
+        return None
+    if any(value is None for value in values):
+        raise HTTPException(
+            status_code=422,
+            detail="min_lat, min_lng, max_lat and max_lng must be provided together",
+        )
+    try:
+        return BoundingBox(
+            min_lat=min_lat, min_lng=min_lng, max_lat=max_lat, max_lng=max_lng
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _region_origin(
+    session: Session,
+    lat: float | None,
+    lng: float | None,
+    place: str | None,
+) -> tuple[float, float]:
+    if (lat is None) != (lng is None):
+        raise HTTPException(status_code=422, detail="lat and lng must be provided together")
+    origin = resolve_origin(session, lat=lat, lng=lng, place=place)
+    if origin is None:
+        if place:
+            raise HTTPException(status_code=404, detail=f"Unknown place: {place}")
+        raise HTTPException(
+            status_code=422,
+            detail="Provide lat/lng, a place name or a bounding box",
+        )
+    return origin
+
+
+@router.get("/geo/nearby", response_model=GeoNearbyResponse)
+def lookup_geo_nearby(
+    lat: float | None = Query(default=None, ge=-90, le=90),
+    lng: float | None = Query(default=None, ge=-180, le=180),
+    place: str | None = Query(default=None, description="Place name used as origin"),
+    radius_km: float = Query(default=20.0, gt=0, le=1000),
+    min_lat: float | None = Query(default=None, ge=-90, le=90),
+    min_lng: float | None = Query(default=None, ge=-180, le=180),
+    max_lat: float | None = Query(default=None, ge=-90, le=90),
+    max_lng: float | None = Query(default=None, ge=-180, le=180),
+    limit: int = Query(default=50, ge=1, le=500),
+    session: Session = Depends(get_session),
+) -> GeoNearbyResponse:
+    settings = get_settings()
+    if not getattr(settings, "geo_enabled", True):
+        return GeoNearbyResponse(items=[])
+
+    bbox = _region_bbox(min_lat, min_lng, max_lat, max_lng)
+    if bbox is not None:
+        return GeoNearbyResponse(items=places_in_bbox(session, bbox, limit=limit))
+
+    origin_lat, origin_lng = _region_origin(session, lat, lng, place)
+    items = places_near(
+        session, lat=origin_lat, lng=origin_lng, radius_km=radius_km, limit=limit
+    )
+    return GeoNearbyResponse(items=items)
+
+
+@router.get("/geo/region", response_model=GeoRegionResponse)
+def lookup_geo_region(
+    osis: str = Query(..., description="OSIS verse or range to inspect"),
+    lat: float | None = Query(default=None, ge=-90, le=90),
+    lng: float | None = Query(default=None, ge=-180, le=180),
+    place: str | None = Query(default=None, description="Place name used as origin"),
+    radius_km: float = Query(default=20.0, gt=0, le=1000),
+    min_lat: float | None = Query(default=None, ge=-90, le=90),
+    min_lng: float | None = Query(default=None, ge=-180, le=180),
+    max_lat: float | None = Query(default=None, ge=-90, le=90),
+    max_lng: float | None = Query(default=None, ge=-180, le=180),
+    session: Session = Depends(get_session),
+) -> GeoRegionResponse:
+    settings = get_settings()
+    if not getattr(settings, "geo_enabled", True):
+        return GeoRegionResponse(osis=osis)
+
+    bbox = _region_bbox(min_lat, min_lng, max_lat, max_lng)
+    if bbox is not None:
+        return places_for_osis_in_region(session, osis, bbox=bbox)
+
+    origin_lat, origin_lng = _region_origin(session, lat, lng, place)
+    return places_for_osis_in_region(
+        session, osis, lat=origin_lat, lng=origin_lng, radius_km=radius_km
+    )
@@ -101,6 +101,10 @@ def search(
         description="Restrict to documents tagged with a topic domain",
     ),
     k: int = Query(default=10, ge=1, le=50),
+    collapse_duplicates: bool | None = Query(
+        default=None,
+        description="Return one passage per near-duplicate cluster",
+    ),
     experiment: list[str] | None = Query(
         default=None,
         alias="experiment",
@@ -127,6 +131,7 @@ def search(
             topic_domain=topic_domain,
         ),
         k=k,
+        collapse_duplicates=collapse_duplicates,
     )
     experiment_tokens: list[str] = []
     header_tokens = request.headers.get("X-Search-Experiments")
@@ -28,17 +28,34 @@ def verse_mentions(
     source_type: str | None = Query(default=None, description="Filter by source type"),
     collection: str | None = Query(default=None, description="Filter by collection"),
     author: str | None = Query(default=None, description="Filter by author"),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=500,
+        description="Page size; omit to return every mention",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Passage identifier returned as next_cursor by the previous page",
+    ),
     session: Session = Depends(get_session),
 ) -> VerseMentionsResponse:
-    """Return all passages that reference the requested OSIS verse."""
+    """Return passages that reference the requested OSIS verse."""
 
     filters = VerseMentionsFilters(
         source_type=source_type,
         collection=collection,
         author=author,
     )
-    mentions = get_mentions_for_osis(session, osis, filters)
-    return VerseMentionsResponse(osis=osis, mentions=mentions, total=len(mentions))
+    mentions = get_mentions_for_osis(
+        session, osis, filters, limit=limit, after=cursor
+    )
+    next_cursor = None
+    if limit is not None and len(mentions) == limit:
+        next_cursor = mentions[-1].passage.id
+    return VerseMentionsResponse(
+        osis=osis, mentions=mentions, total=len(mentions), next_cursor=next_cursor
+    )
 
 
 @router.get("/{osis}/graph", response_model=VerseGraphResponse)
@@ -47,6 +64,17 @@ def verse_graph(
     source_type: str | None = Query(default=None, description="Filter by source type"),
     collection: str | None = Query(default=None, description="Filter by collection"),
     author: str | None = Query(default=None, description="Filter by author"),
+    depth: int = Query(
+        default=1,
+        ge=1,
+        le=3,
+        description="Number of hops to expand through related verses",
+    ),
+    edge_kinds: list[str] | None = Query(
+        default=None,
+        alias="edge_kind",
+        description="Restrict edges to these kinds (repeatable)",
+    ),
     session: Session = Depends(get_session),
 ) -> VerseGraphResponse:
     """Return graph data linking verse mentions and seed relationships."""
@@ -56,7 +84,14 @@ def verse_graph(
         collection=collection,
         author=author,
     )
-    return get_verse_graph(session, osis, filters)
+    try:
+        return get_verse_graph(
+            session, osis, filters, depth=depth, edge_kinds=edge_kinds
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
 
 
 @router.get("/{osis}/timeline", response_model=VerseTimelineResponse)
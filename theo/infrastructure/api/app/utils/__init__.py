@@ -1,5 +1,5 @@
 """Helper utilities for API services."""
 
-from .imports import LazyImportModule
+from .imports import LazyImportModule, import_optional
 
-__all__ = ["LazyImportModule"]
+__all__ = ["LazyImportModule", "import_optional"]
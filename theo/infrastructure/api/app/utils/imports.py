@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 from importlib import import_module
 from threading import Lock
 from types import ModuleType
 from typing import Any
 
+LOGGER = logging.getLogger(__name__)
+
 
 class LazyImportModule:
     """Proxy that loads a module on first attribute access."""
@@ -52,4 +55,24 @@ class LazyImportModule:
         return sorted(set(dir(module)))
 
 
-__all__ = ["LazyImportModule"]
+def import_optional(dotted_path: str, attribute: str | None = None) -> Any | None:
+    """Import an optional dependency at its point of use.
+
+    Returns the module, or ``attribute`` from it, and ``None`` when the
+    dependency is missing or fails to import. Heavy libraries such as
+    ``FlagEmbedding`` are resolved through this helper when they are first
+    needed rather than at module import time, so starting the API, a worker
+    or a CLI command does not pay for them.
+    """
+
+    try:
+        module = import_module(dotted_path)
+    except Exception:  # noqa: BLE001 - broken optional installs behave as absent
+        LOGGER.debug("Optional dependency %s unavailable", dotted_path, exc_info=True)
+        return None
+    if attribute is None:
+        return module
+    return getattr(module, attribute, None)
+
+
+__all__ = ["LazyImportModule", "import_optional"]
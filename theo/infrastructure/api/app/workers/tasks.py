@@ -8,8 +8,9 @@ import sys
 import time
 from datetime import UTC, datetime, timedelta, date
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Iterable, Sequence, cast
+from typing import Any, Callable, Iterable, Iterator, Sequence, cast
 
 from dataclasses import dataclass, replace
 from types import SimpleNamespace
@@ -84,7 +85,10 @@ from ..analytics.topics import (
     store_topic_digest,
     upsert_digest_document,
 )
+from ..db.dashboard_counters import reconcile_dashboard_counters
 from ..db.seeds import _run_with_sqlite_lock_retry
+from ..db.verse_adjacency import rebuild_verse_adjacency
+from ..db.verse_ranges import backfill_verse_ranges as run_verse_range_backfill
 from ..analytics.watchlists import (
     get_watchlist,
     iter_due_watchlists,
@@ -92,6 +96,7 @@ from ..analytics.watchlists import (
 )
 from ..creators.verse_perspectives import CreatorVersePerspectiveService
 from ..enrich import MetadataEnricher
+from ..ranking.feature_store import rebuild_passage_features
 try:  # pragma: no cover - optional ingestion dependency
     from ..ingest.pipeline import (
         PipelineDependencies,
@@ -114,6 +119,8 @@ except Exception:  # pragma: no cover - lean environments
             "Optional ingestion dependencies are not installed; "
             "provide a stub via configure_worker_dependencies."
         )
+from ..infra.ingest_jobs import JobProgressRecorder
+from ..ingest.progress import progress_reporter
 from ..models.ai import ChatMemoryEntry
 from ..models.export import DeliverableDownload
 from ..models.search import HybridSearchFilters, HybridSearchRequest
@@ -206,6 +213,30 @@ celery.conf.beat_schedule.setdefault(
     },
 )
 
+celery.conf.beat_schedule.setdefault(
+    "refresh-verse-adjacency-hourly",
+    {
+        "task": "tasks.refresh_verse_adjacency",
+        "schedule": crontab(minute="20"),
+    },
+)
+
+celery.conf.beat_schedule.setdefault(
+    "refresh-passage-features-hourly",
+    {
+        "task": "tasks.refresh_passage_features",
+        "schedule": crontab(minute="35"),
+    },
+)
+
+celery.conf.beat_schedule.setdefault(
+    "reconcile-dashboard-counters-hourly",
+    {
+        "task": "tasks.reconcile_dashboard_counters",
+        "schedule": crontab(minute="50"),
+    },
+)
+
 celery.conf.beat_schedule.setdefault(
     "refresh-topic-map-nightly",
     {
@@ -628,14 +659,42 @@ def _merge_job_payload(session: Session, job_id: str, payload: dict[str, Any]) -
     repo.merge_payload(job_id, payload)
 
 
+@contextmanager
+def _job_progress(engine: Any, job_id: str | None) -> Iterator[None]:
+    """Record pipeline stage progress on ``job_id`` while the block runs."""
+
+    if not job_id:
+        yield
+        return
+    recorder = JobProgressRecorder(job_id, engine)
+    try:
+        with progress_reporter(recorder):
+            yield
+    finally:
+        recorder.flush()
+
+
+def _remove_spooled_source(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    try:
+        path.parent.rmdir()
+    except OSError:
+        pass
+
+
 @celery.task(name="tasks.process_file")
 def process_file(
     doc_id: str,
     path: str,
     frontmatter: dict | None = None,
     job_id: str | None = None,
+    remove_source: bool = False,
 ) -> None:
-    """Process a file in the background via the ingestion pipeline."""
+    """Process a file in the background via the ingestion pipeline.
+
+    ``remove_source`` marks *path* as an upload spooled for this task (see
+    ``routes.ingest``); it is deleted once the pipeline finishes.
+    """
 
     engine = get_engine()
     deps = get_worker_dependencies()
@@ -645,13 +704,14 @@ def process_file(
             _update_job_status(session, job_id, status="processing")
             session.commit()
         try:
-            document = deps.run_pipeline_for_file(
-                session,
-                Path(path),
-                frontmatter,
-                dependencies=PipelineDependencies(settings=settings),
-            )
-            session.commit()
+            with _job_progress(engine, job_id):
+                document = deps.run_pipeline_for_file(
+                    session,
+                    Path(path),
+                    frontmatter,
+                    dependencies=PipelineDependencies(settings=settings),
+                )
+                session.commit()
             if job_id:
                 _update_job_status(
                     session, job_id, status="completed", document_id=document.id
@@ -664,6 +724,9 @@ def process_file(
             # Avoid passing complex exception objects to prevent RecursionError
             # during billiard serialization; error details are already logged
             raise type(exc)(str(exc)) from None
+        finally:
+            if remove_source:
+                _remove_spooled_source(Path(path))
 
 
 @celery.task(name="tasks.process_url", bind=True, max_retries=3)
@@ -685,14 +748,15 @@ def process_url(
             if job_id:
                 _update_job_status(session, job_id, status="processing")
                 session.commit()
-            document = deps.run_pipeline_for_url(
-                session,
-                url,
-                source_type=source_type,
-                frontmatter=frontmatter,
-                dependencies=PipelineDependencies(settings=settings),
-            )
-            session.commit()
+            with _job_progress(engine, job_id):
+                document = deps.run_pipeline_for_url(
+                    session,
+                    url,
+                    source_type=source_type,
+                    frontmatter=frontmatter,
+                    dependencies=PipelineDependencies(settings=settings),
+                )
+                session.commit()
             if job_id:
                 _update_job_status(
                     session, job_id, status="completed", document_id=document.id
@@ -1478,6 +1542,76 @@ def refresh_creator_verse_rollups(osis_refs: list[str]) -> None:
         service.refresh_many(osis_refs)
 
 
+@celery.task(name="tasks.backfill_verse_ranges")
+def backfill_verse_ranges(
+    batch_size: int = 500, max_batches: int | None = 20
+) -> dict[str, object]:
+    """Advance the resumable verse range backfill, re-enqueueing until done."""
+
+    engine = get_engine()
+    with Session(engine) as session:
+        state = run_verse_range_backfill(
+            session, batch_size=batch_size, max_batches=max_batches
+        )
+
+    if not state.completed:
+        backfill_verse_ranges.delay(batch_size=batch_size, max_batches=max_batches)
+    logger.info(
+        "Verse range backfill advanced",
+        extra={
+            "processed": state.processed,
+            "updated": state.updated,
+            "completed": state.completed,
+        },
+    )
+    return {
+        "processed": state.processed,
+        "updated": state.updated,
+        "last_id": state.last_id,
+        "completed": state.completed,
+    }
+
+
+@celery.task(name="tasks.refresh_verse_adjacency")
+def refresh_verse_adjacency() -> dict[str, object]:
+    """Recompute changed verse adjacency segments and publish a new graph."""
+
+    engine = get_engine()
+    with Session(engine) as session:
+        _adjacency, stats = rebuild_verse_adjacency(session)
+    return {
+        "version": stats.version,
+        "nodes": stats.nodes,
+        "edges": stats.edges,
+        "reused_segments": stats.reused,
+        "rebuilt_segments": stats.rebuilt,
+    }
+
+
+@celery.task(name="tasks.refresh_passage_features")
+def refresh_passage_features() -> dict[str, object]:
+    """Recompute the per-passage ranking features consumed by the reranker."""
+
+    engine = get_engine()
+    with Session(engine) as session:
+        stats = rebuild_passage_features(session)
+    return {
+        "passages": stats.passages,
+        "with_feedback": stats.with_feedback,
+        "duration_seconds": round(stats.duration_seconds, 3),
+    }
+
+
+@celery.task(name="tasks.reconcile_dashboard_counters")
+def reconcile_dashboard_counters_task() -> dict[str, object]:
+    """Recount the dashboard rollups and correct rows that drifted."""
+
+    engine = get_engine()
+    with Session(engine) as session:
+        stats = reconcile_dashboard_counters(session)
+    return {"rows": stats.rows, "corrected": stats.corrected}
+
+
 @celery.task(name="tasks.enqueue_follow_up_retrieval")
 def enqueue_follow_up_retrieval(session_id: str, trail_id: str, action: str) -> None:
     """Record queued follow-up retrieval requests triggered by trail digests."""
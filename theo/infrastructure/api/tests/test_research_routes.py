@@ -462,6 +462,28 @@ def test_geo_lookup_returns_places_with_confidence_and_aliases() -> None:
         assert "Bethlehem Ephrathah" in place["aliases"]
 
 
+def test_geo_nearby_requires_an_origin() -> None:
+    with TestClient(app) as client:
+        response = client.get("/research/geo/nearby", params={"radius_km": 10})
+        assert response.status_code == 422
+
+        partial_box = client.get("/research/geo/nearby", params={"min_lat": 31.0})
+        assert partial_box.status_code == 422
+
+
+def test_geo_nearby_returns_seeded_places_around_coordinates() -> None:
+    with TestClient(app) as client:
+        response = client.get(
+            "/research/geo/nearby",
+            params={"lat": 31.778, "lng": 35.235, "radius_km": 25},
+        )
+        assert response.status_code == 200, response.text
+        items = response.json()["items"]
+        assert "bethlehem" in {item["modern_id"] for item in items}
+        distances = [item["distance_km"] for item in items]
+        assert distances == sorted(distances)
+
+
 def test_features_exposed_in_discovery() -> None:
     with TestClient(app) as client:
         response = client.get("/features/discovery")
@@ -330,7 +330,11 @@ def _ingest_batch_via_api(
     dependencies: PipelineDependencies | None = None,
 ) -> list[str]:
     engine = get_engine()
-    dependency_bundle = dependencies or PipelineDependencies(settings=get_settings())
+    # Unchanged files resolve to their existing documents, so re-running the
+    # command over a folder only parses what is new or edited.
+    dependency_bundle = dependencies or PipelineDependencies(
+        settings=get_settings(), reuse_duplicates=True
+    )
     document_ids: list[str] = []
     
     with Session(engine) as session: